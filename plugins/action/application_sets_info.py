@@ -7,15 +7,10 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 from ansible.plugins.action import ActionBase
-try:
-    from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
-        AnsibleArgSpecValidator,
-    )
-except ImportError:
-    ANSIBLE_UTILS_IS_INSTALLED = False
-else:
-    ANSIBLE_UTILS_IS_INSTALLED = True
 from ansible.errors import AnsibleActionFail
+from ansible_collections.cisco.dnac.plugins.plugin_utils.argspec import (
+    validate_argspec,
+)
 from ansible_collections.cisco.dnac.plugins.plugin_utils.dnac import (
     DNACSDK,
     dnac_argument_spec,
@@ -39,8 +34,6 @@ required_together = []
 
 class ActionModule(ActionBase):
     def __init__(self, *args, **kwargs):
-        if not ANSIBLE_UTILS_IS_INSTALLED:
-            raise AnsibleActionFail("ansible.utils is not installed. Execute 'ansible-galaxy collection install ansible.utils'")
         super(ActionModule, self).__init__(*args, **kwargs)
         self._supports_async = False
         self._supports_check_mode = True
@@ -48,19 +41,15 @@ class ActionModule(ActionBase):
 
     # Checks the supplied parameters against the argument spec for this module
     def _check_argspec(self):
-        aav = AnsibleArgSpecValidator(
-            data=self._task.args,
-            schema=dict(argument_spec=argument_spec),
-            schema_format="argspec",
-            schema_conditionals=dict(
-                required_if=required_if,
-                required_one_of=required_one_of,
-                mutually_exclusive=mutually_exclusive,
-                required_together=required_together,
-            ),
-            name=self._task.action,
+        valid, errors, self._task.args = validate_argspec(
+            self._task.action,
+            self._task.args,
+            argument_spec,
+            required_if=required_if,
+            required_one_of=required_one_of,
+            mutually_exclusive=mutually_exclusive,
+            required_together=required_together,
         )
-        valid, errors, self._task.args = aav.validate()
         if not valid:
             raise AnsibleActionFail(errors)
 
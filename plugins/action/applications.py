@@ -7,19 +7,14 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 from ansible.plugins.action import ActionBase
-try:
-    from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
-        AnsibleArgSpecValidator,
-    )
-except ImportError:
-    ANSIBLE_UTILS_IS_INSTALLED = False
-else:
-    ANSIBLE_UTILS_IS_INSTALLED = True
 from ansible.errors import AnsibleActionFail
+from ansible_collections.cisco.dnac.plugins.plugin_utils.argspec import (
+    validate_argspec,
+)
 from ansible_collections.cisco.dnac.plugins.plugin_utils.dnac import (
     DNACSDK,
+    compile_comparator,
     dnac_argument_spec,
-    dnac_compare_equality,
     get_dict_result,
 )
 from ansible_collections.cisco.dnac.plugins.plugin_utils.exceptions import (
@@ -132,24 +127,24 @@ class Applications(object):
         it_exists = prev_obj is not None and isinstance(prev_obj, dict)
         return (it_exists, prev_obj)
 
-    def requires_update(self, current_obj):
+    # (DNAC param, Ansible param) pairs compared by requires_update
+    comparator = compile_comparator([
+        ("id", "id"),
+        ("name", "name"),
+        ("networkApplications", "networkApplications"),
+        ("networkIdentity", "networkIdentity"),
+        ("applicationSet", "applicationSet"),
+        ("id", "id"),
+    ], argument_spec=argument_spec)
+
+    def requires_update(self, current_obj, full_diff=False):
         requested_obj = self.new_object.get('payload')
         if requested_obj and len(requested_obj) > 0:
             requested_obj = requested_obj[0]
-
-        obj_params = [
-            ("id", "id"),
-            ("name", "name"),
-            ("networkApplications", "networkApplications"),
-            ("networkIdentity", "networkIdentity"),
-            ("applicationSet", "applicationSet"),
-            ("id", "id"),
-        ]
         # Method 1. Params present in request (Ansible) obj are the same as the current (DNAC) params
         # If any does not have eq params, it requires update
-        return any(not dnac_compare_equality(current_obj.get(dnac_param),
-                                             requested_obj.get(ansible_param))
-                   for (dnac_param, ansible_param) in obj_params)
+        changed, self.update_diff = self.comparator(current_obj, requested_obj, full_diff)
+        return changed
 
     def create(self):
         result = self.dnac.exec(
@@ -192,8 +187,6 @@ class Applications(object):
 
 class ActionModule(ActionBase):
     def __init__(self, *args, **kwargs):
-        if not ANSIBLE_UTILS_IS_INSTALLED:
-            raise AnsibleActionFail("ansible.utils is not installed. Execute 'ansible-galaxy collection install ansible.utils'")
         super(ActionModule, self).__init__(*args, **kwargs)
         self._supports_async = False
         self._supports_check_mode = False
@@ -201,19 +194,15 @@ class ActionModule(ActionBase):
 
     # Checks the supplied parameters against the argument spec for this module
     def _check_argspec(self):
-        aav = AnsibleArgSpecValidator(
-            data=self._task.args,
-            schema=dict(argument_spec=argument_spec),
-            schema_format="argspec",
-            schema_conditionals=dict(
-                required_if=required_if,
-                required_one_of=required_one_of,
-                mutually_exclusive=mutually_exclusive,
-                required_together=required_together,
-            ),
-            name=self._task.action,
+        valid, errors, self._task.args = validate_argspec(
+            self._task.action,
+            self._task.args,
+            argument_spec,
+            required_if=required_if,
+            required_one_of=required_one_of,
+            mutually_exclusive=mutually_exclusive,
+            required_together=required_together,
         )
-        valid, errors, self._task.args = aav.validate()
         if not valid:
             raise AnsibleActionFail(errors)
 
@@ -233,7 +222,9 @@ class ActionModule(ActionBase):
         if state == "present":
             (obj_exists, prev_obj) = obj.exists()
             if obj_exists:
-                if obj.requires_update(prev_obj):
+                if obj.requires_update(prev_obj, self._play_context.diff):
+                    if self._play_context.diff:
+                        self._result.update(diff=obj.update_diff)
                     response = obj.update()
                     dnac.object_updated()
                 else:
@@ -7,18 +7,14 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 from ansible.plugins.action import ActionBase
-try:
-    from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
-        AnsibleArgSpecValidator,
-    )
-except ImportError:
-    ANSIBLE_UTILS_IS_INSTALLED = False
-else:
-    ANSIBLE_UTILS_IS_INSTALLED = True
 from ansible.errors import AnsibleActionFail
+from ansible_collections.cisco.dnac.plugins.plugin_utils.argspec import (
+    validate_argspec,
+)
 from ansible_collections.cisco.dnac.plugins.plugin_utils.dnac import (
     DNACSDK,
     dnac_argument_spec,
+    response_cache_argument_spec,
 )
 
 # Get common arguments specification
@@ -60,7 +56,10 @@ argument_spec.update(dict(
     offset=dict(type="int"),
     limit=dict(type="int"),
     headers=dict(type="dict"),
+    all_pages=dict(type="bool", default=False),
 ))
+# Add the response cache arguments, with the default TTL of this module
+argument_spec.update(response_cache_argument_spec(ttl=300))
 
 required_if = []
 required_one_of = []
@@ -70,8 +69,6 @@ required_together = []
 
 class ActionModule(ActionBase):
     def __init__(self, *args, **kwargs):
-        if not ANSIBLE_UTILS_IS_INSTALLED:
-            raise AnsibleActionFail("ansible.utils is not installed. Execute 'ansible-galaxy collection install ansible.utils'")
         super(ActionModule, self).__init__(*args, **kwargs)
         self._supports_async = False
         self._supports_check_mode = True
@@ -79,19 +76,15 @@ class ActionModule(ActionBase):
 
     # Checks the supplied parameters against the argument spec for this module
     def _check_argspec(self):
-        aav = AnsibleArgSpecValidator(
-            data=self._task.args,
-            schema=dict(argument_spec=argument_spec),
-            schema_format="argspec",
-            schema_conditionals=dict(
-                required_if=required_if,
-                required_one_of=required_one_of,
-                mutually_exclusive=mutually_exclusive,
-                required_together=required_together,
-            ),
-            name=self._task.action,
+        valid, errors, self._task.args = validate_argspec(
+            self._task.action,
+            self._task.args,
+            argument_spec,
+            required_if=required_if,
+            required_one_of=required_one_of,
+            mutually_exclusive=mutually_exclusive,
+            required_together=required_together,
         )
-        valid, errors, self._task.args = aav.validate()
         if not valid:
             raise AnsibleActionFail(errors)
 
@@ -135,6 +128,29 @@ class ActionModule(ActionBase):
         )
         return new_object
 
+    def get_all_pages(self, dnac, params):
+        list_params = self.get_object(params)
+        list_params.pop("id")
+        list_params.pop("offset")
+        list_params.pop("limit")
+        count_params = dict(
+            hostname=list_params["hostname"],
+            management_ip_address=list_params["management_ip_address"],
+            mac_address=list_params["mac_address"],
+            location_name=list_params["location_name"],
+            headers=list_params["headers"],
+        )
+        # The count API only knows a few of the filters, the others would make it too large
+        filtered = [key for key, value in list_params.items() if value is not None and key not in count_params]
+        devices = dnac.paginate(
+            family="devices",
+            function='get_device_list',
+            params=list_params,
+            count_function=None if filtered else 'get_device_count',
+            count_params=count_params,
+        )
+        return dict(response=devices)
+
     def run(self, tmp=None, task_vars=None):
         self._task.diff = False
         self._result = super(ActionModule, self).run(tmp, task_vars)
@@ -147,19 +163,28 @@ class ActionModule(ActionBase):
 
         id = self._task.args.get("id")
         if id:
-            response = dnac.exec(
+            response = dnac.cached_exec(
                 family="devices",
                 function='get_device_by_id',
                 params=self.get_object(self._task.args),
+                cache=self._task.args.get("cache"),
+                ttl=self._task.args.get("cache_ttl"),
             )
             self._result.update(dict(dnac_response=response))
             self._result.update(dnac.exit_json())
             return self._result
+        if not id and self._task.args.get("all_pages"):
+            response = self.get_all_pages(dnac, self._task.args)
+            self._result.update(dict(dnac_response=response))
+            self._result.update(dnac.exit_json())
+            return self._result
         if not id:
-            response = dnac.exec(
+            response = dnac.cached_exec(
                 family="devices",
                 function='get_device_list',
                 params=self.get_object(self._task.args),
+                cache=self._task.args.get("cache"),
+                ttl=self._task.args.get("cache_ttl"),
             )
             self._result.update(dict(dnac_response=response))
             self._result.update(dnac.exit_json())
@@ -7,15 +7,14 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 from ansible.plugins.action import ActionBase
-try:
-    from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
-        AnsibleArgSpecValidator,
-    )
-except ImportError:
-    ANSIBLE_UTILS_IS_INSTALLED = False
-else:
-    ANSIBLE_UTILS_IS_INSTALLED = True
 from ansible.errors import AnsibleActionFail
+from ansible_collections.cisco.dnac.plugins.module_utils.download import (
+    existing_download,
+    planned_download,
+)
+from ansible_collections.cisco.dnac.plugins.plugin_utils.argspec import (
+    validate_argspec,
+)
 from ansible_collections.cisco.dnac.plugins.plugin_utils.dnac import (
     DNACSDK,
     dnac_argument_spec,
@@ -31,6 +30,8 @@ argument_spec.update(dict(
     saveFile=dict(type="bool"),
     filename=dict(type="str"),
     headers=dict(type="dict"),
+    dest=dict(type="path"),
+    checksum=dict(type="str"),
 ))
 
 required_if = []
@@ -41,8 +42,6 @@ required_together = []
 
 class ActionModule(ActionBase):
     def __init__(self, *args, **kwargs):
-        if not ANSIBLE_UTILS_IS_INSTALLED:
-            raise AnsibleActionFail("ansible.utils is not installed. Execute 'ansible-galaxy collection install ansible.utils'")
         super(ActionModule, self).__init__(*args, **kwargs)
         self._supports_async = False
         self._supports_check_mode = True
@@ -50,19 +49,15 @@ class ActionModule(ActionBase):
 
     # Checks the supplied parameters against the argument spec for this module
     def _check_argspec(self):
-        aav = AnsibleArgSpecValidator(
-            data=self._task.args,
-            schema=dict(argument_spec=argument_spec),
-            schema_format="argspec",
-            schema_conditionals=dict(
-                required_if=required_if,
-                required_one_of=required_one_of,
-                mutually_exclusive=mutually_exclusive,
-                required_together=required_together,
-            ),
-            name=self._task.action,
+        valid, errors, self._task.args = validate_argspec(
+            self._task.action,
+            self._task.args,
+            argument_spec,
+            required_if=required_if,
+            required_one_of=required_one_of,
+            mutually_exclusive=mutually_exclusive,
+            required_together=required_together,
         )
-        valid, errors, self._task.args = aav.validate()
         if not valid:
             raise AnsibleActionFail(errors)
 
@@ -88,6 +83,27 @@ class ActionModule(ActionBase):
         dnac = DNACSDK(params=self._task.args)
 
         id = self._task.args.get("executionId")
+        if id and self._task.args.get("dest"):
+            # Streamed to disk, only the metadata of the file is returned
+            # Like get_url, a dest that matches the checksum is not downloaded again
+            response = existing_download(self._task.args.get("dest"), self._task.args.get("checksum"))
+            if response is None and self._play_context.check_mode:
+                # Nothing is downloaded, like get_url the file is reported as changed
+                response = planned_download(self._task.args.get("dest"))
+            elif response is None:
+                response = dnac.download(
+                    "/dna/intent/api/v1/data/reports/{0}/executions/{1}".format(self._task.args.get("reportId"), id),
+                    dest=self._task.args.get("dest"),
+                    headers=self._task.args.get("headers"),
+                    checksum=self._task.args.get("checksum"),
+                    family="reports",
+                )
+            # A download with the content dest already had does not replace it
+            if response.pop("changed", True):
+                dnac.changed()
+            self._result.update(dict(dnac_response=response))
+            self._result.update(dnac.exit_json())
+            return self._result
         if id:
             download_response = dnac.exec(
                 family="reports",
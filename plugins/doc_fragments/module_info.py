@@ -54,6 +54,65 @@ options:
           - Flag for Cisco DNA Center SDK to enable the validation of request bodies against a JSON schema.
         type: bool
         default: true
+    dnac_token_cache:
+        description:
+          - Flag to share the Cisco Catalyst Center access token between tasks and forks running on the control node.
+          - When true, the token is kept on disk per host, port, user and version, and is only requested again
+            when it is about to expire or it is rejected by Cisco Catalyst Center.
+          - The cache directory defaults to '~/.ansible/cisco_dnac/tokens' and can be changed with the
+            DNAC_TOKEN_CACHE_DIR environment variable.
+        type: bool
+        default: false
+    dnac_connection_pool_size:
+        description:
+          - Maximum number of keep-alive connections kept open to Cisco DNA Center by each worker process.
+          - Plugins that run in the same worker process against the same Cisco DNA Center reuse these connections
+            instead of opening a new TCP and TLS session for each call.
+          - Every task runs in a new worker process, so the connections are only reused within a task,
+            e.g. by the items of a loop.
+        type: int
+        default: 10
+    dnac_rate_limit:
+        description:
+          - Maximum number of requests per second sent to Cisco DNA Center by each worker process.
+          - 0 only slows down when Cisco DNA Center rejects requests with HTTP 429 or 503.
+          - The rate is halved when requests are rejected and slowly raised again, up to this value.
+          - When set, the state of the limiter is returned in C(rate_limit).
+        type: float
+        default: 0
+    dnac_rate_limit_per_family:
+        description:
+          - Flag to also apply I(dnac_rate_limit) to each API family, such as devices or sites, separately.
+        type: bool
+        default: false
+    dnac_rate_limit_retries:
+        description:
+          - Number of times a request rejected with HTTP 429 or 503 is retried.
+          - The retries wait for the C(Retry-After) given by Cisco DNA Center.
+        type: int
+        default: 5
+    dnac_shared_rate_limit:
+        description:
+          - Maximum number of requests per second sent to Cisco DNA Center by all the forks of the control node together.
+          - The forks share a token bucket kept in a file locked while it is updated. 0 disables it.
+          - The state files are kept in '~/.ansible/cisco_dnac/budget', the base directory can be changed with the
+            DNAC_STATE_DIR environment variable.
+        type: float
+        default: 0
+    dnac_shared_family_concurrency:
+        description:
+          - Maximum number of requests of the same API family, such as devices or sites, running at once
+            across all the forks of the control node. 0 disables it.
+        type: int
+        default: 0
+    dnac_memoize_reads:
+        description:
+          - Flag to memoize the read calls, such as get_device_list, for the duration of the task.
+          - Identical reads share one request, including reads issued at the same time by concurrent threads.
+          - Any call that changes Cisco DNA Center, and any poll of a task or API status, is never memoized and empties the memo.
+          - When true, the hits are counted in C(read_cache).
+        type: bool
+        default: false
 notes:
     - "Supports C(check_mode)"
     - "The plugin runs on the control node and does not use any ansible connection plugins, but instead the embedded connection manager from Cisco DNAC SDK"
@@ -96,6 +96,32 @@ options:
         description: Determines the mode of the file. Set to True for 'append' mode. Set to False for 'write' mode.
         type: bool
         default: True
+    dnac_log_max_bytes:
+        description:
+          - Size in bytes from which the log file is rotated, the current file is renamed with a C(.1) suffix,
+            the previous C(.1) file becomes C(.2), and so on.
+          - The default C(0) never rotates the file.
+        type: int
+        default: 0
+    dnac_log_backup_count:
+        description: Number of rotated log files kept when C(dnac_log_max_bytes) is set, the oldest ones are removed.
+        type: int
+        default: 5
+    dnac_log_compress:
+        description: Flag to compress the rotated log files with gzip, they are named like C(dnac.log.1.gz).
+        type: bool
+        default: false
+    dnac_log_format:
+        description:
+          - Format of the log file.
+          - C(text) writes the time, level and message on every line.
+          - C(json) writes a JSON object per line, with the C(time), C(level), C(module), C(class), C(caller), C(line)
+            and C(message) of the record, the C(phase) running (C(want), C(have), C(diff) or C(verify)), and the API
+            C(family), C(function) and C(latency) of the records logging the API calls at DEBUG level.
+          - The records are written by a background thread in both formats.
+        type: str
+        choices: [text, json]
+        default: text
     validate_response_schema:
         description:
           - Flag for Cisco Catalyst Center SDK to enable the validation of request bodies against a JSON schema.
@@ -110,6 +136,83 @@ options:
       description: Specifies the interval in seconds between successive calls to the API to retrieve task details.
       type: int
       default: 2
+    dnac_token_cache:
+        description:
+          - Flag to share the Cisco Catalyst Center access token between tasks and forks running on the control node.
+          - When true, the token is kept on disk per host, port, user and version, and is only requested again
+            when it is about to expire or it is rejected by Cisco Catalyst Center.
+          - The cache directory defaults to '~/.ansible/cisco_dnac/tokens' and can be changed with the
+            DNAC_TOKEN_CACHE_DIR environment variable.
+        type: bool
+        default: false
+    dnac_rate_limit:
+        description:
+          - Maximum number of requests per second sent to Cisco Catalyst Center by each worker process.
+          - 0 only slows down when Cisco Catalyst Center rejects requests with HTTP 429 or 503.
+          - The rate is halved when requests are rejected and slowly raised again, up to this value.
+          - When set, the state of the limiter is returned in C(rate_limit).
+        type: float
+        default: 0
+    dnac_rate_limit_per_family:
+        description:
+          - Flag to also apply I(dnac_rate_limit) to each API family, such as devices or sites, separately.
+        type: bool
+        default: false
+    dnac_rate_limit_retries:
+        description:
+          - Number of times a request rejected with HTTP 429 or 503, or with a rate limit error, is retried.
+          - The retries wait for the C(Retry-After) given by Cisco Catalyst Center.
+        type: int
+        default: 5
+    dnac_shared_rate_limit:
+        description:
+          - Maximum number of requests per second sent to Cisco Catalyst Center by all the forks of the control node together.
+          - The forks share a token bucket kept in a file locked while it is updated. 0 disables it.
+          - The state files are kept in '~/.ansible/cisco_dnac/budget', the base directory can be changed with the
+            DNAC_STATE_DIR environment variable.
+        type: float
+        default: 0
+    dnac_shared_family_concurrency:
+        description:
+          - Maximum number of requests of the same API family, such as devices or sites, running at once
+            across all the forks of the control node. 0 disables it.
+        type: int
+        default: 0
+    dnac_memoize_reads:
+        description:
+          - Flag to memoize the read calls, such as get_device_list, for the duration of the task.
+          - Identical reads share one request, including reads issued at the same time by concurrent threads.
+          - Any call that changes Cisco Catalyst Center, and any poll of a task or API status, is never memoized and empties the memo.
+          - When true, the hits are counted in C(read_cache).
+        type: bool
+        default: false
+    dnac_metrics:
+        description:
+          - Flag to measure the API calls of the task.
+          - When true, C(api_metrics) holds the totals of the task and, for every SDK family and function called,
+            the number of calls and errors, the p50, p95 and max latency in seconds, and the HTTP requests,
+            response bytes, rate limit retries and task polls of the calls.
+        type: bool
+        default: false
+    dnac_metrics_file:
+        description:
+          - Path of a file receiving a JSON line for every API call when C(dnac_metrics) is true.
+          - The lines are appended, so the file can collect the calls of several tasks.
+        type: str
+    dnac_timings:
+        description:
+          - Flag to time the phases of every config item, getting the wanted and current state,
+            applying the difference and verifying it.
+          - When true, C(timings) holds a breakdown per config item, the seconds spent in C(want),
+            C(have), C(diff) and C(verify), and the seconds and number of the API calls of the item.
+        type: bool
+        default: false
+    dnac_timings_file:
+        description:
+          - Path of a file receiving the spans of every config item when C(dnac_timings) is true.
+          - Every line is an OTLP/JSON trace, the format of the OpenTelemetry file exporter, so the
+            file can be loaded by OpenTelemetry tools. The lines are appended.
+        type: str
 notes:
     - "Does not support C(check_mode)"
     - "The plugin runs on the control node and does not use any ansible connection plugins instead embedded connection manager from Cisco Catalyst Center SDK"
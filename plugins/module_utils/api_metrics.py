@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2024, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+from contextlib import contextmanager
+import json
+import math
+import threading
+import time
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a sorted list, None when it is empty."""
+
+    if not values:
+        return None
+    index = max(0, min(len(values), int(math.ceil(fraction * len(values)))) - 1)
+    return values[index]
+
+
+class CallRecord(object):
+    """What a single API call sent and received, filled in while the call runs."""
+
+    def __init__(self, family, function):
+        self.family = family
+        self.function = function
+        self.requests = 0
+        self.bytes = 0
+        self.retries = 0
+        self.polls = 0
+        self.error = None
+
+
+class ApiMetrics(object):
+    """
+    Metrics of the API calls of a run, per SDK family and function.
+
+    Every call records its count, latency (p50, p95 and max), errors, HTTP requests,
+    response bytes, retries and task polls. The counts of 'summary' are kept up to date
+    after every call, so it can be put in the module result once, while the latencies
+    are only computed by summarize(). With 'path', every call is also appended to that
+    file as a JSON line.
+    """
+
+    def __init__(self, path=None, clock=time.time):
+        """
+        Parameters:
+            path (str) - JSON-lines file receiving a line per call.
+            clock (callable) - Returns the current time in seconds.
+        """
+
+        self.path = path
+        self.clock = clock
+        self.latencies = {}
+        self.elapsed = {}
+        self.total_elapsed = 0.0
+        self.summary = {
+            "totals": {"calls": 0, "errors": 0, "requests": 0, "bytes": 0, "retries": 0, "polls": 0, "elapsed": 0.0},
+            "calls": {},
+        }
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def current(self):
+        """The CallRecord of the call running in this thread, None outside of a call."""
+
+        return getattr(self._local, "record", None)
+
+    @contextmanager
+    def call(self, family, function):
+        """Measure the call run inside the block, HTTP requests and retries are added to it meanwhile."""
+
+        outer = self.current
+        record = CallRecord(family, function)
+        self._local.record = record
+        start = self.clock()
+        try:
+            yield record
+        except Exception as e:
+            record.error = type(e).__name__
+            raise
+        finally:
+            self._local.record = outer
+            self.record(record, self.clock() - start)
+
+    def count_retry(self):
+        record = self.current
+        if record is not None:
+            record.retries += 1
+
+    def count_polls(self, polls):
+        record = self.current
+        if record is not None:
+            record.polls += polls
+
+    def response_hook(self, response, *args, **kwargs):
+        """'requests' response hook counting the requests and response bytes of the current call."""
+
+        record = self.current
+        if record is None:
+            return
+        record.requests += 1
+        if kwargs.get("stream"):
+            # Reading the body here would buffer a download in memory
+            size = response.headers.get("Content-Length")
+            record.bytes += int(size) if size and size.isdigit() else 0
+        else:
+            record.bytes += len(response.content or b"")
+
+    def record(self, record, elapsed):
+        key = "{0}.{1}".format(record.family, record.function)
+        with self._lock:
+            self.latencies.setdefault(key, []).append(elapsed)
+            self.elapsed[key] = self.elapsed.get(key, 0.0) + elapsed
+            self.total_elapsed += elapsed
+            stats = self.summary["calls"].setdefault(
+                key, {"count": 0, "errors": 0, "requests": 0, "bytes": 0, "retries": 0, "polls": 0})
+            totals = self.summary["totals"]
+            for target in (stats, totals):
+                target["errors"] += 1 if record.error else 0
+                target["requests"] += record.requests
+                target["bytes"] += record.bytes
+                target["retries"] += record.retries
+                target["polls"] += record.polls
+            stats["count"] += 1
+            totals["calls"] += 1
+
+            if self.path:
+                self.write_line(dict(
+                    time=round(self.clock(), 3),
+                    family=record.family,
+                    function=record.function,
+                    elapsed=round(elapsed, 4),
+                    requests=record.requests,
+                    bytes=record.bytes,
+                    retries=record.retries,
+                    polls=record.polls,
+                    error=record.error,
+                ))
+
+    def summarize(self):
+        """Add the latencies of every call, rounded to the millisecond, to 'summary' and return it."""
+
+        with self._lock:
+            for key, latencies in self.latencies.items():
+                latencies.sort()
+                self.summary["calls"][key].update(
+                    p50=round(percentile(latencies, 0.5), 3),
+                    p95=round(percentile(latencies, 0.95), 3),
+                    max=round(latencies[-1], 3),
+                    total=round(self.elapsed[key], 3),
+                )
+            self.summary["totals"]["elapsed"] = round(self.total_elapsed, 3)
+        return self.summary
+
+    def summarized(self, exit_function):
+        """Wrap 'exit_function', e.g. AnsibleModule.exit_json, so that it summarizes the metrics first."""
+
+        def wrapper(*args, **kwargs):
+            self.summarize()
+            return exit_function(*args, **kwargs)
+        return wrapper
+
+    def write_line(self, line):
+        try:
+            with open(self.path, "a") as f:
+                f.write(json.dumps(line, sort_keys=True) + "\n")
+        except EnvironmentError:
+            # The metrics never fail the run, the file is left incomplete
+            self.path = None
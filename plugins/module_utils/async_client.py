@@ -0,0 +1,290 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2024, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import ssl
+
+from ansible_collections.cisco.dnac.plugins.module_utils.call_pool import (
+    DEFAULT_CALL_WORKERS,
+    CallResult,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.lazy_import import (
+    LazyModule,
+    is_importable,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.rate_limiter import (
+    RETRY_STATUS_CODES,
+    parse_retry_after,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.task_waiter import (
+    WAIT_FAILED,
+    WAIT_SUCCESS,
+    WAIT_TIMEOUT,
+    WaitResult,
+)
+
+# Imported by the first module using the transport, most of them never do
+asyncio = LazyModule("asyncio")
+aiohttp = LazyModule("aiohttp")
+HAS_AIOHTTP = is_importable("aiohttp")
+
+DEFAULT_MAX_IN_FLIGHT = 1000
+# Sockets opened to the controller by the native transport, whatever the number of requests in flight
+DEFAULT_CONNECTION_LIMIT = 64
+TASK_PATH = "/dna/intent/api/v1/task/{0}"
+
+
+class AsyncApiError(Exception):
+    """HTTP error of a request sent by the native transport."""
+
+    def __init__(self, status_code, message, headers=None):
+        super(AsyncApiError, self).__init__("HTTP {0}: {1}".format(status_code, message))
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class AsyncDnacClient(object):
+    """
+    asyncio transport of a DNACSDK client, for modules waiting on many requests at once.
+
+    It reuses the base URL, the authentication, the rate limiter and the task waiter of
+    the SDK client. With aiohttp installed, arequest() and wait_tasks() send the requests
+    natively, so thousands of them may be in flight from one process for the cost of a
+    coroutine each, over at most 'connection_limit' sockets. Without aiohttp, or when the
+    control node caps the concurrency of the API families, the requests are sent by the
+    SDK session in a bounded thread pool instead.
+
+    _aexec() always runs DNACSDK._exec() in the thread pool, the SDK functions are blocking.
+
+    Coroutines are run with the run() sync facade, or inside 'async with client:'.
+    """
+
+    def __init__(self, dnac, max_in_flight=DEFAULT_MAX_IN_FLIGHT, executor_workers=DEFAULT_CALL_WORKERS,
+                 connection_limit=DEFAULT_CONNECTION_LIMIT, use_aiohttp=None):
+        """
+        Parameters:
+            dnac (DNACSDK) - The client whose session, rate limiter and task waiter are used.
+            max_in_flight (int) - Requests running at the same time.
+            executor_workers (int) - Threads running the blocking SDK calls.
+            connection_limit (int) - Sockets opened by the native transport.
+            use_aiohttp (bool) - Use the native transport, defaults to whether aiohttp is installed.
+        """
+
+        self.dnac = dnac
+        self.rest_session = dnac.api._session
+        self.rate_limiter = dnac.rate_limiter
+        self.task_waiter = dnac.task_waiter
+        self.max_in_flight = max(1, int(max_in_flight or DEFAULT_MAX_IN_FLIGHT))
+        self.executor_workers = max(1, int(executor_workers or DEFAULT_CALL_WORKERS))
+        self.connection_limit = max(1, int(connection_limit or DEFAULT_CONNECTION_LIMIT))
+        budget = self.rate_limiter.budget
+        self.use_aiohttp = (HAS_AIOHTTP if use_aiohttp is None else bool(use_aiohttp) and HAS_AIOHTTP) and not (
+            budget is not None and budget.family_concurrency)
+        self.executor = None
+        self.session = None
+        self.semaphore = None
+        self.in_flight = 0
+        self.stats = {"requests": 0, "peak_in_flight": 0, "native": self.use_aiohttp}
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def open(self):
+        # The semaphore and the session belong to the running event loop
+        self.semaphore = asyncio.Semaphore(self.max_in_flight)
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.executor_workers)
+        # Authenticates once, in a thread, when the SDK client did not do it yet. Otherwise the
+        # first concurrent requests would all log in
+        await self.run_blocking(lambda: self.rest_session.access_token)
+        if self.use_aiohttp and self.session is None:
+            connector = aiohttp.TCPConnector(limit=self.connection_limit, ssl=self.get_ssl_context())
+            self.session = aiohttp.ClientSession(connector=connector)
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    def get_ssl_context(self):
+        verify = self.rest_session.verify
+        if verify is False:
+            return False
+        if isinstance(verify, str):
+            return ssl.create_default_context(cafile=verify)
+        return None
+
+    def run(self, coroutine):
+        """Run 'coroutine' to completion in a new event loop and return its result, the sync facade."""
+
+        async def run_open():
+            async with self:
+                return await coroutine
+
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(run_open())
+        finally:
+            loop.close()
+
+    async def run_blocking(self, func):
+        return await asyncio.get_event_loop().run_in_executor(self.executor, func)
+
+    async def _aexec(self, family, function, params=None, op_modifies=False):
+        """Run DNACSDK._exec() without blocking the event loop and return its response."""
+
+        async with self.semaphore:
+            return await self.run_blocking(partial(
+                self.dnac._exec, family=family, function=function, params=params, op_modifies=op_modifies))
+
+    async def amap_exec(self, calls, op_modifies=False):
+        """
+        Run (family, function, params) calls concurrently, see DnacBase.map_exec().
+
+        Returns:
+            list - A CallResult per call, in the order of 'calls'.
+        """
+
+        responses = await asyncio.gather(
+            *[self._aexec(call[0], call[1], call[2] if len(call) > 2 else None, op_modifies) for call in calls],
+            return_exceptions=True
+        )
+        return [CallResult(None, response) if isinstance(response, Exception) else CallResult(response, None)
+                for response in responses]
+
+    async def acquire(self, family=None):
+        """Wait for a token of the rate limiter without blocking the event loop."""
+
+        wait = max(bucket.reserve() for bucket in self.rate_limiter.get_buckets(family))
+        if self.rate_limiter.budget is not None:
+            wait = max(wait, self.rate_limiter.budget.reserve())
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def arequest(self, method, path, params=None, json=None, family=None):
+        """
+        Send a request to an API path of the controller and return the decoded JSON response.
+
+        Parameters:
+            method (str) - HTTP method, e.g. 'GET'.
+            path (str) - API path, e.g. '/dna/intent/api/v1/task/<id>'.
+            params (dict) - Query parameters.
+            json (dict) - JSON body.
+            family (str) - API family of the request for the rate limiter.
+        """
+
+        async with self.semaphore:
+            self.in_flight += 1
+            self.stats["requests"] += 1
+            self.stats["peak_in_flight"] = max(self.stats["peak_in_flight"], self.in_flight)
+            try:
+                if not self.use_aiohttp:
+                    send = partial(getattr(self.rest_session, method.lower()), path, params=params)
+                    if json is not None:
+                        send = partial(send, json=json)
+                    return await self.run_blocking(
+                        lambda: self.rate_limiter.call(send, family, log=self.dnac.logger.warning))
+                return await self.send_native(method, path, params, json, family)
+            finally:
+                self.in_flight -= 1
+
+    async def send_native(self, method, path, params, json, family):
+        url = self.rest_session.abs_url(path)
+        params = dict((key, value) for key, value in (params or {}).items() if value is not None)
+        attempt = 0
+        refreshed = False
+        while True:
+            await self.acquire(family)
+            async with self.session.request(method, url, params=params, json=json,
+                                            headers=self.rest_session.headers) as response:
+                if response.status == 401 and not refreshed:
+                    refreshed = True
+                    await self.run_blocking(self.rest_session.refresh_token)
+                    continue
+
+                if response.status in RETRY_STATUS_CODES and attempt < self.rate_limiter.max_retries:
+                    attempt += 1
+                    self.rate_limiter.record_retry()
+                    pause = self.rate_limiter.throttle(family, parse_retry_after(response.headers.get("Retry-After")))
+                    self.dnac.logger.warning("Request of the '%s' family rejected with HTTP %s, retry %s/%s in %.1fs",
+                                             family, response.status, attempt, self.rate_limiter.max_retries, pause)
+                    continue
+
+                if response.status >= 400:
+                    raise AsyncApiError(response.status, await response.text(), response.headers)
+
+                self.rate_limiter.success(family)
+                if response.content_length == 0:
+                    return None
+                return await response.json(content_type=None)
+
+    async def get_task(self, task_id):
+        response = await self.arequest("GET", TASK_PATH.format(task_id), family="task")
+        return (response or {}).get("response")
+
+    async def wait_task(self, task_id, is_success, is_failure=None, timeout=None, poll_task=None):
+        """
+        Poll a task until it finishes, backing off like the task waiter of the SDK client.
+
+        Returns:
+            WaitResult - Status is one of 'success', 'failed' or 'timeout'.
+        """
+
+        waiter = self.task_waiter
+        poll_task = poll_task or self.get_task
+        timeout = waiter.timeout if timeout is None else timeout
+        start_time = waiter.clock()
+        deadline = start_time + timeout
+        polls = 0
+        status = WAIT_TIMEOUT
+        while True:
+            value = await poll_task(task_id)
+            polls += 1
+            if is_failure is not None and is_failure(value):
+                status = WAIT_FAILED
+                break
+            if is_success(value):
+                status = WAIT_SUCCESS
+                break
+
+            remaining = deadline - waiter.clock()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(waiter.next_delay(polls - 1), remaining))
+
+        waiter.record(task_id, polls)
+        return WaitResult(task_id, status, value, polls, waiter.clock() - start_time)
+
+    async def wait_tasks(self, task_ids, is_success, is_failure=None, timeout=None, poll_task=None):
+        """
+        Wait for many tasks at once, every task is polled by its own coroutine.
+
+        Parameters:
+            task_ids (dict) - Maps a caller chosen key (device IP, batch index, ...) to a task ID.
+            is_success (callable) - Receives the task details, True when the task succeeded.
+            is_failure (callable) - Receives the task details, True when the task failed.
+            timeout (int) - Seconds to wait for every task, defaults to the task waiter timeout.
+            poll_task (coroutine function) - Receives a task ID and returns its details, defaults to get_task().
+
+        Returns:
+            dict - Maps each key of 'task_ids' to its WaitResult.
+        """
+
+        keys = list(task_ids)
+        results = await asyncio.gather(
+            *[self.wait_task(task_ids[key], is_success, is_failure, timeout, poll_task) for key in keys]
+        )
+        return dict(zip(keys, results))
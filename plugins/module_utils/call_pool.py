@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2024, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# Stays below the connection pool of the shared session, see session_registry
+DEFAULT_CALL_WORKERS = 8
+
+
+class CallResult(namedtuple("CallResult", ["response", "error"])):
+    """Outcome of one call of map_calls(), 'error' holds the exception raised by a failed call."""
+
+    __slots__ = ()
+
+    @property
+    def failed(self):
+        return self.error is not None
+
+
+def run_call(send, call):
+    try:
+        return CallResult(send(*call), None)
+    except Exception as e:
+        return CallResult(None, e)
+
+
+def map_calls(send, calls, max_workers=DEFAULT_CALL_WORKERS):
+    """
+    Run independent calls on a bounded thread pool.
+
+    A failed call does not stop the others, its exception is returned in its CallResult.
+
+    Parameters:
+        send (callable) - Called with the items of a call as positional arguments.
+        calls (list) - Tuples of arguments, one per call.
+        max_workers (int) - Number of calls running at the same time.
+
+    Returns:
+        list - A CallResult per call, in the order of 'calls'.
+    """
+
+    calls = [tuple(call) for call in calls]
+    workers = min(max(1, int(max_workers or DEFAULT_CALL_WORKERS)), len(calls))
+    if workers <= 1:
+        return [run_call(send, call) for call in calls]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda call: run_call(send, call), calls))
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2024, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import hashlib
+import json
+
+# Mixed in the hashes of the sequences, so [x] and x do not collide
+SEQUENCE_SEED = 0x5eb
+# Values hashed as they are, without a recursive call
+SCALAR_TYPES = frozenset([str, int, float, bool, type(None)])
+
+
+def canonical_hash(value):
+    """
+    Hash of a JSON-like value, equal values give equal hashes.
+
+    Dicts and sets hash the same whatever the order of their items, lists and tuples
+    depend on their order. Like any hash, different values may collide, the elements
+    with the same hash are compared with '==' before being considered equal.
+
+    Raises:
+        TypeError - The value holds an object that is neither a container nor hashable.
+    """
+
+    value_type = type(value)
+    if value_type is dict or (value_type not in SCALAR_TYPES and isinstance(value, dict)):
+        return hash(frozenset([
+            (key, item if type(item) in SCALAR_TYPES else canonical_hash(item)) for key, item in value.items()
+        ]))
+    if value_type is list or value_type is tuple or (value_type not in SCALAR_TYPES and isinstance(value, (list, tuple))):
+        return hash((SEQUENCE_SEED,) + tuple([
+            item if type(item) in SCALAR_TYPES else canonical_hash(item) for item in value
+        ]))
+    if isinstance(value, (set, frozenset)):
+        return hash(frozenset([item if type(item) in SCALAR_TYPES else canonical_hash(item) for item in value]))
+    return hash(value)
+
+
+def _multiset_equal_slow(list1, list2):
+    # Elements without a hash are matched one by one, in O(n^2)
+    remaining = list(list2)
+    for elem in list1:
+        for index, other in enumerate(remaining):
+            if elem == other:
+                del remaining[index]
+                break
+        else:
+            return False
+    return not remaining
+
+
+def multiset_equal(list1, list2):
+    """
+    Tell whether two lists hold the same elements the same number of times, in any order.
+
+    The elements of 'list1' are grouped by canonical hash, every element of 'list2' is
+    matched with '==' against its group only, in O(n) for lists of any size.
+    """
+
+    if len(list1) != len(list2):
+        return False
+    try:
+        groups = {}
+        for elem in list1:
+            groups.setdefault(canonical_hash(elem), []).append(elem)
+        for elem in list2:
+            group = groups.get(canonical_hash(elem))
+            if not group:
+                return False
+            for index, other in enumerate(group):
+                if other == elem:
+                    del group[index]
+                    break
+            else:
+                return False
+    except TypeError:
+        return _multiset_equal_slow(list1, list2)
+    return True
+
+
+def canonical_digest(value):
+    """
+    SHA-256 of the canonical JSON of a value, dict keys in any order give the same digest.
+
+    Unlike canonical_hash(), which relies on hash() and changes with every process, the
+    digest can be stored and compared by the next run.
+    """
+
+    data = json.dumps(value, sort_keys=True, separators=(",", ":"), default=repr)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
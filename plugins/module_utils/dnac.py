@@ -6,20 +6,74 @@
 
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
-try:
-    from cryptography.fernet import Fernet
-    HAS_FERNET = True
-except ImportError:
-    HAS_FERNET = False
-try:
-    from dnacentersdk import api, exceptions
-except ImportError:
-    DNAC_SDK_IS_INSTALLED = False
-else:
-    DNAC_SDK_IS_INSTALLED = True
+from ansible_collections.cisco.dnac.plugins.module_utils.lazy_import import (
+    LazyModule,
+    is_importable,
+)
 from ansible.module_utils._text import to_native
 from ansible.module_utils.common import validation
+from ansible_collections.cisco.dnac.plugins.module_utils.async_client import (
+    AsyncDnacClient,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.call_pool import (
+    DEFAULT_CALL_WORKERS,
+    map_calls,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.api_metrics import (
+    ApiMetrics,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.canonical import (
+    canonical_digest,
+    multiset_equal,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.download import (
+    DownloadError,
+    download_to_file,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.fingerprint_store import (
+    FingerprintStore,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.log_sink import (
+    TEXT_DATE_FORMAT,
+    TEXT_FORMAT,
+    JsonFormatter,
+    attach_log_sink,
+    create_file_handler,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.pagination import (
+    DEFAULT_PAGE_WORKERS,
+    paginate,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.rate_limiter import (
+    DEFAULT_MAX_RETRIES,
+    get_rate_limiter,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.request_memo import (
+    RequestMemo,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.spans import (
+    SPAN_KIND_CLIENT,
+    Tracer,
+    null_span,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.task_status import (
+    BatchedTaskStatus,
+    is_task_error,
+    is_task_finished,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.task_waiter import (
+    TaskWaiter,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.token_cache import (
+    attach_token_cache,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.upload import (
+    HAS_REQUESTS_TOOLBELT,
+    close_multipart_fields,
+    get_multipart_data,
+)
 from abc import ABCMeta, abstractmethod
+from contextlib import ExitStack, contextmanager
 try:
     import logging
     import ipaddress
@@ -27,15 +81,53 @@ except ImportError:
     LOGGING_IN_STANDARD = False
 else:
     LOGGING_IN_STANDARD = True
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import os.path
 import copy
 import json
 # import datetime
-import inspect
 import re
 import socket
+import sys
+import threading
 import time
 
+LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Imported on first use, the SDK is only needed once an API is called
+HAS_FERNET = is_importable("cryptography.fernet")
+cryptography_fernet = LazyModule("cryptography.fernet")
+DNAC_SDK_IS_INSTALLED = is_importable("dnacentersdk")
+api = LazyModule("dnacentersdk.api")
+exceptions = LazyModule("dnacentersdk.exceptions")
+
+
+class Deferred(object):
+    """
+    Argument of DnacBase.log() computed only when the message is logged.
+
+    Example:
+        self.log("Desired State (want): {0}", "INFO", Deferred(self.pprint, self.want))
+    """
+
+    __slots__ = ("func", "args")
+
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = args
+
+    def __format__(self, format_spec):
+        return format(self.func(*self.args), format_spec)
+
+    def __str__(self):
+        return str(self.func(*self.args))
+
 
 class DnacBase():
 
@@ -72,8 +164,19 @@ class DnacBase():
                                         'rendered': self.verify_diff_rendered,
                                         'parsed': self.verify_diff_parsed
                                         }
+        self.phase = None
+        self.tracer = None
+        if self.params.get("dnac_timings"):
+            self.tracer = Tracer(self.params.get("dnac_timings_file"), {"ansible.module": getattr(module, "_name", None)})
+            self.dnac.tracer = self.tracer
         self.dnac_log = dnac_params.get("dnac_log")
+        if self.tracer is not None or (self.dnac_log and dnac_params.get("dnac_log_format") == "json"):
+            self.track_phases()
         self.max_timeout = self.params.get('dnac_api_task_timeout')
+        self.task_waiter = TaskWaiter(
+            max_delay=self.params.get('dnac_task_poll_interval'),
+            timeout=self.max_timeout,
+        )
 
         if self.dnac_log and not DnacBase.__is_log_init:
             self.dnac_log_level = dnac_params.get("dnac_log_level") or 'WARNING'
@@ -86,14 +189,41 @@ class DnacBase():
             self.logger = logging.getLogger('logger')
             DnacBase.__is_log_init = True
             self.log('Logging configured and initiated', "DEBUG")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.dnac.call_log = self.log_api_call
         else:
             # If dnac_log is False, return an empty logger
             self.logger = logging.getLogger('empty_logger')
             self.logger.addHandler(logging.NullHandler())
 
-        self.log('Cisco Catalyst Center parameters: {0}'.format(dnac_params), "DEBUG")
+        self.log('Cisco Catalyst Center parameters: {0}', "DEBUG", dnac_params)
         self.supported_states = ["merged", "deleted", "replaced", "overridden", "gathered", "rendered", "parsed"]
         self.result = {"changed": False, "diff": [], "response": [], "warnings": []}
+        # The SDK wrapper may be built without these helpers, e.g. when its __init__ is patched out
+        rate_limiter = getattr(self.dnac, "rate_limiter", None)
+        if rate_limiter is not None and (self.params.get("dnac_rate_limit") or rate_limiter.budget is not None):
+            self.result["rate_limit"] = rate_limiter.state
+        memo = getattr(self.dnac, "memo", None)
+        if memo is not None:
+            self.result["read_cache"] = memo.stats
+        metrics = getattr(self.dnac, "metrics", None)
+        if metrics is not None:
+            self.result["api_metrics"] = metrics.summary
+            # The latencies are computed once, when the module exits with its result
+            for name in ("exit_json", "fail_json"):
+                if hasattr(module, name):
+                    setattr(module, name, metrics.summarized(getattr(module, name)))
+        if self.tracer is not None:
+            self.result["timings"] = []
+        self.fingerprints = None
+        if self.params.get("dnac_fingerprint_store"):
+            self.fingerprints = FingerprintStore(
+                self.params.get("dnac_fingerprint_store"),
+                "{0}@{1}:{2}".format(getattr(module, "_name", None), self.params.get("dnac_host"), self.params.get("dnac_port")),
+            )
+        self.fingerprint = None
+        self.applied_fingerprints = []
+        self.fingerprint_markers = {}
 
     @abstractmethod
     def validate_input(self):
@@ -184,14 +314,23 @@ class DnacBase():
         level = level_mapping.get(self.dnac_log_level, logging.WARNING)
 
         logger = logging.getLogger(logger_name)
-        # formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(module)s: %(funcName)s: %(lineno)d --- %(message)s', datefmt='%m-%d-%Y %H:%M:%S')
-        formatter = logging.Formatter('%(asctime)s %(levelname)s %(message)s', datefmt='%m-%d-%Y %H:%M:%S')
-
-        file_handler = logging.FileHandler(self.dnac_log_file_path, mode=self.dnac_log_mode)
-        file_handler.setFormatter(formatter)
+        if self.params.get("dnac_log_format") == "json":
+            formatter = JsonFormatter(getattr(self.module, "_name", None))
+        else:
+            # formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(module)s: %(funcName)s: %(lineno)d --- %(message)s', datefmt='%m-%d-%Y %H:%M:%S')
+            formatter = logging.Formatter(TEXT_FORMAT, datefmt=TEXT_DATE_FORMAT)
+
+        file_handler = create_file_handler(
+            self.dnac_log_file_path,
+            mode=self.dnac_log_mode,
+            max_bytes=self.params.get("dnac_log_max_bytes"),
+            backup_count=self.params.get("dnac_log_backup_count") or 0,
+            compress=self.params.get("dnac_log_compress"),
+        )
 
         logger.setLevel(level)
-        logger.addHandler(file_handler)
+        # The file is written by a background thread
+        attach_log_sink(logger, file_handler, formatter)
 
     def validate_dnac_log_level(self):
         """Validates if the logging level is string and of expected value"""
@@ -211,31 +350,47 @@ class DnacBase():
         if not os.path.exists(log_directory):
             raise FileNotFoundError("The directory for log file '{0}' does not exist.".format(dnac_log_file_path))
 
-    def log(self, message, level="WARNING", frameIncrement=0):
+    def log(self, message, level="WARNING", *args, frameIncrement=0, **fields):
         """Logs formatted messages with specified log level and incrementing the call stack frame
         Args:
             self (obj, required): An instance of the DnacBase Class.
-            message (str, required): The log message to be recorded.
+            message (str, required): The log message to be recorded, a format string when args are given.
             level (str, optional): The log level, default is "info".
                                    The log level can be one of 'DEBUG', 'INFO', 'WARNING', 'ERROR', or 'CRITICAL'.
+            args (optional): The arguments of message.format(), only formatted when the level is logged.
+                             Use Deferred for an argument that is costly to compute, e.g. a pretty-printed response.
+            fields (optional): Fields of the JSON logs, e.g. family, function and latency of an API call.
+        Example:
+            self.log("Received API response from 'get_device_list': {0}", "DEBUG", response)
         """
 
-        if self.dnac_log:
-            # of.write("---- %s ---- %s@%s ---- %s \n" % (d, info.lineno, info.function, msg))
-            # message = "Module: " + self.__class__.__name__ + ", " + message
-            class_name = self.__class__.__name__
-            callerframerecord = inspect.stack()[1 + frameIncrement]
-            frame = callerframerecord[0]
-            info = inspect.getframeinfo(frame)
-            log_message = " %s: %s: %s: %s \n" % (class_name, info.function, info.lineno, message)
-            log_method = getattr(self.logger, level.lower())
-            log_method(log_message)
+        if not self.dnac_log:
+            return
+        level_number = LOG_LEVELS.get(level.upper(), logging.WARNING)
+        if not self.logger.isEnabledFor(level_number):
+            return
+
+        # The caller is found without inspect.stack(), which reads the source of the whole stack
+        frame = sys._getframe(1 + frameIncrement)
+        if args:
+            message = message.format(*args)
+        extra = {
+            "dnac_class": self.__class__.__name__,
+            "dnac_caller": frame.f_code.co_name,
+            "dnac_line": frame.f_lineno,
+            "dnac_message": message,
+            "dnac_phase": self.phase,
+        }
+        for key, value in fields.items():
+            extra["dnac_" + key] = value
+        self.logger.log(level_number, " %s: %s: %s: %s \n", self.__class__.__name__, frame.f_code.co_name,
+                        frame.f_lineno, message, extra=extra)
 
     def check_return_status(self):
         """API to check the return status value and exit/fail the module"""
 
         # self.log("status: {0}, msg:{1}".format(self.status, self.msg), frameIncrement=1)
-        self.log("status: {0}, msg: {1}".format(self.status, self.msg), "DEBUG")
+        self.log("status: {0}, msg: {1}", "DEBUG", self.status, self.msg)
         if "failed" in self.status:
             self.module.fail_json(msg=self.msg, response=self.result.get('response', []))
         elif "exited" in self.status:
@@ -243,6 +398,70 @@ class DnacBase():
         elif "invalid" in self.status:
             self.module.fail_json(msg=self.msg, response=self.result.get('response', []))
 
+    def span(self, name, **attributes):
+        """
+        Time a block of code as a span of the current config item when dnac_timings is true.
+
+        Parameters:
+            name (str) - Name of the span, e.g. 'get_sites'.
+            attributes (dict) - Attributes exported with the span.
+
+        Returns:
+            A context manager yielding the span, or None when the timings are not recorded.
+        """
+
+        if self.tracer is None:
+            return null_span()
+        return self.tracer.span(name, **attributes)
+
+    def track_phases(self):
+        """
+        Wrap get_want(), get_have() and the diff and verify functions of the states.
+
+        'phase' names the phase running, 'want', 'have', 'diff' or 'verify', for the JSON logs.
+        With dnac_timings, the phases are spans too: every call of get_want() made by main()
+        starts the timings of the next config item, the calls made by the phases, e.g.
+        get_have() from a verify function, are nested spans.
+        """
+
+        def timed(phase, func, **attributes):
+            def run(*args, **kwargs):
+                outer, self.phase = self.phase, phase
+                try:
+                    if self.tracer is None:
+                        return func(*args, **kwargs)
+                    if phase == "want" and not self.tracer.stack:
+                        timings = {}
+                        self.result["timings"].append(timings)
+                        self.tracer.start_trace("config", timings, index=len(self.result["timings"]) - 1)
+                    with self.tracer.span(phase, **attributes) as span:
+                        result = func(*args, **kwargs)
+                        if "failed" in str(getattr(result, "status", "")):
+                            span.error = getattr(result, "msg", None) or "failed"
+                        return result
+                finally:
+                    self.phase = outer
+            return run
+
+        for phase in ("want", "have"):
+            func = getattr(self, "get_" + phase, None)
+            if func is not None:
+                setattr(self, "get_" + phase, timed(phase, func))
+        for state, func in self.get_diff_state_apply.items():
+            self.get_diff_state_apply[state] = timed("diff", func, state=state)
+        for state, func in self.verify_diff_state_apply.items():
+            self.verify_diff_state_apply[state] = timed("verify", func, state=state)
+
+    def log_api_call(self, family, function, latency, error=None):
+        """Log an API call of DNACSDK._exec() at DEBUG level, with its latency in seconds."""
+
+        if error:
+            self.log("API call '{0}.{1}' failed in {2:.3f}s: {3}", "DEBUG", family, function, latency, error,
+                     family=family, function=function, latency=round(latency, 3))
+        else:
+            self.log("API call '{0}.{1}' returned in {2:.3f}s", "DEBUG", family, function, latency,
+                     family=family, function=function, latency=round(latency, 3))
+
     def is_valid_password(self, password):
         """
         Check if a password is valid.
@@ -301,7 +520,22 @@ class DnacBase():
                        "dnac_log": params.get("dnac_log"),
                        "dnac_log_level": params.get("dnac_log_level"),
                        "dnac_log_file_path": params.get("dnac_log_file_path"),
-                       "dnac_log_append": params.get("dnac_log_append")
+                       "dnac_log_append": params.get("dnac_log_append"),
+                       "dnac_log_max_bytes": params.get("dnac_log_max_bytes"),
+                       "dnac_log_backup_count": params.get("dnac_log_backup_count"),
+                       "dnac_log_compress": params.get("dnac_log_compress"),
+                       "dnac_log_format": params.get("dnac_log_format"),
+                       "dnac_token_cache": params.get("dnac_token_cache"),
+                       "dnac_rate_limit": params.get("dnac_rate_limit"),
+                       "dnac_rate_limit_per_family": params.get("dnac_rate_limit_per_family"),
+                       "dnac_rate_limit_retries": params.get("dnac_rate_limit_retries"),
+                       "dnac_shared_rate_limit": params.get("dnac_shared_rate_limit"),
+                       "dnac_shared_family_concurrency": params.get("dnac_shared_family_concurrency"),
+                       "dnac_memoize_reads": params.get("dnac_memoize_reads"),
+                       "dnac_metrics": params.get("dnac_metrics"),
+                       "dnac_metrics_file": params.get("dnac_metrics_file"),
+                       "dnac_api_task_timeout": params.get("dnac_api_task_timeout"),
+                       "dnac_task_poll_interval": params.get("dnac_task_poll_interval")
                        }
         return dnac_params
 
@@ -325,14 +559,46 @@ class DnacBase():
             params={"task_id": task_id}
         )
 
-        self.log('Task Details: {0}'.format(str(response)), 'DEBUG')
-        self.log("Retrieving task details by the API 'get_task_by_id' using task ID: {0}, Response: {1}".format(task_id, response), "DEBUG")
+        self.log('Task Details: {0}', 'DEBUG', response)
+        self.log("Retrieving task details by the API 'get_task_by_id' using task ID: {0}, Response: {1}", "DEBUG", task_id, response)
 
         if response and isinstance(response, dict):
             result = response.get('response')
 
         return result
 
+    def list_tasks(self, offset, limit, start_time):
+        """
+        List the tasks started after 'start_time' in Cisco Catalyst Center.
+        Args:
+            offset (int): The first record to return, numbered from 1.
+            limit (int): The number of records to return.
+            start_time (int): Epoch time in milliseconds from which the tasks are listed.
+        Returns:
+            list: The task records of the page, empty when there are none.
+        """
+
+        response = self.dnac._exec(
+            family="task",
+            function='get_tasks',
+            params={"offset": offset, "limit": limit, "start_time": start_time}
+        )
+        self.log("Received {0} task(s) from the API 'get_tasks' with offset {1}", "DEBUG", len((response or {}).get('response') or []), offset)
+
+        if response and isinstance(response, dict):
+            return response.get('response') or []
+
+        return []
+
+    def get_batched_task_status(self):
+        """
+        Build a provider resolving the details of many tasks with the task list API, see BatchedTaskStatus.
+        Returns:
+            BatchedTaskStatus: Callable receiving a list of task IDs and returning a dict of task details.
+        """
+
+        return BatchedTaskStatus(self.list_tasks, self.get_task_details, log=self.log)
+
     def get_device_details_limit(self):
         """
         Retrieves the limit for 'get_device_list' API to collect the device details..
@@ -348,6 +614,124 @@ class DnacBase():
         api_response_limit = 500
         return api_response_limit
 
+    def paginate(self, family, function, params=None, page_size=None, offset_param="offset",
+                 limit_param="limit", start=1, max_items=None, prefetch=True, op_modifies=False,
+                 count_function=None, count_params=None, max_workers=None):
+        """
+        Iterate lazily over the items returned by an offset/limit API of Cisco Catalyst Center.
+
+        Parameters:
+            self (object): An instance of a class that provides access to Cisco Catalyst Center.
+            family (str): The SDK family of the API, e.g. 'devices'.
+            function (str): The SDK function of the API, e.g. 'get_device_list'.
+            params (dict): The other parameters of the API, the same for every page.
+            page_size (int): The number of items requested per page, defaults to get_device_details_limit().
+            offset_param (str): The name of the offset parameter of the API, e.g. 'start_index'.
+            limit_param (str): The name of the limit parameter of the API, e.g. 'records_to_return'.
+            start (int): The offset of the first item.
+            max_items (int): The maximum number of items to return, None for all of them.
+            prefetch (bool): Request the next page in the background while the current one is consumed.
+            op_modifies (bool): Passed to every API call.
+            count_function (str): The SDK function returning the number of items, e.g. 'get_device_count'.
+            count_params (dict): The parameters of the count API, they must filter the items like 'params'.
+            max_workers (int): The number of pages requested at the same time once the count is known.
+        Returns:
+            generator: Yields the items of the 'response' list of every page.
+        Description:
+            The pages are requested as the items are consumed, so a caller looking for a single item stops
+            the requests as soon as it breaks out of its loop. The iteration ends on an empty or short page.
+            With a 'count_function' the pages up to the count are requested concurrently and returned in order,
+            the following pages are still requested one by one if the count was outdated.
+        """
+
+        page_size = page_size or self.get_device_details_limit()
+        total = None
+        if count_function:
+            total = self.get_total_count(family, count_function, count_params)
+        if max_workers is None:
+            max_workers = DEFAULT_PAGE_WORKERS if total is not None else 1
+
+        def fetch_page(offset, limit):
+            page_params = dict(params or {})
+            page_params[offset_param] = offset
+            page_params[limit_param] = limit
+            response = self.dnac._exec(
+                family=family,
+                function=function,
+                params=page_params,
+                op_modifies=op_modifies,
+            )
+            self.log("Received {0} item(s) from the API '{1}' with {2} {3}", "DEBUG",
+                     len((response or {}).get("response") or []), function, offset_param, offset)
+            if not isinstance(response, dict):
+                return []
+            return response.get("response") or []
+
+        return paginate(fetch_page, page_size, start, max_items, prefetch, total, max_workers)
+
+    def get_total_count(self, family, function, params=None):
+        """
+        Get the number of items reported by a count API of Cisco Catalyst Center.
+
+        Parameters:
+            self (object): An instance of a class that provides access to Cisco Catalyst Center.
+            family (str): The SDK family of the API, e.g. 'devices'.
+            function (str): The SDK function of the API, e.g. 'get_device_count'.
+            params (dict): The parameters of the API.
+        Returns:
+            int: The number of items, or None when the response does not carry a count.
+        """
+
+        response = self.dnac._exec(
+            family=family,
+            function=function,
+            params=params or {},
+        )
+        count = response.get("response") if isinstance(response, dict) else None
+        if isinstance(count, bool) or not isinstance(count, int):
+            self.log("The API '{0}' returned no usable count: {1}", "WARNING", function, response)
+            return None
+
+        self.log("The API '{0}' reported {1} item(s)", "DEBUG", function, count)
+        return count
+
+    def map_exec(self, calls, max_workers=DEFAULT_CALL_WORKERS, op_modifies=False):
+        """
+        Run independent API calls of Cisco Catalyst Center concurrently.
+
+        Parameters:
+            self (object): An instance of a class that provides access to Cisco Catalyst Center.
+            calls (list): The (family, function, params) tuples of the calls.
+            max_workers (int): The number of calls running at the same time.
+            op_modifies (bool): Passed to every API call.
+        Returns:
+            list: A CallResult(response, error) per call, in the order of 'calls'.
+        Description:
+            The calls share the session, the rate limiter and the read memo of the module, and run on a bounded
+            thread pool. A failed call does not stop the others, its exception is returned in the 'error' of its
+            result. The calls are logged from the calling thread once they are all done, in order.
+        """
+
+        def send(family, function, params=None):
+            return self.dnac._exec(
+                family=family,
+                function=function,
+                params=params,
+                op_modifies=op_modifies,
+            )
+
+        calls = [(call[0], call[1], call[2] if len(call) > 2 else None) for call in calls]
+        start_time = time.time()
+        results = map_calls(send, calls, max_workers)
+        for call, result in zip(calls, results):
+            if result.failed:
+                self.log("The API '{0}' with {1} failed: {2}", "DEBUG", call[1], call[2], result.error)
+            else:
+                self.log("Received API response from '{0}' with {1}: {2}", "DEBUG", call[1], call[2], result.response)
+
+        self.log("Ran {0} API call(s) with up to {1} worker(s) in {2:.2f} seconds", "DEBUG", len(results), max_workers, time.time() - start_time)
+        return results
+
     def check_task_response_status(self, response, validation_string, api_name, data=False):
         """
         Get the site id from the site name.
@@ -380,42 +764,183 @@ class DnacBase():
             return self
 
         task_id = response.get("taskId")
-        start_time = time.time()
-        while True:
-            end_time = time.time()
-            if (end_time - start_time) >= self.max_timeout:
-                self.msg = "Max timeout of {max_timeout} sec has reached for the task id '{task_id}'. " \
-                           .format(max_timeout=self.max_timeout, task_id=task_id) + \
-                           "Exiting the loop due to unexpected API '{api_name}' status.".format(api_name=api_name)
-                self.log(self.msg, "WARNING")
-                self.status = "failed"
-                break
 
+        def is_success(task_details):
+            progress = (task_details or {}).get("progress")
+            if not progress or validation_string not in progress.lower():
+                self.log("Progress is {0} for task ID: {1}", "DEBUG", progress, task_id)
+                return False
+            return True
+
+        wait_result = self.wait_for_task(task_id, is_success)
+        task_details = wait_result.value
+        if wait_result.timed_out:
+            self.msg = "Max timeout of {max_timeout} sec has reached for the task id '{task_id}'. " \
+                       .format(max_timeout=self.max_timeout, task_id=task_id) + \
+                       "Exiting the loop due to unexpected API '{api_name}' status.".format(api_name=api_name)
+            self.log(self.msg, "WARNING")
+            self.status = "failed"
+        elif wait_result.failed:
+            if task_details.get("failureReason"):
+                self.msg = str(task_details.get("failureReason"))
+                string_check = "check task tree"
+                if string_check in self.msg.lower():
+                    time.sleep(self.params.get('dnac_task_poll_interval'))
+                    self.msg = self.check_task_tree_response(task_id)
+            else:
+                self.msg = str(task_details.get("progress"))
+            self.status = "failed"
+        else:
+            self.result['changed'] = True
+            if data is True:
+                self.msg = task_details.get("data")
+            self.status = "success"
+
+        return self
+
+    def wait_for_task(self, task_id, is_success=None, is_failure=None, timeout=None):
+        """
+        Wait for a task to finish, polling 'get_task_by_id' with exponential backoff.
+
+        Parameters:
+            task_id (str) - The unique identifier of the task.
+            is_success (callable) - Receives the task details, True when the task succeeded.
+                                    Defaults to the task having an 'endTime'.
+            is_failure (callable) - Receives the task details, True when the task failed.
+                                    Defaults to 'isError' being True.
+            timeout (int) - Seconds to wait, defaults to 'dnac_api_task_timeout'.
+
+        Returns:
+            WaitResult - Holds the status ('success', 'failed' or 'timeout'), the last task
+                         details in 'value' and the number of polls it took.
+        """
+
+        if is_success is None:
+            def is_success(task_details):
+                return bool((task_details or {}).get("endTime"))
+
+        if is_failure is None:
+            def is_failure(task_details):
+                return (task_details or {}).get("isError") is True
+
+        def poll():
             task_details = self.get_task_details(task_id)
-            self.log('Getting task details from task ID {0}: {1}'.format(task_id, task_details), "DEBUG")
-
-            if task_details.get("isError") is True:
-                if task_details.get("failureReason"):
-                    self.msg = str(task_details.get("failureReason"))
-                    string_check = "check task tree"
-                    if string_check in self.msg.lower():
-                        time.sleep(self.params.get('dnac_task_poll_interval'))
-                        self.msg = self.check_task_tree_response(task_id)
-                else:
-                    self.msg = str(task_details.get("progress"))
-                self.status = "failed"
-                break
+            self.log('Getting task details from task ID {0}: {1}', "DEBUG", task_id, task_details)
+            return task_details
 
-            if validation_string in task_details.get("progress").lower():
-                self.result['changed'] = True
-                if data is True:
-                    self.msg = task_details.get("data")
-                self.status = "success"
-                break
+        wait_result = self.task_waiter.wait(poll, is_success, is_failure, name=task_id, timeout=timeout)
+        self.log("Task ID {0} finished with status '{1}' after {2} polls in {3:.2f} seconds", "DEBUG",
+                 task_id, wait_result.status, wait_result.polls, wait_result.elapsed)
+        return wait_result
 
-            self.log("Progress is {0} for task ID: {1}".format(task_details.get('progress'), task_id), "DEBUG")
+    def iter_task_results(self, task_ids, is_success=None, is_failure=None, timeout=None,
+                          max_workers=None, poll_task=None):
+        """
+        Wait for many tasks at once and yield each outcome as soon as the task finishes.
 
-        return self
+        Parameters:
+            task_ids (dict) - Maps a caller chosen key (device IP, batch index, ...) to a task ID.
+            is_success (callable) - Receives the task details, True when the task succeeded.
+                                    Defaults to the task having an 'endTime'.
+            is_failure (callable) - Receives the task details, True when the task failed.
+                                    Defaults to 'isError' being True.
+            timeout (int) - Seconds to wait for every task, defaults to 'dnac_api_task_timeout'.
+            max_workers (int) - When greater than 1, every task is waited on in a bounded thread
+                                pool instead of the default single round-robin loop.
+            poll_task (callable) - Receives a task ID and returns its details. By default the
+                                   outstanding tasks are resolved together through the task list
+                                   API, see get_batched_task_status().
+
+        Yields:
+            tuple - (key, WaitResult) pairs in completion order. WaitResult.value holds the
+                    last task details.
+        """
+
+        is_success = is_success or is_task_finished
+        is_failure = is_failure or is_task_error
+        self.log("Waiting for {0} task(s): {1}", "DEBUG", len(task_ids), task_ids)
+
+        if max_workers and max_workers > 1:
+            poll_task = poll_task or self.get_task_details
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(task_ids) or 1)) as executor:
+                futures = dict(
+                    (executor.submit(self.task_waiter.wait,
+                                     (lambda task_id=task_id: poll_task(task_id)),
+                                     is_success, is_failure, key, timeout), key)
+                    for key, task_id in task_ids.items()
+                )
+                for future in as_completed(futures):
+                    wait_result = future.result()
+                    self.log("Task ID {0} for '{1}' finished with status '{2}' after {3} polls", "DEBUG",
+                             task_ids[futures[future]], futures[future], wait_result.status, wait_result.polls)
+                    yield futures[future], wait_result
+            return
+
+        coalesce = 0
+        if poll_task is None:
+            # One list call resolves any number of tasks, so every task due before the
+            # longest poll interval is polled in the same round
+            coalesce = self.task_waiter.max_delay
+            batched_task_status = self.get_batched_task_status()
+
+            def poll_many(keys):
+                task_details = batched_task_status([task_ids[key] for key in keys])
+                return dict((key, task_details.get(task_ids[key])) for key in keys)
+        else:
+            def poll_many(keys):
+                return dict((key, poll_task(task_ids[key])) for key in keys)
+
+        for wait_result in self.task_waiter.wait_many(list(task_ids), poll_many, is_success, is_failure, timeout, coalesce):
+            self.log("Task ID {0} for '{1}' finished with status '{2}' after {3} polls", "DEBUG",
+                     task_ids[wait_result.name], wait_result.name, wait_result.status, wait_result.polls)
+            yield wait_result.name, wait_result
+
+    def wait_for_tasks(self, task_ids, is_success=None, is_failure=None, timeout=None,
+                       max_workers=None, poll_task=None):
+        """
+        Wait for many tasks at once, see iter_task_results().
+
+        Returns:
+            dict - Maps each key of 'task_ids' to its WaitResult.
+        """
+
+        return dict(self.iter_task_results(task_ids, is_success, is_failure, timeout, max_workers, poll_task))
+
+    def get_async_client(self, **kwargs):
+        """
+        Get an asyncio transport sharing the session, rate limiter and task waiter of the SDK client.
+
+        Parameters:
+            kwargs - Passed to AsyncDnacClient, e.g. 'max_in_flight'.
+        Returns:
+            AsyncDnacClient: Runs its coroutines with its run() method.
+        """
+
+        return AsyncDnacClient(self.dnac, **kwargs)
+
+    def wait_for_tasks_async(self, task_ids, is_success=None, is_failure=None, timeout=None, max_in_flight=None):
+        """
+        Wait for many tasks at once on the asyncio transport, every task polled by its own coroutine.
+
+        Parameters:
+            task_ids (dict) - Maps a caller chosen key (device IP, batch index, ...) to a task ID.
+            is_success (callable) - Receives the task details, defaults to the task having an 'endTime'.
+            is_failure (callable) - Receives the task details, defaults to 'isError' being True.
+            timeout (int) - Seconds to wait for every task, defaults to 'dnac_api_task_timeout'.
+            max_in_flight (int) - Task polls sent at the same time.
+
+        Returns:
+            dict - Maps each key of 'task_ids' to its WaitResult, like wait_for_tasks().
+        """
+
+        self.log("Waiting for {0} task(s) on the asyncio transport: {1}", "DEBUG", len(task_ids), task_ids)
+        client = self.get_async_client(max_in_flight=max_in_flight)
+        wait_results = client.run(client.wait_tasks(
+            task_ids, is_success or is_task_finished, is_failure or is_task_error, timeout))
+        for key, wait_result in wait_results.items():
+            self.log("Task ID {0} for '{1}' finished with status '{2}' after {3} polls", "DEBUG", task_ids[key], key, wait_result.status, wait_result.polls)
+        self.log("Task polls on the asyncio transport: {0}", "DEBUG", client.stats)
+        return wait_results
 
     def reset_values(self):
         """Reset all neccessary attributes to default values"""
@@ -423,6 +948,126 @@ class DnacBase():
         self.have.clear()
         self.want.clear()
 
+    def get_fingerprint_objects(self, config):
+        """
+        Get the objects of Cisco Catalyst Center managed by a config item, for dnac_fingerprint_store.
+
+        Parameters:
+            config (dict): A config item of the playbook.
+        Returns:
+            list: (kind, name) pairs, e.g. ('site', 'Global/USA/SJC'), or None when the item is never skipped.
+        Description:
+            Overridden by the modules supporting dnac_fingerprint_store, along with list_fingerprint_markers().
+        """
+
+        return None
+
+    def list_fingerprint_markers(self, kind):
+        """
+        Get the markers of all the objects of a kind with a bulk query, e.g. their last update time.
+
+        Parameters:
+            kind (str): A kind returned by get_fingerprint_objects().
+        Returns:
+            dict: The marker of every object by name, a marker changes whenever the object changes.
+        """
+
+        return {}
+
+    def get_fingerprint_marker(self, objects):
+        """
+        Get the marker of the objects of a config item, None when one of them does not exist.
+
+        Parameters:
+            objects (list): (kind, name) pairs returned by get_fingerprint_objects().
+        Returns:
+            str: The digest of the markers of the objects.
+        """
+
+        markers = []
+        for kind, name in objects:
+            if kind not in self.fingerprint_markers:
+                self.fingerprint_markers[kind] = self.list_fingerprint_markers(kind)
+                self.log("Listed {0} marker(s) of the '{1}' objects", "DEBUG", len(self.fingerprint_markers[kind]), kind)
+            marker = self.fingerprint_markers[kind].get(name)
+            if marker is None:
+                return None
+            markers.append(marker)
+        return canonical_digest(markers)
+
+    def skip_unchanged(self, config):
+        """
+        Tell whether a config item is left as it is, being unchanged since it was last applied.
+
+        Parameters:
+            config (dict): A config item of the playbook, before get_want() or get_have().
+        Returns:
+            bool: True when neither the item nor the objects it manages changed since the last run
+                  recorded by dnac_fingerprint_store, the item then needs no get_have() nor diff.
+        Description:
+            Only the items of the merged state are skipped. The markers of every kind of objects are
+            listed once per run. The fingerprint of an item that is not skipped is kept in 'fingerprint',
+            keep_fingerprint() records it once the item is applied.
+        """
+
+        self.fingerprint = None
+        if self.fingerprints is None or self.params.get("state") != "merged":
+            return False
+
+        objects = self.get_fingerprint_objects(config)
+        if not objects:
+            return False
+
+        item = canonical_digest(sorted(objects))
+        digest = canonical_digest(config)
+        self.fingerprint = (item, digest, objects)
+        stored = self.fingerprints.get(item)
+        if self.fingerprints.error:
+            self.log("The fingerprint store '{0}' is not usable: {1}", "WARNING", self.fingerprints.path, self.fingerprints.error)
+            self.fingerprints = None
+            return False
+        if stored is None or stored[0] != digest:
+            self.log("The config item of {0} was not applied as it is by a previous run", "DEBUG", objects)
+            return False
+        if stored[1] != self.get_fingerprint_marker(objects):
+            self.log("The objects {0} changed in Cisco Catalyst Center since the last run", "DEBUG", objects)
+            return False
+
+        self.log("Skipping the config item of {0}, unchanged since the last run", "INFO", objects)
+        self.fingerprint = None
+        return True
+
+    def keep_fingerprint(self):
+        """Record the fingerprint of the config item just applied, written by save_fingerprints()."""
+
+        if self.fingerprint is not None:
+            self.applied_fingerprints.append(self.fingerprint)
+            self.fingerprint = None
+
+    def save_fingerprints(self):
+        """
+        Write the fingerprints of the config items applied by the run to dnac_fingerprint_store.
+
+        The markers are listed again, once per kind of objects, the run having changed some of them.
+        """
+
+        if self.fingerprints is None or not self.applied_fingerprints:
+            return
+
+        self.dnac.invalidate_memo()
+        for item, digest, objects in self.applied_fingerprints:
+            for kind, name in objects:
+                self.fingerprint_markers.pop(kind, None)
+        fingerprints = [
+            (item, digest, self.get_fingerprint_marker(objects)) for item, digest, objects in self.applied_fingerprints
+        ]
+
+        self.fingerprints.save(fingerprints)
+        if self.fingerprints.error:
+            self.log("Unable to save the fingerprints in '{0}': {1}", "WARNING", self.fingerprints.path, self.fingerprints.error)
+        else:
+            self.log("Saved the fingerprints of {0} config item(s)", "INFO", len(fingerprints))
+
     def get_execution_details(self, execid):
         """
         Get the execution details of an API
@@ -434,13 +1079,13 @@ class DnacBase():
             response (dict) - Status for API execution
         """
 
-        self.log("Execution Id: {0}".format(execid), "DEBUG")
+        self.log("Execution Id: {0}", "DEBUG", execid)
         response = self.dnac._exec(
             family="task",
             function='get_business_api_execution_details',
             params={"execution_id": execid}
         )
-        self.log("Response for the current execution: {0}".format(response))
+        self.log("Response for the current execution: {0}", "WARNING", response)
         return response
 
     def check_execution_response_status(self, response, api_name):
@@ -466,28 +1111,27 @@ class DnacBase():
             return self
 
         execution_id = response.get("executionId")
-        start_time = time.time()
-        while True:
-            end_time = time.time()
-            if (end_time - start_time) >= self.max_timeout:
-                self.msg = "Max timeout of {max_timeout} sec has reached for the execution id '{execution_id}'. "\
-                           .format(max_timeout=self.max_timeout, execution_id=execution_id) + \
-                           "Exiting the loop due to unexpected API '{api_name}' status.".format(api_name=api_name)
-                self.log(self.msg, "WARNING")
-                self.status = "failed"
-                break
-
-            execution_details = self.get_execution_details(execution_id)
-            if execution_details.get("status") == "SUCCESS":
-                self.result['changed'] = True
-                self.msg = "Successfully executed"
-                self.status = "success"
-                break
-
-            if execution_details.get("bapiError"):
-                self.msg = execution_details.get("bapiError")
-                self.status = "failed"
-                break
+        wait_result = self.task_waiter.wait(
+            lambda: self.get_execution_details(execution_id),
+            is_success=lambda execution_details: execution_details.get("status") == "SUCCESS",
+            is_failure=lambda execution_details: bool(execution_details.get("bapiError")),
+            name=execution_id,
+        )
+        self.log("Execution ID {0} finished with status '{1}' after {2} polls", "DEBUG", execution_id, wait_result.status, wait_result.polls)
+
+        if wait_result.timed_out:
+            self.msg = "Max timeout of {max_timeout} sec has reached for the execution id '{execution_id}'. "\
+                       .format(max_timeout=self.max_timeout, execution_id=execution_id) + \
+                       "Exiting the loop due to unexpected API '{api_name}' status.".format(api_name=api_name)
+            self.log(self.msg, "WARNING")
+            self.status = "failed"
+        elif wait_result.failed:
+            self.msg = wait_result.value.get("bapiError")
+            self.status = "failed"
+        else:
+            self.result['changed'] = True
+            self.msg = "Successfully executed"
+            self.status = "success"
 
         return self
 
@@ -519,7 +1163,7 @@ class DnacBase():
             - This function should only be called if HAS_FERNET is True.
         """
         if HAS_FERNET:
-            return {"generate_key": Fernet.generate_key()}
+            return {"generate_key": cryptography_fernet.Fernet.generate_key()}
         else:
             error_message = "The 'cryptography' library is not installed. Please install it using 'pip install cryptography'."
             return {"error_message": error_message}
@@ -537,7 +1181,7 @@ class DnacBase():
             - The password should be encoded to bytes before encryption.
         """
         try:
-            fernet = Fernet(key)
+            fernet = cryptography_fernet.Fernet(key)
             encrypted_password = fernet.encrypt(password.encode())
             return {"encrypt_password": encrypted_password}
         except Exception as e:
@@ -556,7 +1200,7 @@ class DnacBase():
             - The encrypted password should be decoded from bytes after decryption.
         """
         try:
-            fernet = Fernet(key)
+            fernet = cryptography_fernet.Fernet(key)
             decrypted_password = fernet.decrypt(encrypted_password.encode()).decode()
             return {"decrypt_password": decrypted_password}
         except Exception as e:
@@ -578,7 +1222,7 @@ class DnacBase():
             for key, value in config.items():
                 new_key = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', key).lower()
                 if new_key != key:
-                    self.log("{0} will be deprecated soon. Please use {1}.".format(key, new_key), "DEBUG")
+                    self.log("{0} will be deprecated soon. Please use {1}.", "DEBUG", key, new_key)
                 new_value = self.camel_to_snake_case(value)
                 new_config[new_key] = new_value
         elif isinstance(config, list):
@@ -655,15 +1299,7 @@ class DnacBase():
             response from the API. If the timeout is reached first, the method logs a warning and returns None.
         """
 
-        events_response = None
-        start_time = time.time()
-
-        while True:
-            end_time = time.time()
-            if (end_time - start_time) >= self.max_timeout:
-                self.log("""Max timeout of {0} sec has reached for the execution id '{1}' for the event and unexpected
-                        api status so moving out of the loop.""".format(self.max_timeout, status_execution_id), "WARNING")
-                break
+        def poll():
             # Now we check the status of API Events for configuring destination and notifications
             response = self.dnac._exec(
                 family="event_management",
@@ -671,13 +1307,20 @@ class DnacBase():
                 op_modifies=True,
                 params={"execution_id": status_execution_id}
             )
-            self.log("Received API response from 'get_status_api_for_events': {0}".format(str(response)), "DEBUG")
-            if response['apiStatus'] != "IN_PROGRESS":
-                events_response = response
-                break
-            time.sleep(self.params.get('dnac_task_poll_interval'))
+            self.log("Received API response from 'get_status_api_for_events': {0}", "DEBUG", response)
+            return response
+
+        wait_result = self.task_waiter.wait(
+            poll,
+            is_success=lambda response: response['apiStatus'] != "IN_PROGRESS",
+            name=status_execution_id,
+        )
+        if wait_result.timed_out:
+            self.log("""Max timeout of {0} sec has reached for the execution id '{1}' for the event and unexpected
+                    api status so moving out of the loop.""", "WARNING", self.max_timeout, status_execution_id)
+            return None
 
-        return events_response
+        return wait_result.value
 
     def is_valid_server_address(self, server_address):
         """
@@ -726,7 +1369,7 @@ class DnacBase():
         final_file_path = os.path.join(current_working_directory, file_path)
         self.log(str(final_file_path))
         if not os.path.exists(final_file_path):
-            self.log("The specified path '{0}' is not valid. Please provide a valid path.".format(final_file_path), "ERROR")
+            self.log("The specified path '{0}' is not valid. Please provide a valid path.", "ERROR", final_file_path)
             return False
 
         return True
@@ -748,7 +1391,7 @@ class DnacBase():
                 return True
 
         except (ValueError, FileNotFoundError):
-            self.log("The provided file '{0}' is not in JSON format".format(file_path), "CRITICAL")
+            self.log("The provided file '{0}' is not in JSON format", "CRITICAL", file_path)
             return False
 
     def check_task_tree_response(self, task_id):
@@ -767,8 +1410,8 @@ class DnacBase():
             function='get_task_tree',
             params={"task_id": task_id}
         )
-        self.log("Retrieving task tree details by the API 'get_task_tree' using task ID: {task_id}, Response: {response}"
-                 .format(task_id=task_id, response=response), "DEBUG")
+        self.log("Retrieving task tree details by the API 'get_task_tree' using task ID: {0}, Response: {1}",
+                 "DEBUG", task_id, response)
         error_msg = ""
         if response and isinstance(response, dict):
             result = response.get('response')
@@ -783,14 +1426,6 @@ class DnacBase():
         return error_msg
 
 
-def is_list_complex(x):
-    return isinstance(x[0], dict) or isinstance(x[0], list)
-
-
-def has_diff_elem(ls1, ls2):
-    return any((elem not in ls1 for elem in ls2))
-
-
 def compare_list(list1, list2):
     len_list1 = len(list1)
     len_list2 = len(list2)
@@ -804,17 +1439,9 @@ def compare_list(list1, list2):
     if attempt_std_cmp:
         return True
 
-    if not is_list_complex(list1) and not is_list_complex(list2):
-        return set(list1) == set(list2)
-
-    # Compare normally if it exceeds expected size * 2 (len_list1==len_list2)
-    MAX_SIZE_CMP = 100
-    # Fail fast if elem not in list, thanks to any and generators
-    if len_list1 > MAX_SIZE_CMP:
-        return attempt_std_cmp
-    else:
-        # not changes 'has diff elem' to list1 != list2 ':lists are not equal'
-        return not (has_diff_elem(list1, list2)) or not (has_diff_elem(list2, list1))
+    # The order of the elements does not matter, their number does, the lists are
+    # compared as multisets of the canonical forms of their elements in O(n)
+    return multiset_equal(list1, list2)
 
 
 def fn_comp_key(k, dict1, dict2):
@@ -871,6 +1498,17 @@ def dnac_argument_spec():
         dnac_verify=dict(type="bool", default=True),
         dnac_version=dict(type="str", default="2.2.3.3"),
         dnac_debug=dict(type="bool", default=False),
+        dnac_token_cache=dict(type="bool", default=False),
+        dnac_rate_limit=dict(type="float", default=0),
+        dnac_rate_limit_per_family=dict(type="bool", default=False),
+        dnac_rate_limit_retries=dict(type="int", default=DEFAULT_MAX_RETRIES),
+        dnac_shared_rate_limit=dict(type="float", default=0),
+        dnac_shared_family_concurrency=dict(type="int", default=0),
+        dnac_memoize_reads=dict(type="bool", default=False),
+        dnac_metrics=dict(type="bool", default=False),
+        dnac_metrics_file=dict(type="str"),
+        dnac_timings=dict(type="bool", default=False),
+        dnac_timings_file=dict(type="str"),
         validate_response_schema=dict(type="bool", default=True),
     )
     return argument_spec
@@ -1116,22 +1754,73 @@ class DNACSDK(object):
         self.result = dict(changed=False, result="")
         self.validate_response_schema = params.get("validate_response_schema")
         self.logger = logging.getLogger('dnacentersdk')
+        self.task_waiter = TaskWaiter(
+            max_delay=params.get("dnac_task_poll_interval"),
+            timeout=params.get("dnac_api_task_timeout"),
+        )
         if DNAC_SDK_IS_INSTALLED:
-            self.api = api.DNACenterAPI(
-                username=params.get("dnac_username"),
-                password=params.get("dnac_password"),
-                base_url="https://{dnac_host}:{dnac_port}".format(
-                    dnac_host=params.get("dnac_host"), dnac_port=params.get("dnac_port")
-                ),
-                version=params.get("dnac_version"),
-                verify=params.get("dnac_verify"),
-                debug=params.get("dnac_debug"),
+            base_url = "https://{dnac_host}:{dnac_port}".format(
+                dnac_host=params.get("dnac_host"), dnac_port=params.get("dnac_port")
+            )
+            self.rate_limiter = get_rate_limiter(
+                base_url,
+                rate=params.get("dnac_rate_limit"),
+                per_family=params.get("dnac_rate_limit_per_family"),
+                max_retries=params.get("dnac_rate_limit_retries"),
+                shared_rate=params.get("dnac_shared_rate_limit"),
+                family_concurrency=params.get("dnac_shared_family_concurrency"),
             )
+            self.base_url = base_url
+            self.params = params
+            self._api = None
+            self._api_lock = threading.Lock()
+            self.memo = RequestMemo() if params.get("dnac_memoize_reads") else None
+            self.metrics = ApiMetrics(params.get("dnac_metrics_file")) if params.get("dnac_metrics") else None
+            # Set by DnacBase when dnac_timings is true, and when the API calls are logged
+            self.tracer = None
+            self.call_log = None
             if params.get("dnac_debug") and LOGGING_IN_STANDARD:
                 self.logger.addHandler(logging.StreamHandler())
         else:
             self.fail_json(msg="DNA Center Python SDK is not installed. Execute 'pip install dnacentersdk'")
 
+    @property
+    def api(self):
+        """
+        The DNACenterAPI client, built by the first API call.
+
+        Building it imports the SDK, creates every API family object and logs in, which
+        the rendered or parsed states and the tasks failing their validation never need.
+        """
+
+        if self._api is None:
+            with self._api_lock:
+                # Concurrent first calls, e.g. from map_exec(), share the same client
+                if self._api is None:
+                    self._api = self.create_api()
+        return self._api
+
+    def create_api(self):
+        params = self.params
+        # Rejected requests are retried by the rate limiter instead of the SDK
+        dnac_api = api.DNACenterAPI(
+            username=params.get("dnac_username"),
+            password=params.get("dnac_password"),
+            base_url=self.base_url,
+            version=params.get("dnac_version"),
+            verify=params.get("dnac_verify"),
+            debug=params.get("dnac_debug"),
+            wait_on_rate_limit=False,
+        )
+        if params.get("dnac_token_cache"):
+            attach_token_cache(dnac_api, params)
+        if HAS_REQUESTS_TOOLBELT:
+            # Uploads are streamed in large chunks and their throughput is logged
+            dnac_api._session.multipart_data = get_multipart_data(log=self.logger.info)
+        if self.metrics is not None:
+            dnac_api._session._req_session.hooks["response"].append(self.metrics.response_hook)
+        return dnac_api
+
     def changed(self):
         self.result["changed"] = True
 
@@ -1168,57 +1857,154 @@ class DNACSDK(object):
     def extract_file_name(self, file_path):
         return os.path.basename(file_path)
 
-    def _exec(self, family, function, params=None, op_modifies=False, **kwargs):
+    def invalidate_memo(self):
+        """Forget the memoized reads, the next reads are sent to Cisco Catalyst Center."""
+
+        if self.memo is not None:
+            self.memo.invalidate()
+
+    def download(self, path, dest, params=None, headers=None, checksum=None, family=None):
+        """
+        Stream the body of an API path to a file instead of keeping it in memory.
+
+        Parameters:
+            path (str) - API path, e.g. '/dna/intent/api/v1/file/<id>'.
+            dest (str) - Path of the file, or directory where the file named by the server is written.
+            checksum (str) - Expected checksum formatted as '<algorithm>:<checksum>'.
+            family (str) - API family of the request for the rate limiter.
+
+        Returns:
+            dict - 'path', 'filename', 'dirpath', 'size', 'checksum', 'content_type' and 'changed' of the file,
+                   'changed' is False when 'dest' already had this content.
+        """
+
+        try:
+            return self.rate_limiter.call(
+                lambda: download_to_file(self.api._session, path, dest, params, headers, checksum),
+                family, log=self.log_retry,
+            )
+        except (exceptions.dnacentersdkException, DownloadError, EnvironmentError) as e:
+            self.fail_json(
+                msg=(
+                    "An error occured when downloading '{path}'."
+                    " The error was: {error}"
+                ).format(path=path, error=to_native(e))
+            )
+
+    def rewind_multipart_fields(self, params):
+        # A retried upload has to send the files from the start again
+        for field in (params.get("multipart_fields") or {}).values():
+            if isinstance(field, tuple) and len(field) > 1 and hasattr(field[1], "seek"):
+                field[1].seek(0)
+
+    def log_retry(self, message):
+        if self.metrics is not None:
+            self.metrics.count_retry()
+        self.logger.warning(message)
+
+    @contextmanager
+    def logged_call(self, family, function):
+        start = time.time()
+        error = None
+        try:
+            yield
+        except Exception as e:
+            error = to_native(e)
+            raise
+        finally:
+            self.call_log(family, function, time.time() - start, error)
+
+    def _exec(self, family, function, params=None, op_modifies=False, memoize=True, **kwargs):
+        if self.metrics is None and self.tracer is None and self.call_log is None:
+            return self._exec_call(family, function, params, op_modifies, memoize, **kwargs)
+        with ExitStack() as stack:
+            if self.call_log is not None:
+                stack.enter_context(self.logged_call(family, function))
+            if self.metrics is not None:
+                stack.enter_context(self.metrics.call(family, function))
+            if self.tracer is not None:
+                stack.enter_context(self.tracer.span(
+                    "{0}.{1}".format(family, function), kind=SPAN_KIND_CLIENT, family=family, function=function))
+            return self._exec_call(family, function, params, op_modifies, memoize, **kwargs)
+
+    def _exec_call(self, family, function, params=None, op_modifies=False, memoize=True, **kwargs):
         family_name = family
-        function_name = function
         try:
             family = getattr(self.api, family)
             func = getattr(family, function)
         except Exception as e:
             self.fail_json(msg=e)
 
-        try:
-            if params:
-                file_paths_params = kwargs.get('file_paths', [])
-                # This substitution is for the import file operation
-                if file_paths_params and isinstance(file_paths_params, list):
-                    multipart_fields = {}
-                    for (key, value) in file_paths_params:
-                        if isinstance(params.get(key), str) and self.is_file(params[key]):
-                            file_name = self.extract_file_name(params[key])
-                            file_path = params[key]
-                            multipart_fields[value] = (file_name, open(file_path, 'rb'))
+        if params:
+            file_paths_params = kwargs.get('file_paths', [])
+            # This substitution is for the import file operation
+            if file_paths_params and isinstance(file_paths_params, list):
+                multipart_fields = {}
+                for (key, value) in file_paths_params:
+                    if isinstance(params.get(key), str) and self.is_file(params[key]):
+                        file_name = self.extract_file_name(params[key])
+                        file_path = params[key]
+                        multipart_fields[value] = (file_name, open(file_path, 'rb'))
 
-                    params.setdefault("multipart_fields", multipart_fields)
-                    params.setdefault("multipart_monitor_callback", None)
+                params.setdefault("multipart_fields", multipart_fields)
+                params.setdefault("multipart_monitor_callback", None)
 
-                if not self.validate_response_schema and op_modifies:
-                    params["active_validation"] = False
+            if not self.validate_response_schema and op_modifies:
+                params["active_validation"] = False
 
-                response = func(**params)
+        def send():
+            if params:
+                self.rewind_multipart_fields(params)
+                return func(**params)
+            return func()
 
-            else:
-                response = func()
+        attempt = 0
+        try:
+            while True:
+                if self.memo is not None and memoize:
+                    response = self.memo.call(
+                        family_name, function, params,
+                        lambda: self.rate_limiter.call(send, family_name, log=self.log_retry),
+                        op_modifies,
+                    )
+                else:
+                    response = self.rate_limiter.call(send, family_name, log=self.log_retry)
+
+                if not (response and isinstance(response, dict) and response.get("executionId")):
+                    break
 
-            if response and isinstance(response, dict) and response.get("executionId"):
                 execution_id = response.get("executionId")
                 exec_details_params = {"execution_id": execution_id}
                 exec_details_func = getattr(
                     getattr(self.api, "task"), "get_business_api_execution_details"
                 )
 
-                while True:
-                    execution_details = exec_details_func(**exec_details_params)
-                    if execution_details.get("status") == "SUCCESS":
-                        break
-
-                    bapi_error = execution_details.get("bapiError")
-                    if bapi_error and RATE_LIMIT_MESSAGE in bapi_error:
-                        self.logger.warning("!!!!! %s !!!!!", RATE_LIMIT_MESSAGE)
-                        time.sleep(RATE_LIMIT_RETRY_AFTER)
-                        return self._exec(
-                            family_name, function_name, params, op_modifies, **kwargs
-                        )
+                wait_result = self.task_waiter.wait(
+                    lambda: self.rate_limiter.call(
+                        lambda: exec_details_func(**exec_details_params), "task", log=self.log_retry
+                    ),
+                    is_success=lambda execution_details: execution_details.get("status") == "SUCCESS",
+                    is_failure=lambda execution_details: bool(execution_details.get("bapiError")),
+                    name=execution_id,
+                )
+
+                if self.metrics is not None:
+                    self.metrics.count_polls(wait_result.polls)
+                bapi_error = wait_result.value.get("bapiError")
+                if not (wait_result.failed and RATE_LIMIT_MESSAGE in bapi_error):
+                    break
+
+                if attempt >= self.rate_limiter.max_retries:
+                    self.fail_json(
+                        msg="{0} for '{1}' after {2} retries".format(RATE_LIMIT_MESSAGE, function, attempt)
+                    )
+                attempt += 1
+                self.rate_limiter.record_retry()
+                if self.metrics is not None:
+                    self.metrics.count_retry()
+                pause = self.rate_limiter.throttle(family_name, RATE_LIMIT_RETRY_AFTER)
+                self.logger.warning("!!!!! %s, retry %s/%s in %ss !!!!!", RATE_LIMIT_MESSAGE, attempt,
+                                    self.rate_limiter.max_retries, pause)
 
         except exceptions.dnacentersdkException as e:
             self.fail_json(
@@ -1227,6 +2013,9 @@ class DNACSDK(object):
                     " The error was: {error}"
                 ).format(error=to_native(e))
             )
+        finally:
+            # The files of an upload are closed once the call is done, retries included
+            close_multipart_fields(params)
         return response
 
     def fail_json(self, msg, **kwargs):
@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2024, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import hashlib
+import os
+import re
+import tempfile
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_CHECKSUM_ALGORITHM = "sha256"
+DEFAULT_FILENAME = "download"
+DOWNLOAD_EXPECTED_CODES = [200, 206]
+FILENAME_PATTERN = re.compile(r"""filename\*?=(?:UTF-8'')?["']?([^"';]+)""", re.IGNORECASE)
+
+
+class DownloadError(Exception):
+    """The downloaded file does not match the expected size or checksum."""
+
+
+def parse_checksum(checksum):
+    """
+    Split a checksum given as '<algorithm>:<hex digest>', e.g. 'sha256:9f86d0...'.
+
+    Returns:
+        tuple - (algorithm, digest), or (None, None) when no checksum is given.
+    """
+
+    if not checksum:
+        return None, None
+    algorithm, separator, digest = checksum.partition(":")
+    if not separator or not digest:
+        raise DownloadError("The checksum '{0}' must be formatted as '<algorithm>:<checksum>'".format(checksum))
+    algorithm = algorithm.strip().lower()
+    if algorithm not in hashlib.algorithms_available:
+        raise DownloadError("Unsupported checksum algorithm '{0}'".format(algorithm))
+    return algorithm, digest.strip().lower()
+
+
+def get_filename(headers, default=DEFAULT_FILENAME):
+    """Return the file name of the 'Content-Disposition' header, without any directory part."""
+
+    match = FILENAME_PATTERN.search((headers or {}).get("Content-Disposition") or "")
+    if not match:
+        return default
+    return os.path.basename(match.group(1).strip()) or default
+
+
+def resolve_dest(dest, filename):
+    """Append 'filename' to 'dest' when it is a directory."""
+
+    dest = os.path.expanduser(dest)
+    if dest.endswith(os.sep) or os.path.isdir(dest):
+        return os.path.join(dest, filename)
+    return dest
+
+
+def planned_download(dest):
+    """
+    Metadata of a download that check mode does not run, e.g. for get_url-like results.
+
+    Returns:
+        dict - 'path', 'filename' and 'dirpath' the file would have. When 'dest' is a directory
+               the file name is only sent by the server, 'path' and 'filename' are then None.
+    """
+
+    dest = os.path.expanduser(dest)
+    if dest.endswith(os.sep) or os.path.isdir(dest):
+        return dict(path=None, filename=None, dirpath=os.path.abspath(dest))
+    return dict(path=dest, filename=os.path.basename(dest), dirpath=os.path.dirname(os.path.abspath(dest)))
+
+
+def file_digests(path, algorithms, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Hex digests of a file for each of 'algorithms', read once in chunks."""
+
+    hashers = dict((algorithm, hashlib.new(algorithm)) for algorithm in algorithms)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            for hasher in hashers.values():
+                hasher.update(chunk)
+    return dict((algorithm, hasher.hexdigest()) for algorithm, hasher in hashers.items())
+
+
+def existing_download(dest, checksum=None):
+    """
+    Metadata of a file already downloaded to 'dest' with the expected checksum, like get_url
+    does not download again a file that matches its 'checksum'.
+
+    Returns:
+        dict - 'path', 'filename', 'dirpath', 'size', 'checksum' and 'changed' (False) of the file,
+               or None when there is no checksum, 'dest' is a directory or its content differs.
+               An invalid checksum or an unreadable file also return None, the download reports them.
+    """
+
+    dest = os.path.expanduser(dest)
+    try:
+        algorithm, digest = parse_checksum(checksum)
+        if not algorithm or dest.endswith(os.sep) or not os.path.isfile(dest):
+            return None
+        digests = file_digests(dest, set([algorithm, DEFAULT_CHECKSUM_ALGORITHM]))
+    except (DownloadError, IOError, OSError):
+        return None
+    if digests[algorithm] != digest:
+        return None
+    return dict(
+        path=dest,
+        filename=os.path.basename(dest),
+        dirpath=os.path.dirname(os.path.abspath(dest)),
+        size=os.path.getsize(dest),
+        checksum="{0}:{1}".format(DEFAULT_CHECKSUM_ALGORITHM, digests[DEFAULT_CHECKSUM_ALGORITHM]),
+        changed=False,
+    )
+
+
+def same_content(path, size, sha256):
+    """Tell whether the file 'path' exists with this size and SHA-256 digest."""
+
+    if not os.path.isfile(path) or os.path.getsize(path) != size:
+        return False
+    return file_digests(path, [DEFAULT_CHECKSUM_ALGORITHM])[DEFAULT_CHECKSUM_ALGORITHM] == sha256
+
+
+def write_chunks(chunks, dest, expected_size=None, checksum=None):
+    """
+    Write the chunks of a download to 'dest', replacing it only once the download is complete.
+
+    The chunks go to a temporary file next to 'dest', so memory use does not depend on the
+    size of the download and an interrupted or corrupted download never replaces 'dest'.
+    Neither does a download of the same size and content as 'dest'.
+
+    Parameters:
+        chunks (iterable) - The bytes of the download.
+        dest (str) - Path of the file.
+        expected_size (int) - Size announced by the server, e.g. its 'Content-Length'.
+        checksum (str) - Expected checksum formatted as '<algorithm>:<checksum>'.
+
+    Returns:
+        dict - 'path', 'size' and 'checksum' (SHA-256, formatted like the 'checksum' parameter) of the file,
+               and 'changed', False when 'dest' already had this content.
+    """
+
+    algorithm, digest = parse_checksum(checksum)
+    hashers = {DEFAULT_CHECKSUM_ALGORITHM: hashlib.new(DEFAULT_CHECKSUM_ALGORITHM)}
+    if algorithm:
+        hashers.setdefault(algorithm, hashlib.new(algorithm))
+
+    directory = os.path.dirname(os.path.abspath(dest))
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".{0}.".format(os.path.basename(dest)), suffix=".part")
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                f.write(chunk)
+                size += len(chunk)
+                for hasher in hashers.values():
+                    hasher.update(chunk)
+
+        if expected_size is not None and size != expected_size:
+            raise DownloadError("Incomplete download of '{0}': received {1} bytes out of {2}".format(dest, size, expected_size))
+        if algorithm and hashers[algorithm].hexdigest() != digest:
+            raise DownloadError("The {0} checksum of '{1}' is {2}, expected {3}".format(
+                algorithm, dest, hashers[algorithm].hexdigest(), digest))
+
+        changed = not same_content(dest, size, hashers[DEFAULT_CHECKSUM_ALGORITHM].hexdigest())
+        if changed:
+            # mkstemp() creates the file readable by the owner only, use the usual permissions instead
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temp_path, 0o666 & ~umask)
+            os.replace(temp_path, dest)
+        else:
+            os.remove(temp_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+    return dict(
+        path=dest,
+        size=size,
+        checksum="{0}:{1}".format(DEFAULT_CHECKSUM_ALGORITHM, hashers[DEFAULT_CHECKSUM_ALGORITHM].hexdigest()),
+        changed=changed,
+    )
+
+
+def save_response(response, dest, checksum=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Stream the body of a 'requests' response opened with 'stream=True' to disk.
+
+    Parameters:
+        response (requests.Response) - The response, it is closed once the body was read.
+        dest (str) - Path of the file, or directory where the file named by the server is written.
+        checksum (str) - Expected checksum formatted as '<algorithm>:<checksum>'.
+        chunk_size (int) - Bytes read and written at once.
+
+    Returns:
+        dict - 'path', 'filename', 'dirpath', 'size', 'checksum', 'content_type' and 'changed' of the file.
+    """
+
+    try:
+        headers = response.headers or {}
+        filename = get_filename(headers)
+        path = resolve_dest(dest, filename)
+        expected_size = None
+        # A compressed body is decoded while it is read, its length is not the one of the file
+        if headers.get("Content-Length") and not headers.get("Content-Encoding"):
+            expected_size = int(headers["Content-Length"])
+
+        metadata = write_chunks(response.iter_content(chunk_size=chunk_size), path, expected_size, checksum)
+    finally:
+        response.close()
+
+    metadata.update(
+        filename=os.path.basename(path),
+        dirpath=os.path.dirname(os.path.abspath(path)),
+        content_type=headers.get("Content-Type"),
+    )
+    return metadata
+
+
+def download_to_file(rest_session, path, dest, params=None, headers=None, checksum=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Download an API path of the controller to disk with the session of the SDK.
+
+    Parameters:
+        rest_session (dnacentersdk.restsession.RestSession) - The session of the SDK client.
+        path (str) - API path, e.g. '/dna/intent/api/v1/file/<id>'.
+        dest (str) - Path of the file, or directory where the file named by the server is written.
+        params (dict) - Query parameters.
+        headers (dict) - Additional headers of the request.
+        checksum (str) - Expected checksum formatted as '<algorithm>:<checksum>'.
+
+    Returns:
+        dict - The metadata of the file, see save_response().
+    """
+
+    kwargs = dict(params=params, stream=True)
+    if headers:
+        # Merged with the headers of the session, so a refreshed token is still used
+        kwargs["headers"] = dict((key, str(value)) for key, value in headers.items())
+    response = rest_session.request("GET", path, DOWNLOAD_EXPECTED_CODES, 0, **kwargs)
+    return save_response(response, dest, checksum, chunk_size)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2024, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import time
+try:
+    import sqlite3
+except ImportError:
+    HAS_SQLITE3 = False
+else:
+    HAS_SQLITE3 = True
+
+# Seconds a run waits for another one writing the same file
+LOCK_TIMEOUT = 30
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS fingerprints ("
+    " scope TEXT NOT NULL,"
+    " item TEXT NOT NULL,"
+    " digest TEXT NOT NULL,"
+    " marker TEXT NOT NULL,"
+    " updated REAL NOT NULL,"
+    " PRIMARY KEY (scope, item))"
+)
+
+
+class FingerprintStore(object):
+    """
+    Fingerprints of the config items applied by a workflow manager, in a SQLite file.
+
+    A fingerprint is the digest of the desired state of an item and the marker of the
+    objects it manages in Cisco Catalyst Center, e.g. their last update time, as they were
+    once the item was applied. The rows of a module and controller are read in a single
+    query, the first time one is needed, and written in a single transaction. The store
+    never fails the run, once an error occurred 'error' is set and the store is left alone.
+    """
+
+    def __init__(self, path, scope, clock=time.time):
+        """
+        Parameters:
+            path (str) - Path of the SQLite file, created when missing.
+            scope (str) - Module and controller the rows belong to, e.g. 'site_workflow_manager@10.0.0.1:443'.
+            clock (callable) - Returns the current time in seconds.
+        """
+
+        self.path = path
+        self.scope = scope
+        self.clock = clock
+        self.error = None if HAS_SQLITE3 else "sqlite3 is not available"
+        self._rows = None
+
+    def connect(self):
+        connection = sqlite3.connect(self.path, timeout=LOCK_TIMEOUT)
+        connection.execute(SCHEMA)
+        return connection
+
+    def load(self):
+        """
+        Returns:
+            dict - (digest, marker) of every item of the scope, empty when the store is unusable.
+        """
+
+        if self._rows is not None:
+            return self._rows
+        self._rows = {}
+        if self.error:
+            return self._rows
+        try:
+            connection = self.connect()
+            try:
+                cursor = connection.execute(
+                    "SELECT item, digest, marker FROM fingerprints WHERE scope = ?", (self.scope,))
+                self._rows = dict((item, (digest, marker)) for item, digest, marker in cursor)
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            self.error = str(e)
+        return self._rows
+
+    def get(self, item):
+        return self.load().get(item)
+
+    def save(self, fingerprints):
+        """
+        Parameters:
+            fingerprints (list) - (item, digest, marker) of the items applied, a None marker forgets the item.
+        """
+
+        if self.error or not fingerprints:
+            return
+        now = self.clock()
+        try:
+            connection = self.connect()
+            try:
+                with connection:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO fingerprints (scope, item, digest, marker, updated) VALUES (?, ?, ?, ?, ?)",
+                        [(self.scope, item, digest, marker, now) for item, digest, marker in fingerprints if marker is not None])
+                    connection.executemany(
+                        "DELETE FROM fingerprints WHERE scope = ? AND item = ?",
+                        [(self.scope, item) for item, digest, marker in fingerprints if marker is None])
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            self.error = str(e)
+            return
+        rows = self.load()
+        for item, digest, marker in fingerprints:
+            if marker is None:
+                rows.pop(item, None)
+            else:
+                rows[item] = (digest, marker)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2024, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import importlib
+
+try:
+    from importlib.util import find_spec
+except ImportError:
+    find_spec = None
+
+
+def is_importable(name):
+    """
+    Tell whether a module can be imported, without importing it when possible.
+
+    It replaces the HAS_X flags set by a try/except import for the libraries imported by LazyModule.
+    """
+
+    if find_spec is None:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            return False
+        return True
+
+    try:
+        return find_spec(name) is not None
+    except (ImportError, ValueError):
+        # The parent package of a dotted name is missing
+        return False
+
+
+class LazyModule(object):
+    """
+    Stand-in of a module, imported on the first access to one of its attributes.
+
+    Importing dnacentersdk alone takes most of the startup time of a task, although rendered
+    or parsed states and argument validation failures never call the API. A LazyModule is
+    bound to the usual name, e.g. 'api = LazyModule("dnacentersdk.api")', and the code using
+    'api.DNACenterAPI' does not change.
+    """
+
+    def __init__(self, name):
+        self._lazy_name = name
+        self._lazy_module = None
+
+    def __getattr__(self, attribute):
+        # Only called for the attributes of the module, the ones above are found first
+        if self._lazy_module is None:
+            self._lazy_module = importlib.import_module(self._lazy_name)
+        return getattr(self._lazy_module, attribute)
+
+    def __repr__(self):
+        return "<lazy module '{0}'>".format(self._lazy_name)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2024, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+import errno
+import hashlib
+import json
+import os
+import tempfile
+
+DEFAULT_STATE_DIR = os.path.join("~", ".ansible", "cisco_dnac")
+STATE_DIR_ENV = "DNAC_STATE_DIR"
+
+
+def get_state_dir(*subdirs):
+    """
+    Return (and create) a private directory used to keep local state.
+
+    Parameters:
+        subdirs (str) - Optional sub directories below the base state directory.
+
+    Returns:
+        str - Absolute path of the directory. The base directory can be moved with
+              the DNAC_STATE_DIR environment variable.
+    """
+
+    base_dir = os.environ.get(STATE_DIR_ENV) or DEFAULT_STATE_DIR
+    path = os.path.abspath(os.path.expanduser(os.path.join(base_dir, *subdirs)))
+    try:
+        os.makedirs(path, 0o700)
+    except OSError as e:
+        if e.errno != errno.EEXIST:
+            raise
+    return path
+
+
+def hash_key(*parts):
+    """Build a file system safe key out of the given parts."""
+
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class FileLock(object):
+    """
+    Advisory inter-process lock backed by 'fcntl.flock'.
+
+    When fcntl is not available the lock degrades to a no-op, every
+    process then works on its own view of the state.
+    """
+
+    def __init__(self, path, shared=False, blocking=True):
+        self.path = path
+        self.shared = shared
+        self.blocking = blocking
+        self._fd = None
+
+    def acquire(self):
+        """Acquire the lock. Returns False when a non blocking lock is already held."""
+
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        if not HAS_FCNTL:
+            return True
+
+        flags = fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+        if not self.blocking:
+            flags |= fcntl.LOCK_NB
+        try:
+            fcntl.flock(self._fd, flags)
+        except (IOError, OSError) as e:
+            os.close(self._fd)
+            self._fd = None
+            if e.errno in (errno.EAGAIN, errno.EACCES):
+                return False
+            raise
+        return True
+
+    def release(self):
+        if self._fd is None:
+            return
+        try:
+            if HAS_FCNTL:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+def read_json(path, default=None):
+    """Read a JSON document, returning 'default' when it is missing or unreadable."""
+
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return default
+
+
+def write_json_atomic(path, data):
+    """Write a JSON document with owner-only permissions, replacing 'path' atomically."""
+
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.chmod(tmp_path, 0o600)
+        os.rename(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
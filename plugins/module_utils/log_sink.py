@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2024, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import atexit
+import datetime
+import gzip
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import shutil
+
+TEXT_FORMAT = '%(asctime)s %(levelname)s %(message)s'
+TEXT_DATE_FORMAT = '%m-%d-%Y %H:%M:%S'
+# Attributes set on the records by DnacBase.log(), and the keys of the JSON lines they go to
+RECORD_FIELDS = (
+    ("dnac_class", "class"),
+    ("dnac_caller", "caller"),
+    ("dnac_line", "line"),
+    ("dnac_phase", "phase"),
+    ("dnac_family", "family"),
+    ("dnac_function", "function"),
+    ("dnac_latency", "latency"),
+)
+
+
+class JsonFormatter(logging.Formatter):
+    """Format the records as JSON lines, with the fields DnacBase sets on them."""
+
+    def __init__(self, module=None):
+        """
+        Parameters:
+            module (str) - Name of the Ansible module, added to every line.
+        """
+
+        logging.Formatter.__init__(self)
+        self.module = module
+
+    def format(self, record):
+        line = {
+            "time": datetime.datetime.fromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "module": self.module,
+            "message": getattr(record, "dnac_message", None) or record.getMessage(),
+        }
+        for attribute, key in RECORD_FIELDS:
+            value = getattr(record, attribute, None)
+            if value is not None:
+                line[key] = value
+        if record.exc_info:
+            line["exception"] = self.formatException(record.exc_info)
+        return json.dumps(line, default=str)
+
+
+def gzip_rotator(source, dest):
+    """Compress a rotated log file, the rotator of GzipRotatingFileHandler."""
+
+    with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+class GzipRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler compressing the rotated files, named like 'dnac.log.1.gz'."""
+
+    def __init__(self, filename, **kwargs):
+        logging.handlers.RotatingFileHandler.__init__(self, filename, **kwargs)
+        self.rotator = gzip_rotator
+        self.namer = lambda name: name + ".gz"
+
+
+def create_file_handler(path, mode="a", max_bytes=0, backup_count=0, compress=False):
+    """
+    Create the handler writing the log file.
+
+    Parameters:
+        path (str) - Path of the log file.
+        mode (str) - 'a' to append to the file, 'w' to truncate it first.
+        max_bytes (int) - Size from which the file is rotated, 0 disables the rotation.
+        backup_count (int) - Number of rotated files kept.
+        compress (bool) - Compress the rotated files with gzip.
+    """
+
+    if not max_bytes:
+        return logging.FileHandler(path, mode=mode)
+    if mode == "w":
+        # RotatingFileHandler always appends
+        open(path, "w").close()
+    handler_class = GzipRotatingFileHandler if compress else logging.handlers.RotatingFileHandler
+    return handler_class(path, maxBytes=max_bytes, backupCount=backup_count)
+
+
+def attach_log_sink(logger, handler, formatter):
+    """
+    Send the records of a logger to a handler run by a background thread.
+
+    The logger only puts the records in a queue, writing and rotating the file happens in
+    the thread of a QueueListener, so a large response logged at DEBUG level does not hold
+    the API calls. The thread writes the queued records when the process exits.
+
+    Returns:
+        logging.handlers.QueueListener - The started listener.
+    """
+
+    handler.setFormatter(formatter)
+    records = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(records, handler, respect_handler_level=True)
+    logger.addHandler(logging.handlers.QueueHandler(records))
+    listener.start()
+    atexit.register(stop_log_sink, listener)
+    return listener
+
+
+def stop_log_sink(listener):
+    # Stopping an already stopped listener fails
+    if listener._thread is not None:
+        listener.stop()
+    for handler in listener.handlers:
+        handler.close()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2024, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_PAGE_SIZE = 500
+DEFAULT_PAGE_WORKERS = 4
+
+
+def iter_pages(fetch_page, page_size=DEFAULT_PAGE_SIZE, start=1, max_items=None, prefetch=True,
+               total=None, max_workers=1):
+    """
+    Iterate over the pages of an offset/limit API.
+
+    The iteration stops on an empty page, on a page shorter than 'page_size', or once
+    'max_items' items were returned. With 'prefetch' the next page is requested in a
+    background thread while the caller works on the current one. Closing the generator,
+    e.g. by leaving a for loop early, stops requesting pages.
+
+    When the 'total' number of items is known, e.g. from a count API, the pages up to it
+    are requested at once by 'max_workers' threads and returned in order. The count is
+    only a hint: when the page reaching it is still full, the following pages are
+    requested as usual, so items created after the count are not lost.
+
+    Parameters:
+        fetch_page (callable) - Called as fetch_page(offset, limit), returns the list of items of the page.
+        page_size (int) - Number of items requested per page, it must not exceed the API maximum.
+        start (int) - Offset of the first item, 1 for most Cisco Catalyst Center APIs.
+        max_items (int) - Maximum number of items to return, None for all of them.
+        prefetch (bool) - Fetch the next page in the background.
+        total (int) - Number of items reported by the API, None when unknown.
+        max_workers (int) - Number of pages requested at the same time.
+
+    Yields:
+        list - The items of every page, in order.
+    """
+
+    page_size = max(1, int(page_size or DEFAULT_PAGE_SIZE))
+    workers = max(1, int(max_workers or 1))
+    bound = None if total is None else start + max(int(total), 0)
+
+    def page_limit(offset):
+        if max_items is None:
+            return page_size
+        return min(page_size, start + max_items - offset)
+
+    executor = ThreadPoolExecutor(max_workers=workers) if prefetch or workers > 1 else None
+    queue = deque()
+    state = {"next_offset": start, "fan_out": bound is not None, "past_bound": False}
+
+    def schedule():
+        # The first page is always requested, a count may be outdated
+        while True:
+            offset = state["next_offset"]
+            limit = page_limit(offset)
+            if limit <= 0 or (offset != start and bound is not None and offset >= bound and not state["past_bound"]):
+                return
+            # Past an outdated count the pages are requested one ahead, as without count
+            ahead = 1 if bound is not None and offset >= bound else workers
+            if executor is not None and state["fan_out"] and len(queue) < ahead:
+                future = executor.submit(fetch_page, offset, limit)
+            elif not queue:
+                # Requested by the caller when it needs the page
+                future = None
+            else:
+                return
+            queue.append((offset, limit, future))
+            state["next_offset"] = offset + limit
+
+    def cancel_pending():
+        while queue:
+            future = queue.popleft()[2]
+            if future is not None:
+                future.cancel()
+
+    try:
+        schedule()
+        while queue:
+            offset, limit, future = queue.popleft()
+            page = (future.result() if future is not None else fetch_page(offset, limit)) or []
+            has_more = len(page) >= limit
+            if has_more:
+                # Pages are requested ahead of the caller once the result is known to go on
+                state["fan_out"] = True
+                if bound is not None and offset + limit >= bound:
+                    state["past_bound"] = True
+                schedule()
+            else:
+                cancel_pending()
+
+            if page:
+                yield page
+            if not has_more:
+                break
+    finally:
+        cancel_pending()
+        if executor is not None:
+            # Do not wait for a page prefetched for a caller that already stopped
+            executor.shutdown(wait=False)
+
+
+def paginate(fetch_page, page_size=DEFAULT_PAGE_SIZE, start=1, max_items=None, prefetch=True,
+             total=None, max_workers=1):
+    """Iterate over the items of an offset/limit API one by one, see iter_pages()."""
+
+    for page in iter_pages(fetch_page, page_size, start, max_items, prefetch, total, max_workers):
+        for item in page:
+            yield item
@@ -0,0 +1,315 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2024, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+from collections import deque
+from email.utils import mktime_tz, parsedate_tz
+import threading
+import time
+
+from ansible_collections.cisco.dnac.plugins.module_utils.request_budget import (
+    SharedRequestBudget,
+)
+
+RETRY_STATUS_CODES = (429, 503)
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_MIN_RATE = 0.5
+DEFAULT_BACKOFF = 2
+MAX_BACKOFF = 60
+RATE_DECREASE_FACTOR = 0.5
+RATE_INCREASE_STEP = 0.2
+OBSERVED_WINDOW = 50
+
+_LIMITERS = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def parse_retry_after(value, clock=time.time):
+    """
+    Convert a 'Retry-After' header to seconds.
+
+    Parameters:
+        value (str) - Header value, either a number of seconds or an HTTP date.
+
+    Returns:
+        float - Seconds to wait, or None when the header is missing or invalid.
+    """
+
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    parsed = parsedate_tz(value)
+    if parsed is None:
+        return None
+    return max(mktime_tz(parsed) - clock(), 0.0)
+
+
+def get_status_code(exc):
+    """Return the HTTP status code carried by an SDK exception, None if there is none."""
+
+    status_code = getattr(exc, "status_code", None)
+    if status_code is None and getattr(exc, "response", None) is not None:
+        status_code = getattr(exc.response, "status_code", None)
+    return status_code
+
+
+def get_retry_after(exc):
+    """Return the 'Retry-After' of the response attached to an SDK exception, in seconds."""
+
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    return parse_retry_after(headers.get("Retry-After"))
+
+
+class TokenBucket(object):
+    """
+    Token bucket pacing the requests sent to one controller, or one API family of a controller.
+
+    Requests reserve a token and sleep until it is available, so concurrent callers are
+    served in order. 'rate' tokens are added per second up to 'burst'. A bucket without
+    rate only honours the pauses requested through throttle().
+
+    The rate adapts to the controller: throttle() halves it (starting from the observed
+    request rate when no rate was configured) and every success() adds a small step back,
+    up to the configured rate.
+    """
+
+    def __init__(self, rate=None, burst=None, min_rate=DEFAULT_MIN_RATE, clock=time.time, sleep=time.sleep):
+        self.max_rate = float(rate) if rate else None
+        self.rate = self.max_rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.clock = clock
+        self.sleep = sleep
+        self.capacity = self.get_capacity()
+        self.tokens = self.capacity
+        self.updated = clock()
+        self.blocked_until = 0.0
+        self.consecutive_throttles = 0
+        self.recent = deque(maxlen=OBSERVED_WINDOW)
+        self.stats = {"rate": self.rate, "requests": 0, "throttled": 0, "wait_time": 0.0}
+        self._lock = threading.Lock()
+
+    def get_capacity(self):
+        if self.burst:
+            return float(self.burst)
+        return max(1.0, self.rate or 1.0)
+
+    def reserve(self):
+        """Take a token and return the seconds the caller has to wait before using it."""
+
+        with self._lock:
+            now = self.clock()
+            wait = max(self.blocked_until - now, 0.0)
+            if self.rate:
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.tokens -= 1
+                if self.tokens < 0:
+                    wait = max(wait, -self.tokens / self.rate)
+            self.updated = now
+            self.recent.append(now + wait)
+            self.stats["requests"] += 1
+            self.stats["wait_time"] += wait
+            return wait
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            self.sleep(wait)
+        return wait
+
+    def observed_rate(self):
+        if len(self.recent) < 2:
+            return None
+        elapsed = self.recent[-1] - self.recent[0]
+        if elapsed <= 0:
+            return None
+        return (len(self.recent) - 1) / elapsed
+
+    def throttle(self, retry_after=None):
+        """
+        Slow down after the controller rejected a request.
+
+        Parameters:
+            retry_after (float) - Seconds requested by the controller, when it sent a 'Retry-After'.
+
+        Returns:
+            float - Seconds every request of this bucket is paused for.
+        """
+
+        with self._lock:
+            self.consecutive_throttles += 1
+            if retry_after is None:
+                retry_after = min(DEFAULT_BACKOFF ** self.consecutive_throttles, MAX_BACKOFF)
+
+            current_rate = self.rate or self.observed_rate()
+            if current_rate:
+                self.rate = max(self.min_rate, current_rate * RATE_DECREASE_FACTOR)
+                self.capacity = self.get_capacity()
+                self.tokens = min(self.tokens, 0.0)
+
+            now = self.clock()
+            self.updated = now
+            self.blocked_until = max(self.blocked_until, now + retry_after)
+            self.stats["throttled"] += 1
+            self.stats["rate"] = self.rate
+            return retry_after
+
+    def success(self):
+        with self._lock:
+            self.consecutive_throttles = 0
+            if self.rate and (self.max_rate is None or self.rate < self.max_rate):
+                self.rate += RATE_INCREASE_STEP
+                if self.max_rate is not None:
+                    self.rate = min(self.rate, self.max_rate)
+                self.stats["rate"] = self.rate
+
+
+class RateLimiter(object):
+    """
+    Client side rate limiter of a controller.
+
+    Every request takes a token from the controller bucket and, when 'per_family' is set,
+    from the bucket of its API family. Requests rejected with HTTP 429 or 503 are retried
+    in a loop, at most 'max_retries' times, after the pause given by 'Retry-After'.
+
+    An optional SharedRequestBudget extends the limits to all the processes of the control
+    node, its token is taken after the local ones and the rejections pause every process.
+    """
+
+    def __init__(self, rate=None, burst=None, per_family=False, max_retries=DEFAULT_MAX_RETRIES,
+                 budget=None, clock=time.time, sleep=time.sleep):
+        self.rate = rate
+        self.burst = burst
+        self.per_family = per_family
+        self.max_retries = DEFAULT_MAX_RETRIES if max_retries is None else max(int(max_retries), 0)
+        self.clock = clock
+        self.sleep = sleep
+        self.controller = TokenBucket(rate, burst, clock=clock, sleep=sleep)
+        self.families = {}
+        self.retries = 0
+        self.state = {"controller": self.controller.stats, "retries": 0, "families": {}}
+        self._lock = threading.Lock()
+        self.budget = None
+        if budget is not None:
+            self.set_budget(budget)
+
+    def set_budget(self, budget):
+        self.budget = budget
+        self.state["shared"] = budget.stats
+
+    def get_buckets(self, family=None):
+        buckets = [self.controller]
+        if self.per_family and family:
+            with self._lock:
+                bucket = self.families.get(family)
+                if bucket is None:
+                    bucket = TokenBucket(self.rate, self.burst, clock=self.clock, sleep=self.sleep)
+                    self.families[family] = bucket
+                    self.state["families"][family] = bucket.stats
+            buckets.append(bucket)
+        return buckets
+
+    def acquire(self, family=None):
+        """Wait until a request of 'family' may be sent, return the seconds waited."""
+
+        waited = sum(bucket.acquire() for bucket in self.get_buckets(family))
+        if self.budget is not None:
+            waited += self.budget.acquire()
+        return waited
+
+    def throttle(self, family=None, retry_after=None):
+        """Pause the requests after a rejection, return the pause in seconds."""
+
+        pause = max(bucket.throttle(retry_after) for bucket in self.get_buckets(family))
+        if self.budget is not None:
+            self.budget.throttle(pause)
+        return pause
+
+    def success(self, family=None):
+        for bucket in self.get_buckets(family):
+            bucket.success()
+
+    def record_retry(self):
+        with self._lock:
+            self.retries += 1
+            self.state["retries"] = self.retries
+
+    def call(self, func, family=None, is_retryable=None, log=None):
+        """
+        Call 'func' once a token is available, retrying it while the controller rejects it.
+
+        Parameters:
+            func (callable) - Sends the request.
+            family (str) - API family of the request.
+            is_retryable (callable) - Receives an exception, True when the request was rejected
+                                      and may be retried. Defaults to HTTP 429 and 503 errors.
+            log (callable) - Receives a message about every retry.
+
+        Returns:
+            The value returned by 'func'. The last exception is raised once 'max_retries' is reached.
+        """
+
+        is_retryable = is_retryable or (lambda exc: get_status_code(exc) in RETRY_STATUS_CODES)
+        attempt = 0
+        while True:
+            self.acquire(family)
+            try:
+                if self.budget is not None:
+                    with self.budget.slot(family):
+                        result = func()
+                else:
+                    result = func()
+            except Exception as e:
+                if not is_retryable(e) or attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                self.record_retry()
+                pause = self.throttle(family, get_retry_after(e))
+                if log:
+                    log("Request of the '{0}' family rejected with HTTP {1}, retry {2}/{3} in {4:.1f}s"
+                        .format(family, get_status_code(e), attempt, self.max_retries, pause))
+                continue
+
+            self.success(family)
+            return result
+
+
+def get_rate_limiter(base_url, rate=None, burst=None, per_family=False, max_retries=DEFAULT_MAX_RETRIES,
+                     shared_rate=None, family_concurrency=None):
+    """
+    Get the rate limiter of a controller, creating it on first use.
+
+    The SDK clients of a worker process talking to the same controller share its limiter,
+    the settings of the first client are kept.
+
+    Parameters:
+        base_url (str) - Controller URL, e.g. 'https://10.0.0.1:443'.
+        rate (float) - Requests per second, None or 0 to only honour the controller rejections.
+        burst (int) - Requests that may be sent at once, defaults to the rate.
+        per_family (bool) - Also limit every API family to 'rate'.
+        max_retries (int) - Retries of a request rejected with HTTP 429 or 503.
+        shared_rate (float) - Requests per second of all the processes of the control node together.
+        family_concurrency (int) - Requests of the same API family running at once on the control node.
+
+    Returns:
+        RateLimiter - The limiter of the controller.
+    """
+
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(base_url)
+        if limiter is None:
+            limiter = RateLimiter(rate, burst, per_family, max_retries)
+            _LIMITERS[base_url] = limiter
+        if limiter.budget is None and (shared_rate or family_concurrency):
+            limiter.set_budget(SharedRequestBudget(base_url, shared_rate, family_concurrency=family_concurrency))
+        return limiter
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2024, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+from contextlib import contextmanager
+import os
+import threading
+import time
+
+from ansible_collections.cisco.dnac.plugins.module_utils.local_state import (
+    FileLock,
+    get_state_dir,
+    hash_key,
+    read_json,
+    write_json_atomic,
+)
+
+SLOT_POLL_INITIAL = 0.05
+SLOT_POLL_MAX = 0.5
+
+
+class SharedRequestBudget(object):
+    """
+    Request budget of a controller shared by every process of the control node.
+
+    The token bucket lives in a small JSON file updated under an exclusive file lock,
+    so all the forks of a play draw from the same 'rate' requests per second. Requests
+    reserve their token in turn and sleep outside the lock until it is available.
+
+    The concurrency of every API family is capped with 'family_concurrency' slot files,
+    a request holds a lock on one of them while it runs. The locks are released by the
+    kernel when a process dies, so a killed fork never leaks a slot.
+    """
+
+    def __init__(self, key, rate=None, burst=None, family_concurrency=None, state_dir=None,
+                 clock=time.time, sleep=time.sleep):
+        """
+        Parameters:
+            key (str) - Identifies the controller, e.g. its base URL.
+            rate (float) - Requests per second of all the processes together, None for no limit.
+            burst (int) - Requests that may be sent at once, defaults to the rate.
+            family_concurrency (int) - Requests of the same API family running at once, None for no limit.
+            state_dir (str) - Directory of the state files, defaults to '~/.ansible/cisco_dnac/budget'.
+        """
+
+        self.rate = float(rate) if rate else None
+        self.capacity = float(burst) if burst else max(1.0, self.rate or 1.0)
+        self.family_concurrency = int(family_concurrency) if family_concurrency else None
+        self.state_dir = state_dir or get_state_dir("budget")
+        self.name = hash_key(key)
+        self.clock = clock
+        self.sleep = sleep
+        self.state_path = os.path.join(self.state_dir, self.name + ".json")
+        self.lock_path = os.path.join(self.state_dir, self.name + ".lock")
+        self.stats = {"rate": self.rate, "family_concurrency": self.family_concurrency,
+                      "wait_time": 0.0, "slot_wait_time": 0.0}
+        self._stats_lock = threading.Lock()
+
+    def add_stat(self, name, value):
+        with self._stats_lock:
+            self.stats[name] += value
+
+    def update_bucket(self, update):
+        """Apply 'update' to the bucket state under the file lock and return its result."""
+
+        with FileLock(self.lock_path):
+            now = self.clock()
+            state = read_json(self.state_path) or {}
+            state.setdefault("tokens", self.capacity)
+            state.setdefault("updated", now)
+            state.setdefault("blocked_until", 0.0)
+            result = update(state, now)
+            state["updated"] = now
+            write_json_atomic(self.state_path, state)
+        return result
+
+    def reserve(self):
+        """Take a token from the shared bucket and return the seconds to wait before using it."""
+
+        def take_token(state, now):
+            wait = max(state["blocked_until"] - now, 0.0)
+            if self.rate:
+                elapsed = max(now - state["updated"], 0.0)
+                state["tokens"] = min(self.capacity, state["tokens"] + elapsed * self.rate) - 1
+                if state["tokens"] < 0:
+                    wait = max(wait, -state["tokens"] / self.rate)
+            return wait
+
+        return self.update_bucket(take_token)
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            self.add_stat("wait_time", wait)
+            self.sleep(wait)
+        return wait
+
+    def throttle(self, retry_after):
+        """Pause every process for 'retry_after' seconds after the controller rejected a request."""
+
+        def block(state, now):
+            state["blocked_until"] = max(state["blocked_until"], now + retry_after)
+
+        self.update_bucket(block)
+
+    @contextmanager
+    def slot(self, family=None):
+        """Hold one of the concurrency slots of 'family' while the block runs."""
+
+        if not self.family_concurrency or not family:
+            yield
+            return
+
+        paths = [
+            os.path.join(self.state_dir, "{0}-{1}-{2}.slot".format(self.name, hash_key(family)[:16], index))
+            for index in range(self.family_concurrency)
+        ]
+        start_time = self.clock()
+        delay = SLOT_POLL_INITIAL
+        lock = None
+        while lock is None:
+            for path in paths:
+                candidate = FileLock(path, blocking=False)
+                if candidate.acquire():
+                    lock = candidate
+                    break
+            else:
+                self.sleep(delay)
+                delay = min(delay * 2, SLOT_POLL_MAX)
+
+        self.add_stat("slot_wait_time", self.clock() - start_time)
+        try:
+            yield
+        finally:
+            lock.release()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2024, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import copy
+import json
+import threading
+
+READ_PREFIXES = ("get_", "retrieve", "count")
+# Polling a task means the controller state is changing, these are never memoized
+VOLATILE_FAMILIES = ("task",)
+
+
+def is_read(family, function):
+    """Tell whether an SDK function only reads data, based on its name."""
+
+    return family not in VOLATILE_FAMILIES and function.startswith(READ_PREFIXES)
+
+
+def make_key(family, function, params):
+    """
+    Build the memoization key of a call.
+
+    Returns:
+        str - The key, or None when the parameters can not be serialized (e.g. open files).
+    """
+
+    try:
+        return json.dumps([family, function, params or {}], sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+
+
+class _InFlight(object):
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class RequestMemo(object):
+    """
+    Memoize the read calls of a run, with single-flight coalescing.
+
+    The first caller of a key runs the call, concurrent callers of the same key wait for
+    it and share its outcome. Errors are not memoized. Every call that is not a read, every
+    task poll and every call sent with op_modifies, e.g. the poll of a status API, empties
+    the memo. Callers get a deep copy of the memoized responses
+    so they may modify them freely.
+    """
+
+    def __init__(self):
+        self.responses = {}
+        self.in_flight = {}
+        self.generation = 0
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "invalidations": 0}
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        with self._lock:
+            if self.responses:
+                self.stats["invalidations"] += 1
+            self.responses.clear()
+            # Reads in flight were sent before the invalidation, they must not be memoized
+            self.generation += 1
+
+    def call(self, family, function, params, send, op_modifies=False):
+        """
+        Return the response of 'send', memoized when the call is a read.
+
+        Parameters:
+            family (str) - SDK family of the call.
+            function (str) - SDK function of the call.
+            params (dict) - Parameters of the call, part of the key.
+            send (callable) - Sends the request and returns its response.
+            op_modifies (bool) - The call reads a state that is changing, it is never memoized.
+        """
+
+        if op_modifies or not is_read(family, function):
+            self.invalidate()
+            return send()
+
+        key = make_key(family, function, params)
+        if key is None:
+            return send()
+
+        with self._lock:
+            if key in self.responses:
+                self.stats["hits"] += 1
+                return copy.deepcopy(self.responses[key])
+
+            generation = self.generation
+            flight = self.in_flight.get(key)
+            owner = flight is None
+            if owner:
+                flight = _InFlight()
+                self.in_flight[key] = flight
+                self.stats["misses"] += 1
+            else:
+                self.stats["coalesced"] += 1
+
+        if not owner:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.value)
+
+        try:
+            flight.value = send()
+        except Exception as e:
+            flight.error = e
+            raise
+        else:
+            with self._lock:
+                if generation == self.generation:
+                    self.responses[key] = flight.value
+            return copy.deepcopy(flight.value)
+        finally:
+            with self._lock:
+                self.in_flight.pop(key, None)
+            flight.event.set()
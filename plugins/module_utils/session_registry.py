@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2024, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    HAS_REQUESTS = False
+else:
+    HAS_REQUESTS = True
+import threading
+
+DEFAULT_POOL_MAXSIZE = 10
+
+_SESSIONS = {}
+_SESSIONS_LOCK = threading.Lock()
+
+if HAS_REQUESTS:
+    class SharedSession(requests.Session):
+        """Session that outlives the SDK clients it is handed to."""
+
+        def close(self):
+            # The SDK closes its session when the client is garbage collected,
+            # registered sessions are only closed by close_shared_sessions()
+            pass
+
+        def close_shared(self):
+            super(SharedSession, self).close()
+
+
+def build_session(pool_maxsize=DEFAULT_POOL_MAXSIZE, shared=False):
+    """
+    Build a keep-alive 'requests.Session' with a connection pool of 'pool_maxsize' sockets.
+
+    Parameters:
+        pool_maxsize (int) - Maximum number of connections kept open per controller.
+        shared (bool) - Build a session that ignores close() calls from its users.
+
+    Returns:
+        requests.Session - The new session, or None when requests is not installed.
+    """
+
+    if not HAS_REQUESTS:
+        return None
+
+    pool_maxsize = max(1, int(pool_maxsize or DEFAULT_POOL_MAXSIZE))
+    session = SharedSession() if shared else requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_shared_session(base_url, username=None, version=None, pool_maxsize=DEFAULT_POOL_MAXSIZE):
+    """
+    Get the long-lived session registered for a controller endpoint, creating it on first use.
+
+    The SDK keeps the access token in the session headers, so sessions are only shared
+    between clients that talk to the same endpoint with the same user and API version.
+
+    Parameters:
+        base_url (str) - Controller URL, e.g. 'https://10.0.0.1:443'.
+        username (str) - User the SDK authenticates with.
+        version (str) - Cisco Catalyst Center API version.
+        pool_maxsize (int) - Connection pool size used when the session is created.
+
+    Returns:
+        requests.Session - The shared session, or None when requests is not installed.
+    """
+
+    key = (base_url, username, version)
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(key)
+        if session is None:
+            session = build_session(pool_maxsize, shared=True)
+            if session is not None:
+                _SESSIONS[key] = session
+        return session
+
+
+def close_shared_sessions():
+    """Close every registered session and empty the registry."""
+
+    with _SESSIONS_LOCK:
+        for session in _SESSIONS.values():
+            session.close_shared()
+        _SESSIONS.clear()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2024, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import atexit
+import binascii
+from contextlib import contextmanager
+import json
+import os
+import threading
+import time
+
+SCOPE_NAME = "cisco.dnac"
+# OpenTelemetry span kinds and status codes
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+STATUS_CODE_ERROR = 2
+
+
+def new_id(size):
+    return binascii.hexlify(os.urandom(size)).decode("ascii")
+
+
+def otlp_value(value):
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def otlp_attributes(attributes):
+    return [{"key": key, "value": otlp_value(value)} for key, value in sorted(attributes.items()) if value is not None]
+
+
+@contextmanager
+def null_span():
+    """Stand-in of Tracer.span() when the spans are not recorded."""
+
+    yield None
+
+
+class Span(object):
+    """A timed operation, e.g. a phase of a config item or an API call."""
+
+    def __init__(self, name, trace_id, parent=None, kind=SPAN_KIND_INTERNAL, attributes=None, start=None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = new_id(8)
+        self.parent = parent
+        self.kind = kind
+        self.attributes = attributes or {}
+        self.start = start
+        self.end = None
+        self.error = None
+
+    @property
+    def duration(self):
+        return (self.end or self.start) - self.start
+
+    def to_otlp(self):
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent.span_id if self.parent is not None else "",
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(int(self.start * 1e9)),
+            "endTimeUnixNano": str(int((self.end or self.start) * 1e9)),
+            "attributes": otlp_attributes(self.attributes),
+        }
+        if self.error:
+            span["status"] = {"code": STATUS_CODE_ERROR, "message": self.error}
+        return span
+
+
+class Tracer(object):
+    """
+    Spans of the config items of a task, with the time spent in every phase.
+
+    A trace is started for every config item, the spans opened meanwhile become its
+    children, or the children of the span open in the same thread. The phases directly
+    under the item and the API calls are summed up in the 'timings' of the item. With
+    'path', the spans of every item are appended to that file as an OTLP/JSON line,
+    the format of the OpenTelemetry file exporter, once the next item starts or the
+    process exits.
+    """
+
+    def __init__(self, path=None, resource=None, clock=time.time):
+        """
+        Parameters:
+            path (str) - JSON-lines file receiving the spans of every config item.
+            resource (dict) - Attributes of the resource of the spans, e.g. the module name.
+            clock (callable) - Returns the current time in seconds.
+        """
+
+        self.path = path
+        self.resource = dict(resource or {})
+        self.resource.setdefault("service.name", SCOPE_NAME)
+        self.clock = clock
+        self.root = None
+        self.timings = None
+        self.spans = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        if path:
+            atexit.register(self.end_trace)
+
+    @property
+    def stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    @property
+    def current(self):
+        """The innermost span open in this thread, else the config item."""
+
+        return self.stack[-1] if self.stack else self.root
+
+    def start_trace(self, name, timings, **attributes):
+        """
+        End the trace of the previous config item and start the one of the next item.
+
+        Parameters:
+            name (str) - Name of the root span.
+            timings (dict) - Receives the seconds spent in every phase and in the API calls of the item.
+        """
+
+        self.end_trace()
+        with self._lock:
+            self.root = Span(name, new_id(16), attributes=attributes, start=self.clock())
+            self.timings = timings
+            self.spans = [self.root]
+
+    def end_trace(self):
+        with self._lock:
+            root, spans = self.root, self.spans
+            if root is None:
+                return
+            self.root, self.timings, self.spans = None, None, []
+            root.end = max([span.end for span in spans if span.end] + [root.start])
+        if self.path:
+            self.export(spans)
+
+    @contextmanager
+    def span(self, name, kind=SPAN_KIND_INTERNAL, **attributes):
+        """Time the code run inside the block as a span named 'name'."""
+
+        span = Span(name, self.root.trace_id if self.root else new_id(16), self.current, kind, attributes, self.clock())
+        self.stack.append(span)
+        try:
+            yield span
+        except Exception as e:
+            span.error = "{0}: {1}".format(type(e).__name__, e)
+            raise
+        finally:
+            self.stack.pop()
+            span.end = self.clock()
+            self.finish(span)
+
+    def finish(self, span):
+        with self._lock:
+            if span.trace_id != (self.root.trace_id if self.root else None):
+                # Outside of a config item, e.g. the validation of the input
+                return
+            self.spans.append(span)
+            timings = self.timings
+            if span.parent is self.root and span.kind == SPAN_KIND_INTERNAL:
+                timings[span.name] = round(timings.get(span.name, 0.0) + span.duration, 3)
+            if span.kind == SPAN_KIND_CLIENT:
+                timings["api"] = round(timings.get("api", 0.0) + span.duration, 3)
+                timings["api_calls"] = timings.get("api_calls", 0) + 1
+
+    def export(self, spans):
+        line = {
+            "resourceSpans": [{
+                "resource": {"attributes": otlp_attributes(self.resource)},
+                "scopeSpans": [{
+                    "scope": {"name": SCOPE_NAME},
+                    "spans": [span.to_otlp() for span in spans],
+                }],
+            }],
+        }
+        try:
+            with open(self.path, "a") as f:
+                f.write(json.dumps(line, sort_keys=True) + "\n")
+        except EnvironmentError:
+            # The spans never fail the run, the file is left incomplete
+            self.path = None
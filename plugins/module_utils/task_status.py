@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2024, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import time
+
+DEFAULT_PAGE_SIZE = 500
+DEFAULT_MAX_PAGES = 4
+DEFAULT_LOOKBACK = 300
+DEFAULT_MIN_BATCH = 2
+
+TASK_PENDING = "PENDING"
+
+
+def is_task_summary(task):
+    """
+    Tell a task summary of the '/dna/intent/api/v1/tasks' list from the detailed task records.
+
+    The detailed records returned by 'get_task_by_id' (and by the task list of older releases)
+    carry 'isError' and 'progress'. The summaries of newer releases only carry 'status'.
+    """
+
+    return "isError" not in task and "progress" not in task
+
+
+def is_task_finished(task_details):
+    """Default success check of the task waits, the task has an 'endTime'."""
+
+    return bool((task_details or {}).get("endTime"))
+
+
+def is_task_error(task_details):
+    """Default failure check of the task waits, 'isError' is True."""
+
+    return (task_details or {}).get("isError") is True
+
+
+class BatchedTaskStatus(object):
+    """
+    Resolve the status of many tasks with a few calls to the task list API.
+
+    Every call lists the tasks started since the provider was created (minus 'lookback'
+    seconds) page by page until all the requested task IDs are found. Detailed task records
+    are used as they are. Summaries of tasks still pending reuse the last known details,
+    only tasks that finished or that the list did not return are fetched one by one through
+    'get_task'. When listing fails the provider falls back to 'get_task' for good.
+    """
+
+    def __init__(self, list_tasks, get_task, page_size=DEFAULT_PAGE_SIZE, max_pages=DEFAULT_MAX_PAGES,
+                 lookback=DEFAULT_LOOKBACK, min_batch=DEFAULT_MIN_BATCH, clock=time.time, log=None):
+        """
+        Parameters:
+            list_tasks (callable) - Called as list_tasks(offset, limit, start_time) with 'start_time' in
+                                    epoch milliseconds, returns a list of task records.
+            get_task (callable) - Receives a task ID and returns its detailed record.
+            page_size (int) - Number of tasks requested per page.
+            max_pages (int) - Pages read per call before falling back to per ID lookups.
+            lookback (int) - Seconds before the creation of the provider included in the listing.
+            min_batch (int) - Below this number of task IDs the tasks are fetched one by one.
+            log (callable) - Receives a message and a log level.
+        """
+
+        self.list_tasks = list_tasks
+        self.get_task = get_task
+        self.page_size = max(1, int(page_size))
+        self.max_pages = max(1, int(max_pages))
+        self.min_batch = max(1, int(min_batch))
+        self.log = log or (lambda msg, level="DEBUG": None)
+        self.start_time = int((clock() - lookback) * 1000)
+        self.enabled = True
+        self.known = {}
+        self.list_calls = 0
+        self.single_calls = 0
+
+    def fetch_one(self, task_id):
+        self.single_calls += 1
+        details = self.get_task(task_id)
+        if details:
+            self.known[task_id] = details
+        return details
+
+    def list_wanted(self, wanted):
+        """
+        Page through the task list until every ID of 'wanted' is found or 'max_pages' pages are read.
+
+        Returns:
+            dict - Maps the task IDs of 'wanted' that were found to their task record.
+        """
+
+        found = {}
+        offset = 1
+        for dummy in range(self.max_pages):
+            page = self.list_tasks(offset, self.page_size, self.start_time) or []
+            self.list_calls += 1
+            for task in page:
+                task_id = task.get("id")
+                if task_id in wanted:
+                    found[task_id] = task
+
+            if len(found) == len(wanted) or len(page) < self.page_size:
+                break
+
+            # Overlap the pages by one record, the controller releases do not agree on
+            # whether the offset starts at 0 or 1 and a duplicate is harmless
+            offset += len(page) - 1
+
+        return found
+
+    def __call__(self, task_ids):
+        """
+        Get the details of the tasks in 'task_ids'.
+
+        Returns:
+            dict - Maps every task ID to its details, None when the task could not be retrieved.
+        """
+
+        task_ids = list(task_ids)
+        if not self.enabled or len(task_ids) < self.min_batch:
+            return dict((task_id, self.fetch_one(task_id)) for task_id in task_ids)
+
+        try:
+            found = self.list_wanted(set(task_ids))
+        except Exception as e:
+            self.enabled = False
+            self.log("Listing the tasks failed, falling back to one 'get_task_by_id' call per task: {0}"
+                     .format(str(e)), "WARNING")
+            found = {}
+
+        results = {}
+        for task_id in task_ids:
+            task = found.get(task_id)
+            if task is None:
+                results[task_id] = self.fetch_one(task_id)
+            elif not is_task_summary(task):
+                self.known[task_id] = task
+                results[task_id] = task
+            elif task.get("status") == TASK_PENDING:
+                results[task_id] = self.known.get(task_id, task)
+            else:
+                results[task_id] = self.fetch_one(task_id)
+
+        self.log("Resolved the status of {0} task(s) with {1} list call(s) and {2} single call(s) so far"
+                 .format(len(task_ids), self.list_calls, self.single_calls), "DEBUG")
+        return results
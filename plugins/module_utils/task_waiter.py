@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2024, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import random
+import threading
+import time
+
+WAIT_SUCCESS = "success"
+WAIT_FAILED = "failed"
+WAIT_TIMEOUT = "timeout"
+
+DEFAULT_INITIAL_DELAY = 0.5
+DEFAULT_MAX_DELAY = 2
+DEFAULT_MULTIPLIER = 2.0
+DEFAULT_JITTER = 0.1
+DEFAULT_TIMEOUT = 1200
+
+
+class WaitResult(object):
+    """Outcome of a single wait: final status, last polled value, poll count and elapsed seconds."""
+
+    def __init__(self, name, status, value, polls, elapsed):
+        self.name = name
+        self.status = status
+        self.value = value
+        self.polls = polls
+        self.elapsed = elapsed
+
+    @property
+    def succeeded(self):
+        return self.status == WAIT_SUCCESS
+
+    @property
+    def failed(self):
+        return self.status == WAIT_FAILED
+
+    @property
+    def timed_out(self):
+        return self.status == WAIT_TIMEOUT
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "status": self.status,
+            "polls": self.polls,
+            "elapsed": round(self.elapsed, 3),
+        }
+
+
+class TaskWaiter(object):
+    """
+    Poll an asynchronous operation until it finishes, backing off between polls.
+
+    The delay starts at 'initial_delay' and is multiplied by 'multiplier' after each
+    poll up to 'max_delay', with +/- 'jitter' (a fraction of the delay) applied so that
+    many waiters do not poll the controller in lock-step. Every wait stops after
+    'timeout' seconds. The number of polls of every wait is kept in 'poll_counts'.
+    """
+
+    def __init__(self, initial_delay=DEFAULT_INITIAL_DELAY, max_delay=DEFAULT_MAX_DELAY,
+                 multiplier=DEFAULT_MULTIPLIER, jitter=DEFAULT_JITTER, timeout=DEFAULT_TIMEOUT,
+                 sleep=time.sleep, clock=time.time):
+        self.max_delay = max(float(max_delay or DEFAULT_MAX_DELAY), 0.0)
+        self.initial_delay = min(float(initial_delay), self.max_delay)
+        self.multiplier = max(float(multiplier), 1.0)
+        self.jitter = min(max(float(jitter), 0.0), 1.0)
+        self.timeout = timeout if timeout is not None else DEFAULT_TIMEOUT
+        self.sleep = sleep
+        self.clock = clock
+        self.poll_counts = {}
+        self.total_polls = 0
+        self._lock = threading.Lock()
+
+    def next_delay(self, attempt):
+        """Return the delay to apply after poll number 'attempt' (starting at 0)."""
+
+        delay = min(self.max_delay, self.initial_delay * (self.multiplier ** attempt))
+        if self.jitter:
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        return max(delay, 0.0)
+
+    def record(self, name, polls):
+        with self._lock:
+            self.poll_counts[name] = self.poll_counts.get(name, 0) + polls
+            self.total_polls += polls
+
+    def wait(self, poll, is_success, is_failure=None, name=None, timeout=None):
+        """
+        Call 'poll' until 'is_success' or 'is_failure' holds for its result, or the deadline passes.
+
+        Parameters:
+            poll (callable) - Returns the current state of the operation.
+            is_success (callable) - Receives the polled value, True when the operation succeeded.
+            is_failure (callable) - Receives the polled value, True when the operation failed.
+            name (str) - Name of the wait used for the poll counters, e.g. the task ID.
+            timeout (int) - Overrides the waiter timeout for this wait.
+
+        Returns:
+            WaitResult - Status is one of 'success', 'failed' or 'timeout'.
+        """
+
+        timeout = self.timeout if timeout is None else timeout
+        start_time = self.clock()
+        deadline = start_time + timeout
+        polls = 0
+        value = None
+        status = WAIT_TIMEOUT
+        while True:
+            value = poll()
+            polls += 1
+            if is_failure is not None and is_failure(value):
+                status = WAIT_FAILED
+                break
+            if is_success(value):
+                status = WAIT_SUCCESS
+                break
+
+            remaining = deadline - self.clock()
+            if remaining <= 0:
+                break
+            self.sleep(min(self.next_delay(polls - 1), remaining))
+
+        self.record(name, polls)
+        return WaitResult(name, status, value, polls, self.clock() - start_time)
+
+    def wait_many(self, names, poll_many, is_success, is_failure=None, timeout=None, coalesce=0):
+        """
+        Wait for several operations in a single round-robin loop.
+
+        Every operation keeps its own backoff schedule. On each round the operations that
+        are due are polled together through 'poll_many', and the loop sleeps until the next
+        one is due. Results are yielded as soon as each operation finishes, so the whole
+        wait lasts about as long as the slowest operation.
+
+        Parameters:
+            names (iterable) - Names of the operations to wait for, e.g. task IDs.
+            poll_many (callable) - Receives the list of names that are due and returns a dict
+                                   mapping each of them to its current state.
+            is_success (callable) - Receives a polled value, True when the operation succeeded.
+            is_failure (callable) - Receives a polled value, True when the operation failed.
+            timeout (int) - Overrides the waiter timeout, it applies to every operation.
+            coalesce (float) - Operations due within this many seconds are polled together with
+                               the ones already due, useful when 'poll_many' costs the same for
+                               one or many names.
+
+        Yields:
+            WaitResult - One per operation, in the order they finish.
+        """
+
+        timeout = self.timeout if timeout is None else timeout
+        start_time = self.clock()
+        deadline = start_time + timeout
+        pending = {}
+        for name in names:
+            pending[name] = {"polls": 0, "due": start_time, "value": None}
+
+        while pending:
+            now = self.clock()
+            due = [name for name, state in pending.items() if state["due"] <= now]
+            if due and coalesce:
+                due = [name for name, state in pending.items() if state["due"] <= now + coalesce]
+            values = poll_many(due) if due else {}
+            for name in due:
+                state = pending[name]
+                state["polls"] += 1
+                state["value"] = value = values.get(name)
+                status = None
+                if is_failure is not None and is_failure(value):
+                    status = WAIT_FAILED
+                elif is_success(value):
+                    status = WAIT_SUCCESS
+
+                if status is None:
+                    state["due"] = self.clock() + self.next_delay(state["polls"] - 1)
+                    continue
+
+                del pending[name]
+                self.record(name, state["polls"])
+                yield WaitResult(name, status, value, state["polls"], self.clock() - start_time)
+
+            if not pending:
+                break
+
+            now = self.clock()
+            if now >= deadline:
+                for name, state in list(pending.items()):
+                    del pending[name]
+                    self.record(name, state["polls"])
+                    yield WaitResult(name, WAIT_TIMEOUT, state["value"], state["polls"], now - start_time)
+                break
+
+            next_due = min(state["due"] for state in pending.values())
+            if next_due > now:
+                self.sleep(min(next_due, deadline) - now)
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2024, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+from ansible_collections.cisco.dnac.plugins.module_utils.local_state import (
+    FileLock,
+    get_state_dir,
+    hash_key,
+    read_json,
+    write_json_atomic,
+)
+import base64
+import json
+import os
+import time
+
+# Cisco Catalyst Center issues tokens that are valid for one hour
+DEFAULT_TOKEN_TTL = 3600
+# Refresh a cached token this many seconds before it expires
+DEFAULT_REFRESH_MARGIN = 300
+TOKEN_CACHE_DIR_ENV = "DNAC_TOKEN_CACHE_DIR"
+
+
+def get_token_expiry(token, default_ttl=DEFAULT_TOKEN_TTL):
+    """
+    Get the expiry time of an access token.
+
+    Parameters:
+        token (str) - Access token returned by the authentication API.
+        default_ttl (int) - Lifetime assumed when the token carries no 'exp' claim.
+
+    Returns:
+        float - Epoch time after which the token must not be used.
+    """
+
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload.encode("ascii")).decode("utf-8"))
+        return float(claims["exp"])
+    except Exception:
+        return time.time() + default_ttl
+
+
+class TokenCache(object):
+    """
+    On-disk cache of access tokens, shared by every task and fork running on the control node.
+
+    Entries are keyed by controller host, port, user, version and a fingerprint of the
+    password, and stored in owner-only files. A per-entry lock makes sure only one process
+    logs in when the token is missing or about to expire, the others wait and reuse it.
+    """
+
+    def __init__(self, cache_dir=None, refresh_margin=DEFAULT_REFRESH_MARGIN, default_ttl=DEFAULT_TOKEN_TTL):
+        if cache_dir:
+            self.cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+            if not os.path.isdir(self.cache_dir):
+                os.makedirs(self.cache_dir, 0o700)
+        else:
+            self.cache_dir = get_state_dir("tokens")
+        self.refresh_margin = refresh_margin
+        self.default_ttl = default_ttl
+
+    def make_key(self, host, port, username, version, password=None):
+        return hash_key(host, port, username, version, password)
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def _lock_path(self, key):
+        return os.path.join(self.cache_dir, key + ".lock")
+
+    def _is_fresh(self, entry):
+        if not entry or not entry.get("token"):
+            return False
+        return entry.get("expires", 0) - self.refresh_margin > time.time()
+
+    def get(self, key):
+        """Return the cached token for 'key', or None when it is missing or about to expire."""
+
+        entry = read_json(self._entry_path(key))
+        if self._is_fresh(entry):
+            return entry["token"]
+        return None
+
+    def put(self, key, token):
+        """Store 'token' for 'key' together with its expiry time."""
+
+        write_json_atomic(self._entry_path(key), {
+            "token": token,
+            "expires": get_token_expiry(token, self.default_ttl),
+            "created": time.time(),
+        })
+
+    def invalidate(self, key):
+        try:
+            os.remove(self._entry_path(key))
+        except OSError:
+            pass
+
+    def get_or_fetch(self, key, fetch, stale_token=None):
+        """
+        Return a valid token for 'key', calling 'fetch' only when no usable token is cached.
+
+        Parameters:
+            key (str) - Cache key built with make_key().
+            fetch (callable) - Logs in against the controller and returns a new token.
+            stale_token (str) - Token that the caller knows is rejected by the controller,
+                                it is never returned even if it has not expired yet.
+
+        Returns:
+            str - The access token.
+        """
+
+        token = self.get(key)
+        if token and token != stale_token:
+            return token
+
+        with FileLock(self._lock_path(key)):
+            # Another process may have refreshed the token while we were waiting
+            token = self.get(key)
+            if token and token != stale_token:
+                return token
+
+            token = fetch()
+            self.put(key, token)
+            return token
+
+
+def attach_token_cache(api, params, cache=None):
+    """
+    Make a dnacentersdk API object obtain its access tokens through the shared TokenCache.
+
+    The SDK session calls its 'get_access_token' hook both for the first login and when a
+    request is answered with 401. The hook is wrapped so the first call reuses a cached token
+    and a refresh only logs in again if the rejected token is still the cached one.
+
+    Parameters:
+        api (DNACenterAPI) - SDK object whose session is wired to the cache.
+        params (dict) - Connection parameters (dnac_host, dnac_port, dnac_username, ...).
+        cache (TokenCache) - Cache to use, a default one is created when omitted.
+
+    Returns:
+        TokenCache - The cache in use, or None when the SDK session could not be wired.
+    """
+
+    session = getattr(api, "_session", None)
+    fetch = getattr(session, "_get_access_token", None)
+    if session is None or fetch is None:
+        return None
+
+    if cache is None:
+        cache = TokenCache(cache_dir=os.environ.get(TOKEN_CACHE_DIR_ENV))
+    key = cache.make_key(
+        params.get("dnac_host"),
+        params.get("dnac_port"),
+        params.get("dnac_username"),
+        params.get("dnac_version"),
+        params.get("dnac_password"),
+    )
+
+    def get_access_token():
+        return cache.get_or_fetch(key, fetch, stale_token=getattr(session, "_access_token", None))
+
+    session._get_access_token = get_access_token
+
+    # SDK releases that log in while being constructed already hold a token, share it
+    current_token = getattr(session, "_access_token", None)
+    if current_token and not cache.get(key):
+        cache.put(key, current_token)
+
+    return cache
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2024, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import hashlib
+import time
+
+from ansible_collections.cisco.dnac.plugins.module_utils.lazy_import import (
+    LazyModule,
+    is_importable,
+)
+
+# Imported by the first upload, requests_toolbelt pulls in requests
+HAS_REQUESTS_TOOLBELT = is_importable("requests_toolbelt")
+multipart_encoder = LazyModule("requests_toolbelt.multipart.encoder")
+
+DEFAULT_UPLOAD_CHUNK_SIZE = 1024 * 1024
+DEFAULT_PROGRESS_INTERVAL = 10
+MEBIBYTE = 1024 * 1024
+
+
+class MultipartUpload(object):
+    """
+    multipart/form-data body streamed from its files in fixed-size chunks.
+
+    The HTTP stack asks for small blocks (8 to 16 KiB), every read returns at least
+    'chunk_size' bytes instead, so a multi-GB image is sent with a few thousand reads of
+    the files. The progress is logged every 'progress_interval' seconds and once the
+    body was sent, with the throughput.
+
+    It can be used as the 'data' of a request, like the MultipartEncoder it wraps.
+    """
+
+    def __init__(self, fields, chunk_size=DEFAULT_UPLOAD_CHUNK_SIZE, create_callback=None, log=None,
+                 progress_interval=DEFAULT_PROGRESS_INTERVAL, on_complete=None, clock=time.time):
+        """
+        Parameters:
+            fields (dict) - The fields of the body, see MultipartEncoder.
+            chunk_size (int) - Minimum number of bytes returned by every read.
+            create_callback (callable) - Receives the upload and returns a callback called with it
+                                         after every read, like the 'multipart_monitor_callback' of the SDK.
+            log (callable) - Receives the progress messages.
+            progress_interval (float) - Seconds between two progress messages.
+            on_complete (callable) - Receives the 'stats' once the body was sent.
+        """
+
+        self.encoder = multipart_encoder.MultipartEncoder(fields=fields)
+        self.content_type = self.encoder.content_type
+        self.len = self.encoder.len
+        self.chunk_size = max(1, int(chunk_size or DEFAULT_UPLOAD_CHUNK_SIZE))
+        self.log = log
+        self.progress_interval = progress_interval
+        self.on_complete = on_complete
+        self.clock = clock
+        self.bytes_read = 0
+        self.reads = 0
+        self.start_time = None
+        self.last_report = None
+        self.completed = False
+        self.callback = create_callback(self) if create_callback is not None else None
+
+    @property
+    def stats(self):
+        elapsed = self.clock() - self.start_time if self.start_time is not None else 0.0
+        return dict(
+            size=self.len,
+            bytes_sent=self.bytes_read,
+            reads=self.reads,
+            elapsed=round(elapsed, 3),
+            throughput=round(self.bytes_read / MEBIBYTE / elapsed, 2) if elapsed > 0 else None,
+        )
+
+    def read(self, size=-1):
+        if self.start_time is None:
+            self.start_time = self.last_report = self.clock()
+
+        if size is not None and size >= 0:
+            size = max(size, self.chunk_size)
+        data = self.encoder.read(size)
+        self.bytes_read += len(data)
+        self.reads += 1
+
+        if self.callback is not None:
+            self.callback(self)
+        self.report_progress()
+        return data
+
+    def report_progress(self):
+        if self.completed:
+            return
+
+        if self.bytes_read >= self.len:
+            self.completed = True
+            stats = self.stats
+            if self.log:
+                self.log("Uploaded {0:.1f} MiB in {1:.1f}s ({2} MiB/s)".format(
+                    self.len / MEBIBYTE, stats["elapsed"], stats["throughput"]))
+            if self.on_complete:
+                self.on_complete(stats)
+            return
+
+        now = self.clock()
+        if self.log and now - self.last_report >= self.progress_interval:
+            self.last_report = now
+            stats = self.stats
+            self.log("Uploaded {0:.1f} of {1:.1f} MiB ({2:.0f}%) at {3} MiB/s".format(
+                self.bytes_read / MEBIBYTE, self.len / MEBIBYTE, 100.0 * self.bytes_read / (self.len or 1),
+                stats["throughput"]))
+
+
+def get_multipart_data(chunk_size=DEFAULT_UPLOAD_CHUNK_SIZE, log=None, on_complete=None):
+    """
+    Build a replacement of the 'multipart_data' method of the SDK session creating MultipartUpload bodies.
+
+    Parameters:
+        chunk_size (int) - Minimum number of bytes returned by every read of the bodies.
+        log (callable) - Receives the progress messages.
+        on_complete (callable) - Receives the stats of every completed upload.
+    """
+
+    def multipart_data(fields, create_callback):
+        if fields is None:
+            return None
+        return MultipartUpload(fields, chunk_size, create_callback, log=log, on_complete=on_complete)
+
+    return multipart_data
+
+
+def close_multipart_fields(params):
+    """Close the files of the 'multipart_fields' of an SDK call once it is done."""
+
+    fields = (params or {}).get("multipart_fields") or {}
+    for field in (fields.values() if isinstance(fields, dict) else (value for dummy, value in fields)):
+        if isinstance(field, tuple) and len(field) > 1 and hasattr(field[1], "close"):
+            field[1].close()
+
+
+def file_checksums(path, algorithms=("md5", "sha512"), chunk_size=DEFAULT_UPLOAD_CHUNK_SIZE):
+    """
+    Compute several checksums of a file in a single pass, reading it in fixed-size chunks.
+
+    Parameters:
+        path (str) - Path of the file.
+        algorithms (tuple) - hashlib names of the checksums.
+        chunk_size (int) - Bytes read at once, memory use does not depend on the size of the file.
+
+    Returns:
+        dict - Maps every algorithm to the hex digest of the file.
+    """
+
+    hashers = dict((algorithm, hashlib.new(algorithm)) for algorithm in algorithms)
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            for hasher in hashers.values():
+                hasher.update(chunk)
+    return dict((algorithm, hasher.hexdigest()) for algorithm, hasher in hashers.items())
@@ -792,6 +792,7 @@ import re
 import json
 from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
+    Deferred,
     validate_list_of_dicts,
     validate_str,
     get_dict_result,
@@ -954,7 +955,7 @@ class Accesspoint(DnacBase):
                     want[key] = value
 
         self.want = want
-        self.log("Desired State (want): {0}".format(self.pprint(self.want)), "INFO")
+        self.log("Desired State (want): {0}", "INFO", Deferred(self.pprint, self.want))
         return self
 
     def get_have(self, input_config):
@@ -979,8 +980,7 @@ class Accesspoint(DnacBase):
         current_ap_config = None
         (ap_exists, current_ap_config) = self.get_current_config(input_config)
 
-        self.log("Current AP config details (have): {0}".format(self.pprint(
-            current_ap_config)), "DEBUG")
+        self.log("Current AP config details (have): {0}", "DEBUG", Deferred(self.pprint, current_ap_config))
         have = {}
 
         if ap_exists:
@@ -1000,7 +1000,7 @@ class Accesspoint(DnacBase):
             have["site_id"] = self.payload["current_site"]["site_id"]
 
         self.have = have
-        self.log("Current State (have): {0}".format(self.pprint(self.have)), "INFO")
+        self.log("Current State (have): {0}", "INFO", Deferred(self.pprint, self.have))
         return self
 
     def get_diff_merged(self, ap_config):
@@ -1074,10 +1074,9 @@ class Accesspoint(DnacBase):
             self.result["response"] = responses
             return self
 
-        self.log('Final AP Configuration data to update {0}'.format(self.pprint(
-            consolidated_data)), "INFO")
+        self.log('Final AP Configuration data to update {0}', "INFO", Deferred(self.pprint, consolidated_data))
         task_response = self.update_ap_configuration(consolidated_data)
-        self.log("Access Point update response: {0} .".format(task_response), "INFO")
+        self.log("Access Point update response: {0} .", "INFO", task_response)
 
         if task_response and isinstance(task_response, dict):
             resync_retry_count = self.payload.get("dnac_api_task_timeout")
@@ -1085,7 +1084,7 @@ class Accesspoint(DnacBase):
             while resync_retry_count:
                 task_details_response = self.get_task_details(
                     task_response["response"]["taskId"])
-                self.log("Status of the task: {0} .".format(self.status), "INFO")
+                self.log("Status of the task: {0} .", "INFO", self.status)
 
                 if task_details_response.get("endTime") is not None:
                     if task_details_response.get("isError") is True:
@@ -1093,16 +1092,14 @@ class Accesspoint(DnacBase):
                         self.status = "failed"
                         self.msg = "Unable to get success response, hence AP config not updated"
                         self.log(self.msg, "ERROR")
-                        self.log("Task Details: {0} .".format(self.pprint(
-                            task_details_response)), "ERROR")
+                        self.log("Task Details: {0} .", "ERROR", Deferred(self.pprint, task_details_response))
                         responses["accesspoints_updates"] = {
                             "ap_update_config_task_details": task_details_response,
                             "ap_config_update_status": self.msg}
                         self.module.fail_json(msg=self.msg, response=responses)
                     else:
                         self.result['changed'] = True
-                        self.log("Task Details: {0} .".format(self.pprint(
-                            task_details_response)), "INFO")
+                        self.log("Task Details: {0} .", "INFO", Deferred(self.pprint, task_details_response))
                         self.msg = "AP Configuration - {0} updated Successfully"\
                             .format(self.have["current_ap_config"].get("ap_name"))
                         self.log(self.msg, "INFO")
@@ -1139,8 +1136,8 @@ class Accesspoint(DnacBase):
         """
 
         self.get_have(config)
-        self.log("Current AP Config (have): {0}".format(str(self.have)), "INFO")
-        self.log("Desired AP Config (want): {0}".format(str(self.want)), "INFO")
+        self.log("Current AP Config (have): {0}", "INFO", self.have)
+        self.log("Desired AP Config (want): {0}", "INFO", self.want)
 
         ap_exists = self.have.get("ap_exists")
         ap_name = self.have.get("current_ap_config").get("ap_name")
@@ -1173,7 +1170,7 @@ class Accesspoint(DnacBase):
                 if each_key not in ("macAddress", "radioConfigurations", "isAssignedSiteAsLocation"):
                     unmatch_count += 1
 
-        self.log("Unmatch count for the radio configuration : {0}".format(str(unmatch_count)), "INFO")
+        self.log("Unmatch count for the radio configuration : {0}", "INFO", unmatch_count)
         self.log(str(require_update), "INFO")
         responses = {}
         responses["accesspoints_verify"] = {}
@@ -1234,10 +1231,10 @@ class Accesspoint(DnacBase):
             for further action or validation.
         """
         invalid_series = []
-        self.log("Starting validation of radio series with configuration: {0}".format(str(ap_config)), "INFO")
+        self.log("Starting validation of radio series with configuration: {0}", "INFO", ap_config)
         for radio_type in self.radio_interface:
             ap_series = ap_config.get(radio_type)
-            self.log('Validating radio type: {0}'.format(radio_type), "INFO")
+            self.log('Validating radio type: {0}', "INFO", radio_type)
             if ap_series is not None:
                 for series in self.allowed_series[radio_type]:
                     pattern = r'\b{}\w+'.format(re.escape(series))
@@ -1253,10 +1250,10 @@ class Accesspoint(DnacBase):
                             radio_type,
                             str(self.allowed_series[radio_type])
                         )
-                        self.log("Invalid series detected: {}".format(invalid_entry), "DEBUG")
+                        self.log("Invalid series detected: {}", "DEBUG", invalid_entry)
                         invalid_series.append(invalid_entry)
 
-        self.log("Completed validation. Invalid series: {}".format(invalid_series), "INFO")
+        self.log("Completed validation. Invalid series: {}", "INFO", invalid_series)
         return invalid_series
 
     def validate_ap_config_parameters(self, ap_config):
@@ -1546,8 +1543,8 @@ class Accesspoint(DnacBase):
                    (radio_band == "5 GHz" and slot_id == 2):
                     break
 
-        self.log('Completed checking radio role assignments. Role assignment: {0}, radio type: {1}, radio band: {2}'
-                 .format(role_assignment, radio_type, radio_band), "INFO")
+        self.log('Completed checking radio role assignments. Role assignment: {0}, radio type: {1}, radio band: {2}', "INFO",
+                 role_assignment, radio_type, radio_band)
         return role_assignment
 
     def get_accesspoint_details(self, input_config):
@@ -1658,15 +1655,14 @@ class Accesspoint(DnacBase):
             management IP address, or hostname. If found, it retrieves the current
             Access Point configuration and returns it.
         """
-        self.log("Starting to retrieve current configuration with input: {0}".format(str(input_config)), "INFO")
+        self.log("Starting to retrieve current configuration with input: {0}", "INFO", input_config)
         accesspoint_exists, current_configuration = self.get_accesspoint_details(
             input_config)
-        self.log("Access point exists: {0}, Current configuration: {1}"
-                 .format(accesspoint_exists, current_configuration), "INFO")
+        self.log("Access point exists: {0}, Current configuration: {1}", "INFO", accesspoint_exists, current_configuration)
 
         if input_config.get("site"):
             site_exists, current_site = self.site_exists(input_config)
-            self.log('Site exists: {0}, Current site: {1}'.format(site_exists, current_site), "INFO")
+            self.log('Site exists: {0}, Current site: {1}', "INFO", site_exists, current_site)
 
             if site_exists:
                 self.payload.update({
@@ -1678,22 +1674,21 @@ class Accesspoint(DnacBase):
                 provision_status, wlc_details = self.verify_ap_provision(
                     current_configuration["associated_wlc_ip"])
                 self.payload["wlc_provision_status"] = provision_status
-                self.log("WLC provision status: {0}".format(provision_status), "INFO")
+                self.log("WLC provision status: {0}", "INFO", provision_status)
 
         if accesspoint_exists:
             self.payload["access_point_details"] = current_configuration
             ap_ethernet_mac_address = current_configuration["ap_ethernet_mac_address"]
             ap_config_exists, current_configuration = self.get_accesspoint_config(
                 ap_ethernet_mac_address)
-            self.log("Access point configuration exists: {0}, Current configuration: {1}"
-                     .format(ap_config_exists, str(current_configuration)), "INFO")
+            self.log("Access point configuration exists: {0}, Current configuration: {1}", "INFO", ap_config_exists, current_configuration)
 
             if ap_config_exists:
                 self.payload["access_point_config"] = current_configuration
-                self.log("Updated payload with access point configuration: {0}".format(str(self.payload)), "INFO")
+                self.log("Updated payload with access point configuration: {0}", "INFO", self.payload)
 
-        self.log('Completed retrieving current configuration. Access point exists: {0}, Current configuration: {1}'
-                 .format(accesspoint_exists, current_configuration), "INFO")
+        self.log('Completed retrieving current configuration. Access point exists: {0}, Current configuration: {1}', "INFO",
+                 accesspoint_exists, current_configuration)
         return (accesspoint_exists, current_configuration)
 
     def get_accesspoint_config(self, ap_ethernet_mac_address):
@@ -1737,11 +1732,11 @@ class Accesspoint(DnacBase):
             if ap_config_response:
                 self.keymap = self.map_config_key_to_api_param(self.keymap, ap_config_response)
                 current_configuration = self.camel_to_snake_case(ap_config_response)
-                self.log("Received API response from 'get_access_point_configuration': {0}".format(self.pprint(current_configuration)), "INFO")
+                self.log("Received API response from 'get_access_point_configuration': {0}", "INFO", Deferred(self.pprint, current_configuration))
                 accesspoint_config_exists = True
 
         except Exception as e:
-            self.log("Unable to get the Accesspoint configuration for '{0}'.".format(str(input_param) + str(e)), "WARNING")
+            self.log("Unable to get the Accesspoint configuration for '{0}'.", "WARNING", str(input_param) + str(e))
 
         return (accesspoint_config_exists, current_configuration)
 
@@ -1784,7 +1779,7 @@ class Accesspoint(DnacBase):
                 )
                 if response.get("response"):
                     site = response["response"][0]
-                    self.log("Site response: {0}".format(self.pprint(site)), "INFO")
+                    self.log("Site response: {0}", "INFO", Deferred(self.pprint, site))
                     location = get_dict_result(site.get("additionalInfo"), 'nameSpace', "Location")
                     type_info = location.get("attributes", {}).get("type")
 
@@ -1803,8 +1798,8 @@ class Accesspoint(DnacBase):
                         "site_id": site.get("id"),
                         "site_name": site_info["floor"]["parentName"] + "/" + site_info["floor"]["name"]
                     }
-                    self.log('Current site details: {0}'.format(str(current_site)), "INFO")
-                    self.log("Site '{0}' exists in Cisco Catalyst Center".format(site.get("name")), "INFO")
+                    self.log('Current site details: {0}', "INFO", current_site)
+                    self.log("Site '{0}' exists in Cisco Catalyst Center", "INFO", site.get("name"))
                     site_exists = True
             except Exception as e:
                 msg = "The provided site name '{0}' is either invalid or not present in the \
@@ -1870,7 +1865,7 @@ class Accesspoint(DnacBase):
 
         except Exception as e:
             self.log("Failed to execute the get_membership function '{}'\
-                      Error: {}".format(site_id, str(e)), "ERROR")
+                      Error: {}", "ERROR", site_id, e)
             return False
 
     def verify_ap_provision(self, wlc_ip_address):
@@ -1903,8 +1898,7 @@ class Accesspoint(DnacBase):
                 params={"device_management_ip_address": device_management_ip_address}
             )
             if response and response.get("status") == "success":
-                self.log('Response from get_device_info: {0}'.format(self.pprint(response)),
-                         "INFO")
+                self.log('Response from get_device_info: {0}', "INFO", Deferred(self.pprint, response))
                 self.log("WLC already provisioned.", "INFO")
                 provision_status = "success"
                 provision_details = self.pprint(response)
@@ -1956,7 +1950,7 @@ class Accesspoint(DnacBase):
                 "type": type_name,
                 "siteNameHierarchy": site_name_hierarchy
             }]
-            self.log('Current device details: {0}'.format(self.pprint(provision_params)), "INFO")
+            self.log('Current device details: {0}', "INFO", Deferred(self.pprint, provision_params))
 
             response = self.dnac._exec(
                 family="wireless",
@@ -1965,7 +1959,7 @@ class Accesspoint(DnacBase):
                 params={"payload": provision_params},
             )
 
-            self.log('Response from ap_provision: {0}'.format(str(response)), "INFO")
+            self.log('Response from ap_provision: {0}', "INFO", response)
             if response and isinstance(response, dict):
                 executionid = response.get("executionId")
                 resync_retry_count = self.payload.get("dnac_api_task_timeout", 100)
@@ -1987,8 +1981,7 @@ class Accesspoint(DnacBase):
                     time.sleep(resync_retry_interval)
                     resync_retry_count = resync_retry_count - 1
 
-            self.log("Provisioned device with host '{0}' to site '{1}' successfully.".format(
-                host_name, site_name_hierarchy), "INFO")
+            self.log("Provisioned device with host '{0}' to site '{1}' successfully.", "INFO", host_name, site_name_hierarchy)
         except Exception as e:
             error_msg = 'An error occurred during device provisioning: {0}'.format(str(e))
             self.log(error_msg, "ERROR")
@@ -2015,8 +2008,8 @@ class Accesspoint(DnacBase):
             are found, they are collected and returned in a dictionary.
         """
         self.log("Starting radio configuration comparison.", "INFO")
-        self.log("Current radio configuration: {}".format(current_radio), "INFO")
-        self.log("Desired radio configuration: {}".format(want_radio), "INFO")
+        self.log("Current radio configuration: {}", "INFO", current_radio)
+        self.log("Desired radio configuration: {}", "INFO", want_radio)
         available_key = {
             "_0": ("admin_status", "antenna_gain", "antenna_name", "radio_role_assignment",
                    "power_assignment_mode", "powerlevel", "channel_assignment_mode",
@@ -2042,33 +2035,32 @@ class Accesspoint(DnacBase):
         unmatch_count = 0
         dtos_keys = list(want_radio.keys())
         slot_id_key = "_" + str(current_radio["slot_id"])
-        self.log('Comparing keys for slot ID: {}'.format(current_radio["slot_id"]), "INFO")
+        self.log('Comparing keys for slot ID: {}', "INFO", current_radio["slot_id"])
 
         for dto_key in dtos_keys:
             if dto_key in available_key[slot_id_key]:
                 if dto_key == "antenna_name":
                     temp_dtos[dto_key] = want_radio[dto_key]
                     unmatch_count = unmatch_count + 1
-                    self.log("Antenna name unmatched: {0}".format(want_radio[dto_key]), "INFO")
+                    self.log("Antenna name unmatched: {0}", "INFO", want_radio[dto_key])
                 elif dto_key == "cable_loss":
                     temp_dtos[dto_key] = want_radio[dto_key]
-                    self.log("Cable loss set to: {0}".format(want_radio[dto_key]), "INFO")
+                    self.log("Cable loss set to: {0}", "INFO", want_radio[dto_key])
                 elif dto_key == "antenna_cable_name":
                     temp_dtos[dto_key] = want_radio[dto_key]
-                    self.log("Antenna cable name set to: {0}".format(want_radio[dto_key]), "INFO")
+                    self.log("Antenna cable name set to: {0}", "INFO", want_radio[dto_key])
                 elif dto_key == "radio_type":
                     temp_dtos["radioType"] = want_radio[dto_key]
-                    self.log("Radio type set to: {0}".format(want_radio[dto_key]), "INFO")
+                    self.log("Radio type set to: {0}", "INFO", want_radio[dto_key])
                 else:
                     if want_radio[dto_key] != current_radio[dto_key]:
                         temp_dtos[self.keymap[dto_key]] = want_radio[dto_key]
                         unmatch_count = unmatch_count + 1
-                        self.log("Unmatched key {0}: current value {1}, desired value {2}"
-                                 .format(dto_key, current_radio[dto_key], want_radio[dto_key]), "INFO")
+                        self.log("Unmatched key {0}: current value {1}, desired value {2}", "INFO", dto_key, current_radio[dto_key], want_radio[dto_key])
 
         temp_dtos["unmatch"] = unmatch_count
-        self.log('Total unmatched keys: {0}'.format(unmatch_count), "INFO")
-        self.log('Completed radio configuration comparison. Result: {0}'.format(temp_dtos), "INFO")
+        self.log('Total unmatched keys: {0}', "INFO", unmatch_count)
+        self.log('Completed radio configuration comparison. Result: {0}', "INFO", temp_dtos)
         return temp_dtos
 
     def config_diff(self, current_ap_config):
@@ -2177,8 +2169,7 @@ class Accesspoint(DnacBase):
                     update_config["macAddress"] = current_ap_config["eth_mac"]
 
             if update_config:
-                self.log("Consolidated config to update AP configuration: {0}"
-                         .format(self.pprint(update_config)), "INFO")
+                self.log("Consolidated config to update AP configuration: {0}", "INFO", Deferred(self.pprint, update_config))
                 return update_config
 
             self.log('Playbook AP configuration remain same in current AP configration', "INFO")
@@ -2200,8 +2191,7 @@ class Accesspoint(DnacBase):
             final_input_data = functions.update_ap_configuration(ap_config)
         """
 
-        self.log("Updating access point configuration information: {0}"
-                 .format(ap_config["macAddress"]), "INFO")
+        self.log("Updating access point configuration information: {0}", "INFO", ap_config["macAddress"])
 
         ap_config["apList"] = []
         temp_dict = {}
@@ -2375,7 +2365,7 @@ class Accesspoint(DnacBase):
             if ap_config.get(key_to_remove):
                 del ap_config[key_to_remove]
 
-        self.log("Update access point before update: {0}".format(self.pprint(ap_config)), "INFO")
+        self.log("Update access point before update: {0}", "INFO", Deferred(self.pprint, ap_config))
         try:
             response = self.dnac._exec(
                 family="wireless",
@@ -2386,13 +2376,11 @@ class Accesspoint(DnacBase):
 
             if response:
                 response = response.get("response")
-                self.log("Response of Access Point Configuration: {0}".format(
-                    self.pprint(response)), "INFO")
+                self.log("Response of Access Point Configuration: {0}", "INFO", Deferred(self.pprint, response))
                 return dict(mac_address=self.have["mac_address"], response=response)
 
         except Exception as e:
-            self.log("AP config update Error: {0} {1}".format(self.pprint(ap_config), str(e)),
-                     "ERROR")
+            self.log("AP config update Error: {0} {1}", "ERROR", Deferred(self.pprint, ap_config), e)
             return None
 
     def data_frame(self, fields_to_include=None, records=list):
@@ -2433,7 +2421,7 @@ class Accesspoint(DnacBase):
             return filtered_data
 
         except Exception as e:
-            self.log("Unable to filter fields: {0}".format(str(e)) , "ERROR")
+            self.log("Unable to filter fields: {0}", "ERROR", e)
             return None
 
     def map_config_key_to_api_param(self, keymap=any, data=any):
@@ -2531,8 +2519,23 @@ def main():
         "dnac_log_file_path": {"type": 'str', "default": 'dnac.log'},
         'config_verify': {'type': 'bool', "default": False},
         "dnac_log_append": {"type": 'bool', "default": True},
+        "dnac_log_max_bytes": {"type": 'int', "default": 0},
+        "dnac_log_backup_count": {"type": 'int', "default": 5},
+        "dnac_log_compress": {"type": 'bool', "default": False},
+        "dnac_log_format": {"type": 'str', "default": 'text', "choices": ['text', 'json']},
         'dnac_api_task_timeout': {'type': 'int', "default": 1200},
         'dnac_task_poll_interval': {'type': 'int', "default": 2},
+        'dnac_token_cache': {'type': 'bool', 'default': False},
+        'dnac_rate_limit': {'type': 'float', 'default': 0},
+        'dnac_rate_limit_per_family': {'type': 'bool', 'default': False},
+        'dnac_rate_limit_retries': {'type': 'int', 'default': 5},
+        'dnac_shared_rate_limit': {'type': 'float', 'default': 0},
+        'dnac_shared_family_concurrency': {'type': 'int', 'default': 0},
+        'dnac_memoize_reads': {'type': 'bool', 'default': False},
+        'dnac_metrics': {'type': 'bool', 'default': False},
+        'dnac_metrics_file': {'type': 'str'},
+        'dnac_timings': {'type': 'bool', 'default': False},
+        'dnac_timings_file': {'type': 'str'},
         'next_task_after_interval': {'type': 'int', "default": 5},
         'config': {'required': True, 'type': 'list', 'elements': 'dict'},
         'validate_response_schema': {'type': 'bool', 'default': True},
@@ -23,6 +23,24 @@ options:
     description:
     - Timestamp query parameter. Epoch time(in milliseconds) when the Client health data is required.
     type: float
+  cache:
+    description:
+    - Use of the on-disk response cache shared by the plays of the control node.
+    - C(use) returns a cached response younger than I(cache_ttl) and caches the fresh ones.
+    - C(refresh) always calls Cisco DNA Center and caches the response.
+    - C(bypass) calls Cisco DNA Center without reading or writing the cache.
+    - The cache is kept in '~/.ansible/cisco_dnac/responses', which can be changed with the
+      DNAC_RESPONSE_CACHE_DIR environment variable. Its size is capped to 50 MiB, or to the bytes given
+      in the DNAC_RESPONSE_CACHE_MAX_SIZE environment variable, by removing the least recently used responses.
+    - When the cache cannot be written, Cisco DNA Center is called and C(response_cache.status) is C(error).
+    type: str
+    choices: [refresh, use, bypass]
+    default: bypass
+  cache_ttl:
+    description:
+    - Maximum age in seconds of a cached response returned when I(cache=use).
+    type: int
+    default: 60
 requirements:
 - dnacentersdk >= 2.7.2
 - python >= 3.5
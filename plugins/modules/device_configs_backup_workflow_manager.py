@@ -159,13 +159,6 @@ response_2:
     }
 """
 # common approach when a module relies on optional dependencies that are not available during the validation process.
-try:
-    import pyzipper
-    HAS_PYZIPPER = True
-except ImportError:
-    HAS_PYZIPPER = False
-    pyzipper = None
-
 try:
     import pathlib
     HAS_PATHLIB = True
@@ -178,12 +171,22 @@ from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
     validate_list_of_dicts
 )
-from io import BytesIO
+from ansible_collections.cisco.dnac.plugins.module_utils.lazy_import import (
+    LazyModule,
+    is_importable,
+)
+import json
+import os
 import random
 import string
 import re
+import tempfile
 import time
 
+# pyzipper is only imported when an encrypted archive is extracted
+HAS_PYZIPPER = is_importable("pyzipper")
+pyzipper = LazyModule("pyzipper")
+
 
 class Device_configs_backup(DnacBase):
 
@@ -273,7 +276,7 @@ class Device_configs_backup(DnacBase):
                 self.log(msg, "CRITICAL")
                 self.module.fail_json(msg=msg)
 
-        self.log("Validated IP address collected for config collection is {0}".format(ip_address), "INFO")
+        self.log("Validated IP address collected for config collection is {0}", "INFO", ip_address)
 
     def get_site_details(self, site_name_hierarchy):
         """
@@ -300,16 +303,16 @@ class Device_configs_backup(DnacBase):
             )
         except Exception:
             self.log("Exception occurred as \
-                site '{0}' was not found".format(self.want.get("site_name")), "CRITICAL")
+                site '{0}' was not found", "CRITICAL", self.want.get("site_name"))
             self.module.fail_json(msg="Site not found", response=[])
 
         if response:
             self.log("Received site details\
-                for '{0}': {1}".format(site_name_hierarchy, str(response)), "DEBUG")
+                for '{0}': {1}", "DEBUG", site_name_hierarchy, response)
             site = response.get("response")
             if len(site) == 1:
                 site_exists = True
-                self.log("Site Name: {0} exists in the Cisco Catalyst Center".format(site_name_hierarchy), "INFO")
+                self.log("Site Name: {0} exists in the Cisco Catalyst Center", "INFO", site_name_hierarchy)
 
         return site_exists
 
@@ -328,7 +331,7 @@ class Device_configs_backup(DnacBase):
         have = {}
         have = self.validated_config[0]
         self.have = have
-        self.log("Parameters collected from get have api are {0}".format(self.have), "INFO")
+        self.log("Parameters collected from get have api are {0}", "INFO", self.have)
         return self
 
     def get_device_ids_list(self):
@@ -356,9 +359,9 @@ class Device_configs_backup(DnacBase):
             params=device_params,
             op_modifies=True
         )
-        self.log("Response collected from the API 'get_device_list' is {0}".format(str(response)), "DEBUG")
+        self.log("Response collected from the API 'get_device_list' is {0}", "DEBUG", response)
         device_list = response.get("response")
-        self.log("Length of the device list fetched from the API 'get_device_list' is {0}".format(str(device_list)), "INFO")
+        self.log("Length of the device list fetched from the API 'get_device_list' is {0}", "INFO", device_list)
         original_valid_device_count = len(device_list)
         if original_valid_device_count == 0:
             msg = "No devices found in the inventory matching the given parameters."
@@ -393,8 +396,8 @@ class Device_configs_backup(DnacBase):
 
         device_ids = [id.get("id") for id in valid_devices]
         valid_device_count = len(device_ids)
-        self.log("Collected device IDs: {0}".format(device_ids), "INFO")
-        self.log("Backup of {0} devices out of {1} devices is possible".format(valid_device_count, original_valid_device_count), "INFO")
+        self.log("Collected device IDs: {0}", "INFO", device_ids)
+        self.log("Backup of {0} devices out of {1} devices is possible", "INFO", valid_device_count, original_valid_device_count)
         return device_ids
 
     def get_devices_by_site_and_params(self):
@@ -420,7 +423,7 @@ class Device_configs_backup(DnacBase):
                         "identifier": "uuid"},
                 op_modifies=True
             )
-            self.log("Response collected from the API 'get_device_detail' {0}".format(device_details_response), "DEBUG")
+            self.log("Response collected from the API 'get_device_detail' {0}", "DEBUG", device_details_response)
             device_details = device_details_response.get("response")
             if device_details.get("location") == site:
                 devices_in_site.append(dev_id)
@@ -448,9 +451,9 @@ class Device_configs_backup(DnacBase):
             function='get_device_list',
             op_modifies=True
         )
-        self.log("Response collected from the API 'get_device_list' is {0}".format(str(response)), "DEBUG")
+        self.log("Response collected from the API 'get_device_list' is {0}", "DEBUG", response)
         device_list = response.get("response")
-        self.log("Length of the device list fetched from the API 'get_device_list' is {0}".format(str(device_list)), "INFO")
+        self.log("Length of the device list fetched from the API 'get_device_list' is {0}", "INFO", device_list)
         if len(device_list) == 0:
             msg = "No devices found in the inventory"
             self.log(msg, "CRITICAL")
@@ -461,7 +464,7 @@ class Device_configs_backup(DnacBase):
             if device.get("site") == site:
                 device_ids.append(device)
 
-        self.log("Device IDs collected:{0}".format(device_ids), "INFO")
+        self.log("Device IDs collected:{0}", "INFO", device_ids)
         return device_ids
 
     def password_generator(self):
@@ -501,7 +504,7 @@ class Device_configs_backup(DnacBase):
         """
 
         pattern = r"^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)(?=.*[-=\\;,./~!@#$%^&*()_+{}[\]|:?\"]).{8,}$"
-        self.log("User defined password is {0}".format(password), "DEBUG")
+        self.log("User defined password is {0}", "DEBUG", password)
         if re.match(pattern, password):
             return True
         else:
@@ -540,7 +543,7 @@ class Device_configs_backup(DnacBase):
         else:
             self.want["deviceId"] = self.get_device_ids_list()
 
-        self.log("Device IDs passed is {0}".format(self.want["deviceId"]), "INFO")
+        self.log("Device IDs passed is {0}", "INFO", self.want["deviceId"])
 
         if device_params.get("file_password"):
             password = device_params.get("file_password")
@@ -576,14 +579,14 @@ class Device_configs_backup(DnacBase):
         )
         response = response.get("response")
 
-        self.log("Response collected from 'export_device_configurations' API is {0}".format(str(response)), "DEBUG")
+        self.log("Response collected from 'export_device_configurations' API is {0}", "DEBUG", response)
         if response.get("errorCode"):
             msg = response.get("message")
             self.log(msg, "CRITICAL")
             self.module.fail_json(msg=msg)
 
         task_id = response.get("taskId")
-        self.log("Task Id of the task is {0}".format(task_id), "INFO")
+        self.log("Task Id of the task is {0}", "INFO", task_id)
         return task_id
 
     def get_task_status(self, task_id=None):
@@ -612,7 +615,7 @@ class Device_configs_backup(DnacBase):
             )
             response = response.response
 
-            self.log("Response collected from 'get task by id' is {0}".format(response), "DEBUG")
+            self.log("Response collected from 'get task by id' is {0}", "DEBUG", response)
             if response.get('isError') or re.search(
                 'failed', response.get('progress'), flags=re.IGNORECASE
             ):
@@ -622,9 +625,9 @@ class Device_configs_backup(DnacBase):
                 self.module.fail_json(msg=msg)
                 return False
 
-            self.log("Task status for the task id (before checking status) {0} is {1}".format(str(task_id), str(response)), "INFO")
+            self.log("Task status for the task id (before checking status) {0} is {1}", "INFO", task_id, response)
             progress = response.get('progress')
-            self.log("Progress of the task is {0}".format(str(progress)), "DEBUG")
+            self.log("Progress of the task is {0}", "DEBUG", progress)
 
             if progress == "Device configuration Successfully exported as password protected ZIP.":
                 result = True
@@ -633,7 +636,7 @@ class Device_configs_backup(DnacBase):
                 self.result.update(dict(backup_task=response))
                 return (result, additionalStatusURL)
 
-            self.log("The progress status is {0}, continue to check the status after 3 seconds. Putting into sleep for 3 seconds".format(progress), "INFO")
+            self.log("The progress status is {0}, continue to check the status after 3 seconds. Putting into sleep for 3 seconds", "INFO", progress)
             time.sleep(3)
 
     def download_file(self, additionalStatusURL=None):
@@ -648,38 +651,40 @@ class Device_configs_backup(DnacBase):
             - result: True if the file downloaded and uzipped, else False
         """
 
-        self.log("Downloading: {0}".format(additionalStatusURL), "INFO")
+        self.log("Downloading: {0}", "INFO", additionalStatusURL)
         file_id = additionalStatusURL.split("/")[-1]
 
-        try:
-            response = self.dnac._exec(
-                family="file",
-                function='download_a_file_by_fileid',
-                op_modifies=True,
-                params={"file_id": file_id},
-            )
-            self.log("Received API response from 'download_a_file_by_fileid': {0}".format(str(response)), "DEBUG")
-        except Exception as e:
-            self.log("File couldn't be downloaded: {0}".format(e), "INFO")
-            return False
-
-        if isinstance(response, dict) and response.get("errorCode"):
-            self.log(response.get("message"), "CRITICAL")
-            self.module.fail_json(msg=response.get("message"))
-
-        zip_data = BytesIO(response.data)
-        self.log("ZIP data collected is {0}".format(zip_data), "INFO")
-
         pathlib.Path(self.have.get("file_path")).mkdir(parents=True, exist_ok=True)
-        self.log("Unzipping file after completion of download", "INFO")
 
-        try:
-            with pyzipper.AESZipFile(zip_data, 'r') as f:
-                f.pwd = bytes(self.want.get("password"), encoding="utf-8")
-                f.extractall(path=str(self.have.get("file_path")))
-        except Exception as e:
-            self.log("Error in unzipping: {0}".format(e), "CRITICAL")
-            return False
+        # The archive is streamed to a temporary file instead of being kept in memory
+        with tempfile.TemporaryDirectory(prefix="device_configs_backup_") as download_dir:
+            try:
+                download = self.dnac.download(
+                    path="/dna/intent/api/v1/file/{0}".format(file_id),
+                    dest=os.path.join(download_dir, "{0}.zip".format(file_id)),
+                    family="file",
+                )
+                self.log("Downloaded the archive of {0} bytes with checksum {1}", "INFO", download["size"], download["checksum"])
+            except Exception as e:
+                self.log("File couldn't be downloaded: {0}", "INFO", e)
+                return False
+
+            # Errors are answered with a JSON document instead of the archive
+            if "json" in (download.get("content_type") or ""):
+                with open(download["path"]) as f:
+                    response = json.load(f)
+                if isinstance(response, dict) and response.get("errorCode"):
+                    self.log(response.get("message"), "CRITICAL")
+                    self.module.fail_json(msg=response.get("message"))
+
+            self.log("Unzipping file after completion of download", "INFO")
+            try:
+                with pyzipper.AESZipFile(download["path"], 'r') as f:
+                    f.pwd = bytes(self.want.get("password"), encoding="utf-8")
+                    f.extractall(path=str(self.have.get("file_path")))
+            except Exception as e:
+                self.log("Error in unzipping: {0}", "CRITICAL", e)
+                return False
 
         self.log("Unzipping complete", "INFO")
         return True
@@ -729,8 +734,8 @@ class Device_configs_backup(DnacBase):
             Center configuration's Discovery Database.
         """
 
-        self.log("Current State (have): {0}".format(str(self.have)), "INFO")
-        self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
+        self.log("Desired State (want): {0}", "INFO", self.want)
         # Code to validate Cisco Catalyst Center config for merged state
         window_seconds = 10
         current_time = time.time()
@@ -741,7 +746,7 @@ class Device_configs_backup(DnacBase):
         ]
 
         if len(files_modified_within_window) > 0:
-            self.log("Backup has been taken in the following files {0}".format(str(files_modified_within_window)), "INFO")
+            self.log("Backup has been taken in the following files {0}", "INFO", files_modified_within_window)
         else:
             self.log("Backup has not been taken, please check", "WARNING")
 
@@ -767,9 +772,24 @@ def main():
                     "dnac_log_level": {"type": 'str', "default": 'WARNING'},
                     "dnac_log_file_path": {"type": 'str', "default": 'dnac.log'},
                     "dnac_log_append": {"type": 'bool', "default": True},
+                    "dnac_log_max_bytes": {"type": 'int', "default": 0},
+                    "dnac_log_backup_count": {"type": 'int', "default": 5},
+                    "dnac_log_compress": {"type": 'bool', "default": False},
+                    "dnac_log_format": {"type": 'str', "default": 'text', "choices": ['text', 'json']},
                     "config_verify": {"type": 'bool', "default": False},
                     'dnac_api_task_timeout': {'type': 'int', "default": 1200},
                     'dnac_task_poll_interval': {'type': 'int', "default": 2},
+                    'dnac_token_cache': {'type': 'bool', 'default': False},
+                    'dnac_rate_limit': {'type': 'float', 'default': 0},
+                    'dnac_rate_limit_per_family': {'type': 'bool', 'default': False},
+                    'dnac_rate_limit_retries': {'type': 'int', 'default': 5},
+                    'dnac_shared_rate_limit': {'type': 'float', 'default': 0},
+                    'dnac_shared_family_concurrency': {'type': 'int', 'default': 0},
+                    'dnac_memoize_reads': {'type': 'bool', 'default': False},
+                    'dnac_metrics': {'type': 'bool', 'default': False},
+                    'dnac_metrics_file': {'type': 'str'},
+                    'dnac_timings': {'type': 'bool', 'default': False},
+                    'dnac_timings_file': {'type': 'str'},
                     'validate_response_schema': {'type': 'bool', 'default': True},
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'merged', 'choices': ['merged']}
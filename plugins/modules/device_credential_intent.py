@@ -860,7 +860,7 @@ class DnacCredential(DnacBase):
             return self
 
         self.validated_config = valid_temp
-        self.log("Successfully validated playbook config params: {0}".format(valid_temp), "INFO")
+        self.log("Successfully validated playbook config params: {0}", "INFO", valid_temp)
         self.msg = "Successfully validated input from the playbook"
         self.status = "success"
         return self
@@ -884,17 +884,15 @@ class DnacCredential(DnacBase):
                 op_modifies=True,
                 params={"name": site_name},
             )
-            self.log("Received API response from 'get_site': {0}".format(response), "DEBUG")
+            self.log("Received API response from 'get_site': {0}", "DEBUG", response)
             if not response:
-                self.log("Failed to retrieve the site ID for the site name: {0}"
-                         .format(site_name), "ERROR")
+                self.log("Failed to retrieve the site ID for the site name: {0}", "ERROR", site_name)
                 return None
 
             _id = response.get("response")[0].get("id")
-            self.log("Site ID for the site name {0}: {1}".format(site_name, _id), "INFO")
+            self.log("Site ID for the site name {0}: {1}", "INFO", site_name, _id)
         except Exception as e:
-            self.log("Exception occurred while getting site_id from the site_name: {0}"
-                     .format(e), "CRITICAL")
+            self.log("Exception occurred while getting site_id from the site_name: {0}", "CRITICAL", e)
             return None
 
         return _id
@@ -916,11 +914,9 @@ class DnacCredential(DnacBase):
                 function='get_all_global_credentials_v2',
             )
             global_credentials = global_credentials.get("response")
-            self.log("All global device credentials details: {0}"
-                     .format(global_credentials), "DEBUG")
+            self.log("All global device credentials details: {0}", "DEBUG", global_credentials)
         except Exception as e:
-            self.log("Exception occurred while getting global device credentials: {0}"
-                     .format(e), "CRITICAL")
+            self.log("Exception occurred while getting global device credentials: {0}", "CRITICAL", e)
             return None
 
         return global_credentials
@@ -1469,8 +1465,7 @@ class DnacCredential(DnacBase):
             snmpV3 = self.get_snmpV3_params(snmpV3Details)
             self.have.get("globalCredential").update({"snmpV3": snmpV3})
 
-        self.log("Global device credential details: {0}"
-                 .format(self.have.get("globalCredential")), "DEBUG")
+        self.log("Global device credential details: {0}", "DEBUG", self.have.get("globalCredential"))
         self.msg = "Collected the Global Device Credential Details from the Cisco DNA Center"
         self.status = "success"
         return self
@@ -1494,7 +1489,7 @@ class DnacCredential(DnacBase):
             CredentialDetails = config.get("global_credential_details")
             self.get_have_device_credentials(CredentialDetails).check_return_status()
 
-        self.log("Current State (have): {0}".format(self.have), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
         self.msg = "Successfully retrieved the details from the Cisco DNA Center"
         self.status = "success"
         return self
@@ -1680,8 +1675,7 @@ class DnacCredential(DnacBase):
             values = ["password", "description", "username", "id", "port"]
             have_httpsRead = self.have.get("globalCredential").get("httpsRead")
             for item in httpsRead:
-                self.log("Global credentials details: {0}"
-                         .format(self.have.get("globalCredential")), "DEBUG")
+                self.log("Global credentials details: {0}", "DEBUG", self.have.get("globalCredential"))
                 if not have_httpsRead or have_httpsRead[have_httpsread_ptr] is None:
                     if want.get("want_create").get("httpsRead") is None:
                         want.get("want_create").update({"httpsRead": []})
@@ -1830,8 +1824,8 @@ class DnacCredential(DnacBase):
                             self.msg = "auth_password length should be greater than 8"
                             self.status = "failed"
                             return self
-                        self.log("snmp_mode: {0}".format(create_credential[create_snmpv3_ptr]
-                                 .get("snmpMode")), "DEBUG")
+                        self.log("snmp_mode: {0}", "DEBUG", create_credential[create_snmpv3_ptr]
+                                 .get("snmpMode"))
                     if create_credential[create_snmpv3_ptr].get("snmpMode") == "AUTHPRIV":
                         privs = ["privacy_password", "privacy_type"]
                         key = {
@@ -2146,7 +2140,7 @@ class DnacCredential(DnacBase):
                         self.status = "failed"
                         return self
                 want.get("assign_credentials").update({"snmpV3Id": snmpV3Detail.get("id")})
-        self.log("Desired State (want): {0}".format(want), "INFO")
+        self.log("Desired State (want): {0}", "INFO", want)
         self.want.update(want)
         self.msg = "Collected the Credentials needed to be assigned from the Cisco DNA Center"
         self.status = "success"
@@ -2175,7 +2169,7 @@ class DnacCredential(DnacBase):
             AssignCredentials = config.get("assign_credentials_to_site")
             self.get_want_assign_credentials(AssignCredentials).check_return_status()
 
-        self.log("Desired State (want): {0}".format(self.want), "INFO")
+        self.log("Desired State (want): {0}", "INFO", self.want)
         self.msg = "Successfully retrieved details from the playbook"
         self.status = "success"
         return self
@@ -2205,16 +2199,14 @@ class DnacCredential(DnacBase):
             return self
 
         credential_params = want_create
-        self.log("Creating global credential API input parameters: {0}"
-                 .format(credential_params), "DEBUG")
+        self.log("Creating global credential API input parameters: {0}", "DEBUG", credential_params)
         response = self.dnac._exec(
             family="discovery",
             function='create_global_credentials_v2',
             op_modifies=True,
             params=credential_params,
         )
-        self.log("Received API response from 'create_global_credentials_v2': {0}"
-                 .format(response), "DEBUG")
+        self.log("Received API response from 'create_global_credentials_v2': {0}", "DEBUG", response)
         validation_string = "global credential addition performed"
         self.check_task_response_status(response, validation_string).check_return_status()
         self.log("Global credential created successfully", "INFO")
@@ -2260,8 +2252,7 @@ class DnacCredential(DnacBase):
         values = ["cliCredential", "snmpV2cRead", "snmpV2cWrite",
                   "httpsRead", "httpsWrite", "snmpV3"]
         final_response = []
-        self.log("Desired State for global device credentials updation: {0}"
-                 .format(want_update), "DEBUG")
+        self.log("Desired State for global device credentials updation: {0}", "DEBUG", want_update)
         while flag:
             flag = False
             credential_params = {}
@@ -2278,12 +2269,10 @@ class DnacCredential(DnacBase):
                     op_modifies=True,
                     params=credential_params,
                 )
-                self.log("Received API response for 'update_global_credentials_v2': {0}"
-                         .format(response), "DEBUG")
+                self.log("Received API response for 'update_global_credentials_v2': {0}", "DEBUG", response)
                 validation_string = "global credential update performed"
                 self.check_task_response_status(response, validation_string).check_return_status()
-        self.log("Updating device credential API input parameters: {0}"
-                 .format(final_response), "DEBUG")
+        self.log("Updating device credential API input parameters: {0}", "DEBUG", final_response)
         self.log("Global device credential updated successfully", "INFO")
         result_global_credential.update({
             "Updation": {
@@ -2311,8 +2300,7 @@ class DnacCredential(DnacBase):
         result_assign_credential = self.result.get("response")[0].get("assignCredential")
         credential_params = self.want.get("assign_credentials")
         final_response = []
-        self.log("Assigning device credential to site API input parameters: {0}"
-                 .format(credential_params), "DEBUG")
+        self.log("Assigning device credential to site API input parameters: {0}", "DEBUG", credential_params)
         if not credential_params:
             result_assign_credential.update({
                 "No Assign Credentials": {
@@ -2334,14 +2322,11 @@ class DnacCredential(DnacBase):
                 op_modifies=True,
                 params=credential_params,
             )
-            self.log("Received API response for 'assign_device_credential_to_site_v2': {0}"
-                     .format(response), "DEBUG")
+            self.log("Received API response for 'assign_device_credential_to_site_v2': {0}", "DEBUG", response)
             validation_string = "desired common settings operation successful"
             self.check_task_response_status(response, validation_string).check_return_status()
-        self.log("Device credential assigned to site {0} is successfully."
-                 .format(site_ids), "INFO")
-        self.log("Desired State for assign credentials to a site: {0}"
-                 .format(final_response), "DEBUG")
+        self.log("Device credential assigned to site {0} is successfully.", "INFO", site_ids)
+        self.log("Desired State for assign credentials to a site: {0}", "DEBUG", final_response)
         result_assign_credential.update({
             "Assign Credentials": {
                 "response": final_response,
@@ -2392,7 +2377,7 @@ class DnacCredential(DnacBase):
         result_global_credential = self.result.get("response")[0].get("globalCredential")
         have_values = self.have.get("globalCredential")
         final_response = {}
-        self.log("Global device credentials to be deleted: {0}".format(have_values), "DEBUG")
+        self.log("Global device credentials to be deleted: {0}", "DEBUG", have_values)
         credential_mapping = {
             "cliCredential": "cli_credential",
             "snmpV2cRead": "snmp_v2c_read",
@@ -2406,9 +2391,9 @@ class DnacCredential(DnacBase):
             final_response.update({item: []})
             for value in have_values.get(item):
                 if value is None:
-                    self.log("Credential Name: {0}".format(item), "DEBUG")
-                    self.log("Credential Item: {0}".format(config.get("global_credential_details")
-                             .get(credential_mapping.get(item))), "DEBUG")
+                    self.log("Credential Name: {0}", "DEBUG", item)
+                    self.log("Credential Item: {0}", "DEBUG", config.get("global_credential_details")
+                             .get(credential_mapping.get(item)))
                     final_response.get(item).append(
                         str(config.get("global_credential_details")
                             .get(credential_mapping.get(item))[config_itr]) + " is not found."
@@ -2421,15 +2406,13 @@ class DnacCredential(DnacBase):
                     op_modifies=True,
                     params={"id": _id},
                 )
-                self.log("Received API response for 'delete_global_credential_v2': {0}"
-                         .format(response), "DEBUG")
+                self.log("Received API response for 'delete_global_credential_v2': {0}", "DEBUG", response)
                 validation_string = "global credential deleted successfully"
                 self.check_task_response_status(response, validation_string).check_return_status()
                 final_response.get(item).append(_id)
                 config_itr = config_itr + 1
 
-        self.log("Deleting device credential API input parameters: {0}"
-                 .format(final_response), "DEBUG")
+        self.log("Deleting device credential API input parameters: {0}", "DEBUG", final_response)
         self.log("Successfully deleted global device credential.", "INFO")
         result_global_credential.update({
             "Deletion": {
@@ -2474,8 +2457,8 @@ class DnacCredential(DnacBase):
         self.log(str("Entered the verify function."), "DEBUG")
         self.get_have(config)
         self.get_want(config)
-        self.log("Current State (have): {0}".format(self.have), "INFO")
-        self.log("Desired State (want): {0}".format(self.want), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
+        self.log("Desired State (want): {0}", "INFO", self.want)
 
         if config.get("global_credential_details") is not None:
             if self.want.get("want_create"):
@@ -2533,8 +2516,8 @@ class DnacCredential(DnacBase):
         """
 
         self.get_have(config)
-        self.log("Current State (have): {0}".format(self.have), "INFO")
-        self.log("Desired State (want): {0}".format(self.want), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
+        self.log("Desired State (want): {0}", "INFO", self.want)
 
         if config.get("global_credential_details") is not None:
             have_global_credential = self.have.get("globalCredential")
@@ -2587,9 +2570,24 @@ def main():
         "dnac_log_level": {"type": 'str', "default": 'WARNING'},
         "dnac_log_file_path": {"type": 'str', "default": 'dnac.log'},
         "dnac_log_append": {"type": 'bool', "default": True},
+        "dnac_log_max_bytes": {"type": 'int', "default": 0},
+        "dnac_log_backup_count": {"type": 'int', "default": 5},
+        "dnac_log_compress": {"type": 'bool', "default": False},
+        "dnac_log_format": {"type": 'str', "default": 'text', "choices": ['text', 'json']},
         "config_verify": {"type": 'bool', "default": False},
         'dnac_api_task_timeout': {'type': 'int', "default": 1200},
         'dnac_task_poll_interval': {'type': 'int', "default": 2},
+        'dnac_token_cache': {'type': 'bool', 'default': False},
+        'dnac_rate_limit': {'type': 'float', 'default': 0},
+        'dnac_rate_limit_per_family': {'type': 'bool', 'default': False},
+        'dnac_rate_limit_retries': {'type': 'int', 'default': 5},
+        'dnac_shared_rate_limit': {'type': 'float', 'default': 0},
+        'dnac_shared_family_concurrency': {'type': 'int', 'default': 0},
+        'dnac_memoize_reads': {'type': 'bool', 'default': False},
+        'dnac_metrics': {'type': 'bool', 'default': False},
+        'dnac_metrics_file': {'type': 'str'},
+        'dnac_timings': {'type': 'bool', 'default': False},
+        'dnac_timings_file': {'type': 'str'},
         "config": {"type": 'list', "required": True, "elements": 'dict'},
         "state": {"default": 'merged', "choices": ['merged', 'deleted']},
         "validate_response_schema": {"type": 'bool', "default": True},
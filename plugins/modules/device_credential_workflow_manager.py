@@ -859,7 +859,7 @@ class DeviceCredential(DnacBase):
             return self
 
         self.validated_config = valid_temp
-        self.log("Successfully validated playbook config params: {0}".format(valid_temp), "INFO")
+        self.log("Successfully validated playbook config params: {0}", "INFO", valid_temp)
         self.msg = "Successfully validated input from the playbook"
         self.status = "success"
         return self
@@ -883,22 +883,20 @@ class DeviceCredential(DnacBase):
                 op_modifies=True,
                 params={"name": site_name},
             )
-            self.log("Received API response from 'get_site': {0}".format(response), "DEBUG")
+            self.log("Received API response from 'get_site': {0}", "DEBUG", response)
             if not response:
-                self.log("Failed to retrieve the site ID for the site name: {0}"
-                         .format(site_name), "ERROR")
+                self.log("Failed to retrieve the site ID for the site name: {0}", "ERROR", site_name)
                 return None
 
             response = response.get("response")
             if not response:
-                self.log("The site with the name '{0}' is not valid".format(site_name), "ERROR")
+                self.log("The site with the name '{0}' is not valid", "ERROR", site_name)
                 return None
 
             _id = response[0].get("id")
-            self.log("Site ID for the site name {0}: {1}".format(site_name, _id), "INFO")
+            self.log("Site ID for the site name {0}: {1}", "INFO", site_name, _id)
         except Exception as e:
-            self.log("Exception occurred while getting site_id from the site_name: {0}"
-                     .format(e), "CRITICAL")
+            self.log("Exception occurred while getting site_id from the site_name: {0}", "CRITICAL", e)
             return None
 
         return _id
@@ -920,11 +918,9 @@ class DeviceCredential(DnacBase):
                 function='get_all_global_credentials_v2',
             )
             global_credentials = global_credentials.get("response")
-            self.log("All global device credentials details: {0}"
-                     .format(global_credentials), "DEBUG")
+            self.log("All global device credentials details: {0}", "DEBUG", global_credentials)
         except Exception as e:
-            self.log("Exception occurred while getting global device credentials: {0}"
-                     .format(e), "CRITICAL")
+            self.log("Exception occurred while getting global device credentials: {0}", "CRITICAL", e)
             return None
 
         return global_credentials
@@ -1488,8 +1484,7 @@ class DeviceCredential(DnacBase):
             snmpV3 = self.get_snmpV3_params(snmpV3Details)
             self.have.get("globalCredential").update({"snmpV3": snmpV3})
 
-        self.log("Global device credential details: {0}"
-                 .format(self.have.get("globalCredential")), "DEBUG")
+        self.log("Global device credential details: {0}", "DEBUG", self.have.get("globalCredential"))
         self.msg = "Collected the Global Device Credential Details from the Cisco Catalyst Center"
         self.status = "success"
         return self
@@ -1513,7 +1508,7 @@ class DeviceCredential(DnacBase):
             CredentialDetails = config.get("global_credential_details")
             self.get_have_device_credentials(CredentialDetails).check_return_status()
 
-        self.log("Current State (have): {0}".format(self.have), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
         self.msg = "Successfully retrieved the details from the Cisco Catalyst Center"
         self.status = "success"
         return self
@@ -1693,8 +1688,7 @@ class DeviceCredential(DnacBase):
             values = ["password", "description", "username", "id", "port"]
             have_httpsRead = self.have.get("globalCredential").get("httpsRead")
             for item in httpsRead:
-                self.log("Global credentials details: {0}"
-                         .format(self.have.get("globalCredential")), "DEBUG")
+                self.log("Global credentials details: {0}", "DEBUG", self.have.get("globalCredential"))
                 if not have_httpsRead or have_httpsRead[have_httpsread_ptr] is None:
                     if want.get("want_create").get("httpsRead") is None:
                         want.get("want_create").update({"httpsRead": []})
@@ -1837,8 +1831,8 @@ class DeviceCredential(DnacBase):
                             self.msg = "auth_password length should be greater than 8"
                             self.status = "failed"
                             return self
-                        self.log("snmp_mode: {0}".format(create_credential[create_snmpv3_ptr]
-                                 .get("snmpMode")), "DEBUG")
+                        self.log("snmp_mode: {0}", "DEBUG", create_credential[create_snmpv3_ptr]
+                                 .get("snmpMode"))
                     if create_credential[create_snmpv3_ptr].get("snmpMode") == "AUTHPRIV":
                         privs = ["privacy_password", "privacy_type"]
                         key = {
@@ -2153,7 +2147,7 @@ class DeviceCredential(DnacBase):
                         self.status = "failed"
                         return self
                 want.get("assign_credentials").update({"snmpV3Id": snmpV3Detail.get("id")})
-        self.log("Desired State (want): {0}".format(want), "INFO")
+        self.log("Desired State (want): {0}", "INFO", want)
         self.want.update(want)
         self.msg = "Collected the Credentials needed to be assigned from the Cisco Catalyst Center"
         self.status = "success"
@@ -2182,7 +2176,7 @@ class DeviceCredential(DnacBase):
             AssignCredentials = config.get("assign_credentials_to_site")
             self.get_want_assign_credentials(AssignCredentials).check_return_status()
 
-        self.log("Desired State (want): {0}".format(self.want), "INFO")
+        self.log("Desired State (want): {0}", "INFO", self.want)
         self.msg = "Successfully retrieved details from the playbook"
         self.status = "success"
         return self
@@ -2212,16 +2206,14 @@ class DeviceCredential(DnacBase):
             return self
 
         credential_params = want_create
-        self.log("Creating global credential API input parameters: {0}"
-                 .format(credential_params), "DEBUG")
+        self.log("Creating global credential API input parameters: {0}", "DEBUG", credential_params)
         response = self.dnac._exec(
             family="discovery",
             function='create_global_credentials_v2',
             op_modifies=True,
             params=credential_params,
         )
-        self.log("Received API response from 'create_global_credentials_v2': {0}"
-                 .format(response), "DEBUG")
+        self.log("Received API response from 'create_global_credentials_v2': {0}", "DEBUG", response)
         validation_string = "global credential addition performed"
         self.check_task_response_status(response, validation_string, "create_global_credentials_v2").check_return_status()
         self.log("Global credential created successfully", "INFO")
@@ -2267,8 +2259,7 @@ class DeviceCredential(DnacBase):
         values = ["cliCredential", "snmpV2cRead", "snmpV2cWrite",
                   "httpsRead", "httpsWrite", "snmpV3"]
         final_response = []
-        self.log("Desired State for global device credentials updation: {0}"
-                 .format(want_update), "DEBUG")
+        self.log("Desired State for global device credentials updation: {0}", "DEBUG", want_update)
         while flag:
             flag = False
             credential_params = {}
@@ -2285,12 +2276,10 @@ class DeviceCredential(DnacBase):
                     op_modifies=True,
                     params=credential_params,
                 )
-                self.log("Received API response for 'update_global_credentials_v2': {0}"
-                         .format(response), "DEBUG")
+                self.log("Received API response for 'update_global_credentials_v2': {0}", "DEBUG", response)
                 validation_string = "global credential update performed"
                 self.check_task_response_status(response, validation_string, "update_global_credentials_v2").check_return_status()
-        self.log("Updating device credential API input parameters: {0}"
-                 .format(final_response), "DEBUG")
+        self.log("Updating device credential API input parameters: {0}", "DEBUG", final_response)
         self.log("Global device credential updated successfully", "INFO")
         result_global_credential.update({
             "Updation": {
@@ -2318,8 +2307,7 @@ class DeviceCredential(DnacBase):
         result_assign_credential = self.result.get("response")[0].get("assignCredential")
         credential_params = self.want.get("assign_credentials")
         final_response = []
-        self.log("Assigning device credential to site API input parameters: {0}"
-                 .format(credential_params), "DEBUG")
+        self.log("Assigning device credential to site API input parameters: {0}", "DEBUG", credential_params)
         if not credential_params:
             result_assign_credential.update({
                 "No Assign Credentials": {
@@ -2341,14 +2329,11 @@ class DeviceCredential(DnacBase):
                 op_modifies=True,
                 params=credential_params,
             )
-            self.log("Received API response for 'assign_device_credential_to_site_v2': {0}"
-                     .format(response), "DEBUG")
+            self.log("Received API response for 'assign_device_credential_to_site_v2': {0}", "DEBUG", response)
             validation_string = "desired common settings operation successful"
             self.check_task_response_status(response, validation_string, "assign_device_credential_to_site_v2").check_return_status()
-        self.log("Device credential assigned to site {0} is successfully."
-                 .format(site_ids), "INFO")
-        self.log("Desired State for assign credentials to a site: {0}"
-                 .format(final_response), "DEBUG")
+        self.log("Device credential assigned to site {0} is successfully.", "INFO", site_ids)
+        self.log("Desired State for assign credentials to a site: {0}", "DEBUG", final_response)
         result_assign_credential.update({
             "Assign Credentials": {
                 "response": final_response,
@@ -2399,7 +2384,7 @@ class DeviceCredential(DnacBase):
         result_global_credential = self.result.get("response")[0].get("globalCredential")
         have_values = self.have.get("globalCredential")
         final_response = {}
-        self.log("Global device credentials to be deleted: {0}".format(have_values), "DEBUG")
+        self.log("Global device credentials to be deleted: {0}", "DEBUG", have_values)
         credential_mapping = {
             "cliCredential": "cli_credential",
             "snmpV2cRead": "snmp_v2c_read",
@@ -2418,9 +2403,9 @@ class DeviceCredential(DnacBase):
                 description = config.get("global_credential_details") \
                                     .get(credential_mapping.get(item))[config_itr].get("description")
                 if value is None:
-                    self.log("Credential Name: {0}".format(item), "DEBUG")
-                    self.log("Credential Item: {0}".format(config.get("global_credential_details")
-                             .get(credential_mapping.get(item))), "DEBUG")
+                    self.log("Credential Name: {0}", "DEBUG", item)
+                    self.log("Credential Item: {0}", "DEBUG", config.get("global_credential_details")
+                             .get(credential_mapping.get(item)))
                     final_response.get(item).append({
                         "description": description,
                         "response": "Global credential not found"
@@ -2435,8 +2420,7 @@ class DeviceCredential(DnacBase):
                     op_modifies=True,
                     params={"id": _id},
                 )
-                self.log("Received API response for 'delete_global_credential_v2': {0}"
-                         .format(response), "DEBUG")
+                self.log("Received API response for 'delete_global_credential_v2': {0}", "DEBUG", response)
                 validation_string = "global credential deleted successfully"
                 response = response.get("response")
                 if response.get("errorcode") is not None:
@@ -2447,7 +2431,7 @@ class DeviceCredential(DnacBase):
                 task_id = response.get("taskId")
                 while True:
                     task_details = self.get_task_details(task_id)
-                    self.log('Getting task details from task ID {0}: {1}'.format(task_id, task_details), "DEBUG")
+                    self.log('Getting task details from task ID {0}: {1}', "DEBUG", task_id, task_details)
 
                     if task_details.get("isError") is True:
                         if task_details.get("failureReason"):
@@ -2461,7 +2445,7 @@ class DeviceCredential(DnacBase):
                         self.status = "success"
                         break
 
-                    self.log("progress set to {0} for taskid: {1}".format(task_details.get('progress'), task_id), "DEBUG")
+                    self.log("progress set to {0} for taskid: {1}", "DEBUG", task_details.get('progress'), task_id)
 
                 if self.status == "failed":
                     failed_status = True
@@ -2475,8 +2459,7 @@ class DeviceCredential(DnacBase):
                         "response": "Global credential deleted successfully"
                     })
 
-        self.log("Deleting device credential API input parameters: {0}"
-                 .format(final_response), "DEBUG")
+        self.log("Deleting device credential API input parameters: {0}", "DEBUG", final_response)
         result_global_credential.update({
             "Deletion": {
                 "response": final_response,
@@ -2526,8 +2509,8 @@ class DeviceCredential(DnacBase):
 
         self.get_have(config)
         self.get_want(config)
-        self.log("Current State (have): {0}".format(self.have), "INFO")
-        self.log("Desired State (want): {0}".format(self.want), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
+        self.log("Desired State (want): {0}", "INFO", self.want)
 
         if config.get("global_credential_details") is not None:
             if self.want.get("want_create"):
@@ -2584,8 +2567,8 @@ class DeviceCredential(DnacBase):
         """
 
         self.get_have(config)
-        self.log("Current State (have): {0}".format(self.have), "INFO")
-        self.log("Desired State (want): {0}".format(self.want), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
+        self.log("Desired State (want): {0}", "INFO", self.want)
 
         if config.get("global_credential_details") is not None:
             have_global_credential = self.have.get("globalCredential")
@@ -2640,9 +2623,24 @@ def main():
         "dnac_log_level": {"type": 'str', "default": 'WARNING'},
         "dnac_log_file_path": {"type": 'str', "default": 'dnac.log'},
         "dnac_log_append": {"type": 'bool', "default": True},
+        "dnac_log_max_bytes": {"type": 'int', "default": 0},
+        "dnac_log_backup_count": {"type": 'int', "default": 5},
+        "dnac_log_compress": {"type": 'bool', "default": False},
+        "dnac_log_format": {"type": 'str', "default": 'text', "choices": ['text', 'json']},
         "config_verify": {"type": 'bool', "default": False},
         'dnac_api_task_timeout': {'type': 'int', "default": 1200},
         'dnac_task_poll_interval': {'type': 'int', "default": 2},
+        'dnac_token_cache': {'type': 'bool', 'default': False},
+        'dnac_rate_limit': {'type': 'float', 'default': 0},
+        'dnac_rate_limit_per_family': {'type': 'bool', 'default': False},
+        'dnac_rate_limit_retries': {'type': 'int', 'default': 5},
+        'dnac_shared_rate_limit': {'type': 'float', 'default': 0},
+        'dnac_shared_family_concurrency': {'type': 'int', 'default': 0},
+        'dnac_memoize_reads': {'type': 'bool', 'default': False},
+        'dnac_metrics': {'type': 'bool', 'default': False},
+        'dnac_metrics_file': {'type': 'str'},
+        'dnac_timings': {'type': 'bool', 'default': False},
+        'dnac_timings_file': {'type': 'str'},
         "config": {"type": 'list', "required": True, "elements": 'dict'},
         "state": {"default": 'merged', "choices": ['merged', 'deleted']},
         "validate_response_schema": {"type": 'bool', "default": True},
@@ -769,7 +769,7 @@ class Discovery(DnacBase):
                                  the class instance.
         """
 
-        self.log("Credential Ids list passed is {0}".format(str(self.creds_ids_list)), "INFO")
+        self.log("Credential Ids list passed is {0}", "INFO", self.creds_ids_list)
         return self.creds_ids_list
 
     def handle_global_credentials(self, response=None):
@@ -951,7 +951,7 @@ class Discovery(DnacBase):
                         msg = "Please provide valid description of the Global Netconf port to be used"
                         self.discovery_specific_cred_failure(msg=msg)
 
-        self.log("Fetched Global credentials IDs are {0}".format(global_credentials_all), "INFO")
+        self.log("Fetched Global credentials IDs are {0}", "INFO", global_credentials_all)
         return global_credentials_all
 
     def get_ccc_global_credentials_v2_info(self):
@@ -975,7 +975,7 @@ class Discovery(DnacBase):
             op_modifies=True
         )
         response = response.get('response')
-        self.log("The Global credentials response from 'get all global credentials v2' API is {0}".format(str(response)), "DEBUG")
+        self.log("The Global credentials response from 'get all global credentials v2' API is {0}", "DEBUG", response)
         global_credentials_all = {}
         global_credentials = self.validated_config[0].get("global_credentials")
         if global_credentials:
@@ -1013,7 +1013,7 @@ class Discovery(DnacBase):
         """
         ip_address_list = self.validated_config[0].get('ip_address_list')
         self.result.update(dict(devices_info=ip_address_list))
-        self.log("Details of the device list passed: {0}".format(str(ip_address_list)), "INFO")
+        self.log("Details of the device list passed: {0}", "INFO", ip_address_list)
         return ip_address_list
 
     def preprocess_device_discovery(self, ip_address_list=None):
@@ -1035,7 +1035,7 @@ class Discovery(DnacBase):
         if ip_address_list is None:
             ip_address_list = []
         discovery_type = self.validated_config[0].get('discovery_type')
-        self.log("Discovery type passed for the discovery is {0}".format(discovery_type), "INFO")
+        self.log("Discovery type passed for the discovery is {0}", "INFO", discovery_type)
         if discovery_type in ["SINGLE", "CDP", "LLDP"]:
             if len(ip_address_list) == 1:
                 ip_address_list = ip_address_list[0]
@@ -1077,7 +1077,7 @@ class Discovery(DnacBase):
                 else:
                     new_ip_collected.append(ip)
             ip_address_list = ','.join(new_ip_collected)
-        self.log("Collected IP address/addresses are {0}".format(str(ip_address_list)), "INFO")
+        self.log("Collected IP address/addresses are {0}", "INFO", ip_address_list)
         return str(ip_address_list)
 
     def preprocess_device_discovery_handle_error(self):
@@ -1269,7 +1269,7 @@ class Discovery(DnacBase):
                 credential_ids.extend(global_cred_list)
             new_object_params['globalCredentialIdList'] = credential_ids
 
-        self.log("All the global credentials used for the discovery task are {0}".format(str(global_credentials_all)), "DEBUG")
+        self.log("All the global credentials used for the discovery task are {0}", "DEBUG", global_credentials_all)
 
         if not (new_object_params.get('snmpUserName') or new_object_params.get('snmpROCommunityDesc') or new_object_params.get('snmpRWCommunityDesc')
                 or global_credentials_all.get('snmpV2cRead') or global_credentials_all.get('snmpV2cWrite') or global_credentials_all.get('snmpV3')):
@@ -1280,7 +1280,7 @@ class Discovery(DnacBase):
             msg = "Please provide atleast one valid CLI credential to perform Discovery"
             self.discovery_specific_cred_failure(msg=msg)
 
-        self.log("The payload/object created for calling the start discovery API is {0}".format(str(new_object_params)), "INFO")
+        self.log("The payload/object created for calling the start discovery API is {0}", "INFO", new_object_params)
 
         return new_object_params
 
@@ -1308,10 +1308,10 @@ class Discovery(DnacBase):
             op_modifies=True,
         )
 
-        self.log("The response received post discovery creation API called is {0}".format(str(result)), "DEBUG")
+        self.log("The response received post discovery creation API called is {0}", "DEBUG", result)
 
         self.result.update(dict(discovery_result=result))
-        self.log("Task Id of the API task created is {0}".format(result.response.get('taskId')), "INFO")
+        self.log("Task Id of the API task created is {0}", "INFO", result.response.get('taskId'))
         return result.response.get('taskId')
 
     def get_merged_task_status(self, task_id=None):
@@ -1338,7 +1338,7 @@ class Discovery(DnacBase):
                 op_modifies=True,
             )
             response = response.response
-            self.log("Task status for the task id {0} is {1}, is_error: {2}".format(str(task_id), str(response), str(response.get('isError'))), "INFO")
+            self.log("Task status for the task id {0} is {1}, is_error: {2}", "INFO", task_id, response, response.get('isError'))
             if response.get('isError') or re.search(
                 'failed', response.get('progress'), flags=re.IGNORECASE
             ):
@@ -1348,7 +1348,7 @@ class Discovery(DnacBase):
                 self.module.fail_json(msg=msg)
                 return False
 
-            self.log("Task status for the task id (before checking status) {0} is {1}".format(str(task_id), str(response)), "INFO")
+            self.log("Task status for the task id (before checking status) {0} is {1}", "INFO", task_id, response)
             progress = response.get('progress')
             try:
                 progress_value = int(progress)
@@ -1357,7 +1357,7 @@ class Discovery(DnacBase):
                 self.result.update(dict(discovery_task=response))
                 return result
             except Exception:
-                self.log("The progress status is {0}, continue to check the status after 3 seconds. Putting into sleep for 3 seconds".format(progress))
+                self.log("The progress status is {0}, continue to check the status after 3 seconds. Putting into sleep for 3 seconds", "WARNING", progress)
                 time.sleep(3)
 
     def get_deleted_task_status(self, task_id=None):
@@ -1383,7 +1383,7 @@ class Discovery(DnacBase):
                 op_modifies=True,
             )
             response = response.response
-            self.log("Task status for the task id {0} is {1}, is_error: {2}".format(str(task_id), str(response), str(response.get('isError'))), "INFO")
+            self.log("Task status for the task id {0} is {1}, is_error: {2}", "INFO", task_id, response, response.get('isError'))
             if response.get('isError') or re.search(
                 'failed', response.get('progress'), flags=re.IGNORECASE
             ):
@@ -1393,7 +1393,7 @@ class Discovery(DnacBase):
                 self.module.fail_json(msg=msg)
                 return False
 
-            self.log("Task status for the task id (before checking status) {0} is {1}".format(str(task_id), str(response)), "INFO")
+            self.log("Task status for the task id (before checking status) {0} is {1}", "INFO", task_id, response)
             progress = response.get('progress')
             if re.search('Discovery deleted successfully.', response.get('progress')):
                 result = True
@@ -1401,7 +1401,7 @@ class Discovery(DnacBase):
                 self.result.update(dict(discovery_task=response))
                 return result
 
-            self.log("The progress status is {0}, continue to check the status after 3 seconds. Putting into sleep for 3 seconds".format(progress))
+            self.log("The progress status is {0}, continue to check the status after 3 seconds. Putting into sleep for 3 seconds", "WARNING", progress)
             time.sleep(3)
 
     def lookup_discovery_by_range_via_name(self):
@@ -1416,44 +1416,24 @@ class Discovery(DnacBase):
         """
         start_index = self.validated_config[0].get("start_index")
         records_to_return = self.validated_config[0].get("records_to_return")
+        discovery_name = self.validated_config[0].get('discovery_name')
 
-        response = {"response": []}
-        if records_to_return > 500:
-            num_intervals = records_to_return // 500
-            for num in range(0, num_intervals + 1):
-                params = dict(
-                    start_index=1 + num * 500,
-                    records_to_return=500,
-                    headers=self.validated_config[0].get("headers")
-                )
-                response_part = self.dnac_apply['exec'](
-                    family="discovery",
-                    function='get_discoveries_by_range',
-                    params=params,
-                    op_modifies=True,
-                )
-                response["response"].extend(response_part["response"])
-        else:
-            params = dict(
-                start_index=self.validated_config[0].get("start_index"),
-                records_to_return=self.validated_config[0].get("records_to_return"),
-                headers=self.validated_config[0].get("headers"),
-            )
-
-            response = self.dnac_apply['exec'](
-                family="discovery",
-                function='get_discoveries_by_range',
-                params=params,
-                op_modifies=True,
-            )
-        self.log("Response of the get discoveries via range API is {0}".format(str(response)), "DEBUG")
-
-        return next(
-            filter(
-                lambda x: x['name'] == self.validated_config[0].get('discovery_name'),
-                response.get("response")
-            ), None
+        # Pages of at most 500 discoveries, no more pages are requested once the discovery is found
+        discoveries = self.paginate(
+            family="discovery",
+            function='get_discoveries_by_range',
+            params=dict(headers=self.validated_config[0].get("headers")),
+            page_size=500,
+            offset_param="start_index",
+            limit_param="records_to_return",
+            start=start_index,
+            max_items=records_to_return,
+            op_modifies=True,
         )
+        discovery = next((item for item in discoveries if item['name'] == discovery_name), None)
+        self.log("Discovery '{0}' found in the range of discoveries: {1}", "DEBUG", discovery_name, discovery)
+
+        return discovery
 
     def get_discoveries_by_range_until_success(self):
         """
@@ -1530,10 +1510,11 @@ class Discovery(DnacBase):
                 function='get_discovered_network_devices_by_discovery_id',
                 params=params,
                 op_modifies=True,
+                memoize=False,
             )
             devices = response.response
 
-            self.log("Retrieved device details using the API 'get_discovered_network_devices_by_discovery_id': {0}".format(str(devices)), "DEBUG")
+            self.log("Retrieved device details using the API 'get_discovered_network_devices_by_discovery_id': {0}", "DEBUG", devices)
             if all(res.get('reachabilityStatus') == 'Success' for res in devices):
                 result = True
                 self.log("All devices in the range are reachable", "INFO")
@@ -1560,7 +1541,7 @@ class Discovery(DnacBase):
             self.log(msg, "CRITICAL")
             self.module.fail_json(msg=msg)
 
-        self.log('Discovery network device with id {0} got completed'.format(discovery_id), "INFO")
+        self.log('Discovery network device with id {0} got completed', "INFO", discovery_id)
         self.result.update(dict(discovery_device_info=devices))
         return result
 
@@ -1603,9 +1584,9 @@ class Discovery(DnacBase):
             op_modifies=True,
         )
 
-        self.log("Response collected from API 'delete_discovery_by_id': {0}".format(str(response)), "DEBUG")
+        self.log("Response collected from API 'delete_discovery_by_id': {0}", "DEBUG", response)
         self.result.update(dict(delete_discovery=response))
-        self.log("Task Id of the deletion task is {0}".format(response.response.get('taskId')), "INFO")
+        self.log("Task Id of the deletion task is {0}", "INFO", response.response.get('taskId'))
         return response.response.get('taskId')
 
     def get_diff_merged(self):
@@ -1707,8 +1688,8 @@ class Discovery(DnacBase):
             Center configuration's Discovery Database.
         """
 
-        self.log("Current State (have): {0}".format(str(self.have)), "INFO")
-        self.log("Desired State (want): {0}".format(str(config)), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
+        self.log("Desired State (want): {0}", "INFO", config)
         # Code to validate Cisco Catalyst Center config for merged state
         discovery_task_info = self.get_discoveries_by_range_until_success()
         discovery_id = discovery_task_info.get('id')
@@ -1723,10 +1704,10 @@ class Discovery(DnacBase):
         )
         discovery_name = config.get('discovery_name')
         if response:
-            self.log("Requested Discovery with name {0} is completed".format(discovery_name), "INFO")
+            self.log("Requested Discovery with name {0} is completed", "INFO", discovery_name)
 
         else:
-            self.log("Requested Discovery with name {0} is not completed".format(discovery_name), "WARNING")
+            self.log("Requested Discovery with name {0} is not completed", "WARNING", discovery_name)
         self.status = "success"
 
         return self
@@ -1745,8 +1726,8 @@ class Discovery(DnacBase):
             Discovery Database.
         """
 
-        self.log("Current State (have): {0}".format(str(self.have)), "INFO")
-        self.log("Desired State (want): {0}".format(str(config)), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
+        self.log("Desired State (want): {0}", "INFO", config)
         # Code to validate Cisco Catalyst Center config for deleted state
         if config.get("delete_all") is True:
             count_discoveries = self.dnac_apply['exec'](
@@ -1763,10 +1744,10 @@ class Discovery(DnacBase):
         discovery_task_info = self.lookup_discovery_by_range_via_name()
         discovery_name = config.get('discovery_name')
         if discovery_task_info:
-            self.log("Requested Discovery with name {0} is present".format(discovery_name), "WARNING")
+            self.log("Requested Discovery with name {0} is present", "WARNING", discovery_name)
 
         else:
-            self.log("Requested Discovery with name {0} is not present and deleted".format(discovery_name), "INFO")
+            self.log("Requested Discovery with name {0} is not present and deleted", "INFO", discovery_name)
         self.status = "success"
 
         return self
@@ -1787,10 +1768,25 @@ def main():
                     'dnac_log_level': {'type': 'str', 'default': 'WARNING'},
                     "dnac_log_file_path": {"type": 'str', "default": 'dnac.log'},
                     "dnac_log_append": {"type": 'bool', "default": True},
+                    "dnac_log_max_bytes": {"type": 'int', "default": 0},
+                    "dnac_log_backup_count": {"type": 'int', "default": 5},
+                    "dnac_log_compress": {"type": 'bool', "default": False},
+                    "dnac_log_format": {"type": 'str', "default": 'text', "choices": ['text', 'json']},
                     'validate_response_schema': {'type': 'bool', 'default': True},
                     'config_verify': {"type": 'bool', "default": False},
                     'dnac_api_task_timeout': {'type': 'int', "default": 1200},
                     'dnac_task_poll_interval': {'type': 'int', "default": 2},
+                    'dnac_token_cache': {'type': 'bool', 'default': False},
+                    'dnac_rate_limit': {'type': 'float', 'default': 0},
+                    'dnac_rate_limit_per_family': {'type': 'bool', 'default': False},
+                    'dnac_rate_limit_retries': {'type': 'int', 'default': 5},
+                    'dnac_shared_rate_limit': {'type': 'float', 'default': 0},
+                    'dnac_shared_family_concurrency': {'type': 'int', 'default': 0},
+                    'dnac_memoize_reads': {'type': 'bool', 'default': False},
+                    'dnac_metrics': {'type': 'bool', 'default': False},
+                    'dnac_metrics_file': {'type': 'str'},
+                    'dnac_timings': {'type': 'bool', 'default': False},
+                    'dnac_timings_file': {'type': 'str'},
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'merged', 'choices': ['merged', 'deleted']}
                     }
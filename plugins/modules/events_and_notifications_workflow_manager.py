@@ -1179,7 +1179,7 @@ class Events(DnacBase):
                 have["email_subscription_notifications"] = email_subscription_notifications
 
         self.have = have
-        self.log("Current State (have): {0}".format(str(have)), "INFO")
+        self.log("Current State (have): {0}", "INFO", have)
 
         return self
 
@@ -1226,7 +1226,7 @@ class Events(DnacBase):
         self.want = want
         self.msg = "Successfully collected all parameters from the playbook "
         self.status = "success"
-        self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+        self.log("Desired State (want): {0}", "INFO", self.want)
 
         return self
 
@@ -1252,11 +1252,11 @@ class Events(DnacBase):
                 op_modifies=True,
                 params={"name": name}
             )
-            self.log("Received API response from 'get_syslog_destination': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'get_syslog_destination': {0}", "DEBUG", response)
             response = response.get('statusMessage')
 
             if not response:
-                self.log("There is no Syslog destination '{0}' present in Cisco Catalyst Center".format(name), "INFO")
+                self.log("There is no Syslog destination '{0}' present in Cisco Catalyst Center", "INFO", name)
                 return response
 
             return response
@@ -1265,7 +1265,7 @@ class Events(DnacBase):
             if "Expecting value: line 1 column 1" in str(e):
                 self.log(
                     "Getting expection as Syslog destination with given name '{0}' not present in Cisco Catalyst"
-                    " Center.".format(name), "WARNING"
+                    " Center.", "WARNING", name
                 )
                 return None
             self.status = "failed"
@@ -1360,7 +1360,7 @@ class Events(DnacBase):
                 op_modifies=True,
                 params=add_syslog_params
             )
-            self.log("Received API response from 'create_syslog_destination': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'create_syslog_destination': {0}", "DEBUG", response)
             status = response.get('apiStatus')
 
             if status == 'SUCCESS':
@@ -1430,7 +1430,7 @@ class Events(DnacBase):
                 op_modifies=True,
                 params=update_syslog_params
             )
-            self.log("Received API response from 'update_syslog_destination': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'update_syslog_destination': {0}", "DEBUG", response)
             status = response.get('apiStatus')
 
             if status == 'SUCCESS':
@@ -1488,22 +1488,22 @@ class Events(DnacBase):
                         }
                     )
                     offset = offset + 1
-                    self.log("Received API response from 'get_snmp_destination': {0}".format(str(response)), "DEBUG")
+                    self.log("Received API response from 'get_snmp_destination': {0}", "DEBUG", response)
 
                     if not response:
-                        self.log("There is no SNMP destination with name '{0}' present in Cisco Catalyst Center".format(name), "INFO")
+                        self.log("There is no SNMP destination with name '{0}' present in Cisco Catalyst Center", "INFO", name)
                         return response
 
                     for destination in response:
                         if destination.get("name") == name:
-                            self.log("SNMP Destination '{0}' present in Cisco Catalyst Center".format(name), "INFO")
+                            self.log("SNMP Destination '{0}' present in Cisco Catalyst Center", "INFO", name)
                             return destination
                     time.sleep(1)
                 except Exception as e:
                     if "Expecting value: line 1 column 1" in str(e):
                         self.log(
                             "Getting expection as SNMP destination with given name '{0}' not present in Cisco Catalyst"
-                            " Center.".format(name), "WARNING"
+                            " Center.", "WARNING", name
                         )
                         return None
 
@@ -1660,7 +1660,7 @@ class Events(DnacBase):
                 op_modifies=True,
                 params=snmp_params
             )
-            self.log("Received API response from 'create_snmp_destination': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'create_snmp_destination': {0}", "DEBUG", response)
             status = response.get('apiStatus')
 
             if status == 'SUCCESS':
@@ -1782,7 +1782,7 @@ class Events(DnacBase):
                 op_modifies=True,
                 params=update_snmp_params
             )
-            self.log("Received API response from 'update_snmp_destination': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'update_snmp_destination': {0}", "DEBUG", response)
             status = response.get('apiStatus')
 
             if status == 'SUCCESS':
@@ -1839,7 +1839,7 @@ class Events(DnacBase):
                         }
                     )
                     offset = offset + 1
-                    self.log("Received API response from 'get_webhook_destination': {0}".format(str(response)), "DEBUG")
+                    self.log("Received API response from 'get_webhook_destination': {0}", "DEBUG", response)
                     response = response.get('statusMessage')
 
                     if not response:
@@ -1848,14 +1848,14 @@ class Events(DnacBase):
 
                     for destination in response:
                         if destination.get("name") == name:
-                            self.log("Webhook Destination '{0}' present in Cisco Catalyst Center".format(name), "INFO")
+                            self.log("Webhook Destination '{0}' present in Cisco Catalyst Center", "INFO", name)
                             return destination
                     time.sleep(1)
                 except Exception as e:
                     if "Expecting value: line 1 column 1" in str(e):
                         self.log(
                             "Getting expection as Syslog destination with given name '{0}' not present in Cisco Catalyst"
-                            " Center.".format(name), "WARNING"
+                            " Center.", "WARNING", name
                         )
                         return None
 
@@ -1919,14 +1919,14 @@ class Events(DnacBase):
             if webhook_params.get("isProxyRoute") is None:
                 webhook_params["isProxyRoute"] = True
 
-            self.log("Requested payload for creating webhook destination - {0}".format(str(webhook_params)), "INFO")
+            self.log("Requested payload for creating webhook destination - {0}", "INFO", webhook_params)
             response = self.dnac._exec(
                 family="event_management",
                 function='create_webhook_destination',
                 op_modifies=True,
                 params=webhook_params
             )
-            self.log("Received API response from 'create_webhook_destination': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'create_webhook_destination': {0}", "DEBUG", response)
             status = response.get('apiStatus')
 
             if status == 'SUCCESS':
@@ -2062,7 +2062,7 @@ class Events(DnacBase):
                 op_modifies=True,
                 params=update_webhook_params
             )
-            self.log("Received API response from 'update_webhook_destination': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'update_webhook_destination': {0}", "DEBUG", response)
             status = response.get('apiStatus')
 
             if status == 'SUCCESS':
@@ -2110,7 +2110,7 @@ class Events(DnacBase):
                 family="event_management",
                 function='get_email_destination'
             )
-            self.log("Received API response from 'get_email_destination': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'get_email_destination': {0}", "DEBUG", response)
 
             if not response:
                 self.log("There is no Email destination present in Cisco Catalyst Center", "INFO")
@@ -2221,7 +2221,7 @@ class Events(DnacBase):
                 op_modifies=True,
                 params=email_params
             )
-            self.log("Received API response from 'create_email_destination': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'create_email_destination': {0}", "DEBUG", response)
             time.sleep(2)
             status = response.get('statusUri')
             status_execution_id = status.split("/")[-1]
@@ -2324,7 +2324,7 @@ class Events(DnacBase):
                 op_modifies=True,
                 params=update_email_params
             )
-            self.log("Received API response from 'update_email_destination': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'update_email_destination': {0}", "DEBUG", response)
             time.sleep(2)
             status = response.get('statusUri')
             status_execution_id = status.split("/")[-1]
@@ -2378,7 +2378,7 @@ class Events(DnacBase):
                 op_modifies=True,
                 params={"name": name}
             )
-            self.log("Received API response from 'get_all_itsm_integration_settings': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'get_all_itsm_integration_settings': {0}", "DEBUG", response)
             response = response.get('data')
             if not response:
                 self.log("There is no ITSM Integration settings present in Cisco Catalyst Center", "INFO")
@@ -2413,7 +2413,7 @@ class Events(DnacBase):
                 op_modifies=True,
                 params={"instance_id": itsm_id}
             )
-            self.log("Received API response from 'get_itsm_integration_setting_by_id': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'get_itsm_integration_setting_by_id': {0}", "DEBUG", response)
 
             if not response:
                 self.log("There is no ITSM Integration settings with given ID present in Cisco Catalyst Center", "INFO")
@@ -2509,7 +2509,7 @@ class Events(DnacBase):
                 op_modifies=True,
                 params=itsm_params
             )
-            self.log("Received API response from 'create_itsm_integration_setting': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'create_itsm_integration_setting': {0}", "DEBUG", response)
             created_date = response.get('createdDate')
 
             if created_date:
@@ -2650,7 +2650,7 @@ class Events(DnacBase):
                 op_modifies=True,
                 params=itsm_param_dict,
             )
-            self.log("Received API response from 'update_itsm_integration_setting': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'update_itsm_integration_setting': {0}", "DEBUG", response)
 
             updated_date = response.get('updatedDate')
 
@@ -2706,7 +2706,7 @@ class Events(DnacBase):
                 op_modifies=True,
                 params={"instance_id": itsm_id}
             )
-            self.log("Received API response from 'delete_itsm_integration_setting': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'delete_itsm_integration_setting': {0}", "DEBUG", response)
 
             if "successfully" in response:
                 self.msg = "ITSM Integration settings instance with name '{0}' deleted successfully from Cisco Catalyst Center".format(itsm_name)
@@ -2750,10 +2750,10 @@ class Events(DnacBase):
                 op_modifies=True,
                 params={"name": name}
             )
-            self.log("Received API response from 'get_syslog_event_subscriptions': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'get_syslog_event_subscriptions': {0}", "DEBUG", response)
 
             if not response:
-                self.log("There is no Syslog Event Notification with given name '{0}' present in Cisco Catalyst Center.".format(name), "INFO")
+                self.log("There is no Syslog Event Notification with given name '{0}' present in Cisco Catalyst Center.", "INFO", name)
                 return response
 
             return response
@@ -2762,7 +2762,7 @@ class Events(DnacBase):
             if "Expecting value: line 1 column 1" in str(e):
                 self.log(
                     "Getting expection as Syslog Event Notification with given name '{0}' not present in Cisco Catalyst"
-                    " Center.".format(name), "WARNING"
+                    " Center.", "WARNING", name
                 )
                 return None
             self.status = "failed"
@@ -2797,10 +2797,10 @@ class Events(DnacBase):
                 op_modifies=True,
                 params={"name": destination}
             )
-            self.log("Received API response from 'get_syslog_subscription_details': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'get_syslog_subscription_details': {0}", "DEBUG", response)
 
             if not response:
-                self.log("Syslog destination with the name '{0}' not found in Cisco Catalyst Center.".format(destination), "INFO")
+                self.log("Syslog destination with the name '{0}' not found in Cisco Catalyst Center.", "INFO", destination)
                 return response
 
             return response[0]
@@ -2809,7 +2809,7 @@ class Events(DnacBase):
             if "Expecting value: line 1 column 1" in str(e):
                 self.log(
                     "Getting expection as Syslog destination with given name '{0}' not present in Cisco Catalyst"
-                    " Center.".format(destination), "WARNING"
+                    " Center.", "WARNING", destination
                 )
                 return None
             self.status = "failed"
@@ -2963,23 +2963,22 @@ class Events(DnacBase):
         """
 
         event_ids = []
+        calls = [("event_management", "get_eventartifacts", {"search": event_name}) for event_name in events]
 
-        for event_name in events:
-            try:
-                response = self.dnac._exec(
-                    family="event_management",
-                    function='get_eventartifacts',
-                    op_modifies=True,
-                    params={"search": event_name}
-                )
-                self.log("Received API response from 'get_eventartifacts': {0}".format(str(response)), "DEBUG")
+        for event_name, result in zip(events, self.map_exec(calls, op_modifies=True)):
+            if result.failed:
+                self.msg = """Error while getting the details of Event with given name '{0}' present in
+                        Cisco Catalyst Center: {1}""".format(event_name, str(result.error))
+                self.log(self.msg, "ERROR")
+                continue
 
-                if not response:
-                    self.log("There is no Event with name '{0}' present in Cisco Catalyst Center.".format(event_name), "INFO")
-                    continue
+            response = result.response
+            if not response:
+                self.log("There is no Event with name '{0}' present in Cisco Catalyst Center.", "INFO", event_name)
+                continue
 
-                response = response[0]
-                event_payload = response.get('eventPayload')
+            try:
+                event_payload = response[0].get('eventPayload')
                 if event_payload:
                     event_id = event_payload.get('eventId')
                     event_ids.append(event_id)
@@ -3008,22 +3007,23 @@ class Events(DnacBase):
         """
 
         site_ids = []
-        for site in sites:
+        calls = [("sites", "get_site", {"name": site}) for site in sites]
+
+        for site, result in zip(sites, self.map_exec(calls, op_modifies=True)):
+            if result.failed:
+                self.msg = """Error while getting the details of Site with given name '{0}' present in
+                        Cisco Catalyst Center: {1}""".format(site, str(result.error))
+                self.log(self.msg, "ERROR")
+                continue
+
             try:
-                response = self.dnac._exec(
-                    family="sites",
-                    function='get_site',
-                    op_modifies=True,
-                    params={"name": site},
-                )
-                self.log("Received API response from 'get_site': {0}".format(str(response)), "DEBUG")
-                response = response.get('response')
+                response = result.response.get('response')
                 if not response:
-                    self.log("No site with the name '{0}' found in Cisco Catalyst Center.".format(site), "INFO")
+                    self.log("No site with the name '{0}' found in Cisco Catalyst Center.", "INFO", site)
                     continue
                 site_id = response[0].get("id")
                 if not site_id:
-                    self.log("Site '{0}' found, but no ID available in the response.".format(site), "WARNING")
+                    self.log("Site '{0}' found, but no ID available in the response.", "WARNING", site)
                     continue
                 site_ids.append(site_id)
 
@@ -3061,7 +3061,7 @@ class Events(DnacBase):
 
         }
         # Collect the Instance ID of the syslog destination
-        self.log("Collecting parameters for Syslog Event Notification named '{0}'.".format(name), "INFO")
+        self.log("Collecting parameters for Syslog Event Notification named '{0}'.", "INFO", name)
         destination = syslog_notification_details.get('destination')
 
         if destination:
@@ -3142,7 +3142,7 @@ class Events(DnacBase):
 
             playbook_params["filter"]["siteIds"] = site_ids
         syslog_notification_params.append(playbook_params)
-        self.log("Syslog notification playbook parameters collected successfully for '{0}': {1}".format(name, playbook_params), "INFO")
+        self.log("Syslog notification playbook parameters collected successfully for '{0}': {1}", "INFO", name, playbook_params)
 
         return syslog_notification_params
 
@@ -3212,7 +3212,7 @@ class Events(DnacBase):
 
         try:
             notification_name = syslog_notification_params[0].get('name')
-            self.log("Requested payload for create_syslog_event_subscription - {0}".format(str(syslog_notification_params)), "INFO")
+            self.log("Requested payload for create_syslog_event_subscription - {0}", "INFO", syslog_notification_params)
             response = self.dnac._exec(
                 family="event_management",
                 function='create_syslog_event_subscription',
@@ -3220,7 +3220,7 @@ class Events(DnacBase):
                 params={'payload': syslog_notification_params}
             )
             time.sleep(1)
-            self.log("Received API response from 'create_syslog_event_subscription': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'create_syslog_event_subscription': {0}", "DEBUG", response)
             status = response.get('statusUri')
             status_execution_id = status.split("/")[-1]
             status_response = self.check_status_api_events(status_execution_id)
@@ -3308,14 +3308,14 @@ class Events(DnacBase):
                 subdomain_in_ccc = domain_subdomain_in_ccc.get("subDomains")
 
                 if domain_input and domain_input != domain_in_ccc:
-                    self.log("Domain '{0}' given in the playbook does not match with domain in Cisco Catalyst Center".format(domain_input), "INFO")
+                    self.log("Domain '{0}' given in the playbook does not match with domain in Cisco Catalyst Center", "INFO", domain_input)
                     return True
 
                 if subdomains_input:
                     list_needs_update = self.is_element_missing(subdomains_input, subdomain_in_ccc)
                     if list_needs_update:
-                        self.log(("Given subdomain_names '{0}' in the playbook do not match with the values present in "
-                                 "Cisco Catalyst Center, so the notification needs an update.").format(subdomains_input), "INFO")
+                        self.log("Given subdomain_names '{0}' in the playbook do not match with the values present in "
+                                 "Cisco Catalyst Center, so the notification needs an update.", "INFO", subdomains_input)
                     return True
             elif isinstance(value, list):
                 if key == "severities":
@@ -3327,8 +3327,8 @@ class Events(DnacBase):
                     list_needs_update = self.is_element_missing(value, filters_in_ccc[key])
 
                 if list_needs_update:
-                    self.log(("Parameter '{0}' given in the playbook does not match with the value present in Cisco Catalyst "
-                             "Center so notification needs update.").format(key), "INFO")
+                    self.log("Parameter '{0}' given in the playbook does not match with the value present in Cisco Catalyst "
+                             "Center so notification needs update.", "INFO", key)
                     return True
 
         return False
@@ -3359,7 +3359,7 @@ class Events(DnacBase):
 
         if description_in_playbook and description_in_playbook != description_in_ccc:
             self.log("Parameter 'description' does not match with the value of description present in Cisco Catalyst Center "
-                     "so given Syslog Event Notification '{0}' needs an update".format(name), "INFO")
+                     "so given Syslog Event Notification '{0}' needs an update", "INFO", name)
             return True
 
         if subs_endpoints:
@@ -3367,7 +3367,7 @@ class Events(DnacBase):
             ccc_instance_id = ccc_endpoints.get("instanceId")
             if instance_id != ccc_instance_id:
                 self.log("Given Syslog destination in the playbook is different from Syslog destination present in Cisco Catalyst Center "
-                         "so given Syslog Event Notification '{0}' needs an update".format(name), "INFO")
+                         "so given Syslog Event Notification '{0}' needs an update", "INFO", name)
                 return True
 
         filters_in_playbook = syslog_notification_params.get("filter")
@@ -3375,7 +3375,7 @@ class Events(DnacBase):
 
         if self.compare_notification_filters(filters_in_playbook, filters_in_ccc):
             self.log("Notification filters differ between the playbook and Cisco Catalyst Center. Syslog Event Subscription Notification "
-                     "'{0}' needs an update.".format(name), "INFO")
+                     "'{0}' needs an update.", "INFO", name)
             return True
 
         return False
@@ -3457,7 +3457,7 @@ class Events(DnacBase):
         sys_notification_update_params.append(notification_params)
 
         try:
-            self.log("Requested payload for update_syslog_event_subscription - {0}".format(str(sys_notification_update_params)), "INFO")
+            self.log("Requested payload for update_syslog_event_subscription - {0}", "INFO", sys_notification_update_params)
             response = self.dnac._exec(
                 family="event_management",
                 function='update_syslog_event_subscription',
@@ -3465,7 +3465,7 @@ class Events(DnacBase):
                 params={'payload': sys_notification_update_params}
             )
             time.sleep(1)
-            self.log("Received API response from 'update_syslog_event_subscription': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'update_syslog_event_subscription': {0}", "DEBUG", response)
             status = response.get('statusUri')
             status_execution_id = status.split("/")[-1]
             status_response = self.check_status_api_events(status_execution_id)
@@ -3518,10 +3518,10 @@ class Events(DnacBase):
                 op_modifies=True,
                 params={"name": name}
             )
-            self.log("Received API response from 'get_rest_webhook_event_subscriptions': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'get_rest_webhook_event_subscriptions': {0}", "DEBUG", response)
 
             if not response:
-                self.log("There is no Webhook Event Notification with given name '{0}' present in Cisco Catalyst Center.".format(name), "INFO")
+                self.log("There is no Webhook Event Notification with given name '{0}' present in Cisco Catalyst Center.", "INFO", name)
                 return response
 
             return response
@@ -3530,11 +3530,11 @@ class Events(DnacBase):
             if "Expecting value: line 1 column 1" in str(e):
                 self.log(
                     "Getting expection as Webhook Event Notification with given name '{0}' not present in Cisco Catalyst"
-                    " Center.".format(name), "WARNING"
+                    " Center.", "WARNING", name
                 )
                 return None
             self.status = "failed"
-            self.log("Error while retrieving Webhook Event Notification details: {0}".format(str(e)), "ERROR")
+            self.log("Error while retrieving Webhook Event Notification details: {0}", "ERROR", e)
             self.log(self.msg, "ERROR")
             self.check_return_status()
 
@@ -3561,9 +3561,9 @@ class Events(DnacBase):
                 op_modifies=True,
                 params={"name": destination}
             )
-            self.log("Received API response from 'get_rest_webhook_subscription_details': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'get_rest_webhook_subscription_details': {0}", "DEBUG", response)
             if not response:
-                self.log("Webhook destination with the name '{0}' not found in Cisco Catalyst Center.".format(destination), "INFO")
+                self.log("Webhook destination with the name '{0}' not found in Cisco Catalyst Center.", "INFO", destination)
                 return response
 
             return response[0]
@@ -3572,7 +3572,7 @@ class Events(DnacBase):
             if "Expecting value: line 1 column 1" in str(e):
                 self.log(
                     "Getting expection as Webhook destination with given name '{0}' not present in Cisco Catalyst"
-                    " Center.".format(destination), "WARNING"
+                    " Center.", "WARNING", destination
                 )
                 return None
             self.status = "failed"
@@ -3608,7 +3608,7 @@ class Events(DnacBase):
 
         }
         # Collect the Instance ID of the webhook destination
-        self.log("Collecting parameters for Webhook Event Notification named '{0}'.".format(name), "INFO")
+        self.log("Collecting parameters for Webhook Event Notification named '{0}'.", "INFO", name)
         destination = webhook_notification_details.get('destination')
 
         if destination:
@@ -3688,9 +3688,9 @@ class Events(DnacBase):
                 self.log(self.msg, "INFO")
 
             playbook_params["filter"]["siteIds"] = site_ids
-            self.log("Site IDs '{0}' found for site names '{1}'. Added to filter.".format(site_ids, sites), "INFO")
+            self.log("Site IDs '{0}' found for site names '{1}'. Added to filter.", "INFO", site_ids, sites)
 
-        self.log("Webhook notification playbook parameters collected successfully for '{0}': {1}".format(name, playbook_params), "INFO")
+        self.log("Webhook notification playbook parameters collected successfully for '{0}': {1}", "INFO", name, playbook_params)
         webhook_notification_params.append(playbook_params)
 
         return webhook_notification_params
@@ -3761,7 +3761,7 @@ class Events(DnacBase):
 
         try:
             notification_name = webhook_notification_params[0].get('name')
-            self.log("Requested payload for create_rest_webhook_event_subscription - {0}".format(str(webhook_notification_params)), "INFO")
+            self.log("Requested payload for create_rest_webhook_event_subscription - {0}", "INFO", webhook_notification_params)
             response = self.dnac._exec(
                 family="event_management",
                 function='create_rest_webhook_event_subscription',
@@ -3769,7 +3769,7 @@ class Events(DnacBase):
                 params={'payload': webhook_notification_params}
             )
             time.sleep(1)
-            self.log("Received API response from 'create_rest_webhook_event_subscription': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'create_rest_webhook_event_subscription': {0}", "DEBUG", response)
             status = response.get('statusUri')
             status_execution_id = status.split("/")[-1]
             status_response = self.check_status_api_events(status_execution_id)
@@ -3826,7 +3826,7 @@ class Events(DnacBase):
 
         if description_in_playbook and description_in_playbook != description_in_ccc:
             self.log("Parameter 'description' does not match with the value of description present in Cisco Catalyst Center "
-                     "so given Webhook Event Notification '{0}' needs an update".format(name), "INFO")
+                     "so given Webhook Event Notification '{0}' needs an update", "INFO", name)
             return True
 
         if subs_endpoints:
@@ -3834,7 +3834,7 @@ class Events(DnacBase):
             ccc_instance_id = ccc_endpoints.get("instanceId")
             if instance_id != ccc_instance_id:
                 self.log("Given Webhook destination in the playbook is different from Webhook destination present in Cisco Catalyst "
-                         "Center so given Webhook Event Subscription Notification '{0}' needs an update".format(name), "INFO")
+                         "Center so given Webhook Event Subscription Notification '{0}' needs an update", "INFO", name)
                 return True
 
         filters_in_playbook = webhook_params.get("filter")
@@ -3842,7 +3842,7 @@ class Events(DnacBase):
 
         if self.compare_notification_filters(filters_in_playbook, filters_in_ccc):
             self.log("Notification filters differ between the playbook and Cisco Catalyst Center. Webhook Event Subscription Notification "
-                     "'{0}' needs an update.".format(name), "INFO")
+                     "'{0}' needs an update.", "INFO", name)
             return True
 
         return False
@@ -3895,7 +3895,7 @@ class Events(DnacBase):
         web_notification_update_params.append(webhook_update_params)
 
         try:
-            self.log("Requested payload for update_rest_webhook_event_subscription - {0}".format(str(web_notification_update_params)), "INFO")
+            self.log("Requested payload for update_rest_webhook_event_subscription - {0}", "INFO", web_notification_update_params)
             response = self.dnac._exec(
                 family="event_management",
                 function='update_rest_webhook_event_subscription',
@@ -3903,7 +3903,7 @@ class Events(DnacBase):
                 params={'payload': web_notification_update_params}
             )
             time.sleep(1)
-            self.log("Received API response from 'update_rest_webhook_event_subscription': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'update_rest_webhook_event_subscription': {0}", "DEBUG", response)
             status = response.get('statusUri')
             status_execution_id = status.split("/")[-1]
             status_response = self.check_status_api_events(status_execution_id)
@@ -3956,10 +3956,10 @@ class Events(DnacBase):
                 op_modifies=True,
                 params={"name": name}
             )
-            self.log("Received API response from 'get_email_event_subscriptions': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'get_email_event_subscriptions': {0}", "DEBUG", response)
 
             if not response:
-                self.log("There is no Email Event Notification with given name '{0}' present in Cisco Catalyst Center.".format(name), "INFO")
+                self.log("There is no Email Event Notification with given name '{0}' present in Cisco Catalyst Center.", "INFO", name)
                 return response
 
             return response
@@ -3968,7 +3968,7 @@ class Events(DnacBase):
             if "Expecting value: line 1 column 1" in str(e):
                 self.log(
                     "Getting expection as Email Event Notification with given name '{0}' not present in Cisco Catalyst"
-                    " Center.".format(name), "WARNING"
+                    " Center.", "WARNING", name
                 )
                 return None
             self.msg = "Exception occurred while retrieving Email Event Subscription Notification: {0}".format(str(e))
@@ -3998,11 +3998,11 @@ class Events(DnacBase):
                 op_modifies=True,
                 params={"name": instance}
             )
-            self.log("Received API response from 'get_email_subscription_details': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'get_email_subscription_details': {0}", "DEBUG", response)
             email_destination_details = None
 
             if not response:
-                self.log("Email instance with given name '{0}' present in Cisco Catalyst Center.".format(instance), "INFO")
+                self.log("Email instance with given name '{0}' present in Cisco Catalyst Center.", "INFO", instance)
                 return response
 
             return response[0]
@@ -4011,7 +4011,7 @@ class Events(DnacBase):
             if "Expecting value: line 1 column 1" in str(e):
                 self.log(
                     "Getting expection as Email instance with given name '{0}' not present in Cisco Catalyst"
-                    " Center.".format(instance), "WARNING"
+                    " Center.", "WARNING", instance
                 )
                 return None
             self.status = "failed"
@@ -4047,7 +4047,7 @@ class Events(DnacBase):
 
         }
         # Collect the Instance ID of the email destination
-        self.log("Collecting parameters for Email Event Notification named '{0}'.".format(email_notf_name), "INFO")
+        self.log("Collecting parameters for Email Event Notification named '{0}'.", "INFO", email_notf_name)
         instance = email_notification_details.get('instance')
 
         if not instance:
@@ -4195,8 +4195,7 @@ class Events(DnacBase):
         email_notification_params.append(playbook_params)
         self.log(
             "Email notification playbook parameters collected successfully for "
-            "'{0}': {1}"
-            .format(email_notf_name, playbook_params), "INFO"
+            "'{0}': {1}", "INFO", email_notf_name, playbook_params
         )
 
         return email_notification_params
@@ -4262,7 +4261,7 @@ class Events(DnacBase):
 
         try:
             notification_name = email_notification_params[0].get('name')
-            self.log("Requested payload for create_email_event_subscription - {0}".format(str(email_notification_params)), "INFO")
+            self.log("Requested payload for create_email_event_subscription - {0}", "INFO", email_notification_params)
             response = self.dnac._exec(
                 family="event_management",
                 function='create_email_event_subscription',
@@ -4270,7 +4269,7 @@ class Events(DnacBase):
                 params={'payload': email_notification_params}
             )
             time.sleep(1)
-            self.log("Received API response from 'create_email_event_subscription': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'create_email_event_subscription': {0}", "DEBUG", response)
             status = response.get('statusUri')
             status_execution_id = status.split("/")[-1]
             status_response = self.check_status_api_events(status_execution_id)
@@ -4328,7 +4327,7 @@ class Events(DnacBase):
 
                 if list_needs_update:
                     self.log("""Parameter '{0}' given in the playbook does not match with the value present in Cisco Catalyst Center
-                                so notification needs update.""".format(param), "INFO")
+                                so notification needs update.""", "INFO", param)
                     return True
             elif subs_endpoints.get(param) != ccc_endpoints.get(param):
                 return True
@@ -4361,7 +4360,7 @@ class Events(DnacBase):
 
         if description_in_playbook and description_in_playbook != description_in_ccc:
             self.log("Parameter 'description' does not match with the value of description present in Cisco Catalyst Center "
-                     "so given Email Event Notification '{0}' needs an update".format(name), "INFO")
+                     "so given Email Event Notification '{0}' needs an update", "INFO", name)
             return True
 
         if subs_endpoints:
@@ -4370,7 +4369,7 @@ class Events(DnacBase):
 
             if notification_update:
                 self.log("Given Email Instance details in the playbook is different from email instance present in Cisco Catalyst "
-                         "Center so given email Event Subscription Notification {0} needs an update".format(name), "INFO")
+                         "Center so given email Event Subscription Notification {0} needs an update", "INFO", name)
                 return True
 
         filters_in_playbook = email_notification_params.get("filter")
@@ -4378,7 +4377,7 @@ class Events(DnacBase):
 
         if self.compare_notification_filters(filters_in_playbook, filters_in_ccc):
             self.log("Notification filters differ between the playbook and Cisco Catalyst Center. Email Event Subscription Notification "
-                     "'{0}' needs an update.".format(name), "INFO")
+                     "'{0}' needs an update.", "INFO", name)
             return True
 
         return False
@@ -4437,7 +4436,7 @@ class Events(DnacBase):
         notification_update_params.append(email_update_params)
 
         try:
-            self.log("Updating Email Event Notification '{0}' with following payload: {1}".format(name, str(notification_update_params)), "INFO")
+            self.log("Updating Email Event Notification '{0}' with following payload: {1}", "INFO", name, notification_update_params)
             response = self.dnac._exec(
                 family="event_management",
                 function='update_email_event_subscription',
@@ -4445,7 +4444,7 @@ class Events(DnacBase):
                 params={'payload': notification_update_params}
             )
             time.sleep(2)
-            self.log("Received API response from 'update_email_event_subscription': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'update_email_event_subscription': {0}", "DEBUG", response)
             status = response.get('statusUri')
             status_execution_id = status.split("/")[-1]
             status_response = self.check_status_api_events(status_execution_id)
@@ -4501,7 +4500,7 @@ class Events(DnacBase):
                 op_modifies=True,
                 params={"subscriptions": subscription_id},
             )
-            self.log("Received API response from 'update_email_event_subscription': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'update_email_event_subscription': {0}", "DEBUG", response)
             status = response.get('statusUri')
             status_execution_id = status.split("/")[-1]
             status_response = self.check_status_api_events(status_execution_id)
@@ -4851,7 +4850,7 @@ class Events(DnacBase):
                 # Need to add snmp destination in Cisco Catalyst Center with given playbook params
                 self.check_snmp_required_parameters(snmp_params).check_return_status()
                 self.log("""Required parameter validated successfully for adding SNMP Destination with name '{0}' in Cisco
-                            Catalyst Center.""".format(destination), "INFO")
+                            Catalyst Center.""", "INFO", destination)
                 self.add_snmp_destination(snmp_params).check_return_status()
             else:
                 # Check destination needs update and if yes then update SNMP Destination
@@ -4969,7 +4968,7 @@ class Events(DnacBase):
                 # Need to create webhook event notification in Cisco Catalyst Center
                 self.mandatory_webhook_notification_parameter_check(webhook_notification_params).check_return_status()
                 self.log("""Successfully validated the required parameter for creating the Webhook Event Notification with
-                    given name '{0}'""".format(notification_name), "INFO")
+                    given name '{0}'""", "INFO", notification_name)
                 self.create_webhook_notification(webhook_notification_params).check_return_status()
             else:
                 webhook_notification_in_ccc = self.have.get("webhook_subscription_notifications")[0]
@@ -5004,7 +5003,7 @@ class Events(DnacBase):
                 # Need to create email event notification in Cisco Catalyst Center
                 self.mandatory_email_notification_parameter_check(email_notification_params).check_return_status()
                 self.log("""Successfully validated the required parameter for creating the email Event Notification with
-                    given name '{0}'""".format(notification_name), "INFO")
+                    given name '{0}'""", "INFO", notification_name)
                 self.create_email_notification(email_notification_params).check_return_status()
             else:
                 email_notification_in_ccc = self.have.get("email_subscription_notifications")[0]
@@ -5040,7 +5039,7 @@ class Events(DnacBase):
                 # Need to create syslog event notification in Cisco Catalyst Center
                 self.mandatory_syslog_notification_parameter_check(syslog_notification_params).check_return_status()
                 self.log("""Successfully validated the required parameter for creating the Syslog Event Notification with
-                    given name '{0}'""".format(notification_name), "INFO")
+                    given name '{0}'""", "INFO", notification_name)
                 self.create_syslog_notification(syslog_notification_params).check_return_status()
             else:
                 syslog_notification_in_ccc = self.have.get("syslog_subscription_notifications")[0]
@@ -5257,8 +5256,8 @@ class Events(DnacBase):
         """
 
         self.get_have(config)
-        self.log("Current State (have): {0}".format(str(self.have)), "INFO")
-        self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
+        self.log("Desired State (want): {0}", "INFO", self.want)
 
         if config.get("syslog_destination"):
             syslog_details = self.want.get("syslog_details")
@@ -5272,7 +5271,7 @@ class Events(DnacBase):
                 self.log(msg, "INFO")
             else:
                 self.log("""Playbook's input does not match with Cisco Catalyst Center, indicating that the Syslog destination with name
-                        '{0}' addition/updation task may not have executed successfully.""".format(syslog_name), "INFO")
+                        '{0}' addition/updation task may not have executed successfully.""", "INFO", syslog_name)
 
         if config.get("snmp_destination"):
             snmp_details = self.want.get("snmp_details")
@@ -5285,7 +5284,7 @@ class Events(DnacBase):
                 self.log(msg, "INFO")
             else:
                 self.log("""Playbook's input does not match with Cisco Catalyst Center, indicating that the SNMP destination with name
-                        '{0}' addition/updation task may not have executed successfully.""".format(snmp_dest_name), "INFO")
+                        '{0}' addition/updation task may not have executed successfully.""", "INFO", snmp_dest_name)
 
         if config.get("webhook_destination"):
             webhook_details = self.want.get("webhook_details")
@@ -5298,7 +5297,7 @@ class Events(DnacBase):
                 self.log(msg, "INFO")
             else:
                 self.log("""Playbook's input does not match with Cisco Catalyst Center, indicating that Rest Webhook destination with name
-                        '{0}' addition/updation task may not have executed successfully.""".format(webhook_name), "INFO")
+                        '{0}' addition/updation task may not have executed successfully.""", "INFO", webhook_name)
 
         if config.get("email_destination"):
 
@@ -5323,7 +5322,7 @@ class Events(DnacBase):
                 self.log(msg, "INFO")
             else:
                 self.log("""Playbook's input does not match with Cisco Catalyst Center, indicating that ITSM Integration setting with
-                        name '{0}' addition/updation task may not have executed successfully.""".format(itsm_name), "INFO")
+                        name '{0}' addition/updation task may not have executed successfully.""", "INFO", itsm_name)
 
         if config.get("webhook_event_notification"):
             webhook_notification_details = self.want.get("webhook_event_notification")
@@ -5336,7 +5335,7 @@ class Events(DnacBase):
                 self.log(msg, "INFO")
             else:
                 self.log("""Playbook's input does not match with Cisco Catalyst Center, indicating that Webhook Event Subscription Notification with
-                        name '{0}' creation/updation task may not have executed successfully.""".format(web_notification_name), "INFO")
+                        name '{0}' creation/updation task may not have executed successfully.""", "INFO", web_notification_name)
 
         if config.get("email_event_notification"):
             email_notification_details = self.want.get("email_event_notification")
@@ -5349,7 +5348,7 @@ class Events(DnacBase):
                 self.log(msg, "INFO")
             else:
                 self.log("""Playbook's input does not match with Cisco Catalyst Center, indicating that Email Event Subscription Notification with
-                        name '{0}' creation/updation task may not have executed successfully.""".format(email_notification_name), "INFO")
+                        name '{0}' creation/updation task may not have executed successfully.""", "INFO", email_notification_name)
 
         if config.get("syslog_event_notification"):
             syslog_notification_details = self.want.get("syslog_event_notification")
@@ -5362,7 +5361,7 @@ class Events(DnacBase):
                 self.log(msg, "INFO")
             else:
                 self.log("""Playbook's input does not match with Cisco Catalyst Center, indicating that Syslog Event Subscription Notification with
-                        name '{0}' creation/updation task may not have executed successfully.""".format(syslog_notification_name), "INFO")
+                        name '{0}' creation/updation task may not have executed successfully.""", "INFO", syslog_notification_name)
 
         return self
 
@@ -5380,8 +5379,8 @@ class Events(DnacBase):
         """
 
         self.get_have(config)
-        self.log("Current State (have): {0}".format(str(self.have)), "INFO")
-        self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
+        self.log("Desired State (want): {0}", "INFO", self.want)
 
         if config.get("itsm_setting"):
             itsm_details = self.want.get("itsm_details")
@@ -5395,7 +5394,7 @@ class Events(DnacBase):
                 self.log(msg, "INFO")
             else:
                 self.log("""Playbook's input does not match with Cisco Catalyst Center, indicating that ITSM Integration setting with
-                        name '{0}' deletion task may not have executed successfully.""".format(itsm_name), "INFO")
+                        name '{0}' deletion task may not have executed successfully.""", "INFO", itsm_name)
 
         if config.get("webhook_event_notification"):
             webhook_notification_details = self.want.get("webhook_event_notification")
@@ -5408,7 +5407,7 @@ class Events(DnacBase):
                 self.log(msg, "INFO")
             else:
                 self.log("""Playbook's input does not match with Cisco Catalyst Center, indicating that Webhook Events Subscription Notification
-                        with name '{0}' deletion task may not have executed successfully.""".format(web_notification_name), "INFO")
+                        with name '{0}' deletion task may not have executed successfully.""", "INFO", web_notification_name)
 
         if config.get("email_event_notification"):
             email_notification_details = self.want.get("email_event_notification")
@@ -5421,7 +5420,7 @@ class Events(DnacBase):
                 self.log(msg, "INFO")
             else:
                 self.log("""Playbook's input does not match with Cisco Catalyst Center, indicating that Email Events Subscription Notification
-                        with name '{0}' deletion task may not have executed successfully.""".format(email_notification_name), "INFO")
+                        with name '{0}' deletion task may not have executed successfully.""", "INFO", email_notification_name)
 
         if config.get("syslog_event_notification"):
             syslog_notification_details = self.want.get("syslog_event_notification")
@@ -5434,7 +5433,7 @@ class Events(DnacBase):
                 self.log(msg, "INFO")
             else:
                 self.log("""Playbook's input does not match with Cisco Catalyst Center, indicating that Syslog Events Subscription Notification
-                        with name '{0}' deletion task may not have executed successfully.""".format(syslog_notification_name), "INFO")
+                        with name '{0}' deletion task may not have executed successfully.""", "INFO", syslog_notification_name)
 
         return self
 
@@ -5453,11 +5452,26 @@ def main():
                     'dnac_log_level': {'type': 'str', 'default': 'WARNING'},
                     "dnac_log_file_path": {"type": 'str', "default": 'dnac.log'},
                     "dnac_log_append": {"type": 'bool', "default": True},
+                    "dnac_log_max_bytes": {"type": 'int', "default": 0},
+                    "dnac_log_backup_count": {"type": 'int', "default": 5},
+                    "dnac_log_compress": {"type": 'bool', "default": False},
+                    "dnac_log_format": {"type": 'str', "default": 'text', "choices": ['text', 'json']},
                     'dnac_log': {'type': 'bool', 'default': False},
                     'validate_response_schema': {'type': 'bool', 'default': True},
                     'config_verify': {'type': 'bool', "default": False},
                     'dnac_api_task_timeout': {'type': 'int', "default": 1200},
                     'dnac_task_poll_interval': {'type': 'int', "default": 2},
+                    'dnac_token_cache': {'type': 'bool', 'default': False},
+                    'dnac_rate_limit': {'type': 'float', 'default': 0},
+                    'dnac_rate_limit_per_family': {'type': 'bool', 'default': False},
+                    'dnac_rate_limit_retries': {'type': 'int', 'default': 5},
+                    'dnac_shared_rate_limit': {'type': 'float', 'default': 0},
+                    'dnac_shared_family_concurrency': {'type': 'int', 'default': 0},
+                    'dnac_memoize_reads': {'type': 'bool', 'default': False},
+                    'dnac_metrics': {'type': 'bool', 'default': False},
+                    'dnac_metrics_file': {'type': 'str'},
+                    'dnac_timings': {'type': 'bool', 'default': False},
+                    'dnac_timings_file': {'type': 'str'},
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'merged', 'choices': ['merged', 'deleted']}
                     }
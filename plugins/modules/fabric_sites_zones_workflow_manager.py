@@ -383,7 +383,7 @@ class FabricSitesZones(DnacBase):
                 op_modifies=True,
                 params={"name": site_name},
             )
-            self.log("Received API response from 'get_site': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'get_site': {0}", "DEBUG", response)
             response = response.get('response')
 
             if not response or not response[0].get("id"):
@@ -427,10 +427,10 @@ class FabricSitesZones(DnacBase):
                 params={"site_id": site_id},
             )
             response = response.get("response")
-            self.log("Received API response from 'get_fabric_sites' for the site '{0}': {1}".format(site_name, str(response)), "DEBUG")
+            self.log("Received API response from 'get_fabric_sites' for the site '{0}': {1}", "DEBUG", site_name, response)
 
             if not response:
-                self.log("Given site '{0}' is not a fabric site in Cisco Catalyst Center.".format(site_name), "INFO")
+                self.log("Given site '{0}' is not a fabric site in Cisco Catalyst Center.", "INFO", site_name)
                 return None
 
             return response[0]
@@ -468,10 +468,10 @@ class FabricSitesZones(DnacBase):
                 params={"site_id": site_id},
             )
             response = response.get("response")
-            self.log("Received API response from 'get_fabric_zones' for the site '{0}': {1}".format(site_name, str(response)), "DEBUG")
+            self.log("Received API response from 'get_fabric_zones' for the site '{0}': {1}", "DEBUG", site_name, response)
 
             if not response:
-                self.log("Given site '{0}' is not a fabric zone in Cisco Catalyst Center.".format(site_name), "INFO")
+                self.log("Given site '{0}' is not a fabric zone in Cisco Catalyst Center.", "INFO", site_name)
                 return None
 
             return response[0]
@@ -518,16 +518,16 @@ class FabricSitesZones(DnacBase):
             if site_type == "fabric_site":
                 site_detail = self.get_fabric_site_detail(site_name, site_id)
                 if site_detail:
-                    self.log("Site detail for fabric site {0} collected successfully.".format(site_name), "DEBUG")
+                    self.log("Site detail for fabric site {0} collected successfully.", "DEBUG", site_name)
                     have["fabric_sites_ids"].append(site_detail.get("siteId"))
             else:
                 zone_detail = self.get_fabric_zone_detail(site_name, site_id)
                 if zone_detail:
-                    self.log("Site detail for fabric zone {0} collected successfully.".format(site_name), "DEBUG")
+                    self.log("Site detail for fabric zone {0} collected successfully.", "DEBUG", site_name)
                     have["fabric_zone_ids"].append(zone_detail.get("siteId"))
 
         self.have = have
-        self.log("Current State (have): {0}".format(str(have)), "INFO")
+        self.log("Current State (have): {0}", "INFO", have)
 
         return self
 
@@ -595,7 +595,7 @@ class FabricSitesZones(DnacBase):
         self.want = want
         self.msg = "Successfully collected all parameters from the playbook for creating/updating the fabric sites/zones."
         self.status = "success"
-        self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+        self.log("Desired State (want): {0}", "INFO", self.want)
 
         return self
 
@@ -639,7 +639,7 @@ class FabricSitesZones(DnacBase):
                 "isPubSubEnabled": site.get("is_pub_sub_enabled", False)
             }
             fabric_site_payload.append(site_payload)
-            self.log("Requested payload for creating fabric site '{0}' is:  {1}".format(site_name, str(site_payload)), "INFO")
+            self.log("Requested payload for creating fabric site '{0}' is:  {1}", "INFO", site_name, site_payload)
 
             response = self.dnac._exec(
                 family="sda",
@@ -647,7 +647,7 @@ class FabricSitesZones(DnacBase):
                 op_modifies=True,
                 params={'payload': fabric_site_payload}
             )
-            self.log("Received API response from 'add_fabric_site' for the site {0}: {1}".format(site_name, str(response)), "DEBUG")
+            self.log("Received API response from 'add_fabric_site' for the site {0}: {1}", "DEBUG", site_name, response)
             response = response.get("response")
 
             if not response:
@@ -674,7 +674,7 @@ class FabricSitesZones(DnacBase):
                 elif task_details.get("endTime") and "workflow_id" in task_details.get("data"):
                     self.status = "success"
                     self.create_site.append(site_name)
-                    self.log("Fabric site '{0}' created successfully in the Cisco Catalyst Center".format(site_name), "INFO")
+                    self.log("Fabric site '{0}' created successfully in the Cisco Catalyst Center", "INFO", site_name)
                     break
 
                 time.sleep(1)
@@ -754,7 +754,7 @@ class FabricSitesZones(DnacBase):
                 "isPubSubEnabled": pub_sub_enable
             }
             update_site_params.append(site_payload)
-            self.log("Requested payload for updating fabric site '{0}' is:  {1}".format(site_name, str(site_payload)), "INFO")
+            self.log("Requested payload for updating fabric site '{0}' is:  {1}", "INFO", site_name, site_payload)
 
             response = self.dnac._exec(
                 family="sda",
@@ -762,7 +762,7 @@ class FabricSitesZones(DnacBase):
                 op_modifies=True,
                 params={'payload': update_site_params}
             )
-            self.log("Received API response from 'update_fabric_site' for the site {0}: {1}".format(site_name, str(response)), "DEBUG")
+            self.log("Received API response from 'update_fabric_site' for the site {0}: {1}", "DEBUG", site_name, response)
             response = response.get("response")
 
             if not response:
@@ -788,7 +788,7 @@ class FabricSitesZones(DnacBase):
                 elif task_details.get("endTime") and "workflow_id" in task_details.get("data"):
                     self.status = "success"
                     self.update_site.append(site_name)
-                    self.log("Fabric site '{0}' updated successfully in the Cisco Catalyst Center".format(site_name), "INFO")
+                    self.log("Fabric site '{0}' updated successfully in the Cisco Catalyst Center", "INFO", site_name)
                     break
                 time.sleep(1)
         except Exception as e:
@@ -826,7 +826,7 @@ class FabricSitesZones(DnacBase):
                 "authenticationProfileName": zone.get("authentication_profile"),
             }
             fabric_zone_payload.append(zone_payload)
-            self.log("Requested payload for creating fabric zone '{0}' is:  {1}".format(site_name, zone_payload), "INFO")
+            self.log("Requested payload for creating fabric zone '{0}' is:  {1}", "INFO", site_name, zone_payload)
 
             response = self.dnac._exec(
                 family="sda",
@@ -834,7 +834,7 @@ class FabricSitesZones(DnacBase):
                 op_modifies=True,
                 params={'payload': fabric_zone_payload}
             )
-            self.log("Received API response from 'add_fabric_zone' for the site {0}: {1}".format(site_name, str(response)), "DEBUG")
+            self.log("Received API response from 'add_fabric_zone' for the site {0}: {1}", "DEBUG", site_name, response)
             response = response.get("response")
 
             if not response:
@@ -861,7 +861,7 @@ class FabricSitesZones(DnacBase):
                 elif task_details.get("endTime") and "workflow_id" in task_details.get("data"):
                     self.status = "success"
                     self.create_zone.append(site_name)
-                    self.log("Fabric zone '{0}' created successfully in the Cisco Catalyst Center.".format(site_name), "INFO")
+                    self.log("Fabric zone '{0}' created successfully in the Cisco Catalyst Center.", "INFO", site_name)
                     break
                 time.sleep(1)
         except Exception as e:
@@ -901,7 +901,7 @@ class FabricSitesZones(DnacBase):
                 "authenticationProfileName": zone.get("authentication_profile") or zone_in_ccc.get("authenticationProfileName")
             }
             update_zone_params.append(zone_payload)
-            self.log("Requested payload for updating fabric zone '{0}' is:  {1}".format(site_name, zone_payload), "INFO")
+            self.log("Requested payload for updating fabric zone '{0}' is:  {1}", "INFO", site_name, zone_payload)
 
             response = self.dnac._exec(
                 family="sda",
@@ -909,7 +909,7 @@ class FabricSitesZones(DnacBase):
                 op_modifies=True,
                 params={'payload': update_zone_params}
             )
-            self.log("Received API response from 'update_fabric_zone' for the site {0}: {1}".format(site_name, str(response)), "DEBUG")
+            self.log("Received API response from 'update_fabric_zone' for the site {0}: {1}", "DEBUG", site_name, response)
             response = response.get("response")
 
             if not response:
@@ -935,7 +935,7 @@ class FabricSitesZones(DnacBase):
                     break
                 elif task_details.get("endTime") and "workflow_id" in task_details.get("data"):
                     self.status = "success"
-                    self.log("Fabric zone '{0}' updated successfully in the Cisco Catalyst Center".format(site_name), "INFO")
+                    self.log("Fabric zone '{0}' updated successfully in the Cisco Catalyst Center", "INFO", site_name)
                     self.update_zone.append(site_name)
                     break
                 time.sleep(1)
@@ -1042,10 +1042,10 @@ class FabricSitesZones(DnacBase):
                 }
             )
             response = response.get("response")
-            self.log("Received API response from 'get_authentication_profiles' for the site '{0}': {1}".format(site_name, str(response)), "DEBUG")
+            self.log("Received API response from 'get_authentication_profiles' for the site '{0}': {1}", "DEBUG", site_name, response)
 
             if not response:
-                self.log("No Authentication profile asssociated to this site '{0}' in Cisco Catalyst Center.".format(site_name), "INFO")
+                self.log("No Authentication profile asssociated to this site '{0}' in Cisco Catalyst Center.", "INFO", site_name)
                 return profile_details
 
             profile_details = response[0]
@@ -1167,14 +1167,14 @@ class FabricSitesZones(DnacBase):
         """
 
         try:
-            self.log("Requested payload for updating authentication profile for site {0}: {1}".format(site_name, profile_update_params), "INFO")
+            self.log("Requested payload for updating authentication profile for site {0}: {1}", "INFO", site_name, profile_update_params)
             response = self.dnac._exec(
                 family="sda",
                 function='update_authentication_profile',
                 op_modifies=True,
                 params={'payload': profile_update_params}
             )
-            self.log("Received API response from 'update_authentication_profile'for site {0}: {1}".format(site_name, str(response)), "DEBUG")
+            self.log("Received API response from 'update_authentication_profile'for site {0}: {1}", "DEBUG", site_name, response)
             response = response.get("response")
 
             if not response:
@@ -1209,7 +1209,7 @@ class FabricSitesZones(DnacBase):
                 if task_details.get("endTime") and "workflow_id" in task_details.get("data"):
                     self.status = "success"
                     self.update_auth_profile.append(site_name)
-                    self.log("Authentication profile for the site '{0}' updated successfully in the Cisco Catalyst Center".format(site_name), "INFO")
+                    self.log("Authentication profile for the site '{0}' updated successfully in the Cisco Catalyst Center", "INFO", site_name)
                     break
 
                 time.sleep(1)
@@ -1250,7 +1250,7 @@ class FabricSitesZones(DnacBase):
                 op_modifies=True,
                 params={"id": fabric_id},
             )
-            self.log("Received API response from '{0}' for the site {1}: {2}".format(api_name, site_name, str(response)), "DEBUG")
+            self.log("Received API response from '{0}' for the site {1}: {2}", "DEBUG", api_name, site_name, response)
             response = response.get("response")
 
             if not response:
@@ -1288,7 +1288,7 @@ class FabricSitesZones(DnacBase):
                         self.delete_site.append(site_name)
                     else:
                         self.delete_zone.append(site_name)
-                    self.log("{0} '{1}' deleted successfully from the Cisco Catalyst Center".format(type_name.title(), site_name), "INFO")
+                    self.log("{0} '{1}' deleted successfully from the Cisco Catalyst Center", "INFO", type_name.title(), site_name)
                     break
 
                 time.sleep(1)
@@ -1433,7 +1433,7 @@ class FabricSitesZones(DnacBase):
                     else:
                         self.status = "success"
                         self.no_update_site.append(site_name)
-                        self.log("Fabric site '{0}' already present and doesnot need any update in the Cisco Catalyst Center.".format(site_name), "INFO")
+                        self.log("Fabric site '{0}' already present and doesnot need any update in the Cisco Catalyst Center.", "INFO", site_name)
             else:
                 # Check whether site zone is already fabric or not.
                 if site_id not in self.have.get("fabric_zone_ids"):
@@ -1447,7 +1447,7 @@ class FabricSitesZones(DnacBase):
                     else:
                         self.status = "success"
                         self.no_update_zone.append(site_name)
-                        self.log("Fabric zone '{0}' already present and doesnot need any update in the Cisco Catalyst Center.".format(site_name), "INFO")
+                        self.log("Fabric zone '{0}' already present and doesnot need any update in the Cisco Catalyst Center.", "INFO", site_name)
 
             # Updating/customising the default parameters for authentication profile template
             if site.get("update_authentication_profile"):
@@ -1571,7 +1571,7 @@ class FabricSitesZones(DnacBase):
                 else:
                     self.status = "success"
                     self.absent_site.append(site_name)
-                    self.log("Unable to delete fabric site '{0}' as it is not present in the Cisco Catalyst Center.".format(site_name), "INFO")
+                    self.log("Unable to delete fabric site '{0}' as it is not present in the Cisco Catalyst Center.", "INFO", site_name)
             else:
                 # Check whether fabric zone is present in Cisco Catalyst Center.
                 if site_id in self.have.get("fabric_zone_ids"):
@@ -1582,7 +1582,7 @@ class FabricSitesZones(DnacBase):
                 else:
                     self.status = "success"
                     self.absent_zone.append(site_name)
-                    self.log("Unable to delete fabric zone '{0}' as it is not present in the Cisco Catalyst Center.".format(site_name), "INFO")
+                    self.log("Unable to delete fabric zone '{0}' as it is not present in the Cisco Catalyst Center.", "INFO", site_name)
 
         return self
 
@@ -1600,8 +1600,8 @@ class FabricSitesZones(DnacBase):
         """
 
         self.get_have(config)
-        self.log("Current State (have): {0}".format(str(self.have)), "INFO")
-        self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
+        self.log("Desired State (want): {0}", "INFO", self.want)
 
         if config.get('fabric_sites'):
             fabric_sites = self.want.get('fabric_sites')
@@ -1688,8 +1688,8 @@ class FabricSitesZones(DnacBase):
         """
 
         self.get_have(config)
-        self.log("Current State (have): {0}".format(str(self.have)), "INFO")
-        self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
+        self.log("Desired State (want): {0}", "INFO", self.want)
 
         fabric_sites = self.want.get('fabric_sites')
         verify_site_list, site_name_list = [], []
@@ -1742,11 +1742,26 @@ def main():
                     'dnac_log_level': {'type': 'str', 'default': 'WARNING'},
                     "dnac_log_file_path": {"type": 'str', "default": 'dnac.log'},
                     "dnac_log_append": {"type": 'bool', "default": True},
+                    "dnac_log_max_bytes": {"type": 'int', "default": 0},
+                    "dnac_log_backup_count": {"type": 'int', "default": 5},
+                    "dnac_log_compress": {"type": 'bool', "default": False},
+                    "dnac_log_format": {"type": 'str', "default": 'text', "choices": ['text', 'json']},
                     'dnac_log': {'type': 'bool', 'default': False},
                     'validate_response_schema': {'type': 'bool', 'default': True},
                     'config_verify': {'type': 'bool', "default": False},
                     'dnac_api_task_timeout': {'type': 'int', "default": 1200},
                     'dnac_task_poll_interval': {'type': 'int', "default": 2},
+                    'dnac_token_cache': {'type': 'bool', 'default': False},
+                    'dnac_rate_limit': {'type': 'float', 'default': 0},
+                    'dnac_rate_limit_per_family': {'type': 'bool', 'default': False},
+                    'dnac_rate_limit_retries': {'type': 'int', 'default': 5},
+                    'dnac_shared_rate_limit': {'type': 'float', 'default': 0},
+                    'dnac_shared_family_concurrency': {'type': 'int', 'default': 0},
+                    'dnac_memoize_reads': {'type': 'bool', 'default': False},
+                    'dnac_metrics': {'type': 'bool', 'default': False},
+                    'dnac_metrics_file': {'type': 'str'},
+                    'dnac_timings': {'type': 'bool', 'default': False},
+                    'dnac_timings_file': {'type': 'str'},
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'merged', 'choices': ['merged', 'deleted']}
                     }
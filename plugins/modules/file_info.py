@@ -35,6 +35,21 @@ options:
     description:
     - The filename used to save the download file.
     type: str
+  dest:
+    description:
+    - Path on the Ansible controller where the downloaded file is streamed in chunks, instead of being returned in I(dnac_response).
+    - When it is a directory, the file name sent by Cisco DNA Center is used.
+    - The file is only replaced once the download is complete and matches its size and I(checksum).
+    - The response then holds the metadata of the file, without its content.
+    - The task reports no change when the file already has the downloaded content, it is then left as is.
+      When the file already matches I(checksum), it is not downloaded again.
+    - In check mode nothing is downloaded. Unless the file already matches I(checksum), the task reports
+      a change with the path the file would have.
+    type: path
+  checksum:
+    description:
+    - Expected checksum of the file downloaded to I(dest), formatted as C(<algorithm>:<checksum>), e.g. C(sha256:9f86d081...).
+    type: str
 requirements:
 - dnacentersdk >= 2.7.2
 - python >= 3.5
@@ -65,10 +80,27 @@ EXAMPLES = r"""
     fileId: string
   register: result
 
+- name: Download File by id to disk
+  cisco.dnac.file_info:
+    dnac_host: "{{dnac_host}}"
+    dnac_username: "{{dnac_username}}"
+    dnac_password: "{{dnac_password}}"
+    dnac_verify: "{{dnac_verify}}"
+    dnac_port: "{{dnac_port}}"
+    dnac_version: "{{dnac_version}}"
+    dnac_debug: "{{dnac_debug}}"
+    headers: "{{my_headers | from_json}}"
+    fileId: string
+    dest: /tmp/downloads/
+    checksum: sha256:string
+  register: result
+
 """
 RETURN = r"""
 dnac_response:
-  description: A dictionary or list with the response returned by the Cisco DNAC Python SDK
+  description:
+  - A dictionary or list with the response returned by the Cisco DNAC Python SDK.
+  - With I(dest), the metadata of the downloaded file instead of its content.
   returned: always
   type: dict
   sample: >
@@ -713,14 +713,6 @@ dnac_response:
       "version": "string"
     }
 """
-# common approach when a module relies on optional dependencies that are not available during the validation process.
-try:
-    import pyzipper
-    HAS_PYZIPPER = True
-except ImportError:
-    HAS_PYZIPPER = False
-    pyzipper = None
-
 import csv
 import time
 from datetime import datetime
@@ -730,6 +722,15 @@ from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
     validate_list_of_dicts,
 )
+from ansible_collections.cisco.dnac.plugins.module_utils.lazy_import import (
+    LazyModule,
+    is_importable,
+)
+
+# pyzipper is only imported when an encrypted archive is extracted
+HAS_PYZIPPER = is_importable("pyzipper")
+pyzipper = LazyModule("pyzipper")
+
 # Defer this feature as API issue is there once it's fixed we will addresses it in upcoming release iac2.0
 support_for_provisioning_wireless = False
 
@@ -902,46 +903,23 @@ class Inventory(DnacBase):
         """
 
         existing_devices_in_ccc = set()
-        offset = 0
-        limit = self.get_device_details_limit()
-        initial_exec = False
 
-        while True:
-            try:
-                if initial_exec:
-                    response = self.dnac._exec(
-                        family="devices",
-                        function='get_device_list',
-                        params={
-                            "offset": offset * limit,
-                            "limit": limit
-                        }
-                    )
-                else:
-                    initial_exec = True
-                    response = self.dnac._exec(
-                        family="devices",
-                        function='get_device_list',
-                    )
-                offset = offset + 1
-                response = response.get("response")
-                if not response:
-                    self.log("There are no device details received from 'get_device_list' API.", "INFO")
-                    break
+        try:
+            # The device count lets the pages be requested concurrently
+            for device in self.paginate(family="devices", function='get_device_list', count_function='get_device_count'):
+                existing_devices_in_ccc.add(device["managementIpAddress"])
 
-                self.log("Received API response from 'get_device_list': {0}".format(str(response)), "DEBUG")
-                for ip in response:
-                    device_ip = ip["managementIpAddress"]
-                    existing_devices_in_ccc.add(device_ip)
+            if not existing_devices_in_ccc:
+                self.log("There are no device details received from 'get_device_list' API.", "INFO")
 
-            except Exception as e:
-                self.status = "failed"
-                self.msg = "Error while fetching device details from Cisco Catalyst Center: {0}".format(str(e))
-                self.log(self.msg, "CRITICAL")
-                self.result['response'] = self.msg
-                self.check_return_status()
+        except Exception as e:
+            self.status = "failed"
+            self.msg = "Error while fetching device details from Cisco Catalyst Center: {0}".format(str(e))
+            self.log(self.msg, "CRITICAL")
+            self.result['response'] = self.msg
+            self.check_return_status()
 
-        self.log("Devices present in Cisco Catalyst Center: {0}".format(str(existing_devices_in_ccc)), "DEBUG")
+        self.log("Devices present in Cisco Catalyst Center: {0}", "DEBUG", existing_devices_in_ccc)
         existing_devices_in_ccc = list(existing_devices_in_ccc)
 
         return existing_devices_in_ccc
@@ -967,7 +945,7 @@ class Inventory(DnacBase):
             params={"name": field_name},
         )
 
-        self.log("Received API response from 'get_all_user_defined_fields': {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from 'get_all_user_defined_fields': {0}", "DEBUG", response)
         udf = response.get("response")
 
         if (len(udf) == 1):
@@ -997,10 +975,10 @@ class Inventory(DnacBase):
                 op_modifies=True,
                 params=udf,
             )
-            self.log("Received API response from 'create_user_defined_field': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'create_user_defined_field': {0}", "DEBUG", response)
             response = response.get("response")
             field_name = udf.get('name')
-            self.log("Global User Defined Field with name '{0}' created successfully".format(field_name), "INFO")
+            self.log("Global User Defined Field with name '{0}' created successfully", "INFO", field_name)
             self.status = "success"
 
         except Exception as e:
@@ -1040,7 +1018,7 @@ class Inventory(DnacBase):
                     op_modifies=True,
                     params=udf_param_dict,
                 )
-                self.log("Received API response from 'add_user_defined_field_to_device': {0}".format(str(response)), "DEBUG")
+                self.log("Received API response from 'add_user_defined_field_to_device': {0}", "DEBUG", response)
                 response = response.get("response")
                 self.status = "success"
                 self.result['changed'] = True
@@ -1073,7 +1051,7 @@ class Inventory(DnacBase):
             op_modifies=True,
             params=payload_params,
         )
-        self.log("Received API response from 'export_device_list': {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from 'export_device_list': {0}", "DEBUG", response)
         response = response.get("response")
         task_id = response.get("taskId")
 
@@ -1102,7 +1080,7 @@ class Inventory(DnacBase):
             op_modifies=True,
             params={"file_id": file_id},
         )
-        self.log("Received API response from 'download_a_file_by_fileid': {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from 'download_a_file_by_fileid': {0}", "DEBUG", response)
 
         return response
 
@@ -1139,7 +1117,7 @@ class Inventory(DnacBase):
         try:
             encryption_method = encryption_dict.get(snmp_protocol)
         except Exception as e:
-            self.log("Given SNMP protcol '{0}' not present".format(snmp_protocol), "WARNING")
+            self.log("Given SNMP protcol '{0}' not present", "WARNING", snmp_protocol)
 
         if not encryption_method:
             self.msg = "Invalid SNMP protocol '{0}' specified for encryption.".format(snmp_protocol)
@@ -1161,7 +1139,7 @@ class Inventory(DnacBase):
         file_content_text = file_content_binary.decode('utf-8')
 
         # Now 'file_content_text' contains the text content of the decrypted file
-        self.log("Text content of decrypted file: {0}".format(file_content_text), "DEBUG")
+        self.log("Text content of decrypted file: {0}", "DEBUG", file_content_text)
 
         # Parse the CSV-like string into a list of dictionaries
         csv_reader = csv.DictReader(StringIO(file_content_text))
@@ -1241,7 +1219,7 @@ class Inventory(DnacBase):
                     self.check_return_status()
                 else:
                     decoded_resp = response.data.decode(encoding='utf-8')
-                    self.log("Decoded response of Export Device Credential file: {0}".format(str(decoded_resp)), "DEBUG")
+                    self.log("Decoded response of Export Device Credential file: {0}", "DEBUG", decoded_resp)
 
                     # Parse the CSV-like string into a list of dictionaries
                     csv_reader = csv.DictReader(StringIO(decoded_resp))
@@ -1331,12 +1309,12 @@ class Inventory(DnacBase):
                 input_device_ips.remove(device_ip)
 
         ap_devices = self.get_ap_devices(input_device_ips)
-        self.log("AP Devices from the playbook input are: {0}".format(str(ap_devices)), "INFO")
+        self.log("AP Devices from the playbook input are: {0}", "INFO", ap_devices)
 
         if ap_devices:
             for ap_ip in ap_devices:
                 input_device_ips.remove(ap_ip)
-            self.log("Following devices {0} are AP, so can't perform resync operation.".format(str(ap_devices)), "WARNING")
+            self.log("Following devices {0} are AP, so can't perform resync operation.", "WARNING", ap_devices)
 
         if not input_device_ips:
             self.msg = "Cannot perform the Resync operation as the device(s) with IP(s) {0} are not present in Cisco Catalyst Center".format(str(device_ips))
@@ -1364,14 +1342,14 @@ class Inventory(DnacBase):
                     'payload': device_ids_list,
                     'force_sync': force_sync
                 }
-                self.log("Request payload for reysnc Device having the device ids: {0}".format(device_ids_list), "INFO")
+                self.log("Request payload for reysnc Device having the device ids: {0}", "INFO", device_ids_list)
                 response = self.dnac._exec(
                     family="devices",
                     function='sync_devices_using_forcesync',
                     op_modifies=True,
                     params=resync_param_dict,
                 )
-                self.log("Received API response from 'sync_devices_using_forcesync': {0}".format(str(response)), "DEBUG")
+                self.log("Received API response from 'sync_devices_using_forcesync': {0}", "DEBUG", response)
 
                 if not response or not isinstance(response, dict):
                     self.status = "failed"
@@ -1384,27 +1362,25 @@ class Inventory(DnacBase):
                 resync_task_dict[task_id] = device_ips_list
                 start += resync_device_count
 
-            for task_id, device_list in resync_task_dict.items():
-                max_timeout = self.config[0].get("resync_max_timeout", 600)
-                start_time = time.time()
-
-                while (True):
-
-                    if (time.time() - start_time) >= max_timeout:
-                        self.log("""Max timeout of {0} has reached for the task id '{1}' for the device(s) '{2}' to be resynced and unexpected
-                                    task status so moving out to next task id""".format(max_timeout, task_id, device_list), "WARNING")
-                        resync_failed_devices.extend(device_list)
-                        break
+            # Wait for all the resync batches together instead of one after the other
+            max_timeout = self.config[0].get("resync_max_timeout", 600)
+            resync_results = self.iter_task_results(
+                dict((task_id, task_id) for task_id in resync_task_dict),
+                is_success=lambda execution_details: 'Synced' in ((execution_details or {}).get("progress") or ""),
+                is_failure=lambda execution_details: bool((execution_details or {}).get("isError")),
+                timeout=max_timeout,
+            )
 
-                    execution_details = self.get_task_details(task_id)
+            for task_id, wait_result in resync_results:
+                device_list = resync_task_dict[task_id]
+                if wait_result.succeeded:
+                    resync_successful_devices.extend(device_list)
+                    continue
 
-                    if 'Synced' in execution_details.get("progress"):
-                        resync_successful_devices.extend(device_list)
-                        break
-                    elif execution_details.get("isError"):
-                        resync_failed_devices.extend(device_list)
-                        break
-                    time.sleep(self.params.get('dnac_task_poll_interval'))
+                if wait_result.timed_out:
+                    self.log("""Max timeout of {0} has reached for the task id '{1}' for the device(s) '{2}' to be resynced and unexpected
+                                task status so moving out to next task id""", "WARNING", max_timeout, task_id, device_list)
+                resync_failed_devices.extend(device_list)
 
             if resync_failed_devices and resync_successful_devices:
                 self.msg = (
@@ -1453,7 +1429,7 @@ class Inventory(DnacBase):
 
         if input_device_ips:
             ap_devices = self.get_ap_devices(input_device_ips)
-            self.log("AP Devices from the playbook input are: {0}".format(str(ap_devices)), "INFO")
+            self.log("AP Devices from the playbook input are: {0}", "INFO", ap_devices)
             for device_ip in input_device_ips:
                 if device_ip not in ap_devices:
                     input_device_ips.remove(device_ip)
@@ -1548,7 +1524,7 @@ class Inventory(DnacBase):
         self.status = "success"
         self.result['changed'] = True
         self.result['response'] = execution_details
-        self.log("{0} Device {1} provisioned successfully!!".format(device_type, device_ip), "INFO")
+        self.log("{0} Device {1} provisioned successfully!!", "INFO", device_type, device_ip)
 
     def handle_failed_provisioning(self, device_ip, execution_details, device_type):
         """
@@ -1619,7 +1595,7 @@ class Inventory(DnacBase):
 
         self.status = "success"
         self.result['changed'] = True
-        self.log("All {0} Devices provisioned successfully!!".format(device_type), "INFO")
+        self.log("All {0} Devices provisioned successfully!!", "INFO", device_type)
 
     def handle_all_failed_provision(self, device_type):
         """
@@ -1655,7 +1631,7 @@ class Inventory(DnacBase):
 
         self.status = "success"
         self.result['changed'] = True
-        self.log("{0} Devices provisioned successfully partially for {1} devices".format(device_type, provision_count), "INFO")
+        self.log("{0} Devices provisioned successfully partially for {1} devices", "INFO", device_type, provision_count)
 
     def provisioned_wired_device(self):
         """
@@ -1714,8 +1690,10 @@ class Inventory(DnacBase):
 
             # Check till device comes into managed state
             while resync_retry_count:
+                # Read the device state again on every retry instead of a memoized one
+                self.dnac.invalidate_memo()
                 response = self.get_device_response(device_ip)
-                self.log("Device is in {0} state waiting for Managed State.".format(response['managementState']), "DEBUG")
+                self.log("Device is in {0} state waiting for Managed State.", "DEBUG", response['managementState'])
 
                 if (
                     response.get('managementState') == "Managed"
@@ -1740,7 +1718,7 @@ class Inventory(DnacBase):
 
             if not managed_flag:
                 self.log("""Device {0} is not transitioning to the managed state, so provisioning operation cannot
-                            be performed.""".format(device_ip), "WARNING")
+                            be performed.""", "WARNING", device_ip)
                 continue
 
             try:
@@ -1882,7 +1860,7 @@ class Inventory(DnacBase):
                 self.log(self.msg, "INFO")
                 return site_type
 
-            self.log("Received API response from 'get_site': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'get_site': {0}", "DEBUG", response)
             site = response.get("response")
             site_additional_info = site[0].get("additionalInfo")
 
@@ -1930,8 +1908,10 @@ class Inventory(DnacBase):
 
                 # Check till device comes into managed state
                 while resync_retry_count:
+                    # Read the device state again on every retry instead of a memoized one
+                    self.dnac.invalidate_memo()
                     response = self.get_device_response(device_ip)
-                    self.log("Device is in {0} state waiting for Managed State.".format(response['managementState']), "DEBUG")
+                    self.log("Device is in {0} state waiting for Managed State.", "DEBUG", response['managementState'])
 
                     if (
                         response.get('managementState') == "Managed"
@@ -1957,7 +1937,7 @@ class Inventory(DnacBase):
 
                 if not managed_flag:
                     self.log("""Device {0} is not transitioning to the managed state, so provisioning operation cannot
-                                be performed.""".format(device_ip), "WARNING")
+                                be performed.""", "WARNING", device_ip)
                     continue
 
                 # Now we have provisioning_param so we can do wireless provisioning
@@ -2031,7 +2011,7 @@ class Inventory(DnacBase):
                 op_modifies=True,
                 params={"name": field_name},
             )
-            self.log("Received API response from 'get_all_user_defined_fields': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'get_all_user_defined_fields': {0}", "DEBUG", response)
             udf = response.get("response")
             if udf:
                 udf_id = udf[0].get("id")
@@ -2131,14 +2111,14 @@ class Inventory(DnacBase):
                     if device_ip_address not in device_in_ccc and device_ip_address not in device_not_in_ccc:
                         device_not_in_ccc.append(device_ip_address)
 
-        self.log("Device(s) {0} exists in Cisco Catalyst Center".format(str(device_in_ccc)), "INFO")
+        self.log("Device(s) {0} exists in Cisco Catalyst Center", "INFO", device_in_ccc)
         have["want_device"] = want_device
         have["device_in_ccc"] = device_in_ccc
         have["device_not_in_ccc"] = device_not_in_ccc
         have["devices_in_playbook"] = devices_in_playbook
 
         self.have = have
-        self.log("Current State (have): {0}".format(str(self.have)), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
 
         return self
 
@@ -2210,18 +2190,15 @@ class Inventory(DnacBase):
         """
 
         device_ids = []
+        calls = [("devices", "get_device_list", {"managementIpAddress": device_ip}) for device_ip in device_ips]
 
-        for device_ip in device_ips:
+        for device_ip, result in zip(device_ips, self.map_exec(calls, op_modifies=True)):
             try:
-                response = self.dnac._exec(
-                    family="devices",
-                    function='get_device_list',
-                    op_modifies=True,
-                    params={"managementIpAddress": device_ip}
-                )
+                if result.failed:
+                    raise result.error
 
+                response = result.response
                 if response:
-                    self.log("Received API response from 'get_device_list': {0}".format(str(response)), "DEBUG")
                     response = response.get("response")
                     if not response:
                         continue
@@ -2257,7 +2234,7 @@ class Inventory(DnacBase):
                     params={"hostname": hostname}
                 )
                 if response:
-                    self.log("Received API response from 'get_device_list': {0}".format(str(response)), "DEBUG")
+                    self.log("Received API response from 'get_device_list': {0}", "DEBUG", response)
                     response = response.get("response")
                     if response:
                         device_ip = response[0]["managementIpAddress"]
@@ -2292,7 +2269,7 @@ class Inventory(DnacBase):
                     params={"serialNumber": serial_number}
                 )
                 if response:
-                    self.log("Received API response from 'get_device_list': {0}".format(str(response)), "DEBUG")
+                    self.log("Received API response from 'get_device_list': {0}", "DEBUG", response)
                     response = response.get("response")
                     if response:
                         device_ip = response[0]["managementIpAddress"]
@@ -2327,7 +2304,7 @@ class Inventory(DnacBase):
                     params={"macAddress": mac_address}
                 )
                 if response:
-                    self.log("Received API response from 'get_device_list': {0}".format(str(response)), "DEBUG")
+                    self.log("Received API response from 'get_device_list': {0}", "DEBUG", response)
                     response = response.get("response")
                     if response:
                         device_ip = response[0]["managementIpAddress"]
@@ -2365,14 +2342,14 @@ class Inventory(DnacBase):
                 op_modifies=True,
                 params=interface_detail_params
             )
-            self.log("Received API response from 'get_interface_details': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'get_interface_details': {0}", "DEBUG", response)
             response = response.get("response")
 
             if response:
                 self.status = "success"
                 interface_id = response["id"]
-                self.log("""Successfully fetched interface ID ({0}) by using device id {1} and interface name {2}."""
-                         .format(interface_id, device_id, interface_name), "INFO")
+                self.log("""Successfully fetched interface ID ({0}) by using device id {1} and interface name {2}.""", "INFO",
+                         interface_id, device_id, interface_name)
                 return response
 
         except Exception as e:
@@ -2402,12 +2379,12 @@ class Inventory(DnacBase):
                 op_modifies=True,
                 params={"ip_address": device_ip}
             )
-            self.log("Received API response from 'get_interface_by_ip': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'get_interface_by_ip': {0}", "DEBUG", response)
             response = response.get("response")
 
             if response:
                 interface_id = response[0]["id"]
-                self.log("Successfully retrieved Interface Id '{0}' for device '{1}'.".format(interface_id, device_ip), "DEBUG")
+                self.log("Successfully retrieved Interface Id '{0}' for device '{1}'.", "DEBUG", interface_id, device_ip)
                 return interface_id
 
         except Exception as e:
@@ -2480,8 +2457,7 @@ class Inventory(DnacBase):
         device_id = self.get_device_ids([device_ip])
 
         if not device_id:
-            self.log("""Error: Device with IP '{0}' not found in Cisco Catalyst Center.Unable to update interface details."""
-                     .format(device_ip), "ERROR")
+            self.log("""Error: Device with IP '{0}' not found in Cisco Catalyst Center.Unable to update interface details.""", "ERROR", device_ip)
             return False
 
         interface_detail_params = {
@@ -2494,7 +2470,7 @@ class Inventory(DnacBase):
             op_modifies=True,
             params=interface_detail_params
         )
-        self.log("Received API response from 'get_interface_details': {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from 'get_interface_details': {0}", "DEBUG", response)
         response = response.get("response")
 
         if not response:
@@ -2597,7 +2573,7 @@ class Inventory(DnacBase):
 
             if response.get("status") == "success" and "retrieved successfully" in response.get("description"):
                 flag = 2
-                self.log("Wired device '{0}' already provisioned in the Cisco Catalyst Center.".format(device_ip), "INFO")
+                self.log("Wired device '{0}' already provisioned in the Cisco Catalyst Center.", "INFO", device_ip)
 
         except Exception as e:
             if "not provisioned to any site" in str(e):
@@ -2638,7 +2614,7 @@ class Inventory(DnacBase):
                 op_modifies=True,
                 params=clear_mac_address_payload,
             )
-            self.log("Received API response from 'clear_mac_address_table': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'clear_mac_address_table': {0}", "DEBUG", response)
 
             if not (response and isinstance(response, dict)):
                 self.status = "failed"
@@ -2774,7 +2750,7 @@ class Inventory(DnacBase):
                         op_modifies=True,
                         params=update_interface_params,
                     )
-                    self.log("Received API response from 'update_interface_details': {0}".format(str(response)), "DEBUG")
+                    self.log("Received API response from 'update_interface_details': {0}", "DEBUG", response)
 
                     if response and isinstance(response, dict):
                         response = response.get('response')
@@ -2896,7 +2872,7 @@ class Inventory(DnacBase):
                 self.check_return_status()
                 break
             elif execution_details.get("endTime"):
-                self.log("Device '{0}' present in Cisco Catalyst Center and have been updated successfully.".format(device_ip), "INFO")
+                self.log("Device '{0}' present in Cisco Catalyst Center and have been updated successfully.", "INFO", device_ip)
                 break
 
         return device_ip
@@ -2925,7 +2901,7 @@ class Inventory(DnacBase):
             )
             response = response.get('response')
             if not response:
-                self.log("Device with given IP '{0}' is not present in Cisco Catalyst Center".format(device_ip), "INFO")
+                self.log("Device with given IP '{0}' is not present in Cisco Catalyst Center", "INFO", device_ip)
                 return False
 
             return True
@@ -2982,7 +2958,7 @@ class Inventory(DnacBase):
         self.want = want
         self.msg = "Successfully collected all parameters from the playbook "
         self.status = "success"
-        self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+        self.log("Desired State (want): {0}", "INFO", self.want)
 
         return self
 
@@ -3131,7 +3107,7 @@ class Inventory(DnacBase):
                     op_modifies=True,
                     params=device_params,
                 )
-                self.log("Received API response from 'add_device': {0}".format(str(response)), "DEBUG")
+                self.log("Received API response from 'add_device': {0}", "DEBUG", response)
 
                 if response and isinstance(response, dict):
                     task_id = response.get('response').get('taskId')
@@ -3209,7 +3185,7 @@ class Inventory(DnacBase):
                         op_modifies=True,
                         params=device_role_params,
                     )
-                    self.log("Received API response from 'update_device_role': {0}".format(str(response)), "DEBUG")
+                    self.log("Received API response from 'update_device_role': {0}", "DEBUG", response)
 
                     if response and isinstance(response, dict):
                         task_id = response.get('response').get('taskId')
@@ -3220,7 +3196,7 @@ class Inventory(DnacBase):
 
                             if 'successfully' in progress or 'succesfully' in progress:
                                 self.status = "success"
-                                self.log("Device '{0}' role updated successfully to '{1}'".format(device_ip, device_role), "INFO")
+                                self.log("Device '{0}' role updated successfully to '{1}'", "INFO", device_ip, device_role)
                                 role_updated_list.append(device_ip)
                                 break
                             elif execution_details.get("isError"):
@@ -3360,7 +3336,7 @@ class Inventory(DnacBase):
 
                 if playbook_params['netconfPort'] and playbook_params['cliTransport'] == "telnet":
                     self.log("""Updating the device cli transport from ssh to telnet with netconf port '{0}' so make
-                            netconf port as None to perform the device update task""".format(playbook_params['netconfPort']), "DEBUG")
+                            netconf port as None to perform the device update task""", "DEBUG", playbook_params['netconfPort'])
                     playbook_params['netconfPort'] = None
 
                 if not playbook_params['snmpVersion']:
@@ -3399,28 +3375,28 @@ class Inventory(DnacBase):
                             self.log(self.msg, "ERROR")
                             self.result['response'] = self.msg
                         else:
-                            self.log("Playbook parameter for updating device new management ip address: {0}".format(str(playbook_params)), "DEBUG")
+                            self.log("Playbook parameter for updating device new management ip address: {0}", "DEBUG", playbook_params)
                             response = self.dnac._exec(
                                 family="devices",
                                 function='sync_devices',
                                 op_modifies=True,
                                 params=playbook_params,
                             )
-                            self.log("Received API response from 'sync_devices': {0}".format(str(response)), "DEBUG")
+                            self.log("Received API response from 'sync_devices': {0}", "DEBUG", response)
 
                             if response and isinstance(response, dict):
                                 self.check_managementip_execution_response(response, device_ip, new_mgmt_ipaddress)
                                 self.check_return_status()
 
                     else:
-                        self.log("Playbook parameter for updating devices: {0}".format(str(playbook_params)), "DEBUG")
+                        self.log("Playbook parameter for updating devices: {0}", "DEBUG", playbook_params)
                         response = self.dnac._exec(
                             family="devices",
                             function='sync_devices',
                             op_modifies=True,
                             params=playbook_params,
                         )
-                        self.log("Received API response from 'sync_devices': {0}".format(str(response)), "DEBUG")
+                        self.log("Received API response from 'sync_devices': {0}", "DEBUG", response)
 
                         if response and isinstance(response, dict):
                             self.check_device_update_execution_response(response, device_ip)
@@ -3463,7 +3439,7 @@ class Inventory(DnacBase):
 
                 if not udf_exist:
                     # Create the Global UDF
-                    self.log("Global User Defined Field '{0}' does not present in Cisco Catalyst Center, we need to create it".format(field_name), "DEBUG")
+                    self.log("Global User Defined Field '{0}' does not present in Cisco Catalyst Center, we need to create it", "DEBUG", field_name)
                     self.create_user_defined_field(udf).check_return_status()
 
                 # Get device Id based on config priority
@@ -3546,7 +3522,7 @@ class Inventory(DnacBase):
                         params={"id": udf_id},
                     )
                     if response and isinstance(response, dict):
-                        self.log("Received API response from 'delete_user_defined_field': {0}".format(str(response)), "DEBUG")
+                        self.log("Received API response from 'delete_user_defined_field': {0}", "DEBUG", response)
                         task_id = response.get('response').get('taskId')
 
                         while True:
@@ -3597,7 +3573,7 @@ class Inventory(DnacBase):
                     op_modifies=True,
                     params=provision_params,
                 )
-                self.log("Received API response from 'get_provisioned_wired_device': {0}".format(str(prov_respone)), "DEBUG")
+                self.log("Received API response from 'get_provisioned_wired_device': {0}", "DEBUG", prov_respone)
 
                 if prov_respone.get("status") == "success":
                     response = self.dnac._exec(
@@ -3606,7 +3582,7 @@ class Inventory(DnacBase):
                         op_modifies=True,
                         params=provision_params,
                     )
-                    self.log("Received API response from 'delete_provisioned_wired_device': {0}".format(str(response)), "DEBUG")
+                    self.log("Received API response from 'delete_provisioned_wired_device': {0}", "DEBUG", response)
                     executionid = response.get("executionId")
 
                     while True:
@@ -3686,8 +3662,8 @@ class Inventory(DnacBase):
         """
 
         self.get_have(config)
-        self.log("Current State (have): {0}".format(str(self.have)), "INFO")
-        self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
+        self.log("Desired State (want): {0}", "INFO", self.want)
 
         devices_to_add = self.have["device_not_in_ccc"]
         credential_update = self.config[0].get("credential_update", False)
@@ -3731,8 +3707,7 @@ class Inventory(DnacBase):
             else:
                 self.log("Playbook parameter does not match with Cisco Catalyst Center, meaning device updation task not executed properly.", "INFO")
         elif device_type != "NETWORK_DEVICE":
-            self.log("""Unable to compare the parameter for device type '{0}' in the playbook with the one in Cisco Catalyst Center."""
-                     .format(device_type), "WARNING")
+            self.log("""Unable to compare the parameter for device type '{0}' in the playbook with the one in Cisco Catalyst Center.""", "WARNING", device_type)
 
         if self.config[0].get('add_user_defined_field'):
             udf_field_list = self.config[0].get('add_user_defined_field')
@@ -3801,8 +3776,8 @@ class Inventory(DnacBase):
         """
 
         self.get_have(config)
-        self.log("Current State (have): {0}".format(str(self.have)), "INFO")
-        self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
+        self.log("Desired State (want): {0}", "INFO", self.want)
         input_devices = self.have["want_device"]
 
         if self.config[0].get('add_user_defined_field'):
@@ -3832,7 +3807,7 @@ class Inventory(DnacBase):
             self.log(self.msg, "INFO")
         else:
             self.log("""Mismatch between playbook parameter device({0}) and Cisco Catalyst Center detected, indicating that
-                     the device deletion task may not have executed successfully.""".format(device_after_deletion), "INFO")
+                     the device deletion task may not have executed successfully.""", "INFO", device_after_deletion)
 
         return self
 
@@ -3851,11 +3826,26 @@ def main():
                     'dnac_log_level': {'type': 'str', 'default': 'WARNING'},
                     "dnac_log_file_path": {"type": 'str', "default": 'dnac.log'},
                     "dnac_log_append": {"type": 'bool', "default": True},
+                    "dnac_log_max_bytes": {"type": 'int', "default": 0},
+                    "dnac_log_backup_count": {"type": 'int', "default": 5},
+                    "dnac_log_compress": {"type": 'bool', "default": False},
+                    "dnac_log_format": {"type": 'str', "default": 'text', "choices": ['text', 'json']},
                     'dnac_log': {'type': 'bool', 'default': False},
                     'validate_response_schema': {'type': 'bool', 'default': True},
                     'config_verify': {'type': 'bool', "default": False},
                     'dnac_api_task_timeout': {'type': 'int', "default": 1200},
                     'dnac_task_poll_interval': {'type': 'int', "default": 2},
+                    'dnac_token_cache': {'type': 'bool', 'default': False},
+                    'dnac_rate_limit': {'type': 'float', 'default': 0},
+                    'dnac_rate_limit_per_family': {'type': 'bool', 'default': False},
+                    'dnac_rate_limit_retries': {'type': 'int', 'default': 5},
+                    'dnac_shared_rate_limit': {'type': 'float', 'default': 0},
+                    'dnac_shared_family_concurrency': {'type': 'int', 'default': 0},
+                    'dnac_memoize_reads': {'type': 'bool', 'default': False},
+                    'dnac_metrics': {'type': 'bool', 'default': False},
+                    'dnac_metrics_file': {'type': 'str'},
+                    'dnac_timings': {'type': 'bool', 'default': False},
+                    'dnac_timings_file': {'type': 'str'},
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'merged', 'choices': ['merged', 'deleted']}
                     }
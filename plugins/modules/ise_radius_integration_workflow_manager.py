@@ -499,7 +499,7 @@ class IseRadiusIntegration(DnacBase):
             return self
 
         self.validated_config = valid_temp
-        self.log("Successfully validated playbook config params: {0}".format(valid_temp), "INFO")
+        self.log("Successfully validated playbook config params: {0}", "INFO", valid_temp)
         self.msg = "Successfully validated input from the playbook"
         self.status = "success"
         return self
@@ -531,8 +531,8 @@ class IseRadiusIntegration(DnacBase):
 
         current_obj = have
         requested_obj = want
-        self.log("Current State (have): {0}".format(current_obj), "DEBUG")
-        self.log("Desired State (want): {0}".format(requested_obj), "DEBUG")
+        self.log("Current State (have): {0}", "DEBUG", current_obj)
+        self.log("Desired State (want): {0}", "DEBUG", requested_obj)
 
         return any(not dnac_compare_equality(current_obj.get(dnac_param),
                                              requested_obj.get(ansible_param))
@@ -561,7 +561,7 @@ class IseRadiusIntegration(DnacBase):
                 raise ValueError("Received an unexpected value for 'get_object': {0}"
                                  .format(get_object))
         except Exception as msg:
-            self.log("Received exception: {0}".format(msg), "CRITICAL")
+            self.log("Received exception: {0}", "CRITICAL", msg)
 
         return obj_params
 
@@ -583,7 +583,7 @@ class IseRadiusIntegration(DnacBase):
             self.log("Authentication and Policy Server data is empty", "INFO")
             return None
 
-        self.log("Authentication and Policy Server Details: {0}".format(auth_server_info), "DEBUG")
+        self.log("Authentication and Policy Server Details: {0}", "DEBUG", auth_server_info)
         auth_server = {
             "authenticationPort": auth_server_info.get("authenticationPort"),
             "accountingPort": auth_server_info.get("accountingPort"),
@@ -598,8 +598,7 @@ class IseRadiusIntegration(DnacBase):
             "timeoutSeconds": str(auth_server_info.get("timeoutSeconds")),
             "encryptionScheme": auth_server_info.get("encryptionScheme")
         }
-        self.log("Formated Authentication and Policy Server details: {0}"
-                 .format(auth_server), "DEBUG")
+        self.log("Formated Authentication and Policy Server details: {0}", "DEBUG", auth_server)
         if auth_server.get("isIseEnabled") is True:
             auth_server_ise_info = auth_server_info.get("ciscoIseDtos")
             auth_server.update({"ciscoIseDtos": []})
@@ -648,19 +647,17 @@ class IseRadiusIntegration(DnacBase):
 
         all_auth_server_details = response.get("response")
         auth_server_details = get_dict_result(all_auth_server_details, "ipAddress", ipAddress)
-        self.log("Authentication and Policy Server Ip Address: {0}"
-                 .format(ipAddress), "DEBUG")
-        self.log("Authentication and Policy Server details: {0}"
-                 .format(auth_server_details), "DEBUG")
+        self.log("Authentication and Policy Server Ip Address: {0}", "DEBUG", ipAddress)
+        self.log("Authentication and Policy Server details: {0}", "DEBUG", auth_server_details)
         if not auth_server_details:
-            self.log("Global pool {0} does not exist".format(ipAddress), "INFO")
+            self.log("Global pool {0} does not exist", "INFO", ipAddress)
             return AuthServer
 
         AuthServer.update({"exists": True})
         AuthServer.update({"id": auth_server_details.get("instanceUuid")})
         AuthServer["details"] = self.get_auth_server_params(auth_server_details)
 
-        self.log("Formatted Authenticaion and Policy Server details: {0}".format(AuthServer), "DEBUG")
+        self.log("Formatted Authenticaion and Policy Server details: {0}", "DEBUG", AuthServer)
         return AuthServer
 
     def get_have_authentication_policy_server(self, authentication_policy_server):
@@ -692,12 +689,9 @@ class IseRadiusIntegration(DnacBase):
                 return self
 
             auth_server = self.auth_server_exists(ip_address)
-            self.log("Authentication and Policy Server exists for '{0}': {1}"
-                     .format(ip_address, auth_server.get("exists")), "DEBUG")
-            self.log("Authentication and Policy Server details for '{0}': {1}"
-                     .format(ip_address, auth_server.get("details")), "DEBUG")
-            self.log("Authentication and Policy Server Id for '{0}': {1}"
-                     .format(ip_address, auth_server.get("id")), "DEBUG")
+            self.log("Authentication and Policy Server exists for '{0}': {1}", "DEBUG", ip_address, auth_server.get("exists"))
+            self.log("Authentication and Policy Server details for '{0}': {1}", "DEBUG", ip_address, auth_server.get("details"))
+            self.log("Authentication and Policy Server Id for '{0}': {1}", "DEBUG", ip_address, auth_server.get("id"))
             all_auth_server_details.append(auth_server)
 
         self.have.update({"authenticationPolicyServer": all_auth_server_details})
@@ -726,7 +720,7 @@ class IseRadiusIntegration(DnacBase):
             return self
 
         self.get_have_authentication_policy_server(authentication_policy_server).check_return_status()
-        self.log("Current State (have): {0}".format(self.have), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
         self.msg = "Successfully retrieved the details from the Cisco Catalyst Center"
         self.status = "success"
         return self
@@ -1099,8 +1093,7 @@ class IseRadiusIntegration(DnacBase):
 
                 self.want.update({"ise_integration_wait_time": ise_integration_wait_time})
 
-            self.log("Authentication and Policy Server playbook details: {0}"
-                     .format(auth_server), "DEBUG")
+            self.log("Authentication and Policy Server playbook details: {0}", "DEBUG", auth_server)
             all_auth_server_details.append(auth_server)
             auth_server_index += 1
 
@@ -1124,7 +1117,7 @@ class IseRadiusIntegration(DnacBase):
             auth_policy_server = config.get("authentication_policy_server")
             self.get_want_authentication_policy_server(auth_policy_server).check_return_status()
 
-        self.log("Desired State (want): {0}".format(self.want), "INFO")
+        self.log("Desired State (want): {0}", "INFO", self.want)
         self.msg = "Successfully retrieved details from the playbook"
         self.status = "success"
         return self
@@ -1168,10 +1161,9 @@ class IseRadiusIntegration(DnacBase):
                 },
             )
             self.log("Received API response for 'accept_cisco_ise_server_certificate_"
-                     "for_cisco_ise_server_integration': {0}".format(response), "DEBUG")
+                     "for_cisco_ise_server_integration': {0}", "DEBUG", response)
         except Exception as msg:
-            self.log("Exception occurred while accepting the certificate of {0}: {1}"
-                     .format(ipAddress, msg))
+            self.log("Exception occurred while accepting the certificate of {0}: {1}", "WARNING", ipAddress, msg)
             return None
         return
 
@@ -1207,7 +1199,7 @@ class IseRadiusIntegration(DnacBase):
                 break
 
             task_details = self.get_task_details(task_id)
-            self.log('Getting task details from task ID {0}: {1}'.format(task_id, task_details), "DEBUG")
+            self.log('Getting task details from task ID {0}: {1}', "DEBUG", task_id, task_details)
             if task_details.get("isError") is True:
                 failure_reason = task_details.get("failureReason")
                 if failure_reason:
@@ -1225,13 +1217,13 @@ class IseRadiusIntegration(DnacBase):
                     break
 
             if self.result['changed'] is True:
-                self.log("The task with task id '{0}' is successfully executed".format(task_id), "DEBUG")
+                self.log("The task with task id '{0}' is successfully executed", "DEBUG", task_id)
                 break
 
             # sleep time after checking the status of the response from the API
-            self.log("The time interval before checking the next response, sleep for {0}".format(sleep_time))
+            self.log("The time interval before checking the next response, sleep for {0}", "WARNING", sleep_time)
             time.sleep(sleep_time)
-            self.log("Progress set to {0} for taskid: {1}".format(task_details.get('progress'), task_id), "DEBUG")
+            self.log("Progress set to {0} for taskid: {1}", "DEBUG", task_details.get('progress'), task_id)
 
         return self
 
@@ -1298,8 +1290,7 @@ class IseRadiusIntegration(DnacBase):
             is_ise_server = self.want.get("authenticationPolicyServer")[auth_server_index].get("isIseEnabled")
             if not self.have.get("authenticationPolicyServer")[auth_server_index].get("exists"):
                 auth_server_params = self.want.get("authenticationPolicyServer")[auth_server_index]
-                self.log("Desired State for Authentication and Policy Server for the IP '{0}' (want): {1}"
-                         .format(ip_address, auth_server_params), "DEBUG")
+                self.log("Desired State for Authentication and Policy Server for the IP '{0}' (want): {1}", "DEBUG", ip_address, auth_server_params)
                 function_name = "add_authentication_and_policy_server_access_configuration"
                 response = self.dnac._exec(
                     family="system_settings",
@@ -1348,8 +1339,7 @@ class IseRadiusIntegration(DnacBase):
                         self.status = "failed"
                         return
 
-                self.log("Successfully created Authentication and Policy Server '{0}'."
-                         .format(ip_address), "INFO")
+                self.log("Successfully created Authentication and Policy Server '{0}'.", "INFO", ip_address)
                 result_auth_server.get("response").get(ip_address) \
                     .update({
                         "authenticationPolicyServer Details": self.want
@@ -1368,8 +1358,7 @@ class IseRadiusIntegration(DnacBase):
             if not (is_ise_server_enabled or self.requires_update(self.have.get("authenticationPolicyServer")[auth_server_index].get("details"),
                                                                   self.want.get("authenticationPolicyServer")[auth_server_index],
                                                                   self.authentication_policy_server_obj_params)):
-                self.log("Authentication and Policy Server '{0}' doesn't require an update"
-                         .format(ip_address), "INFO")
+                self.log("Authentication and Policy Server '{0}' doesn't require an update", "INFO", ip_address)
                 result_auth_server.get("response").get(ip_address).update({
                     "Cisco Catalyst Center params":
                     self.have.get("authenticationPolicyServer")[auth_server_index].get("details")
@@ -1387,10 +1376,9 @@ class IseRadiusIntegration(DnacBase):
             # Authenticaiton and Policy Server Exists
             auth_server_params = copy.deepcopy(self.want.get("authenticationPolicyServer")[auth_server_index])
             auth_server_params.update({"id": self.have.get("authenticationPolicyServer")[auth_server_index].get("id")})
-            self.log("Desired State for Authentication and Policy Server (want): {0}"
-                     .format(auth_server_params), "DEBUG")
-            self.log("Current State for Authentication and Policy Server (have): {0}"
-                     .format(self.have.get("authenticationPolicyServer")[auth_server_index].get("details")), "DEBUG")
+            self.log("Desired State for Authentication and Policy Server (want): {0}", "DEBUG", auth_server_params)
+            self.log("Current State for Authentication and Policy Server (have): {0}", "DEBUG",
+                     self.have.get("authenticationPolicyServer")[auth_server_index].get("details"))
             function_name = "edit_authentication_and_policy_server_access_configuration"
             response = self.dnac._exec(
                 family="system_settings",
@@ -1412,8 +1400,7 @@ class IseRadiusIntegration(DnacBase):
             else:
                 trusted_server_msg = " But the server is not trusted."
 
-            self.log("Authentication and Policy Server '{0}' updated successfully"
-                     .format(ip_address), "INFO")
+            self.log("Authentication and Policy Server '{0}' updated successfully", "INFO", ip_address)
             result_auth_server.get("response").get(ip_address) \
                 .update({"Id": self.have.get("authenticationPolicyServer")[auth_server_index].get("id")})
             result_auth_server.get("msg").update({
@@ -1472,7 +1459,7 @@ class IseRadiusIntegration(DnacBase):
             )
 
             self.log("Received API response for 'delete_authentication_and_"
-                     "policy_server_access_configuration': {0}".format(response), "DEBUG")
+                     "policy_server_access_configuration': {0}", "DEBUG", response)
 
             # Check the task status
             validation_string = "successfully deleted aaa settings"
@@ -1485,7 +1472,7 @@ class IseRadiusIntegration(DnacBase):
             result_auth_server.get("msg").update({
                 ipAddress: "Authentication and Policy Server deleted successfully."
             })
-            self.log("Authentication and Policy Server - {0} deleted successfully.".format(ipAddress))
+            self.log("Authentication and Policy Server - {0} deleted successfully.", "WARNING", ipAddress)
             auth_server_index += 1
 
         self.msg = "Authentication and Policy Server(s) deleted successfully."
@@ -1523,13 +1510,11 @@ class IseRadiusIntegration(DnacBase):
         """
 
         self.get_have(config)
-        self.log("Current State (have): {0}".format(self.have), "INFO")
-        self.log("Requested State (want): {0}".format(self.want), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
+        self.log("Requested State (want): {0}", "INFO", self.want)
         if config.get("authentication_policy_server") is not None:
-            self.log("Desired State of Authentication and Policy Server (want): {0}"
-                     .format(self.want.get("authenticationPolicyServer")), "DEBUG")
-            self.log("Current State of Authentication and Policy Server (have): {0}"
-                     .format(self.have.get("authenticationPolicyServer")), "DEBUG")
+            self.log("Desired State of Authentication and Policy Server (want): {0}", "DEBUG", self.want.get("authenticationPolicyServer"))
+            self.log("Current State of Authentication and Policy Server (have): {0}", "DEBUG", self.have.get("authenticationPolicyServer"))
             check_list = ["isIseEnabled", "ipAddress", "pxgridEnabled",
                           "useDnacCertForPxgrid", "port", "protocol",
                           "retries", "role", "timeoutSeconds", "encryptionScheme"]
@@ -1571,13 +1556,12 @@ class IseRadiusIntegration(DnacBase):
         """
 
         self.get_have(config)
-        self.log("Current State (have): {0}".format(self.have), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
         auth_server_index = 0
         authentication_policy_server = config.get("authentication_policy_server")
         for item in authentication_policy_server:
             ip_address = item.get("server_ip_address")
-            self.log("Authentication and Policy Server deleted from the Cisco Catalyst Center: {0}"
-                     .format(ip_address), "INFO")
+            self.log("Authentication and Policy Server deleted from the Cisco Catalyst Center: {0}", "INFO", ip_address)
             if item is not None:
                 auth_server_exists = self.have.get("authenticationPolicyServer")[auth_server_index].get("exists")
                 if auth_server_exists:
@@ -1586,8 +1570,7 @@ class IseRadiusIntegration(DnacBase):
                     self.status = "failed"
                     return self
 
-                self.log("Successfully validated absence of Authentication and Policy Server '{0}'."
-                         .format(ip_address), "INFO")
+                self.log("Successfully validated absence of Authentication and Policy Server '{0}'.", "INFO", ip_address)
 
             auth_server_index += 1
 
@@ -1631,9 +1614,24 @@ def main():
         "dnac_log_level": {"type": 'str', "default": 'WARNING'},
         "dnac_log_file_path": {"type": 'str', "default": 'dnac.log'},
         "dnac_log_append": {"type": 'bool', "default": True},
+        "dnac_log_max_bytes": {"type": 'int', "default": 0},
+        "dnac_log_backup_count": {"type": 'int', "default": 5},
+        "dnac_log_compress": {"type": 'bool', "default": False},
+        "dnac_log_format": {"type": 'str', "default": 'text', "choices": ['text', 'json']},
         "config_verify": {"type": 'bool', "default": False},
         'dnac_api_task_timeout': {'type': 'int', "default": 1200},
         'dnac_task_poll_interval': {'type': 'int', "default": 2},
+        'dnac_token_cache': {'type': 'bool', 'default': False},
+        'dnac_rate_limit': {'type': 'float', 'default': 0},
+        'dnac_rate_limit_per_family': {'type': 'bool', 'default': False},
+        'dnac_rate_limit_retries': {'type': 'int', 'default': 5},
+        'dnac_shared_rate_limit': {'type': 'float', 'default': 0},
+        'dnac_shared_family_concurrency': {'type': 'int', 'default': 0},
+        'dnac_memoize_reads': {'type': 'bool', 'default': False},
+        'dnac_metrics': {'type': 'bool', 'default': False},
+        'dnac_metrics_file': {'type': 'str'},
+        'dnac_timings': {'type': 'bool', 'default': False},
+        'dnac_timings_file': {'type': 'str'},
         "config": {"type": 'list', "required": True, "elements": 'dict'},
         "state": {"default": 'merged', "choices": ['merged', 'deleted']},
         "validate_response_schema": {"type": 'bool', "default": True},
@@ -425,7 +425,7 @@ class NetworkCompliance(DnacBase):
                 self.module.fail_json(self.msg)
 
         ip_address_list_str = ", ".join(ip_address_list)
-        self.log("Successfully validated the IP address(es): {0}".format(ip_address_list_str), "DEBUG")
+        self.log("Successfully validated the IP address(es): {0}", "DEBUG", ip_address_list_str)
 
     def validate_run_compliance_paramters(self, mgmt_ip_to_instance_id_map, run_compliance, run_compliance_categories):
         """
@@ -491,8 +491,7 @@ class NetworkCompliance(DnacBase):
                         device_in_progress.add(compliance_type.get("deviceUuid"))
 
             self.log(
-                "Number of devices with Compliance Status 'IN_PROGRESS': {0}. Device UUIDs: {1}".format(
-                    len(device_in_progress), list(device_in_progress)), "DEBUG"
+                "Number of devices with Compliance Status 'IN_PROGRESS': {0}. Device UUIDs: {1}", "DEBUG", len(device_in_progress), list(device_in_progress)
             )
             if device_in_progress:
                 # Update run_compliance_params to exclude devices with 'IN_PROGRESS' status
@@ -529,7 +528,7 @@ class NetworkCompliance(DnacBase):
                 op_modifies=True,
                 params={"name": site_name},
             )
-            self.log("Response received post 'get_site' API call: {0}".format(str(response)), "DEBUG")
+            self.log("Response received post 'get_site' API call: {0}", "DEBUG", response)
 
             # Process the response if available
             if response:
@@ -541,7 +540,7 @@ class NetworkCompliance(DnacBase):
 
         except Exception as e:
             # Log an error message and fail if an exception occurs
-            self.log("An error occurred while retrieving site details for Site '{0}' using 'get_site' API call: {1}".format(site_name, str(e)), "ERROR")
+            self.log("An error occurred while retrieving site details for Site '{0}' using 'get_site' API call: {1}", "ERROR", site_name, e)
 
         if not site_exists:
             msg = "An error occurred while retrieving site details for Site '{0}'. Please verify that the site exists.".format(site_name)
@@ -575,7 +574,7 @@ class NetworkCompliance(DnacBase):
                     op_modifies=True,
                     params={"managementIpAddress": device_ip}
                 )
-                self.log("Response received post 'get_device_list' API call: {0}".format(str(response)), "DEBUG")
+                self.log("Response received post 'get_device_list' API call: {0}", "DEBUG", response)
 
                 # Check if a valid response is received
                 if response.get("response"):
@@ -595,11 +594,11 @@ class NetworkCompliance(DnacBase):
                             self.log(msg, "INFO")
                 else:
                     # If unable to retrieve device information, log an error message
-                    self.log("Unable to retrieve device information for {0}. Please ensure that the device exists and is reachable.".format(device_ip), "ERROR")
+                    self.log("Unable to retrieve device information for {0}. Please ensure that the device exists and is reachable.", "ERROR", device_ip)
 
             except Exception as e:
                 # Log an error message if any exception occurs during the process
-                self.log("Error while fetching device ID for device: '{0}' from Cisco Catalyst Center: {1}".format(device_ip, str(e)), "ERROR")
+                self.log("Error while fetching device ID for device: '{0}' from Cisco Catalyst Center: {1}", "ERROR", device_ip, e)
         if not mgmt_ip_to_instance_id_map:
             ip_address_list_str = ", ".join(ip_address_list)
             self.msg = "No reachable devices found among the provided IP addresses: {0}".format(ip_address_list_str)
@@ -640,7 +639,7 @@ class NetworkCompliance(DnacBase):
                 op_modifies=True,
                 params=site_params,
             )
-            self.log("Response received post 'get_membership' API Call: {0} ".format(str(response)), "DEBUG")
+            self.log("Response received post 'get_membership' API Call: {0} ", "DEBUG", response)
 
             # Process the response if available
             if response:
@@ -663,11 +662,11 @@ class NetworkCompliance(DnacBase):
                                 self.log(msg, "WARNING")
             else:
                 # If unable to retrieve device information, log an error message
-                self.log("No response received from API call to get membership information for site. {0}".format(site_name), "ERROR")
+                self.log("No response received from API call to get membership information for site. {0}", "ERROR", site_name)
 
         except Exception as e:
             # Log an error message if any exception occurs during the process
-            self.log("Unable to fetch the device(s) associated to the site '{0}' due to {1}".format(site_name, str(e)), "ERROR")
+            self.log("Unable to fetch the device(s) associated to the site '{0}' due to {1}", "ERROR", site_name, e)
 
         if not mgmt_ip_to_instance_id_map:
             self.msg = "Reachable devices not found at Site: {0}".format(site_name)
@@ -729,8 +728,7 @@ class NetworkCompliance(DnacBase):
         msg = None
 
         # Validate if sync is required
-        self.log("Compliance Report for {0} operation for device(s) {1} : {2}".format(
-            task_name, list(mgmt_ip_to_instance_id_map.keys()), response), "INFO")
+        self.log("Compliance Report for {0} operation for device(s) {1} : {2}", "INFO", task_name, list(mgmt_ip_to_instance_id_map.keys()), response)
 
         # Categorize the devices based on status - "COMPLIANT", "NON_COMPLIANT", "OTHER"(status other than COMPLIANT and NON_COMPLIANT)
         categorized_devices = {"COMPLIANT": {}, "NON_COMPLIANT": {}, "OTHER": {}}
@@ -743,7 +741,7 @@ class NetworkCompliance(DnacBase):
             else:
                 categorized_devices["OTHER"][ip_address] = compliance_type
 
-        self.log("Device(s) Categorized based on Compliance status: {0}".format(categorized_devices), "INFO")
+        self.log("Device(s) Categorized based on Compliance status: {0}", "INFO", categorized_devices)
 
         # Validate if all devices are "COMPLIANT" - then sync not required
         if len(categorized_devices["COMPLIANT"]) + len(categorized_devices["OTHER"]) == len(mgmt_ip_to_instance_id_map):
@@ -838,7 +836,7 @@ class NetworkCompliance(DnacBase):
 
             compliance_details = response
             sync_required, self.msg, categorized_devices = self.is_sync_required(response, mgmt_ip_to_instance_id_map)
-            self.log("Is Sync Requied: {0} -- Message: {1}".format(sync_required, self.msg), "DEBUG")
+            self.log("Is Sync Requied: {0} -- Message: {1}", "DEBUG", sync_required, self.msg)
             if not sync_required:
                 self.update_result("ok", False, self.msg, "INFO")
                 self.module.exit_json(**self.result)
@@ -860,7 +858,7 @@ class NetworkCompliance(DnacBase):
                 excluded_device_ids_str = ", ".join(excluded_device_ids)
                 msg = "Skipping these devices because their compliance status is not 'NON_COMPLIANT': {0}".format(excluded_device_ids_str)
                 self.log(msg, "WARNING")
-                self.log("Updated 'sync_device_config_params' parameters: {0}".format(sync_device_config_params), "DEBUG")
+                self.log("Updated 'sync_device_config_params' parameters: {0}", "DEBUG", sync_device_config_params)
 
         # Construct the "want" dictionary containing the desired state parameters
         want = {}
@@ -875,7 +873,7 @@ class NetworkCompliance(DnacBase):
             compliance_details=compliance_details
         )
         self.want = want
-        self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+        self.log("Desired State (want): {0}", "INFO", self.want)
 
         return self
 
@@ -898,20 +896,15 @@ class NetworkCompliance(DnacBase):
         # Initialize the lists/dicts
         final_response = {}
         device_list = []
-        compliance_details_of_device_params = {}
-        device_ip = None
+        calls = []
 
         # Iterate through each device UUID in the run compliance parameters
         for device_uuid in run_compliance_params["deviceUuids"]:
 
             # Find the corresponding device IP for the given device UUID
-            for ip, device_id in mgmt_ip_to_instance_id_map.items():
-                if device_uuid == device_id:
-                    device_ip = ip
-                    break
-
+            device_ip = next((ip for ip, device_id in mgmt_ip_to_instance_id_map.items() if device_uuid == device_id), None)
             if device_ip is None:
-                self.log("Device UUID: {0} not found in mgmt_ip_to_instance_id_map: {1}".format(device_uuid, mgmt_ip_to_instance_id_map), "DEBUG")
+                self.log("Device UUID: {0} not found in mgmt_ip_to_instance_id_map: {1}", "DEBUG", device_uuid, mgmt_ip_to_instance_id_map)
                 continue
 
             # Add the device IP to the device list
@@ -921,22 +914,29 @@ class NetworkCompliance(DnacBase):
             if device_ip not in final_response.keys():
                 final_response[device_ip] = []
 
-            # Check if categories are specified and fetch details for each category of the device
-            if "categories" in run_compliance_params.keys():
-                for category in run_compliance_params["categories"]:
+            # Fetch the details of each category of the device when categories are specified
+            for category in run_compliance_params.get("categories") or [None]:
+                compliance_details_of_device_params = {"device_uuid": device_uuid, "diff_list": True}
+                if category is not None:
                     compliance_details_of_device_params["category"] = category
-                    compliance_details_of_device_params["device_uuid"] = device_uuid
-                    compliance_details_of_device_params["diff_list"] = True
+                calls.append((device_ip, compliance_details_of_device_params))
 
-                    response = self.get_compliance_details_of_device(compliance_details_of_device_params, device_ip)
-                    final_response[device_ip].extend(response)
+        # The details of every device and category are independent, they are requested concurrently
+        results = self.map_exec(
+            [("compliance", "compliance_details_of_device", params) for dummy, params in calls],
+            op_modifies=True,
+        )
+        for (device_ip, params), result in zip(calls, results):
+            if result.failed:
+                self.msg = ("An error occurred while retrieving Compliance Details for device:{0} using 'compliance_details_of_device' API call"
+                            ". Error: {1}".format(device_ip, str(result.error)))
+                self.update_result("failed", False, self.msg, "ERROR")
+                self.check_return_status()
 
-            else:
-                # Fetch compliance details for the device without specific category
-                compliance_details_of_device_params["device_uuid"] = device_uuid
-                compliance_details_of_device_params["diff_list"] = True
-                response = self.get_compliance_details_of_device(compliance_details_of_device_params, device_ip)
-                final_response[device_ip].extend(response)
+            if not result.response:
+                self.log("No response received from the 'compliance_details_of_device' API call.", "ERROR")
+                continue
+            final_response[device_ip].extend(result.response["response"])
 
         # If no compliance details were found, update the result with an error message
         if not final_response:
@@ -947,44 +947,6 @@ class NetworkCompliance(DnacBase):
 
         return final_response
 
-    def get_compliance_details_of_device(self, compliance_details_of_device_params, device_ip):
-        """
-        Retrieve compliance details for a specific device.
-
-        This function makes an API call to fetch compliance details for a given device
-        using the specified parameters. It handles the API response and logs the
-        necessary information.
-
-        Args:
-            compliance_details_of_device_params (dict): Parameters required for the compliance details API call.
-            device_ip (str): The IP address of the device for which compliance details are being fetched.
-
-        Returns:
-            dict or None: The response from the compliance details API call if successful,
-                          None if an error occurs or no response is received.
-        """
-        try:
-            # Make the API call to fetch compliance details for the device
-            response = self.dnac_apply["exec"](
-                family="compliance",
-                function="compliance_details_of_device",
-                params=compliance_details_of_device_params,
-                op_modifies=True
-            )
-            self.log("Response received post 'compliance_details_of_device' API call: {0}".format(str(response)), "DEBUG")
-
-            if response:
-                response = response["response"]
-            else:
-                self.log("No response received from the 'compliance_details_of_device' API call.", "ERROR")
-            return response
-        except Exception as e:
-            # Handle any exceptions that occur during the API call
-            self.msg = ("An error occurred while retrieving Compliance Details for device:{0} using 'compliance_details_of_device' API call"
-                        ". Error: {1}".format(device_ip, str(e)))
-            self.update_result("failed", False, self.msg, "ERROR")
-            self.check_return_status()
-
     def run_compliance(self, run_compliance_params, batch_size):
         """
         Executes a compliance check operation in Cisco Catalyst Center.
@@ -1010,13 +972,13 @@ class NetworkCompliance(DnacBase):
             batches = [device_uuids[i:i + batch_size] for i in range(0, len(device_uuids), batch_size)]
         else:
             batches = [device_uuids]
-        self.log("Created {0} batch(es) for run compliance operation: {1}".format(len(batches), batches), "DEBUG")
+        self.log("Created {0} batch(es) for run compliance operation: {1}", "DEBUG", len(batches), batches)
 
         for idx, batch in enumerate(batches):
-            self.log("Executing 'run_compliance' operation on batch: {0} - {1}".format(idx, batch), "DEBUG")
+            self.log("Executing 'run_compliance' operation on batch: {0} - {1}", "DEBUG", idx, batch)
             batch_params = run_compliance_params.copy()
             batch_params["deviceUuids"] = batch
-            self.log("Batch {0} Parameters: {1}".format(idx, batch_params), "DEBUG")
+            self.log("Batch {0} Parameters: {1}", "DEBUG", idx, batch_params)
 
             try:
                 response = self.dnac_apply["exec"](
@@ -1025,12 +987,12 @@ class NetworkCompliance(DnacBase):
                     params=batch_params,
                     op_modifies=True,
                 )
-                self.log("Response received post 'run_compliance' API call is {0}".format(str(response)), "DEBUG")
+                self.log("Response received post 'run_compliance' API call is {0}", "DEBUG", response)
 
                 if response:
                     self.result.update(dict(response=response["response"]))
                     task_id = response["response"].get("taskId")
-                    self.log("Task Id for the 'run_compliance' task is {0}".format(task_id), "DEBUG")
+                    self.log("Task Id for the 'run_compliance' task is {0}", "DEBUG", task_id)
                     if task_id:
                         batches_dict[idx] = {"task_id": task_id, "batch_params": batch_params}
                 else:
@@ -1066,11 +1028,11 @@ class NetworkCompliance(DnacBase):
                 params=sync_device_config_params,
                 op_modifies=True,
             )
-            self.log("Response received post 'commit_device_configuration' API call is {0}".format(str(response)), "DEBUG")
+            self.log("Response received post 'commit_device_configuration' API call is {0}", "DEBUG", response)
 
             if response:
                 self.result.update(dict(response=response["response"]))
-                self.log("Task Id for the 'commit_device_configuration' task  is {0}".format(response["response"].get("taskId")), "INFO")
+                self.log("Task Id for the 'commit_device_configuration' task  is {0}", "INFO", response["response"].get("taskId"))
                 # Return the task ID
                 return response["response"].get("taskId")
             else:
@@ -1106,7 +1068,7 @@ class NetworkCompliance(DnacBase):
                 op_modifies=True,
             )
             self.log("Response received post 'get_task_by_id' API Call for the Task {0} with Task id {1} "
-                     "is {2}".format(task_name, str(task_id), str(response)), "DEBUG")
+                     "is {2}", "DEBUG", task_name, task_id, response)
 
             if response:
                 response = response["response"]
@@ -1141,7 +1103,7 @@ class NetworkCompliance(DnacBase):
                 op_modifies=True,
             )
             self.log("Response received post 'get_task_tree' API call for the Task {0} with Task id {1} "
-                     "is {2}".format(task_name, str(task_id), str(response)), "DEBUG")
+                     "is {2}", "DEBUG", task_name, task_id, response)
             if response:
                 response = response["response"]
             else:
@@ -1241,54 +1203,49 @@ class NetworkCompliance(DnacBase):
 
         return self
 
-    def get_task_result(self, task_id, device_ids):
+    def get_task_result(self, task_id, device_ids, wait_result):
         """
-        This function retrieves the status of compliance check tasks in Cisco Catalyst Center.
+        This function builds the result of a finished compliance check task in Cisco Catalyst Center.
         Parameters:
             - task_id (str): The ID of the compliance check task.
             - device_ids (list): A list of device UUIDs involved in the compliance check task.
+            - wait_result (WaitResult): The outcome of waiting on the task, its value holds the last task status.
         Returns:
             dict: A dictionary containing the task ID as the key, and a dictionary with 'msg' and 'status' as the value.
         Description:
-            This function continuously checks the status of a compliance check task until completion or timeout.
-            It handles various scenarios such as task completion, task failure, or errors during execution.
-            Upon successful completion, it logs the modified compliance response and updates the result accordingly.
+            This function handles the various ways a compliance check task can end, such as task completion,
+            task failure, errors during execution or no status being returned.
             If the task does not complete within the timeout period, it returns a timeout status.
             If there is an error during task execution, it returns the error message and status.
             If the task fails, it returns the failure message and status.
         """
         task_name = "Run Compliance Check"
-        start_time = time.time()
+        response = wait_result.value
 
-        while True:
-            response = self.get_task_status(task_id, task_name)
+        # Check if response returned
+        if not response:
+            msg = "Error retrieving Task status for {0} with Task Id: {1}".format(task_name, task_id)
+            return {task_id: {"msg": msg, "status": None}}
 
-            # Check if response returned
-            if not response:
-                msg = "Error retrieving Task status for {0} with Task Id: {1}".format(task_name, task_id)
-                return {task_id: {"msg": msg, "status": None}}
+        # Check if the task did not complete within the timeout
+        if wait_result.timed_out:
+            msg = "Task {0} with task id {1} has not completed within the timeout period.".format(task_name, task_id)
+            return {task_id: {"msg": msg, "status": "Timedout"}}
 
-            # Check if the elapsed time exceeds the timeout
-            if time.time() - start_time > self.params.get("dnac_api_task_timeout"):
-                msg = "Task {0} with task id {1} has not completed within the timeout period.".format(task_name, task_id)
-                return {task_id: {"msg": msg, "status": "Timedout"}}
+        # Handle error if task execution encounters an error
+        if response.get("isError"):
+            msg = "Task {0} with task id {1} has encountered an Error: {2}".format(task_name, task_id, response.get("failureReason"))
+            return {task_id: {"msg": msg, "status": "Error"}}
 
-            # Handle error if task execution encounters an error
-            if response.get("isError"):
-                msg = "Task {0} with task id {1} has encountered an Error: {2}".format(task_name, task_id, response.get("failureReason"))
-                return {task_id: {"msg": msg, "status": "Error"}}
-
-            # Check if task completed successfully
-            if not response.get("isError") and "success" in response.get("progress").lower():
-                device_ids_str = ", ".join(device_ids)
-                msg = "{0} has completed successfully on device(s): {1}".format(task_name, device_ids_str)
-                return {task_id: {"msg": msg, "status": "Success"}}
-
-            # Check if task failed
-            if "failed" in response.get("progress").lower():
-                device_ids_str = ", ".join(device_ids)
-                msg = "Failed to {0} on the following device(s): {1}".format(task_name, device_ids_str)
-                return {task_id: {"msg": msg, "status": "Failed"}}
+        # Check if task completed successfully
+        device_ids_str = ", ".join(device_ids)
+        if wait_result.succeeded:
+            msg = "{0} has completed successfully on device(s): {1}".format(task_name, device_ids_str)
+            return {task_id: {"msg": msg, "status": "Success"}}
+
+        # Otherwise the task failed
+        msg = "Failed to {0} on the following device(s): {1}".format(task_name, device_ids_str)
+        return {task_id: {"msg": msg, "status": "Failed"}}
 
     def get_batches_result(self, batches_dict):
         """
@@ -1300,17 +1257,35 @@ class NetworkCompliance(DnacBase):
             list: A list of dictionaries where each dictionary contains the 'task_id', 'batch_params',
                   'task_status', and 'msg' for each batch.
         Description:
-            This function iterates over the provided batches, retrieves the task status for each batch,
-            and stores the result including task ID, batch parameters, task status, and message.
+            This function waits for the tasks of all the provided batches at once, then retrieves the task status
+            for each batch and stores the result including task ID, batch parameters, task status, and message.
         """
+        task_name = "Run Compliance Check"
+
+        def is_success(response):
+            return bool(response) and not response.get("isError") and "success" in (response.get("progress") or "").lower()
+
+        def is_failure(response):
+            # A missing status ends the wait as well, it is reported as an error retrieving the task status
+            return not response or bool(response.get("isError")) or "failed" in (response.get("progress") or "").lower()
+
+        # Wait for all the batches together, every batch is polled on its own schedule
+        wait_results = self.wait_for_tasks(
+            dict((idx, batch_info["task_id"]) for idx, batch_info in batches_dict.items()),
+            is_success=is_success,
+            is_failure=is_failure,
+            timeout=self.params.get("dnac_api_task_timeout"),
+            poll_task=lambda task_id: self.get_task_status(task_id, task_name),
+        )
+
         batches_result = []
         for idx, batch_info in batches_dict.items():
             task_id = batch_info["task_id"]
             device_ids = batch_info["batch_params"]["deviceUuids"]
 
             # Get task status for the current batch
-            task_status = self.get_task_result(task_id, device_ids)
-            self.log("The task status of batch: {0} with task id: {1} is {2}".format(idx, task_id, task_status), "INFO")
+            task_status = self.get_task_result(task_id, device_ids, wait_results[idx])
+            self.log("The task status of batch: {0} with task id: {1} is {2}", "INFO", idx, task_id, task_status)
 
             # Extract message and status from the task status result
             msg = task_status[task_id]["msg"]
@@ -1327,7 +1302,7 @@ class NetworkCompliance(DnacBase):
             # Append the current batch result to the batches_result list
             batches_result.append(batch_result)
 
-        self.log("Collective result of all batches: {0}".format(batches_result), "DEBUG")
+        self.log("Collective result of all batches: {0}", "DEBUG", batches_result)
         return batches_result
 
     def validate_batch_result(self, batches_result, retried_batches=None):
@@ -1363,12 +1338,11 @@ class NetworkCompliance(DnacBase):
                     device_ids_str = ", ".join(device_ids)
                     self.log(
                         "Batch for device(s) {0} has already been retried with batch size of 1 and failed. "
-                        "Stopping recursion.".format(device_ids_str),
-                        "ERROR"
+                        "Stopping recursion.", "ERROR", device_ids_str
                     )
                     continue
 
-                self.log("Re-running compliance check for batch {0} with batch_result: {1} ".format(batch, batches_result), "WARNING")
+                self.log("Re-running compliance check for batch {0} with batch_result: {1} ", "WARNING", batch, batches_result)
                 # Re-run the compliance check for the failed batch with batch size of 1
                 retried_batches.add(device_ids)
                 batches_dict = self.run_compliance(batch_params, batch_size=1)
@@ -1400,7 +1374,7 @@ class NetworkCompliance(DnacBase):
         batches_result = self.get_batches_result(batches_dict)
         successful_devices = self.validate_batch_result(batches_result)
         successful_devices_str = ", ".join(successful_devices)
-        self.log("{0} successful on device(s): {1}".format(task_name, successful_devices_str), "DEBUG")
+        self.log("{0} successful on device(s): {1}", "DEBUG", task_name, successful_devices_str)
 
         # Reverse the mgmt_ip_to_instance_id_map to map device IDs to IPs
         id_to_ip_map = {v: k for k, v in mgmt_ip_to_instance_id_map.items()}
@@ -1414,7 +1388,7 @@ class NetworkCompliance(DnacBase):
         unsuccessful_devices = list(set(all_device_ids) - set(successful_devices))
         unsuccessful_ips = [id_to_ip_map[device_id] for device_id in unsuccessful_devices if device_id in id_to_ip_map]
         unsuccessful_ips_str = ", ".join(unsuccessful_ips)
-        self.log("{0} unsuccessful on device(s): {1}".format(task_name, unsuccessful_ips_str), "DEBUG")
+        self.log("{0} unsuccessful on device(s): {1}", "DEBUG", task_name, unsuccessful_ips_str)
 
         if successful_devices:
 
@@ -1430,7 +1404,7 @@ class NetworkCompliance(DnacBase):
             successful_devices_params = self.want.get("run_compliance_params").copy()
             successful_devices_params["deviceUuids"] = successful_devices
             compliance_report = self.get_compliance_report(successful_devices_params, mgmt_ip_to_instance_id_map)
-            self.log("Compliance Report: {0}".format(compliance_report), "INFO")
+            self.log("Compliance Report: {0}", "INFO", compliance_report)
             self.update_result("success", True, self.msg, "INFO", compliance_report)
         else:
             self.msg = "Failed to {0} on the following device(s): {1}".format(task_name, unsuccessful_ips_str)
@@ -1485,9 +1459,9 @@ class NetworkCompliance(DnacBase):
                     ip = next((k for k, v in mgmt_ip_to_instance_id_map.items() if v == device_id), None)
                     if device_id in progress and "copy_Running_To_Startup=Success" in progress:
                         success_devices.append(ip)
-                        self.log("{0} operation completed successfully on device: {1} with device UUID: {2}".format(task_name, ip, device_id), "DEBUG")
+                        self.log("{0} operation completed successfully on device: {1} with device UUID: {2}", "DEBUG", task_name, ip, device_id)
                     elif device_id in progress and "copy_Running_To_Startup=Failed" in progress:
-                        self.log("{0} operation FAILED on device: {1} with device UUID: {2}".format(task_name, ip, device_id), "DEBUG")
+                        self.log("{0} operation FAILED on device: {1} with device UUID: {2}", "DEBUG", task_name, ip, device_id)
                         failed_devices.append(ip)
 
             success_devices = set(success_devices)
@@ -1535,11 +1509,11 @@ class NetworkCompliance(DnacBase):
             # Execute the action and check its status
             if self.want.get(action_param):
                 if action_param == "run_compliance_params":
-                    self.log("Performing '{0}' operation...".format(action_func.__name__), "DEBUG")
+                    self.log("Performing '{0}' operation...", "DEBUG", action_func.__name__)
                     batch_size = self.want.get("run_compliance_batch_size")
                     result_task_id = action_func(self.want.get(action_param), batch_size=batch_size)
                 else:
-                    self.log("Performing '{0}' operation...".format(action_func.__name__), "DEBUG")
+                    self.log("Performing '{0}' operation...", "DEBUG", action_func.__name__)
                     result_task_id = action_func(self.want.get(action_param))
 
                 if not result_task_id:
@@ -1566,7 +1540,7 @@ class NetworkCompliance(DnacBase):
         if config.get("sync_device_config"):
             # Get compliance details before running sync_device_config
             compliance_details_before = self.want.get("compliance_details")
-            self.log("Compliance details before running sync_device_config: {0}".format(compliance_details_before), "INFO")
+            self.log("Compliance details before running sync_device_config: {0}", "INFO", compliance_details_before)
 
             # Get compliance details after running sync_device_config
             compliance_details_after = self.get_compliance_report(
@@ -1578,7 +1552,7 @@ class NetworkCompliance(DnacBase):
                 self.update("failed", False, self.msg, "ERROR")
                 self.check_return_status()
 
-            self.log("Compliance details after running sync_device_config: {0}.".format(compliance_details_after), "INFO")
+            self.log("Compliance details after running sync_device_config: {0}.", "INFO", compliance_details_after)
 
             # Get the device IDs to check
             sync_device_ids = self.want.get("sync_device_config_params").get("deviceId", [])
@@ -1641,11 +1615,26 @@ def main():
                     "dnac_log_level": {"type": "str", "default": "WARNING"},
                     "dnac_log_file_path": {"type": "str", "default": "dnac.log"},
                     "dnac_log_append": {"type": "bool", "default": True},
+                    "dnac_log_max_bytes": {"type": "int", "default": 0},
+                    "dnac_log_backup_count": {"type": "int", "default": 5},
+                    "dnac_log_compress": {"type": "bool", "default": False},
+                    "dnac_log_format": {"type": "str", "default": "text", "choices": ["text", "json"]},
                     "dnac_log": {"type": "bool", "default": False},
                     "validate_response_schema": {"type": "bool", "default": True},
                     "config_verify": {"type": "bool", "default": False},
                     "dnac_api_task_timeout": {"type": "int", "default": 1200},
                     "dnac_task_poll_interval": {"type": "int", "default": 2},
+                    "dnac_token_cache": {"type": "bool", "default": False},
+                    "dnac_rate_limit": {"type": "float", "default": 0},
+                    "dnac_rate_limit_per_family": {"type": "bool", "default": False},
+                    "dnac_rate_limit_retries": {"type": "int", "default": 5},
+                    "dnac_shared_rate_limit": {"type": "float", "default": 0},
+                    "dnac_shared_family_concurrency": {"type": "int", "default": 0},
+                    "dnac_memoize_reads": {"type": "bool", "default": False},
+                    "dnac_metrics": {"type": "bool", "default": False},
+                    "dnac_metrics_file": {"type": "str"},
+                    "dnac_timings": {"type": "bool", "default": False},
+                    "dnac_timings_file": {"type": "str"},
                     "config": {"required": True, "type": "list", "elements": "dict"},
                     "state": {"default": "merged", "choices": ["merged"]}
                     }
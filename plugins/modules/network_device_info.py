@@ -189,6 +189,32 @@ options:
     description:
     - Limit query parameter. 1 <= limit <= 500 max. No. Of devices to be returned in the result.
     type: int
+  all_pages:
+    description:
+    - Return every device matching the filters instead of a single page, I(offset) and I(limit) are ignored.
+    - When only the hostname, management IP address, MAC address and location name filters are used, the number
+      of devices is requested first and the pages are then requested concurrently.
+    - The response cache is not used for these requests.
+    type: bool
+    default: false
+  cache:
+    description:
+    - Use of the on-disk response cache shared by the plays of the control node.
+    - C(use) returns a cached response younger than I(cache_ttl) and caches the fresh ones.
+    - C(refresh) always calls Cisco DNA Center and caches the response.
+    - C(bypass) calls Cisco DNA Center without reading or writing the cache.
+    - The cache is kept in '~/.ansible/cisco_dnac/responses', which can be changed with the
+      DNAC_RESPONSE_CACHE_DIR environment variable. Its size is capped to 50 MiB, or to the bytes given
+      in the DNAC_RESPONSE_CACHE_MAX_SIZE environment variable, by removing the least recently used responses.
+    - When the cache cannot be written, Cisco DNA Center is called and C(response_cache.status) is C(error).
+    type: str
+    choices: [refresh, use, bypass]
+    default: bypass
+  cache_ttl:
+    description:
+    - Maximum age in seconds of a cached response returned when I(cache=use).
+    type: int
+    default: 300
 requirements:
 - dnacentersdk >= 2.7.2
 - python >= 3.5
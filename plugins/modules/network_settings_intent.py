@@ -605,7 +605,7 @@ class NetworkSettings(DnacBase):
             return self
 
         self.validated_config = valid_temp
-        self.log("Successfully validated playbook config params: {0}".format(valid_temp), "INFO")
+        self.log("Successfully validated playbook config params: {0}", "INFO", valid_temp)
         self.msg = "Successfully validated input from the playbook"
         self.status = "success"
         return self
@@ -636,8 +636,8 @@ class NetworkSettings(DnacBase):
 
         current_obj = have
         requested_obj = want
-        self.log("Current State (have): {0}".format(current_obj), "DEBUG")
-        self.log("Desired State (want): {0}".format(requested_obj), "DEBUG")
+        self.log("Current State (have): {0}", "DEBUG", current_obj)
+        self.log("Desired State (want): {0}", "DEBUG", requested_obj)
 
         return any(not dnac_compare_equality(current_obj.get(dnac_param),
                                              requested_obj.get(ansible_param))
@@ -685,7 +685,7 @@ class NetworkSettings(DnacBase):
                 raise ValueError("Received an unexpected value for 'get_object': {0}"
                                  .format(get_object))
         except Exception as msg:
-            self.log("Received exception: {0}".format(msg), "CRITICAL")
+            self.log("Received exception: {0}", "CRITICAL", msg)
 
         return obj_params
 
@@ -708,17 +708,15 @@ class NetworkSettings(DnacBase):
                 op_modifies=True,
                 params={"name": site_name},
             )
-            self.log("Received API response from 'get_site': {0}".format(response), "DEBUG")
+            self.log("Received API response from 'get_site': {0}", "DEBUG", response)
             if not response:
-                self.log("Failed to retrieve the site ID for the site name: {0}"
-                         .format(site_name), "ERROR")
+                self.log("Failed to retrieve the site ID for the site name: {0}", "ERROR", site_name)
                 return None
 
             _id = response.get("response")[0].get("id")
-            self.log("Site ID for site name '{0}': {1}".format(site_name, _id), "DEBUG")
+            self.log("Site ID for site name '{0}': {1}", "DEBUG", site_name, _id)
         except Exception as msg:
-            self.log("Exception occurred while retrieving site_id from the site_name: {0}"
-                     .format(msg), "CRITICAL")
+            self.log("Exception occurred while retrieving site_id from the site_name: {0}", "CRITICAL", msg)
             return None
 
         return _id
@@ -739,7 +737,7 @@ class NetworkSettings(DnacBase):
             self.log("Global Pool is empty", "INFO")
             return None
 
-        self.log("Global Pool Details: {0}".format(pool_info), "DEBUG")
+        self.log("Global Pool Details: {0}", "DEBUG", pool_info)
         global_pool = {
             "settings": {
                 "ippool": [{
@@ -751,14 +749,14 @@ class NetworkSettings(DnacBase):
                 }]
             }
         }
-        self.log("Formated global pool details: {0}".format(global_pool), "DEBUG")
+        self.log("Formated global pool details: {0}", "DEBUG", global_pool)
         global_ippool = global_pool.get("settings").get("ippool")[0]
         if pool_info.get("ipv6") is False:
             global_ippool.update({"IpAddressSpace": "IPv4"})
         else:
             global_ippool.update({"IpAddressSpace": "IPv6"})
 
-        self.log("ip_address_space: {0}".format(global_ippool.get("IpAddressSpace")), "DEBUG")
+        self.log("ip_address_space: {0}", "DEBUG", global_ippool.get("IpAddressSpace"))
         if not pool_info["gateways"]:
             global_ippool.update({"gateway": ""})
         else:
@@ -837,7 +835,7 @@ class NetworkSettings(DnacBase):
                 else:
                     reserve_pool.update({"ipv6GateWay": ""})
         reserve_pool.update({"slaacSupport": True})
-        self.log("Formatted reserve pool details: {0}".format(reserve_pool), "DEBUG")
+        self.log("Formatted reserve pool details: {0}", "DEBUG", reserve_pool)
         return reserve_pool
 
     def get_network_params(self, site_id):
@@ -860,7 +858,7 @@ class NetworkSettings(DnacBase):
             op_modifies=True,
             params={"site_id": site_id}
         )
-        self.log("Received API response from 'get_network_v2': {0}".format(response), "DEBUG")
+        self.log("Received API response from 'get_network_v2': {0}", "DEBUG", response)
         if not isinstance(response, dict):
             self.log("Failed to retrieve the network details - "
                      "Response is not a dictionary", "ERROR")
@@ -985,7 +983,7 @@ class NetworkSettings(DnacBase):
                     }
                 })
 
-        self.log("Formatted playbook network details: {0}".format(network_details), "DEBUG")
+        self.log("Formatted playbook network details: {0}", "DEBUG", network_details)
         return network_details
 
     def global_pool_exists(self, name):
@@ -1018,16 +1016,16 @@ class NetworkSettings(DnacBase):
 
         all_global_pool_details = response.get("response")
         global_pool_details = get_dict_result(all_global_pool_details, "ipPoolName", name)
-        self.log("Global ip pool name: {0}".format(name), "DEBUG")
-        self.log("Global pool details: {0}".format(global_pool_details), "DEBUG")
+        self.log("Global ip pool name: {0}", "DEBUG", name)
+        self.log("Global pool details: {0}", "DEBUG", global_pool_details)
         if not global_pool_details:
-            self.log("Global pool {0} does not exist".format(name), "INFO")
+            self.log("Global pool {0} does not exist", "INFO", name)
             return global_pool
         global_pool.update({"exists": True})
         global_pool.update({"id": global_pool_details.get("id")})
         global_pool["details"] = self.get_global_pool_params(global_pool_details)
 
-        self.log("Formatted global pool details: {0}".format(global_pool), "DEBUG")
+        self.log("Formatted global pool details: {0}", "DEBUG", global_pool)
         return global_pool
 
     def reserve_pool_exists(self, name, site_name):
@@ -1053,7 +1051,7 @@ class NetworkSettings(DnacBase):
             "success": True
         }
         site_id = self.get_site_id(site_name)
-        self.log("Site ID for the site name {0}: {1}".format(site_name, site_id), "DEBUG")
+        self.log("Site ID for the site name {0}: {1}", "DEBUG", site_name, site_id)
         if not site_id:
             reserve_pool.update({"success": False})
             self.msg = "Failed to get the site id from the site name {0}".format(site_name)
@@ -1075,16 +1073,15 @@ class NetworkSettings(DnacBase):
         all_reserve_pool_details = response.get("response")
         reserve_pool_details = get_dict_result(all_reserve_pool_details, "groupName", name)
         if not reserve_pool_details:
-            self.log("Reserved pool {0} does not exist in the site {1}"
-                     .format(name, site_name), "DEBUG")
+            self.log("Reserved pool {0} does not exist in the site {1}", "DEBUG", name, site_name)
             return reserve_pool
 
         reserve_pool.update({"exists": True})
         reserve_pool.update({"id": reserve_pool_details.get("id")})
         reserve_pool.update({"details": self.get_reserve_pool_params(reserve_pool_details)})
 
-        self.log("Reserved pool details: {0}".format(reserve_pool.get("details")), "DEBUG")
-        self.log("Reserved pool id: {0}".format(reserve_pool.get("id")), "DEBUG")
+        self.log("Reserved pool details: {0}", "DEBUG", reserve_pool.get("details"))
+        self.log("Reserved pool id: {0}", "DEBUG", reserve_pool.get("id"))
         return reserve_pool
 
     def get_have_global_pool(self, config):
@@ -1126,7 +1123,7 @@ class NetworkSettings(DnacBase):
         # If the Global Pool doesn't exist and a previous name is provided
         # Else try using the previous name
         global_pool = self.global_pool_exists(name)
-        self.log("Global pool details: {0}".format(global_pool), "DEBUG")
+        self.log("Global pool details: {0}", "DEBUG", global_pool)
         prev_name = global_pool_ippool[0].get("prev_name")
         if global_pool.get("exists") is False and \
                 prev_name is not None:
@@ -1136,8 +1133,8 @@ class NetworkSettings(DnacBase):
                 self.status = "failed"
                 return self
 
-        self.log("Global pool exists: {0}".format(global_pool.get("exists")), "DEBUG")
-        self.log("Current Site: {0}".format(global_pool.get("details")), "DEBUG")
+        self.log("Global pool exists: {0}", "DEBUG", global_pool.get("exists"))
+        self.log("Current Site: {0}", "DEBUG", global_pool.get("details"))
         self.have.update({"globalPool": global_pool})
         self.msg = "Collecting the global pool details from the Cisco DNA Center"
         self.status = "success"
@@ -1169,7 +1166,7 @@ class NetworkSettings(DnacBase):
             return self
 
         site_name = reserve_pool_details.get("site_name")
-        self.log("Site Name: {0}".format(site_name), "DEBUG")
+        self.log("Site Name: {0}", "DEBUG", site_name)
         if site_name is None:
             self.msg = "Missing parameter 'site_name' in reserve_pool_details"
             self.status = "failed"
@@ -1180,7 +1177,7 @@ class NetworkSettings(DnacBase):
         reserve_pool = self.reserve_pool_exists(name, site_name)
         if not reserve_pool.get("success"):
             return self.check_return_status()
-        self.log("Reserved pool details: {0}".format(reserve_pool), "DEBUG")
+        self.log("Reserved pool details: {0}", "DEBUG", reserve_pool)
 
         # If the Reserved Pool doesn't exist and a previous name is provided
         # Else try using the previous name
@@ -1197,8 +1194,8 @@ class NetworkSettings(DnacBase):
                 self.status = "failed"
                 return self
 
-        self.log("Reserved pool exists: {0}".format(reserve_pool.get("exists")), "DEBUG")
-        self.log("Reserved pool: {0}".format(reserve_pool.get("details")), "DEBUG")
+        self.log("Reserved pool exists: {0}", "DEBUG", reserve_pool.get("exists"))
+        self.log("Reserved pool: {0}", "DEBUG", reserve_pool.get("details"))
 
         # If reserve pool exist, convert ipv6AddressSpace to the required format (boolean)
         if reserve_pool.get("exists"):
@@ -1208,7 +1205,7 @@ class NetworkSettings(DnacBase):
             else:
                 reserve_pool_details.update({"ipv6AddressSpace": True})
 
-        self.log("Reserved pool details: {0}".format(reserve_pool), "DEBUG")
+        self.log("Reserved pool details: {0}", "DEBUG", reserve_pool)
         self.have.update({"reservePool": reserve_pool})
         self.msg = "Collecting the reserve pool details from the Cisco DNA Center"
         self.status = "success"
@@ -1240,7 +1237,7 @@ class NetworkSettings(DnacBase):
 
         network["site_id"] = site_id
         network["net_details"] = self.get_network_params(site_id)
-        self.log("Network details from the Catalyst Center: {0}".format(network), "DEBUG")
+        self.log("Network details from the Catalyst Center: {0}", "DEBUG", network)
         self.have.update({"network": network})
         self.msg = "Collecting the network details from the Cisco DNA Center"
         self.status = "success"
@@ -1268,7 +1265,7 @@ class NetworkSettings(DnacBase):
         if config.get("network_management_details") is not None:
             self.get_have_network(config).check_return_status()
 
-        self.log("Current State (have): {0}".format(self.have), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
         self.msg = "Successfully retrieved the details from the Cisco DNA Center"
         self.status = "success"
         return self
@@ -1338,7 +1335,7 @@ class NetworkSettings(DnacBase):
                 if want_ippool.get(key) is None and have_ippool.get(key) is not None:
                     want_ippool[key] = have_ippool[key]
 
-        self.log("Global pool playbook details: {0}".format(want_global), "DEBUG")
+        self.log("Global pool playbook details: {0}", "DEBUG", want_global)
         self.want.update({"wantGlobal": want_global})
         self.msg = "Collecting the global pool details from the playbook"
         self.status = "success"
@@ -1402,7 +1399,7 @@ class NetworkSettings(DnacBase):
                 self.status = "failed"
                 return self
 
-        self.log("Reserved IP pool playbook details: {0}".format(want_reserve), "DEBUG")
+        self.log("Reserved IP pool playbook details: {0}", "DEBUG", want_reserve)
 
         # If there are no existing Reserved Pool details, validate and set defaults
         if not self.have.get("reservePool").get("details"):
@@ -1456,7 +1453,7 @@ class NetworkSettings(DnacBase):
                     del want_reserve[key]
 
         self.want.update({"wantReserve": want_reserve})
-        self.log("Desired State (want): {0}".format(self.want), "INFO")
+        self.log("Desired State (want): {0}", "INFO", self.want)
         self.msg = "Collecting the reserve pool details from the playbook"
         self.status = "success"
         return self
@@ -1490,7 +1487,7 @@ class NetworkSettings(DnacBase):
             }
         }
         want_network_settings = want_network.get("settings")
-        self.log("Current state (have): {0}".format(self.have), "DEBUG")
+        self.log("Current state (have): {0}", "DEBUG", self.have)
         if network_management_details.get("dhcp_server") is not None:
             want_network_settings.update({
                 "dhcpServer": network_management_details.get("dhcp_server")
@@ -1693,7 +1690,7 @@ class NetworkSettings(DnacBase):
         else:
             del want_network_settings["clientAndEndpoint_aaa"]
 
-        self.log("Network playbook details: {0}".format(want_network), "DEBUG")
+        self.log("Network playbook details: {0}", "DEBUG", want_network)
         self.want.update({"wantNetwork": want_network})
         self.msg = "Collecting the network details from the playbook"
         self.status = "success"
@@ -1723,7 +1720,7 @@ class NetworkSettings(DnacBase):
                                                .get("settings")
             self.get_want_network(network_management_details).check_return_status()
 
-        self.log("Desired State (want): {0}".format(self.want), "INFO")
+        self.log("Desired State (want): {0}", "INFO", self.want)
         self.msg = "Successfully retrieved details from the playbook"
         self.status = "success"
         return self
@@ -1747,7 +1744,7 @@ class NetworkSettings(DnacBase):
         # Check pool exist, if not create and return
         if not self.have.get("globalPool").get("exists"):
             pool_params = self.want.get("wantGlobal")
-            self.log("Desired State for global pool (want): {0}".format(pool_params), "DEBUG")
+            self.log("Desired State for global pool (want): {0}", "DEBUG", pool_params)
             response = self.dnac._exec(
                 family="network_settings",
                 function="create_global_pool",
@@ -1755,7 +1752,7 @@ class NetworkSettings(DnacBase):
                 params=pool_params,
             )
             self.check_execution_response_status(response).check_return_status()
-            self.log("Successfully created global pool '{0}'.".format(name), "INFO")
+            self.log("Successfully created global pool '{0}'.", "INFO", name)
             result_global_pool.get("response").get(name) \
                 .update({"globalPool Details": self.want.get("wantGlobal")})
             result_global_pool.get("msg").update({name: "Global Pool Created Successfully"})
@@ -1764,7 +1761,7 @@ class NetworkSettings(DnacBase):
         # Pool exists, check update is required
         if not self.requires_update(self.have.get("globalPool").get("details"),
                                     self.want.get("wantGlobal"), self.global_pool_obj_params):
-            self.log("Global pool '{0}' doesn't require an update".format(name), "INFO")
+            self.log("Global pool '{0}' doesn't require an update", "INFO", name)
             result_global_pool.get("response").get(name).update({
                 "Cisco DNA Center params":
                 self.have.get("globalPool").get("details").get("settings").get("ippool")[0]
@@ -1782,7 +1779,7 @@ class NetworkSettings(DnacBase):
         pool_params = copy.deepcopy(self.want.get("wantGlobal"))
         pool_params_ippool = pool_params.get("settings").get("ippool")[0]
         pool_params_ippool.update({"id": self.have.get("globalPool").get("id")})
-        self.log("Desired State for global pool (want): {0}".format(pool_params), "DEBUG")
+        self.log("Desired State for global pool (want): {0}", "DEBUG", pool_params)
         keys_to_remove = ["IpAddressSpace", "ipPoolCidr", "type"]
         for key in keys_to_remove:
             del pool_params["settings"]["ippool"][0][key]
@@ -1793,7 +1790,7 @@ class NetworkSettings(DnacBase):
             if pool_params_ippool.get(key) is None:
                 pool_params_ippool[key] = have_ippool.get(key)
 
-        self.log("Desired global pool details (want): {0}".format(pool_params), "DEBUG")
+        self.log("Desired global pool details (want): {0}", "DEBUG", pool_params)
         response = self.dnac._exec(
             family="network_settings",
             function="update_global_pool",
@@ -1802,7 +1799,7 @@ class NetworkSettings(DnacBase):
         )
 
         self.check_execution_response_status(response).check_return_status()
-        self.log("Global pool '{0}' updated successfully".format(name), "INFO")
+        self.log("Global pool '{0}' updated successfully", "INFO", name)
         result_global_pool.get("response").get(name) \
             .update({"Id": self.have.get("globalPool").get("details").get("id")})
         result_global_pool.get("msg").update({name: "Global Pool Updated Successfully"})
@@ -1824,20 +1821,17 @@ class NetworkSettings(DnacBase):
         name = config.get("reserve_pool_details").get("name")
         result_reserve_pool = self.result.get("response")[1].get("reservePool")
         result_reserve_pool.get("response").update({name: {}})
-        self.log("Current reserved pool details in Catalyst Center: {0}"
-                 .format(self.have.get("reservePool").get("details")), "DEBUG")
-        self.log("Desired reserved pool details in Catalyst Center: {0}"
-                 .format(self.want.get("wantReserve")), "DEBUG")
+        self.log("Current reserved pool details in Catalyst Center: {0}", "DEBUG", self.have.get("reservePool").get("details"))
+        self.log("Desired reserved pool details in Catalyst Center: {0}", "DEBUG", self.want.get("wantReserve"))
 
         # Check pool exist, if not create and return
-        self.log("IPv4 global pool: {0}"
-                 .format(self.want.get("wantReserve").get("ipv4GlobalPool")), "DEBUG")
+        self.log("IPv4 global pool: {0}", "DEBUG", self.want.get("wantReserve").get("ipv4GlobalPool"))
         site_name = config.get("reserve_pool_details").get("site_name")
         reserve_params = self.want.get("wantReserve")
         site_id = self.get_site_id(site_name)
         reserve_params.update({"site_id": site_id})
         if not self.have.get("reservePool").get("exists"):
-            self.log("Desired reserved pool details (want): {0}".format(reserve_params), "DEBUG")
+            self.log("Desired reserved pool details (want): {0}", "DEBUG", reserve_params)
             response = self.dnac._exec(
                 family="network_settings",
                 function="reserve_ip_subpool",
@@ -1845,7 +1839,7 @@ class NetworkSettings(DnacBase):
                 params=reserve_params,
             )
             self.check_execution_response_status(response).check_return_status()
-            self.log("Successfully created IP subpool reservation '{0}'.".format(name), "INFO")
+            self.log("Successfully created IP subpool reservation '{0}'.", "INFO", name)
             result_reserve_pool.get("response").get(name) \
                 .update({"reservePool Details": self.want.get("wantReserve")})
             result_reserve_pool.get("msg") \
@@ -1855,7 +1849,7 @@ class NetworkSettings(DnacBase):
         # Check update is required
         if not self.requires_update(self.have.get("reservePool").get("details"),
                                     self.want.get("wantReserve"), self.reserve_pool_obj_params):
-            self.log("Reserved ip subpool '{0}' doesn't require an update".format(name), "INFO")
+            self.log("Reserved ip subpool '{0}' doesn't require an update", "INFO", name)
             result_reserve_pool.get("response").get(name) \
                 .update({"Cisco DNA Center params": self.have.get("reservePool").get("details")})
             result_reserve_pool.get("response").get(name) \
@@ -1864,12 +1858,10 @@ class NetworkSettings(DnacBase):
                 .update({name: "Reserve ip subpool doesn't require an update"})
             return
 
-        self.log("Reserved ip pool '{0}' requires an update".format(name), "DEBUG")
+        self.log("Reserved ip pool '{0}' requires an update", "DEBUG", name)
         # Pool Exists
-        self.log("Current reserved ip pool '{0}' details in Catalyst Center: {1}"
-                 .format(name, self.have.get("reservePool")), "DEBUG")
-        self.log("Desired reserved ip pool '{0}' details: {1}"
-                 .format(name, self.want.get("wantReserve")), "DEBUG")
+        self.log("Current reserved ip pool '{0}' details in Catalyst Center: {1}", "DEBUG", name, self.have.get("reservePool"))
+        self.log("Desired reserved ip pool '{0}' details: {1}", "DEBUG", name, self.want.get("wantReserve"))
         reserve_params.update({"id": self.have.get("reservePool").get("id")})
         response = self.dnac._exec(
             family="network_settings",
@@ -1878,7 +1870,7 @@ class NetworkSettings(DnacBase):
             params=reserve_params,
         )
         self.check_execution_response_status(response).check_return_status()
-        self.log("Reserved ip subpool '{0}' updated successfully.".format(name), "INFO")
+        self.log("Reserved ip subpool '{0}' updated successfully.", "INFO", name)
         result_reserve_pool['msg'] = "Reserved Ip Subpool Updated Successfully"
         result_reserve_pool.get("response").get(name) \
             .update({"Reservation details": self.have.get("reservePool").get("details")})
@@ -1904,7 +1896,7 @@ class NetworkSettings(DnacBase):
         if not self.requires_update(self.have.get("network").get("net_details"),
                                     self.want.get("wantNetwork"), self.network_obj_params):
 
-            self.log("Network in site '{0}' doesn't require an update.".format(site_name), "INFO")
+            self.log("Network in site '{0}' doesn't require an update.", "INFO", site_name)
             result_network.get("response").get(site_name).update({
                 "Cisco DNA Center params": self.have.get("network")
                 .get("net_details").get("settings")
@@ -1912,10 +1904,9 @@ class NetworkSettings(DnacBase):
             result_network.get("msg").update({site_name: "Network doesn't require an update"})
             return
 
-        self.log("Network in site '{0}' requires update.".format(site_name), "INFO")
-        self.log("Current State of network in Catalyst Center: {0}"
-                 .format(self.have.get("network")), "DEBUG")
-        self.log("Desired State of network: {0}".format(self.want.get("wantNetwork")), "DEBUG")
+        self.log("Network in site '{0}' requires update.", "INFO", site_name)
+        self.log("Current State of network in Catalyst Center: {0}", "DEBUG", self.have.get("network"))
+        self.log("Desired State of network: {0}", "DEBUG", self.want.get("wantNetwork"))
 
         net_params = copy.deepcopy(self.want.get("wantNetwork"))
         net_params.update({"site_id": self.have.get("network").get("site_id")})
@@ -1925,7 +1916,7 @@ class NetworkSettings(DnacBase):
             op_modifies=True,
             params=net_params,
         )
-        self.log("Received API response of 'update_network_v2': {0}".format(response), "DEBUG")
+        self.log("Received API response of 'update_network_v2': {0}", "DEBUG", response)
         validation_string = "desired common settings operation successful"
         self.check_task_response_status(response, validation_string).check_return_status()
         self.log("Network has been changed successfully", "INFO")
@@ -1979,10 +1970,9 @@ class NetworkSettings(DnacBase):
             self.status = "success"
             return self
 
-        self.log("Reserved IP pool scheduled for deletion: {0}"
-                 .format(self.have.get("reservePool").get("name")), "INFO")
+        self.log("Reserved IP pool scheduled for deletion: {0}", "INFO", self.have.get("reservePool").get("name"))
         _id = self.have.get("reservePool").get("id")
-        self.log("Reserved pool {0} id: {1}".format(name, _id), "DEBUG")
+        self.log("Reserved pool {0} id: {1}", "DEBUG", name, _id)
         response = self.dnac._exec(
             family="network_settings",
             function="release_reserve_ip_subpool",
@@ -2076,36 +2066,31 @@ class NetworkSettings(DnacBase):
         """
 
         self.get_have(config)
-        self.log("Current State (have): {0}".format(self.have), "INFO")
-        self.log("Requested State (want): {0}".format(self.want), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
+        self.log("Requested State (want): {0}", "INFO", self.want)
         if config.get("global_pool_details") is not None:
-            self.log("Desired State of global pool (want): {0}"
-                     .format(self.want.get("wantGlobal")), "DEBUG")
-            self.log("Current State of global pool (have): {0}"
-                     .format(self.have.get("globalPool").get("details")), "DEBUG")
+            self.log("Desired State of global pool (want): {0}", "DEBUG", self.want.get("wantGlobal"))
+            self.log("Current State of global pool (have): {0}", "DEBUG", self.have.get("globalPool").get("details"))
             if self.requires_update(self.have.get("globalPool").get("details"),
                                     self.want.get("wantGlobal"), self.global_pool_obj_params):
                 self.msg = "Global Pool Config is not applied to the DNAC"
                 self.status = "failed"
                 return self
 
-            self.log("Successfully validated global pool '{0}'.".format(self.want
-                     .get("wantGlobal").get("settings").get("ippool")[0].get("ipPoolName")), "INFO")
+            self.log("Successfully validated global pool '{0}'.", "INFO", self.want
+                     .get("wantGlobal").get("settings").get("ippool")[0].get("ipPoolName"))
             self.result.get("response")[0].get("globalPool").update({"Validation": "Success"})
 
         if config.get("reserve_pool_details") is not None:
             if self.requires_update(self.have.get("reservePool").get("details"),
                                     self.want.get("wantReserve"), self.reserve_pool_obj_params):
-                self.log("Desired State for reserve pool (want): {0}"
-                         .format(self.want.get("wantReserve")), "DEBUG")
-                self.log("Current State for reserve pool (have): {0}"
-                         .format(self.have.get("reservePool").get("details")), "DEBUG")
+                self.log("Desired State for reserve pool (want): {0}", "DEBUG", self.want.get("wantReserve"))
+                self.log("Current State for reserve pool (have): {0}", "DEBUG", self.have.get("reservePool").get("details"))
                 self.msg = "Reserved Pool Config is not applied to the DNAC"
                 self.status = "failed"
                 return self
 
-            self.log("Successfully validated the reserved pool '{0}'."
-                     .format(self.want.get("wantReserve").get("name")), "INFO")
+            self.log("Successfully validated the reserved pool '{0}'.", "INFO", self.want.get("wantReserve").get("name"))
             self.result.get("response")[1].get("reservePool").update({"Validation": "Success"})
 
         if config.get("network_management_details") is not None:
@@ -2115,8 +2100,7 @@ class NetworkSettings(DnacBase):
                 self.status = "failed"
                 return self
 
-            self.log("Successfully validated the network functions '{0}'."
-                     .format(config.get("network_management_details").get("site_name")), "INFO")
+            self.log("Successfully validated the network functions '{0}'.", "INFO", config.get("network_management_details").get("site_name"))
             self.result.get("response")[2].get("network").update({"Validation": "Success"})
 
         self.msg = "Successfully validated the Global Pool, Reserve Pool \
@@ -2138,8 +2122,8 @@ class NetworkSettings(DnacBase):
         """
 
         self.get_have(config)
-        self.log("Current State (have): {0}".format(self.have), "INFO")
-        self.log("Desired State (want): {0}".format(self.want), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
+        self.log("Desired State (want): {0}", "INFO", self.want)
         if config.get("global_pool_details") is not None:
             global_pool_exists = self.have.get("globalPool").get("exists")
             if global_pool_exists:
@@ -2147,9 +2131,8 @@ class NetworkSettings(DnacBase):
                 self.status = "failed"
                 return self
 
-            self.log("Successfully validated absence of Global Pool '{0}'."
-                     .format(config.get("global_pool_details")
-                             .get("settings").get("ip_pool")[0].get("name")), "INFO")
+            self.log("Successfully validated absence of Global Pool '{0}'.", "INFO",
+                     config.get("global_pool_details").get("settings").get("ip_pool")[0].get("name"))
             self.result.get("response")[0].get("globalPool").update({"Validation": "Success"})
 
         if config.get("reserve_pool_details") is not None:
@@ -2159,8 +2142,7 @@ class NetworkSettings(DnacBase):
                 self.status = "failed"
                 return self
 
-            self.log("Successfully validated the absence of Reserve Pool '{0}'."
-                     .format(config.get("reserve_pool_details").get("name")), "INFO")
+            self.log("Successfully validated the absence of Reserve Pool '{0}'.", "INFO", config.get("reserve_pool_details").get("name"))
             self.result.get("response")[1].get("reservePool").update({"Validation": "Success"})
 
         self.msg = "Successfully validated the absence of Global Pool/Reserve Pool"
@@ -2199,9 +2181,24 @@ def main():
         "dnac_log_level": {"type": 'str', "default": 'WARNING'},
         "dnac_log_file_path": {"type": 'str', "default": 'dnac.log'},
         "dnac_log_append": {"type": 'bool', "default": True},
+        "dnac_log_max_bytes": {"type": 'int', "default": 0},
+        "dnac_log_backup_count": {"type": 'int', "default": 5},
+        "dnac_log_compress": {"type": 'bool', "default": False},
+        "dnac_log_format": {"type": 'str', "default": 'text', "choices": ['text', 'json']},
         "config_verify": {"type": 'bool', "default": False},
         "dnac_api_task_timeout": {"type": 'int', "default": 1200},
         "dnac_task_poll_interval": {"type": 'int', "default": 2},
+        "dnac_token_cache": {"type": "bool", "default": False},
+        "dnac_rate_limit": {"type": "float", "default": 0},
+        "dnac_rate_limit_per_family": {"type": "bool", "default": False},
+        "dnac_rate_limit_retries": {"type": "int", "default": 5},
+        "dnac_shared_rate_limit": {"type": "float", "default": 0},
+        "dnac_shared_family_concurrency": {"type": "int", "default": 0},
+        "dnac_memoize_reads": {"type": "bool", "default": False},
+        "dnac_metrics": {"type": "bool", "default": False},
+        "dnac_metrics_file": {"type": "str"},
+        "dnac_timings": {"type": "bool", "default": False},
+        "dnac_timings_file": {"type": "str"},
         "config": {"type": 'list', "required": True, "elements": 'dict'},
         "state": {"default": 'merged', "choices": ['merged', 'deleted']},
         "validate_response_schema": {"type": 'bool', "default": True},
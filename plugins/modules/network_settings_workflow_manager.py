@@ -29,6 +29,14 @@ options:
     description: Set to True to verify the Cisco Catalyst Center after applying the playbook config.
     type: bool
     default: False
+  dnac_fingerprint_store:
+    description:
+    - Path of a SQLite file recording the config items applied by the module, created when missing.
+    - A config item of the C(merged) state is skipped, without reading its current state, when it is the same as the
+      last time it was applied and the objects it manages did not change in Cisco Catalyst Center since then.
+    - The objects are checked with a single bulk query per kind of objects, e.g. all the global pools.
+    - The config items with C(network_management_details) are never skipped.
+    type: str
   state:
     description: The state of Cisco Catalyst Center after module completion.
     type: str
@@ -796,7 +804,7 @@ class NetworkSettings(DnacBase):
             return self
 
         self.validated_config = valid_temp
-        self.log("Successfully validated playbook config params: {0}".format(valid_temp), "INFO")
+        self.log("Successfully validated playbook config params: {0}", "INFO", valid_temp)
         self.msg = "Successfully validated input from the playbook"
         self.status = "success"
         return self
@@ -827,8 +835,8 @@ class NetworkSettings(DnacBase):
 
         current_obj = have
         requested_obj = want
-        self.log("Current State (have): {0}".format(current_obj), "DEBUG")
-        self.log("Desired State (want): {0}".format(requested_obj), "DEBUG")
+        self.log("Current State (have): {0}", "DEBUG", current_obj)
+        self.log("Desired State (want): {0}", "DEBUG", requested_obj)
 
         return any(not dnac_compare_equality(current_obj.get(dnac_param),
                                              requested_obj.get(ansible_param))
@@ -877,7 +885,7 @@ class NetworkSettings(DnacBase):
                 raise ValueError("Received an unexpected value for 'get_object': {0}"
                                  .format(get_object))
         except Exception as msg:
-            self.log("Received exception: {0}".format(msg), "CRITICAL")
+            self.log("Received exception: {0}", "CRITICAL", msg)
 
         return obj_params
 
@@ -900,17 +908,15 @@ class NetworkSettings(DnacBase):
                 op_modifies=True,
                 params={"name": site_name},
             )
-            self.log("Received API response from 'get_site': {0}".format(response), "DEBUG")
+            self.log("Received API response from 'get_site': {0}", "DEBUG", response)
             if not response:
-                self.log("Failed to retrieve the site ID for the site name: {0}"
-                         .format(site_name), "ERROR")
+                self.log("Failed to retrieve the site ID for the site name: {0}", "ERROR", site_name)
                 return None
 
             _id = response.get("response")[0].get("id")
-            self.log("Site ID for site name '{0}': {1}".format(site_name, _id), "DEBUG")
+            self.log("Site ID for site name '{0}': {1}", "DEBUG", site_name, _id)
         except Exception as msg:
-            self.log("Exception occurred while retrieving site_id from the site_name: {0}"
-                     .format(msg), "CRITICAL")
+            self.log("Exception occurred while retrieving site_id from the site_name: {0}", "CRITICAL", msg)
             return None
 
         return _id
@@ -931,7 +937,7 @@ class NetworkSettings(DnacBase):
             self.log("Global Pool is empty", "INFO")
             return None
 
-        self.log("Global Pool Details: {0}".format(pool_info), "DEBUG")
+        self.log("Global Pool Details: {0}", "DEBUG", pool_info)
         global_pool = {
             "dhcpServerIps": pool_info.get("dhcpServerIps"),
             "dnsServerIps": pool_info.get("dnsServerIps"),
@@ -939,14 +945,14 @@ class NetworkSettings(DnacBase):
             "ipPoolName": pool_info.get("ipPoolName"),
             "type": pool_info.get("ipPoolType").capitalize()
         }
-        self.log("Formated global pool details: {0}".format(global_pool), "DEBUG")
+        self.log("Formated global pool details: {0}", "DEBUG", global_pool)
         # global_ippool = global_pool.get("settings").get("ippool")[0]
         if pool_info.get("ipv6") is False:
             global_pool.update({"IpAddressSpace": "IPv4"})
         else:
             global_pool.update({"IpAddressSpace": "IPv6"})
 
-        self.log("ip_address_space: {0}".format(global_pool.get("IpAddressSpace")), "DEBUG")
+        self.log("ip_address_space: {0}", "DEBUG", global_pool.get("IpAddressSpace"))
         if not pool_info["gateways"]:
             global_pool.update({"gateway": ""})
         else:
@@ -1026,7 +1032,7 @@ class NetworkSettings(DnacBase):
             else:
                 reserve_pool.update({"slaacSupport": True})
 
-        self.log("Formatted reserve pool details: {0}".format(reserve_pool), "DEBUG")
+        self.log("Formatted reserve pool details: {0}", "DEBUG", reserve_pool)
         return reserve_pool
 
     def get_network_params(self, site_id):
@@ -1049,7 +1055,7 @@ class NetworkSettings(DnacBase):
             op_modifies=True,
             params={"site_id": site_id}
         )
-        self.log("Received API response from 'get_network_v2': {0}".format(response), "DEBUG")
+        self.log("Received API response from 'get_network_v2': {0}", "DEBUG", response)
         if not isinstance(response, dict):
             self.log("Failed to retrieve the network details - "
                      "Response is not a dictionary", "ERROR")
@@ -1192,7 +1198,7 @@ class NetworkSettings(DnacBase):
         if not network_settings_syslog.get("ipAddresses"):
             network_settings_syslog.update({"ipAddresses": []})
 
-        self.log("Formatted playbook network details: {0}".format(network_details), "DEBUG")
+        self.log("Formatted playbook network details: {0}", "DEBUG", network_details)
         return network_details
 
     def get_reserved_ip_subpool(self, site_id):
@@ -1228,8 +1234,7 @@ class NetworkSettings(DnacBase):
 
             reserve_pool_details = response.get("response")
             if not reserve_pool_details:
-                self.log("No subpools are reserved in the site with ID - '{0}'."
-                         .format(site_id), "DEBUG")
+                self.log("No subpools are reserved in the site with ID - '{0}'.", "DEBUG", site_id)
                 return self
 
             self.all_reserved_pool_details.get(site_id).extend(reserve_pool_details)
@@ -1279,12 +1284,12 @@ class NetworkSettings(DnacBase):
 
             all_global_pool_details = response.get("response")
             if not all_global_pool_details:
-                self.log("Global pool '{0}' does not exist".format(name), "INFO")
+                self.log("Global pool '{0}' does not exist", "INFO", name)
                 return global_pool
 
             global_pool_details = get_dict_result(all_global_pool_details, "ipPoolName", name)
             if global_pool_details:
-                self.log("Global pool found with name '{0}': {1}".format(name, global_pool_details), "INFO")
+                self.log("Global pool found with name '{0}': {1}", "INFO", name, global_pool_details)
                 global_pool.update({"exists": True})
                 global_pool.update({"id": global_pool_details.get("id")})
                 global_pool["details"] = self.get_global_pool_params(global_pool_details)
@@ -1292,7 +1297,7 @@ class NetworkSettings(DnacBase):
 
             value += 25
 
-        self.log("Formatted global pool details: {0}".format(global_pool), "DEBUG")
+        self.log("Formatted global pool details: {0}", "DEBUG", global_pool)
         return global_pool
 
     def reserve_pool_exists(self, name, site_name):
@@ -1318,7 +1323,7 @@ class NetworkSettings(DnacBase):
             "success": True
         }
         site_id = self.get_site_id(site_name)
-        self.log("Site ID for the site name {0}: {1}".format(site_name, site_id), "DEBUG")
+        self.log("Site ID for the site name {0}: {1}", "DEBUG", site_name, site_id)
         if not site_id:
             reserve_pool.update({"success": False})
             self.msg = "Failed to get the site id from the site name {0}".format(site_name)
@@ -1329,20 +1334,18 @@ class NetworkSettings(DnacBase):
             self.get_reserved_ip_subpool(site_id)
 
         if not self.all_reserved_pool_details.get(site_id):
-            self.log("Reserved pool {0} does not exist in the site {1}"
-                     .format(name, site_name), "DEBUG")
+            self.log("Reserved pool {0} does not exist in the site {1}", "DEBUG", name, site_name)
             return reserve_pool
 
         reserve_pool_details = get_dict_result(self.all_reserved_pool_details.get(site_id), "groupName", name)
         if reserve_pool_details:
-            self.log("Reserve pool found with name '{0}' in the site '{1}': {2}"
-                     .format(name, site_name, reserve_pool_details), "INFO")
+            self.log("Reserve pool found with name '{0}' in the site '{1}': {2}", "INFO", name, site_name, reserve_pool_details)
             reserve_pool.update({"exists": True})
             reserve_pool.update({"id": reserve_pool_details.get("id")})
             reserve_pool.update({"details": self.get_reserve_pool_params(reserve_pool_details)})
 
-        self.log("Reserved pool details: {0}".format(reserve_pool.get("details")), "DEBUG")
-        self.log("Reserved pool id: {0}".format(reserve_pool.get("id")), "DEBUG")
+        self.log("Reserved pool details: {0}", "DEBUG", reserve_pool.get("details"))
+        self.log("Reserved pool id: {0}", "DEBUG", reserve_pool.get("id"))
         return reserve_pool
 
     def get_have_global_pool(self, global_pool_details):
@@ -1399,7 +1402,7 @@ class NetworkSettings(DnacBase):
             # If the Global Pool doesn't exist and a previous name is provided
             # Else try using the previous name
             global_pool.append(self.global_pool_exists(name))
-            self.log("Global pool details of '{0}': {1}".format(name, global_pool[global_pool_index]), "DEBUG")
+            self.log("Global pool details of '{0}': {1}", "DEBUG", name, global_pool[global_pool_index])
             prev_name = pool_details.get("prev_name")
             if global_pool[global_pool_index].get("exists") is False and \
                     prev_name is not None:
@@ -1413,7 +1416,7 @@ class NetworkSettings(DnacBase):
                 global_pool[global_pool_index].update({"prev_name": name})
             global_pool_index += 1
 
-        self.log("Global pool details: {0}".format(global_pool), "DEBUG")
+        self.log("Global pool details: {0}", "DEBUG", global_pool)
         self.have.update({"globalPool": global_pool})
         self.msg = "Collecting the global pool details from the Cisco Catalyst Center"
         self.status = "success"
@@ -1459,7 +1462,7 @@ class NetworkSettings(DnacBase):
                 return self
 
             site_name = item.get("site_name")
-            self.log("Site Name: {0}".format(site_name), "DEBUG")
+            self.log("Site Name: {0}", "DEBUG", site_name)
             if site_name is None:
                 self.msg = "Missing parameter 'site_name' in reserve_pool_details"
                 self.status = "failed"
@@ -1470,7 +1473,7 @@ class NetworkSettings(DnacBase):
             reserve_pool.append(self.reserve_pool_exists(name, site_name))
             if not reserve_pool[reserve_pool_index].get("success"):
                 return self.check_return_status()
-            self.log("Reserved pool details for '{0}': {1}".format(name, reserve_pool[reserve_pool_index]), "DEBUG")
+            self.log("Reserved pool details for '{0}': {1}", "DEBUG", name, reserve_pool[reserve_pool_index])
 
             # If the Reserved Pool doesn't exist and a previous name is provided
             # Else try using the previous name
@@ -1488,8 +1491,8 @@ class NetworkSettings(DnacBase):
                     self.status = "failed"
                     return self
 
-            self.log("Reserved pool exists: {0}".format(reserve_pool[reserve_pool_index].get("exists")), "DEBUG")
-            self.log("Reserved pool: {0}".format(reserve_pool[reserve_pool_index].get("details")), "DEBUG")
+            self.log("Reserved pool exists: {0}", "DEBUG", reserve_pool[reserve_pool_index].get("exists"))
+            self.log("Reserved pool: {0}", "DEBUG", reserve_pool[reserve_pool_index].get("details"))
 
             # If reserve pool exist, convert ipv6AddressSpace to the required format (boolean)
             if reserve_pool[reserve_pool_index].get("exists"):
@@ -1501,7 +1504,7 @@ class NetworkSettings(DnacBase):
 
             reserve_pool_index += 1
 
-        self.log("Reserved pool details: {0}".format(reserve_pool), "DEBUG")
+        self.log("Reserved pool details: {0}", "DEBUG", reserve_pool)
         self.have.update({"reservePool": reserve_pool})
         self.msg = "Collected the reserve pool details from the Cisco Catalyst Center"
         self.status = "success"
@@ -1534,7 +1537,7 @@ class NetworkSettings(DnacBase):
 
             network["site_id"] = site_id
             network["net_details"] = self.get_network_params(site_id)
-            self.log("Network details from the Catalyst Center for site '{0}': {1}".format(site_name, network), "DEBUG")
+            self.log("Network details from the Catalyst Center for site '{0}': {1}", "DEBUG", site_name, network)
             all_network_management_details.append(network)
 
         self.have.update({"network": all_network_management_details})
@@ -1567,7 +1570,7 @@ class NetworkSettings(DnacBase):
         if network_details is not None:
             self.get_have_network(network_details).check_return_status()
 
-        self.log("Current State (have): {0}".format(self.have), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
         self.msg = "Successfully retrieved the details from the Cisco Catalyst Center"
         self.status = "success"
         return self
@@ -1592,34 +1595,22 @@ class NetworkSettings(DnacBase):
             self.status = "failed"
             return self.check_return_status()
 
-        value = 1
-        while True:
-            response = self.dnac._exec(
-                family="network_settings",
-                function="get_global_pool",
-                params={"offset": value}
-            )
-            value += 25
-            if not isinstance(response, dict):
-                self.msg = "Failed to retrieve the global pool details - Response is not a dictionary"
-                self.log(self.msg, "CRITICAL")
-                self.status = "failed"
-                return self.check_return_status()
-
-            all_global_pool_details = response.get("response")
-            if not all_global_pool_details:
-                self.log("Invalid global_pool_name '{0}' under reserve_pool_details".format(global_pool_name), "ERROR")
-                self.msg = "No information found for the global pool named '{0}'".format(global_pool_name)
-                self.status = "failed"
-                return self.check_return_status()
+        # Stop requesting pages as soon as the global pool is found
+        global_pool_details = next((
+            global_pool for global_pool in self.paginate(
+                family="network_settings", function="get_global_pool", page_size=25
+            ) if global_pool.get("ipPoolName") == global_pool_name
+        ), None)
+        if not global_pool_details:
+            self.log("Invalid global_pool_name '{0}' under reserve_pool_details", "ERROR", global_pool_name)
+            self.msg = "No information found for the global pool named '{0}'".format(global_pool_name)
+            self.status = "failed"
+            return self.check_return_status()
 
-            global_pool_details = get_dict_result(all_global_pool_details, "ipPoolName", global_pool_name)
-            if global_pool_details:
-                global_pool_cidr = global_pool_details.get("ipPoolCidr")
-                self.log("Global pool found with name '{0}': {1}".format(global_pool_name, global_pool_details), "INFO")
-                break
+        global_pool_cidr = global_pool_details.get("ipPoolCidr")
+        self.log("Global pool found with name '{0}': {1}", "INFO", global_pool_name, global_pool_details)
 
-        self.log("Global Pool '{0}' cidr: {1}".format(global_pool_name, global_pool_cidr), "INFO")
+        self.log("Global Pool '{0}' cidr: {1}", "INFO", global_pool_name, global_pool_cidr)
         return global_pool_cidr
 
     def get_want_global_pool(self, global_ippool):
@@ -1696,7 +1687,7 @@ class NetworkSettings(DnacBase):
             want_ippool.append(pool_values)
             global_pool_index += 1
 
-        self.log("Global pool playbook details: {0}".format(want_global), "DEBUG")
+        self.log("Global pool playbook details: {0}", "DEBUG", want_global)
         self.want.update({"wantGlobal": want_global})
         self.msg = "Collecting the global pool details from the playbook"
         self.status = "success"
@@ -1769,7 +1760,7 @@ class NetworkSettings(DnacBase):
                     self.status = "failed"
                     return self
 
-            self.log("Reserved IP pool playbook details: {0}".format(pool_values), "DEBUG")
+            self.log("Reserved IP pool playbook details: {0}", "DEBUG", pool_values)
 
             # If there are no existing Reserved Pool details, validate and set defaults
             if not self.have.get("reservePool")[reserve_pool_index].get("details"):
@@ -1825,7 +1816,7 @@ class NetworkSettings(DnacBase):
             reserve_pool_index += 1
 
         self.want.update({"wantReserve": want_reserve})
-        self.log("Reserved Pool details: {0}".format(want_reserve), "INFO")
+        self.log("Reserved Pool details: {0}", "INFO", want_reserve)
         self.msg = "Collected the reserved pool details from the playbook"
         self.status = "success"
         return self
@@ -1862,7 +1853,7 @@ class NetworkSettings(DnacBase):
                 }
             }
             want_network_settings = want_network.get("settings")
-            self.log("Current state (have): {0}".format(self.have), "DEBUG")
+            self.log("Current state (have): {0}", "DEBUG", self.have)
             if item.get("dhcp_server") is not None:
                 want_network_settings.update({
                     "dhcpServer": item.get("dhcp_server")
@@ -2132,7 +2123,7 @@ class NetworkSettings(DnacBase):
             all_network_management_details.append(want_network)
             network_management_index += 1
 
-        self.log("Network playbook details: {0}".format(all_network_management_details), "DEBUG")
+        self.log("Network playbook details: {0}", "DEBUG", all_network_management_details)
         self.want.update({"wantNetwork": all_network_management_details})
         self.msg = "Collected the network details from the playbook"
         self.status = "success"
@@ -2161,7 +2152,7 @@ class NetworkSettings(DnacBase):
             network_management_details = config.get("network_management_details")
             self.get_want_network(network_management_details).check_return_status()
 
-        self.log("Desired State (want): {0}".format(self.want), "INFO")
+        self.log("Desired State (want): {0}", "INFO", self.want)
         self.msg = "Successfully retrieved details from the playbook"
         self.status = "success"
         return self
@@ -2182,7 +2173,7 @@ class NetworkSettings(DnacBase):
         global_pool_index = 0
         result_global_pool = self.result.get("response")[0].get("globalPool")
         want_global_pool = self.want.get("wantGlobal").get("settings").get("ippool")
-        self.log("Global pool playbook details: {0}".format(global_pool), "DEBUG")
+        self.log("Global pool playbook details: {0}", "DEBUG", global_pool)
         for item in self.have.get("globalPool"):
             result_global_pool.get("msg") \
                 .update({want_global_pool[global_pool_index].get("ipPoolName"): {}})
@@ -2195,7 +2186,7 @@ class NetworkSettings(DnacBase):
 
         # Check create_global_pool; if yes, create the global pool
         if create_global_pool:
-            self.log("Global pool(s) details to be created: {0}".format(create_global_pool), "INFO")
+            self.log("Global pool(s) details to be created: {0}", "INFO", create_global_pool)
             pool_params = {
                 "settings": {
                     "ippool": copy.deepcopy(create_global_pool)
@@ -2211,7 +2202,7 @@ class NetworkSettings(DnacBase):
             self.log("Successfully created global pool successfully.", "INFO")
             for item in pool_params.get("settings").get("ippool"):
                 name = item.get("ipPoolName")
-                self.log("Global pool '{0}' created successfully.".format(name), "INFO")
+                self.log("Global pool '{0}' created successfully.", "INFO", name)
                 result_global_pool.get("response").update({"created": pool_params})
                 result_global_pool.get("msg").update({name: "Global Pool Created Successfully"})
 
@@ -2223,7 +2214,7 @@ class NetworkSettings(DnacBase):
                 for pool_value in self.have.get("globalPool"):
                     if pool_value.get("exists") and (pool_value.get("details").get("ipPoolName") == name or pool_value.get("prev_name") == name):
                         if not self.requires_update(pool_value.get("details"), item, self.global_pool_obj_params):
-                            self.log("Global pool '{0}' doesn't require an update".format(name), "INFO")
+                            self.log("Global pool '{0}' doesn't require an update", "INFO", name)
                             result_global_pool.get("msg").update({name: "Global pool doesn't require an update"})
                         elif item not in final_update_global_pool:
                             final_update_global_pool.append(item)
@@ -2237,13 +2228,13 @@ class NetworkSettings(DnacBase):
                         "ippool": copy.deepcopy(final_update_global_pool)
                     }
                 }
-                self.log("Desired State for global pool (want): {0}".format(pool_params), "DEBUG")
+                self.log("Desired State for global pool (want): {0}", "DEBUG", pool_params)
                 keys_to_remove = ["IpAddressSpace", "ipPoolCidr", "type"]
                 for item in pool_params["settings"]["ippool"]:
                     for key in keys_to_remove:
                         del item[key]
 
-                self.log("Desired global pool details (want): {0}".format(pool_params), "DEBUG")
+                self.log("Desired global pool details (want): {0}", "DEBUG", pool_params)
                 response = self.dnac._exec(
                     family="network_settings",
                     function="update_global_pool",
@@ -2254,7 +2245,7 @@ class NetworkSettings(DnacBase):
                 self.check_execution_response_status(response, "update_global_pool").check_return_status()
                 for item in pool_params.get("settings").get("ippool"):
                     name = item.get("ipPoolName")
-                    self.log("Global pool '{0}' Updated successfully.".format(name), "INFO")
+                    self.log("Global pool '{0}' Updated successfully.", "INFO", name)
                     result_global_pool.get("response").update({"globalPool Details": pool_params})
                     result_global_pool.get("msg").update({name: "Global Pool Updated Successfully"})
 
@@ -2279,21 +2270,18 @@ class NetworkSettings(DnacBase):
             reserve_pool_index += 1
             name = item.get("name")
             result_reserve_pool = self.result.get("response")[1].get("reservePool")
-            self.log("Current reserved pool '{0}' details in Catalyst Center: {1}"
-                     .format(name, self.have.get("reservePool")[reserve_pool_index].get("details")), "DEBUG")
-            self.log("Desired reserved pool '{0}' details in Catalyst Center: {1}"
-                     .format(name, self.want.get("wantReserve")[reserve_pool_index]), "DEBUG")
+            self.log("Current reserved pool '{0}' details in Catalyst Center: {1}", "DEBUG",
+                     name, self.have.get("reservePool")[reserve_pool_index].get("details"))
+            self.log("Desired reserved pool '{0}' details in Catalyst Center: {1}", "DEBUG", name, self.want.get("wantReserve")[reserve_pool_index])
 
             # Check pool exist, if not create and return
-            self.log("IPv4 reserved pool '{0}': {1}"
-                     .format(name, self.want.get("wantReserve")[reserve_pool_index].get("ipv4GlobalPool")), "DEBUG")
+            self.log("IPv4 reserved pool '{0}': {1}", "DEBUG", name, self.want.get("wantReserve")[reserve_pool_index].get("ipv4GlobalPool"))
             site_name = item.get("site_name")
             reserve_params = self.want.get("wantReserve")[reserve_pool_index]
             site_id = self.get_site_id(site_name)
             reserve_params.update({"site_id": site_id})
             if not self.have.get("reservePool")[reserve_pool_index].get("exists"):
-                self.log("Desired reserved pool '{0}' details (want): {1}"
-                         .format(name, reserve_params), "DEBUG")
+                self.log("Desired reserved pool '{0}' details (want): {1}", "DEBUG", name, reserve_params)
                 response = self.dnac._exec(
                     family="network_settings",
                     function="reserve_ip_subpool",
@@ -2301,7 +2289,7 @@ class NetworkSettings(DnacBase):
                     params=reserve_params,
                 )
                 self.check_execution_response_status(response, "reserve_ip_subpool").check_return_status()
-                self.log("Successfully created IP subpool reservation '{0}'.".format(name), "INFO")
+                self.log("Successfully created IP subpool reservation '{0}'.", "INFO", name)
                 result_reserve_pool.get("response") \
                     .update({name: self.want.get("wantReserve")[reserve_pool_index]})
                 result_reserve_pool.get("msg") \
@@ -2312,18 +2300,16 @@ class NetworkSettings(DnacBase):
             if not self.requires_update(self.have.get("reservePool")[reserve_pool_index].get("details"),
                                         self.want.get("wantReserve")[reserve_pool_index],
                                         self.reserve_pool_obj_params):
-                self.log("Reserved ip subpool '{0}' doesn't require an update".format(name), "INFO")
+                self.log("Reserved ip subpool '{0}' doesn't require an update", "INFO", name)
                 result_reserve_pool.get("msg") \
                     .update({name: "Reserved ip subpool doesn't require an update"})
                 continue
 
-            self.log("Reserved ip pool '{0}' requires an update".format(name), "DEBUG")
+            self.log("Reserved ip pool '{0}' requires an update", "DEBUG", name)
 
             # Pool Exists
-            self.log("Current reserved ip pool '{0}' details in Catalyst Center: {1}"
-                     .format(name, self.have.get("reservePool")), "DEBUG")
-            self.log("Desired reserved ip pool '{0}' details: {1}"
-                     .format(name, self.want.get("wantReserve")), "DEBUG")
+            self.log("Current reserved ip pool '{0}' details in Catalyst Center: {1}", "DEBUG", name, self.have.get("reservePool"))
+            self.log("Desired reserved ip pool '{0}' details: {1}", "DEBUG", name, self.want.get("wantReserve"))
             reserve_params.update({"id": self.have.get("reservePool")[reserve_pool_index].get("id")})
             response = self.dnac._exec(
                 family="network_settings",
@@ -2332,7 +2318,7 @@ class NetworkSettings(DnacBase):
                 params=reserve_params,
             )
             self.check_execution_response_status(response, "update_reserve_ip_subpool").check_return_status()
-            self.log("Reserved ip subpool '{0}' updated successfully.".format(name), "INFO")
+            self.log("Reserved ip subpool '{0}' updated successfully.", "INFO", name)
             result_reserve_pool.get("response") \
                 .update({name: reserve_params})
             result_reserve_pool.get("response").get(name) \
@@ -2369,7 +2355,7 @@ class NetworkSettings(DnacBase):
                     client_and_endpoint_aaa.get("sharedSecret") or
                     self.requires_update(have_network_details, want_network_details, self.network_obj_params)):
 
-                self.log("Network in site '{0}' doesn't require an update.".format(site_name), "INFO")
+                self.log("Network in site '{0}' doesn't require an update.", "INFO", site_name)
                 result_network.get("response").get(site_name).update({
                     "Cisco Catalyst Center params": self.have.get("network")[network_management_index]
                     .get("net_details").get("settings")
@@ -2377,10 +2363,9 @@ class NetworkSettings(DnacBase):
                 result_network.get("msg").update({site_name: "Network doesn't require an update"})
                 continue
 
-            self.log("Network in site '{0}' requires update.".format(site_name), "INFO")
-            self.log("Current State of network in Catalyst Center: {0}"
-                     .format(self.have.get("network")), "DEBUG")
-            self.log("Desired State of network: {0}".format(self.want.get("wantNetwork")), "DEBUG")
+            self.log("Network in site '{0}' requires update.", "INFO", site_name)
+            self.log("Current State of network in Catalyst Center: {0}", "DEBUG", self.have.get("network"))
+            self.log("Desired State of network: {0}", "DEBUG", self.want.get("wantNetwork"))
 
             net_params = copy.deepcopy(self.want.get("wantNetwork")[network_management_index])
             net_params.update({"site_id": self.have.get("network")[network_management_index].get("site_id")})
@@ -2402,10 +2387,10 @@ class NetworkSettings(DnacBase):
                 self.status = "failed"
                 return self
 
-            self.log("Received API response of 'update_network_v2': {0}".format(response), "DEBUG")
+            self.log("Received API response of 'update_network_v2': {0}", "DEBUG", response)
             validation_string = "desired common settings operation successful"
             self.check_task_response_status(response, validation_string, "update_network_v2").check_return_status()
-            self.log("Network under the site '{0}' has been changed successfully".format(site_name), "INFO")
+            self.log("Network under the site '{0}' has been changed successfully", "INFO", site_name)
             result_network.get("msg") \
                 .update({site_name: "Network Updated successfully"})
             result_network.get("response").get(site_name) \
@@ -2461,13 +2446,12 @@ class NetworkSettings(DnacBase):
 
             if not reserve_pool_exists:
                 result_reserve_pool.get("msg").update({name: "Reserve Pool not found"})
-                self.log("Reserved Ip Subpool '{0}' not found".format(name), "INFO")
+                self.log("Reserved Ip Subpool '{0}' not found", "INFO", name)
                 continue
 
-            self.log("Reserved IP pool scheduled for deletion: {0}"
-                     .format(self.have.get("reservePool")[reserve_pool_index].get("name")), "INFO")
+            self.log("Reserved IP pool scheduled for deletion: {0}", "INFO", self.have.get("reservePool")[reserve_pool_index].get("name"))
             _id = self.have.get("reservePool")[reserve_pool_index].get("id")
-            self.log("Reserved pool '{0}' id: {1}".format(name, _id), "DEBUG")
+            self.log("Reserved pool '{0}' id: {1}", "DEBUG", name, _id)
             response = self.dnac._exec(
                 family="network_settings",
                 function="release_reserve_ip_subpool",
@@ -2506,7 +2490,7 @@ class NetworkSettings(DnacBase):
             global_pool_index += 1
             if not global_pool_exists:
                 result_global_pool.get("msg").update({name: "Global Pool not found"})
-                self.log("Global pool '{0}' not found".format(name), "INFO")
+                self.log("Global pool '{0}' not found", "INFO", name)
                 continue
 
             id = item.get("id")
@@ -2567,14 +2551,12 @@ class NetworkSettings(DnacBase):
 
         self.all_reserved_pool_details = {}
         self.get_have(config)
-        self.log("Current State (have): {0}".format(self.have), "INFO")
-        self.log("Requested State (want): {0}".format(self.want), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
+        self.log("Requested State (want): {0}", "INFO", self.want)
         if config.get("global_pool_details") is not None:
             global_pool_index = 0
-            self.log("Desired State of global pool (want): {0}"
-                     .format(self.want.get("wantGlobal")), "DEBUG")
-            self.log("Current State of global pool (have): {0}"
-                     .format(self.have.get("globalPool")), "DEBUG")
+            self.log("Desired State of global pool (want): {0}", "DEBUG", self.want.get("wantGlobal"))
+            self.log("Current State of global pool (have): {0}", "DEBUG", self.have.get("globalPool"))
             for item in self.want.get("wantGlobal").get("settings").get("ippool"):
                 global_pool_details = self.have.get("globalPool")[global_pool_index].get("details")
                 if not global_pool_details:
@@ -2594,10 +2576,8 @@ class NetworkSettings(DnacBase):
 
         if config.get("reserve_pool_details") is not None:
             reserve_pool_index = 0
-            self.log("Desired State for reserve pool (want): {0}"
-                     .format(self.want.get("wantReserve")), "DEBUG")
-            self.log("Current State for reserve pool (have): {0}"
-                     .format(self.have.get("reservePool")), "DEBUG")
+            self.log("Desired State for reserve pool (want): {0}", "DEBUG", self.want.get("wantReserve"))
+            self.log("Current State for reserve pool (have): {0}", "DEBUG", self.have.get("reservePool"))
             for item in self.want.get("wantReserve"):
                 reserve_pool_details = self.have.get("reservePool")[reserve_pool_index].get("details")
                 if not reserve_pool_details:
@@ -2625,8 +2605,7 @@ class NetworkSettings(DnacBase):
                     self.status = "failed"
                     return self
 
-                self.log("Successfully validated the network functions '{0}'."
-                         .format(item.get("site_name")), "INFO")
+                self.log("Successfully validated the network functions '{0}'.", "INFO", item.get("site_name"))
                 network_management_index += 1
 
             self.result.get("response")[2].get("network").update({"Validation": "Success"})
@@ -2650,8 +2629,8 @@ class NetworkSettings(DnacBase):
 
         self.all_reserved_pool_details = {}
         self.get_have(config)
-        self.log("Current State (have): {0}".format(self.have), "INFO")
-        self.log("Desired State (want): {0}".format(self.want), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
+        self.log("Desired State (want): {0}", "INFO", self.want)
         if config.get("global_pool_details") is not None:
             global_pool_index = 0
             global_pool_details = self.have.get("globalPool")
@@ -2665,7 +2644,7 @@ class NetworkSettings(DnacBase):
                     self.status = "failed"
                     return self
 
-                self.log("Successfully validated absence of Global Pool '{0}'.".format(name), "INFO")
+                self.log("Successfully validated absence of Global Pool '{0}'.", "INFO", name)
                 global_pool_index += 1
             self.result.get("response")[0].get("globalPool").update({"Validation": "Success"})
 
@@ -2681,13 +2660,84 @@ class NetworkSettings(DnacBase):
                     self.status = "failed"
                     return self
 
-                self.log("Successfully validated the absence of Reserve Pool '{0}'.".format(name), "INFO")
+                self.log("Successfully validated the absence of Reserve Pool '{0}'.", "INFO", name)
                 self.result.get("response")[1].get("reservePool").update({"Validation": "Success"})
 
         self.msg = "Successfully validated the absence of Global Pool/Reserve Pool"
         self.status = "success"
         return self
 
+    def get_fingerprint_objects(self, config):
+        """
+        Get the Global Pools and Reserved Pools managed by a config item, for 'dnac_fingerprint_store'.
+
+        Parameters:
+            config (dict) - Playbook details containing Global Pool,
+            Reserved Pool, and Network Management configuration.
+
+        Returns:
+            list - The ('global_pool', name) and ('reserve_pool', 'site_name/name') pairs of the pools,
+            None for the items with network_management_details, there is no bulk query of
+            the network settings of all the sites.
+        """
+
+        if config.get("network_management_details") is not None:
+            return None
+
+        objects = []
+        global_pool_details = config.get("global_pool_details") or {}
+        for pool_details in (global_pool_details.get("settings") or {}).get("ip_pool") or []:
+            objects.append(("global_pool", pool_details.get("name")))
+
+        for pool_details in config.get("reserve_pool_details") or []:
+            objects.append(("reserve_pool", "{0}/{1}".format(pool_details.get("site_name"), pool_details.get("name"))))
+
+        return objects
+
+    def list_fingerprint_markers(self, kind):
+        """
+        Get all the Global Pools or all the Reserved Pools of Cisco Catalyst Center.
+
+        Parameters:
+            kind (str) - The kind of objects, 'global_pool' or 'reserve_pool'.
+
+        Returns:
+            dict - The details of every pool by name, or by 'site_name/name' for the Reserved Pools.
+        """
+
+        if kind == "global_pool":
+            return dict((pool.get("ipPoolName"), pool) for pool in
+                        self.paginate("network_settings", "get_global_pool", page_size=25))
+
+        return dict(("{0}/{1}".format(pool.get("siteHierarchy"), pool.get("groupName")), pool) for pool in
+                    self.paginate("network_settings", "get_reserve_ip_subpool", page_size=25))
+
+    def skip_unchanged(self, config):
+        """
+        Skip the pools of a config item unchanged since the last run, reported as not requiring an update.
+
+        Parameters:
+            config (dict) - Playbook details containing Global Pool,
+            Reserved Pool, and Network Management configuration.
+
+        Returns:
+            bool - True when the config item is skipped.
+        """
+
+        if not super().skip_unchanged(config):
+            return False
+
+        result_global_pool = self.result.get("response")[0].get("globalPool")
+        result_reserve_pool = self.result.get("response")[1].get("reservePool")
+        for kind, name in self.get_fingerprint_objects(config):
+            if kind == "global_pool":
+                result_global_pool.get("msg").update({name: "Global pool doesn't require an update"})
+            else:
+                result_reserve_pool.get("msg") \
+                    .update({name.rsplit("/", 1)[-1]: "Reserved ip subpool doesn't require an update"})
+
+        return True
+
     def reset_values(self):
         """
         Reset all neccessary attributes to default values
@@ -2720,9 +2770,25 @@ def main():
         "dnac_log_level": {"type": 'str', "default": 'WARNING'},
         "dnac_log_file_path": {"type": 'str', "default": 'dnac.log'},
         "dnac_log_append": {"type": 'bool', "default": True},
+        "dnac_log_max_bytes": {"type": 'int', "default": 0},
+        "dnac_log_backup_count": {"type": 'int', "default": 5},
+        "dnac_log_compress": {"type": 'bool', "default": False},
+        "dnac_log_format": {"type": 'str', "default": 'text', "choices": ['text', 'json']},
         "config_verify": {"type": 'bool', "default": False},
         "dnac_api_task_timeout": {"type": 'int', "default": 1200},
         "dnac_task_poll_interval": {"type": 'int', "default": 2},
+        "dnac_token_cache": {"type": "bool", "default": False},
+        "dnac_rate_limit": {"type": "float", "default": 0},
+        "dnac_rate_limit_per_family": {"type": "bool", "default": False},
+        "dnac_rate_limit_retries": {"type": "int", "default": 5},
+        "dnac_shared_rate_limit": {"type": "float", "default": 0},
+        "dnac_shared_family_concurrency": {"type": "int", "default": 0},
+        "dnac_memoize_reads": {"type": "bool", "default": False},
+        "dnac_metrics": {"type": "bool", "default": False},
+        "dnac_metrics_file": {"type": "str"},
+        "dnac_timings": {"type": "bool", "default": False},
+        "dnac_timings_file": {"type": "str"},
+        "dnac_fingerprint_store": {"type": "str"},
         "config": {"type": 'list', "required": True, "elements": 'dict'},
         "state": {"default": 'merged', "choices": ['merged', 'deleted']},
         "validate_response_schema": {"type": 'bool', "default": True},
@@ -2742,13 +2808,17 @@ def main():
 
     for config in ccc_network.config:
         ccc_network.reset_values()
+        if ccc_network.skip_unchanged(config):
+            continue
         ccc_network.get_have(config).check_return_status()
         if state != "deleted":
             ccc_network.get_want(config).check_return_status()
         ccc_network.get_diff_state_apply[state](config).check_return_status()
         if config_verify:
             ccc_network.verify_diff_state_apply[state](config).check_return_status()
+        ccc_network.keep_fingerprint()
 
+    ccc_network.save_fingerprints()
     module.exit_json(**ccc_network.result)
 
 
@@ -433,17 +433,17 @@ class PnP(DnacBase):
             )
         except Exception:
             self.log("Exception occurred as site \
-                '{0}' was not found".format(self.want.get("site_name")), "CRITICAL")
+                '{0}' was not found", "CRITICAL", self.want.get("site_name"))
             self.module.fail_json(msg="Site not found", response=[])
 
         if response:
             self.log("Received site details \
-                for '{0}': {1}".format(self.want.get("site_name"), str(response)), "DEBUG")
+                for '{0}': {1}", "DEBUG", self.want.get("site_name"), response)
             site = response.get("response")
             if len(site) == 1:
                 site_id = site[0].get("id")
                 site_exists = True
-                self.log("Site Name: {1}, Site ID: {0}".format(site_id, self.want.get("site_name")), "INFO")
+                self.log("Site Name: {1}, Site ID: {0}", "INFO", site_id, self.want.get("site_name"))
 
         return (site_exists, site_id)
 
@@ -472,18 +472,18 @@ class PnP(DnacBase):
             )
         except Exception:
             self.log("Exception occurred as \
-                site '{0}' was not found".format(self.want.get("site_name")), "CRITICAL")
+                site '{0}' was not found", "CRITICAL", self.want.get("site_name"))
             self.module.fail_json(msg="Site not found", response=[])
 
         if response:
             self.log("Received site details\
-                for '{0}': {1}".format(self.want.get("site_name"), str(response)), "DEBUG")
+                for '{0}': {1}", "DEBUG", self.want.get("site_name"), response)
             site = response.get("response")
             site_additional_info = site[0].get("additionalInfo")
             for item in site_additional_info:
                 if item["nameSpace"] == "Location":
                     site_type = item.get("attributes").get("type")
-                    self.log("Site type for site name '{1}' : {0}".format(site_type, self.want.get("site_name")), "INFO")
+                    self.log("Site type for site name '{1}' : {0}", "INFO", site_type, self.want.get("site_name"))
 
         return site_type
 
@@ -515,7 +515,7 @@ class PnP(DnacBase):
             device_dict["deviceInfo"] = param
             device_info_list.append(device_dict)
 
-        self.log("PnP paramters passed are {0}".format(str(params_list)), "INFO")
+        self.log("PnP paramters passed are {0}", "INFO", params_list)
         return device_info_list
 
     def get_image_params(self, params):
@@ -541,7 +541,7 @@ class PnP(DnacBase):
             'is_tagged_golden': params.get('golden_image')
         }
 
-        self.log("Image details are {0}".format(str(image_params)), "INFO")
+        self.log("Image details are {0}", "INFO", image_params)
         return image_params
 
     def pnp_cred_failure(self, msg=None):
@@ -634,7 +634,7 @@ class PnP(DnacBase):
                 self.pnp_cred_failure(msg=msg)
             claim_params["rfProfile"] = self.validated_config[0]["rf_profile"]
 
-        self.log("Parameters used for claiming are {0}".format(str(claim_params)), "INFO")
+        self.log("Parameters used for claiming are {0}", "INFO", claim_params)
         return claim_params
 
     def get_reset_params(self):
@@ -673,7 +673,7 @@ class PnP(DnacBase):
             ]
         }
 
-        self.log("Paramters used for resetting from errored state:{0}".format(str(reset_params)), "INFO")
+        self.log("Paramters used for resetting from errored state:{0}", "INFO", reset_params)
         return reset_params
 
     def get_have(self):
@@ -704,10 +704,10 @@ class PnP(DnacBase):
                 op_modifies=True,
             )
             self.log("Device details for the device with serial \
-                number '{0}': {1}".format(self.want.get("serial_number"), str(device_response)), "DEBUG")
+                number '{0}': {1}", "DEBUG", self.want.get("serial_number"), device_response)
 
             if not (device_response and (len(device_response) == 1)):
-                self.log("Device with serial number {0} is not found in the inventory".format(self.want.get("serial_number")), "WARNING")
+                self.log("Device with serial number {0} is not found in the inventory", "WARNING", self.want.get("serial_number"))
                 self.msg = "Adding the device to database"
                 self.status = "success"
                 self.have = have
@@ -727,7 +727,7 @@ class PnP(DnacBase):
                     op_modifies=True,
                 )
                 image_list = image_response.get("response")
-                self.log("Image details obtained from the API 'get_software_image_details': {0}".format(str(image_response)), "DEBUG")
+                self.log("Image details obtained from the API 'get_software_image_details': {0}", "DEBUG", image_response)
 
                 # check if project has templates or not
                 template_list = self.dnac_apply['exec'](
@@ -736,7 +736,7 @@ class PnP(DnacBase):
                     params={"project_names": self.want.get("project_name")},
                     op_modifies=True,
                 )
-                self.log("List of templates under the project '{0}': {1}".format(self.want.get("project_name"), str(template_list)), "DEBUG")
+                self.log("List of templates under the project '{0}': {1}", "DEBUG", self.want.get("project_name"), template_list)
 
                 dev_details_response = self.dnac_apply['exec'](
                     family="device_onboarding_pnp",
@@ -744,9 +744,9 @@ class PnP(DnacBase):
                     params={"id": device_response[0].get("id")},
                     op_modifies=True,
                 )
-                self.log("Device details retrieved after calling the 'get_device_by_id' API: {0}".format(str(dev_details_response)), "DEBUG")
+                self.log("Device details retrieved after calling the 'get_device_by_id' API: {0}", "DEBUG", dev_details_response)
                 install_mode = dev_details_response.get("deviceInfo").get("mode")
-                self.log("Installation mode of the device with the serial no. '{0}':{1}".format(self.want.get("serial_number"), install_mode), "INFO")
+                self.log("Installation mode of the device with the serial no. '{0}':{1}", "INFO", self.want.get("serial_number"), install_mode)
 
                 # check if given site exits, if exists store current site info
                 site_exists = False
@@ -762,7 +762,7 @@ class PnP(DnacBase):
 
                 if site_exists:
                     have["site_id"] = site_id
-                    self.log("Site Exists: {0}\nSite Name: {1}\nSite ID: {2}".format(site_exists, site_name, site_id), "INFO")
+                    self.log("Site Exists: {0}\nSite Name: {1}\nSite ID: {2}", "INFO", site_exists, site_name, site_id)
                     if self.want.get("pnp_type") == "AccessPoint":
                         if self.get_site_type() != "floor":
                             self.msg = "Please ensure that the site type is specified as 'floor' when claiming an AP."\
@@ -788,7 +788,7 @@ class PnP(DnacBase):
                             return self
 
                         have["image_id"] = image_list[0].get("imageUuid")
-                        self.log("Image ID for the image '{0}': {1}".format(self.want.get('image_params').get('image_name'), str(have["image_id"])), "INFO")
+                        self.log("Image ID for the image '{0}': {1}", "INFO", self.want.get('image_params').get('image_name'), have["image_id"])
 
                     template_name = self.want.get("template_name")
                     if template_name:
@@ -909,10 +909,10 @@ class PnP(DnacBase):
                     op_modifies=True,
                 )
                 self.log("Device details for serial number {0} \
-                        obtained from the API 'get_device_list': {1}".format(device["deviceInfo"]["serialNumber"], str(multi_device_response)), "DEBUG")
+                        obtained from the API 'get_device_list': {1}", "DEBUG", device["deviceInfo"]["serialNumber"], multi_device_response)
                 if (multi_device_response and (len(multi_device_response) == 1)):
                     devices_added.append(device)
-                    self.log("Details of the added device:{0}".format(str(device)), "INFO")
+                    self.log("Details of the added device:{0}", "INFO", device)
             if (len(self.want.get("pnp_params")) - len(devices_added)) == 0:
                 self.result['response'] = []
                 self.result['msg'] = "Devices are already added"
@@ -930,7 +930,7 @@ class PnP(DnacBase):
                 params={"payload": bulk_list},
                 op_modifies=True,
             )
-            self.log("Response from API 'import_devices_in_bulk' for imported devices: {0}".format(bulk_params), "DEBUG")
+            self.log("Response from API 'import_devices_in_bulk' for imported devices: {0}", "DEBUG", bulk_params)
             if len(bulk_params.get("successList")) > 0:
                 self.result['msg'] = "{0} device(s) imported successfully".format(
                     len(bulk_params.get("successList")))
@@ -972,7 +972,7 @@ class PnP(DnacBase):
                 )
 
                 self.have["deviceInfo"] = dev_add_response.get("deviceInfo")
-                self.log("Response from API 'add device' for a single device addition: {0}".format(str(dev_add_response)), "DEBUG")
+                self.log("Response from API 'add device' for a single device addition: {0}", "DEBUG", dev_add_response)
                 if self.have["deviceInfo"]:
                     self.result['msg'] = "Only Device Added Successfully"
                     self.log(self.result['msg'], "INFO")
@@ -997,7 +997,7 @@ class PnP(DnacBase):
                 )
                 self.get_have().check_return_status()
                 self.have["deviceInfo"] = dev_add_response.get("deviceInfo")
-                self.log("Response from API 'add device' for single device addition: {0}".format(str(dev_add_response)), "DEBUG")
+                self.log("Response from API 'add device' for single device addition: {0}", "DEBUG", dev_add_response)
                 claim_params = self.get_claim_params()
                 claim_params["deviceId"] = dev_add_response.get("id")
                 claim_response = self.dnac_apply['exec'](
@@ -1007,7 +1007,7 @@ class PnP(DnacBase):
                     params=claim_params,
                 )
 
-                self.log("Response from API 'claim a device to a site' for a single claiming: {0}".format(str(dev_add_response)), "DEBUG")
+                self.log("Response from API 'claim a device to a site' for a single claiming: {0}", "DEBUG", dev_add_response)
                 if claim_response.get("response") == "Device Claimed" and self.have["deviceInfo"]:
                     self.result['msg'] = "Device Added and Claimed Successfully"
                     self.log(self.result['msg'], "INFO")
@@ -1028,7 +1028,7 @@ class PnP(DnacBase):
             op_modifies=True,
             params=provisioned_count_params,
         )
-        self.log("Response from 'get device count' API for provisioned devices: {0}".format(str(prov_dev_response)), "DEBUG")
+        self.log("Response from 'get device count' API for provisioned devices: {0}", "DEBUG", prov_dev_response)
 
         plan_dev_response = self.dnac_apply['exec'](
             family="device_onboarding_pnp",
@@ -1036,7 +1036,7 @@ class PnP(DnacBase):
             op_modifies=True,
             params=planned_count_params,
         )
-        self.log("Response from 'get_device_count' API for devices in planned state: {0}".format(str(plan_dev_response)), "DEBUG")
+        self.log("Response from 'get_device_count' API for devices in planned state: {0}", "DEBUG", plan_dev_response)
 
         dev_details_response = self.dnac_apply['exec'](
             family="device_onboarding_pnp",
@@ -1044,13 +1044,13 @@ class PnP(DnacBase):
             params={"id": self.have["device_id"]},
             op_modifies=True,
         )
-        self.log("Response from 'get_device_by_id' API for device details: {0}".format(str(dev_details_response)), "DEBUG")
+        self.log("Response from 'get_device_by_id' API for device details: {0}", "DEBUG", dev_details_response)
 
         is_stack = False
         if dev_details_response.get("deviceInfo").get("stack"):
             is_stack = dev_details_response.get("deviceInfo").get("stack")
         pnp_state = dev_details_response.get("deviceInfo").get("state")
-        self.log("PnP state of the device: {0}".format(pnp_state), "INFO")
+        self.log("PnP state of the device: {0}", "INFO", pnp_state)
 
         if not self.want["site_name"]:
             self.result['response'] = self.have.get("device_found")
@@ -1061,7 +1061,7 @@ class PnP(DnacBase):
         update_payload = {"deviceInfo": self.want.get('pnp_params')[0].get("deviceInfo")}
         update_payload["deviceInfo"]["stack"] = is_stack
 
-        self.log("The request sent for 'update_device' API for device's config update: {0}".format(update_payload), "DEBUG")
+        self.log("The request sent for 'update_device' API for device's config update: {0}", "DEBUG", update_payload)
         update_response = self.dnac_apply['exec'](
             family="device_onboarding_pnp",
             function="update_device",
@@ -1069,7 +1069,7 @@ class PnP(DnacBase):
                     "payload": update_payload},
             op_modifies=True,
         )
-        self.log("Response from 'update_device' API for device's config update: {0}".format(str(update_response)), "DEBUG")
+        self.log("Response from 'update_device' API for device's config update: {0}", "DEBUG", update_response)
 
         if pnp_state == "Error":
             reset_paramters = self.get_reset_params()
@@ -1079,7 +1079,7 @@ class PnP(DnacBase):
                 params={"payload": reset_paramters},
                 op_modifies=True,
             )
-            self.log("Response from 'update_device' API for errored state resolution: {0}".format(str(reset_response)), "DEBUG")
+            self.log("Response from 'update_device' API for errored state resolution: {0}", "DEBUG", reset_response)
             self.result['msg'] = "Device reset done Successfully"
             self.log(self.result['msg'], "INFO")
             self.result['response'] = reset_response
@@ -1101,7 +1101,7 @@ class PnP(DnacBase):
                 return self
 
         claim_params = self.get_claim_params()
-        self.log("Parameters for claiming the device: {0}".format(str(claim_params)), "DEBUG")
+        self.log("Parameters for claiming the device: {0}", "DEBUG", claim_params)
 
         claim_response = self.dnac_apply['exec'](
             family="device_onboarding_pnp",
@@ -1109,7 +1109,7 @@ class PnP(DnacBase):
             op_modifies=True,
             params=claim_params,
         )
-        self.log("Response from 'claim_a_device_to_a_site' API for claiming: {0}".format(str(claim_response)), "DEBUG")
+        self.log("Response from 'claim_a_device_to_a_site' API for claiming: {0}", "DEBUG", claim_response)
         if claim_response.get("response") == "Device Claimed":
             self.result['msg'] = "Only Device Claimed Successfully"
             self.log(self.result['msg'], "INFO")
@@ -1144,7 +1144,7 @@ class PnP(DnacBase):
                 params={"serial_number": device["deviceInfo"]["serialNumber"]},
                 op_modifies=True,
             )
-            self.log("Response from 'get_device_list' API for claiming: {0}".format(str(multi_device_response)), "DEBUG")
+            self.log("Response from 'get_device_list' API for claiming: {0}", "DEBUG", multi_device_response)
             if multi_device_response and len(multi_device_response) == 1:
                 device_id = multi_device_response[0].get("id")
 
@@ -1155,7 +1155,7 @@ class PnP(DnacBase):
                     params={"id": device_id},
                 )
                 self.log("Device details for the deleted device with \
-                        serial number '{0}': {1}".format(device["deviceInfo"]["serialNumber"], str(response)), "DEBUG")
+                        serial number '{0}': {1}", "DEBUG", device["deviceInfo"]["serialNumber"], response)
                 if response.get("deviceInfo", {}).get("state") == "Deleted":
                     devices_deleted.append(device["deviceInfo"]["serialNumber"])
                     self.want.get("pnp_params").remove(device)
@@ -1192,8 +1192,8 @@ class PnP(DnacBase):
             Center configuration's PnP Database.
         """
 
-        self.log("Current State (have): {0}".format(str(self.have)), "INFO")
-        self.log("Desired State (want): {0}".format(str(config)), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
+        self.log("Desired State (want): {0}", "INFO", config)
         # Code to validate Cisco Catalyst Center config for merged state
         for device in self.want.get("pnp_params"):
             device_response = self.dnac_apply['exec'](
@@ -1233,8 +1233,8 @@ class PnP(DnacBase):
             PnP Database.
         """
 
-        self.log("Current State (have): {0}".format(str(self.have)), "INFO")
-        self.log("Desired State (want): {0}".format(str(config)), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
+        self.log("Desired State (want): {0}", "INFO", config)
         # Code to validate Cisco Catalyst Center config for deleted state
         for device in self.want.get("pnp_params"):
             device_response = self.dnac_apply['exec'](
@@ -1276,10 +1276,25 @@ def main():
                     'dnac_log_level': {'type': 'str', 'default': 'WARNING'},
                     "dnac_log_file_path": {"type": 'str', "default": 'dnac.log'},
                     "dnac_log_append": {"type": 'bool', "default": True},
+                    "dnac_log_max_bytes": {"type": 'int', "default": 0},
+                    "dnac_log_backup_count": {"type": 'int', "default": 5},
+                    "dnac_log_compress": {"type": 'bool', "default": False},
+                    "dnac_log_format": {"type": 'str', "default": 'text', "choices": ['text', 'json']},
                     'validate_response_schema': {'type': 'bool', 'default': True},
                     'config_verify': {"type": 'bool', "default": False},
                     'dnac_api_task_timeout': {'type': 'int', "default": 1200},
                     'dnac_task_poll_interval': {'type': 'int', "default": 2},
+                    'dnac_token_cache': {'type': 'bool', 'default': False},
+                    'dnac_rate_limit': {'type': 'float', 'default': 0},
+                    'dnac_rate_limit_per_family': {'type': 'bool', 'default': False},
+                    'dnac_rate_limit_retries': {'type': 'int', 'default': 5},
+                    'dnac_shared_rate_limit': {'type': 'float', 'default': 0},
+                    'dnac_shared_family_concurrency': {'type': 'int', 'default': 0},
+                    'dnac_memoize_reads': {'type': 'bool', 'default': False},
+                    'dnac_metrics': {'type': 'bool', 'default': False},
+                    'dnac_metrics_file': {'type': 'str'},
+                    'dnac_timings': {'type': 'bool', 'default': False},
+                    'dnac_timings_file': {'type': 'str'},
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'merged', 'choices': ['merged', 'deleted']}
                     }
@@ -335,7 +335,7 @@ class Provision(DnacBase):
             self.log(str(e), "ERROR")
             self.module.fail_json(msg=str(e))
 
-        self.log("The device response from 'get_network_device_by_ip' API is {0}".format(str(dev_response)), "DEBUG")
+        self.log("The device response from 'get_network_device_by_ip' API is {0}", "DEBUG", dev_response)
         dev_dict = dev_response.get("response")
         device_family = dev_dict["family"]
 
@@ -345,7 +345,7 @@ class Provision(DnacBase):
             device_type = "wired"
         else:
             device_type = None
-        self.log("The device type is {0}".format(device_type), "INFO")
+        self.log("The device type is {0}", "INFO", device_type)
         return device_type
 
     def get_device_id(self):
@@ -369,11 +369,11 @@ class Provision(DnacBase):
             op_modifies=True
         )
 
-        self.log("The device response from 'get_network_device_by_ip' API is {0}".format(str(dev_response)), "DEBUG")
+        self.log("The device response from 'get_network_device_by_ip' API is {0}", "DEBUG", dev_response)
         dev_dict = dev_response.get("response")
         device_id = dev_dict.get("id")
 
-        self.log("Device ID of the device with IP address {0} is {1}".format(self.validated_config[0]["management_ip_address"], device_id), "INFO")
+        self.log("Device ID of the device with IP address {0} is {1}", "INFO", self.validated_config[0]["management_ip_address"], device_id)
         return device_id
 
     def get_serial_number(self):
@@ -399,14 +399,14 @@ class Provision(DnacBase):
             )
 
         except Exception as e:
-            self.log("An error occurred while fetching the serial number: {0}".format(str(e)), "ERROR")
+            self.log("An error occurred while fetching the serial number: {0}", "ERROR", e)
             return None
 
         if not (response or response.get("response")):
             self.log("No response received from 'get_network_device_by_ip' API or it's invalid.", "ERROR")
             return None
 
-        self.log("The device response from 'get_network_device_by_ip' API is {0}".format(str(response)), "DEBUG")
+        self.log("The device response from 'get_network_device_by_ip' API is {0}", "DEBUG", response)
         dev_dict = response.get("response")
         serial_number = dev_dict.get("serialNumber")
 
@@ -414,7 +414,7 @@ class Provision(DnacBase):
             self.log("Serial number not found in the response.", "ERROR")
             return None
 
-        self.log("Serial Number of the device is {0}".format(str(serial_number)), "INFO")
+        self.log("Serial Number of the device is {0}", "INFO", serial_number)
 
         return serial_number
 
@@ -443,9 +443,9 @@ class Provision(DnacBase):
                 params=params,
                 op_modifies=True
             )
-            self.log("Response collected from 'get_task_by_id' API is {0}".format(str(response)), "DEBUG")
+            self.log("Response collected from 'get_task_by_id' API is {0}", "DEBUG", response)
             response = response.response
-            self.log("Task status for the task id {0} is {1}".format(str(task_id), str(response.get("progress"))), "INFO")
+            self.log("Task status for the task id {0} is {1}", "INFO", task_id, response.get("progress"))
             if response.get('isError') or re.search(
                 'failed', response.get('progress'), flags=re.IGNORECASE
             ):
@@ -487,8 +487,8 @@ class Provision(DnacBase):
                 params=params,
                 op_modifies=True
             )
-            self.log("Response collected from 'get_business_api_execution_details' API is {0}".format(str(response)), "DEBUG")
-            self.log("Execution status for the execution id {0} is {1}".format(str(execution_id), str(response.get("status"))), "INFO")
+            self.log("Response collected from 'get_business_api_execution_details' API is {0}", "DEBUG", response)
+            self.log("Execution status for the execution id {0} is {1}", "INFO", execution_id, response.get("status"))
             if response.get('bapiError') or response.get("status") == "FAILURE":
                 msg = 'Assigning to site execution with id {0} has not completed - Reason: {1}'.format(
                     execution_id, response.get("bapiError"))
@@ -528,8 +528,8 @@ class Provision(DnacBase):
                 params=params,
                 op_modifies=True
             )
-            self.log("Response collected from 'get_business_api_execution_details' API is {0}".format(str(response)), "DEBUG")
-            self.log("Execution status for the execution id {0} is {1}".format(str(execution_id), str(response.get("status"))), "INFO")
+            self.log("Response collected from 'get_business_api_execution_details' API is {0}", "DEBUG", response)
+            self.log("Execution status for the execution id {0} is {1}", "INFO", execution_id, response.get("status"))
             if response.get('bapiError') or response.get("status") == "FAILURE":
                 if response.get("bapiError") == "Device was already provisioned , please use provision update API to reprovision the device":
                     msg = "Performing reprovisioning of wireless device"
@@ -573,18 +573,18 @@ class Provision(DnacBase):
             )
         except Exception:
             self.log("Exception occurred as \
-                site '{0}' was not found".format(site_name_hierarchy), "CRITICAL")
+                site '{0}' was not found", "CRITICAL", site_name_hierarchy)
             self.module.fail_json(msg="Site not found", response=[])
 
         if response:
             self.log("Received site details\
-                for '{0}': {1}".format(site_name_hierarchy, str(response)), "DEBUG")
+                for '{0}': {1}", "DEBUG", site_name_hierarchy, response)
             site = response.get("response")
             site_additional_info = site[0].get("additionalInfo")
             for item in site_additional_info:
                 if item["nameSpace"] == "Location":
                     site_type = item.get("attributes").get("type")
-                    self.log("Site type for site name '{1}' : {0}".format(site_type, site_name_hierarchy), "INFO")
+                    self.log("Site type for site name '{1}' : {0}", "INFO", site_type, site_name_hierarchy)
 
         return site_type
 
@@ -615,18 +615,18 @@ class Provision(DnacBase):
             )
         except Exception:
             self.log("Exception occurred as \
-                site '{0}' was not found".format(self.want.get("site_name")), "CRITICAL")
+                site '{0}' was not found", "CRITICAL", self.want.get("site_name"))
             self.module.fail_json(msg="Site not found", response=[])
 
         if response:
             self.log("Received site details\
-                for '{0}': {1}".format(site_name_hierarchy, str(response)), "DEBUG")
+                for '{0}': {1}", "DEBUG", site_name_hierarchy, response)
             site = response.get("response")
             site_additional_info = site[0].get("additionalInfo")
             if len(site) == 1:
                 site_id = site[0].get("id")
                 site_exists = True
-                self.log("Site Name: {1}, Site ID: {0}".format(site_id, site_name_hierarchy), "INFO")
+                self.log("Site Name: {1}, Site ID: {0}", "INFO", site_id, site_name_hierarchy)
 
         return (site_exists, site_id)
 
@@ -643,7 +643,7 @@ class Provision(DnacBase):
 
         """
 
-        self.log("Checking site assignment for device with UUID: {0}".format(uuid), "INFO")
+        self.log("Checking site assignment for device with UUID: {0}", "INFO", uuid)
         try:
             site_response = self.dnac_apply['exec'](
                 family="devices",
@@ -652,7 +652,7 @@ class Provision(DnacBase):
                         "identifier": "uuid"},
                 op_modifies=True
             )
-            self.log("Response collected from the API 'get_device_detail' {0}".format(site_response))
+            self.log("Response collected from the API 'get_device_detail' {0}", "WARNING", site_response)
             site_response = site_response.get("response")
             if site_response.get("location"):
                 return True
@@ -688,7 +688,7 @@ class Provision(DnacBase):
                         "serial_number": serial_number},
                 op_modifies=True
             )
-            self.log("Response collected from the 'get_memership' API is {0}".format(site_response), "DEBUG")
+            self.log("Response collected from the 'get_memership' API is {0}", "DEBUG", site_response)
             device_list = site_response.get("device")
             if len(device_list) > 0:
                 if all(device.get("response") == [] for device in device_list):
@@ -741,7 +741,7 @@ class Provision(DnacBase):
                 "site_id": site_id
             }
 
-        self.log("Parameters collected for the provisioning of wired device:{0}".format(wired_params), "INFO")
+        self.log("Parameters collected for the provisioning of wired device:{0}", "INFO", wired_params)
         return wired_params
 
     def get_wireless_params(self):
@@ -800,9 +800,9 @@ class Provision(DnacBase):
             op_modifies=True
         )
 
-        self.log("Response collected from 'get_network_device_by_ip' is:{0}".format(str(response)), "DEBUG")
+        self.log("Response collected from 'get_network_device_by_ip' is:{0}", "DEBUG", response)
         wireless_params[0]["deviceName"] = response.get("response").get("hostname")
-        self.log("Parameters collected for the provisioning of wireless device:{0}".format(wireless_params), "INFO")
+        self.log("Parameters collected for the provisioning of wireless device:{0}", "INFO", wireless_params)
         return wireless_params
 
     def get_want(self):
@@ -862,7 +862,7 @@ class Provision(DnacBase):
                 params={"payload": self.want.get("prov_params"),
                         "headers": headers_payload}
             )
-            self.log("Wireless provisioning response collected from 'provision_update' API is: {0}".format(str(response)), "DEBUG")
+            self.log("Wireless provisioning response collected from 'provision_update' API is: {0}", "DEBUG", response)
             execution_id = response.get("executionId")
             self.get_execution_status_wireless(execution_id=execution_id)
             self.result["changed"] = True
@@ -872,7 +872,7 @@ class Provision(DnacBase):
             self.log(self.result['msg'], "INFO")
             return self
         except Exception as e:
-            self.log("Parameters are {0}".format(self.want))
+            self.log("Parameters are {0}", "WARNING", self.want)
             self.msg = "Error in wireless re-provisioning of {0} due to {1}".format(self.validated_config[0]["management_ip_address"], e)
             self.log(self.msg, "ERROR")
             self.status = "failed"
@@ -906,9 +906,9 @@ class Provision(DnacBase):
                 )
             except Exception:
                 status_response = {}
-            self.log("Wired device's status Response collected from 'get_provisioned_wired_device' API is:{0}".format(str(status_response)), "DEBUG")
+            self.log("Wired device's status Response collected from 'get_provisioned_wired_device' API is:{0}", "DEBUG", status_response)
             status = status_response.get("status")
-            self.log("The provisioned status of the wired device is {0}".format(status), "INFO")
+            self.log("The provisioned status of the wired device is {0}", "INFO", status)
 
             if status == "success":
                 try:
@@ -918,7 +918,7 @@ class Provision(DnacBase):
                         op_modifies=True,
                         params=self.want["prov_params"],
                     )
-                    self.log("Reprovisioning response collected from 're_provision_wired_device' API is: {0}".format(response), "DEBUG")
+                    self.log("Reprovisioning response collected from 're_provision_wired_device' API is: {0}", "DEBUG", response)
                     task_id = response.get("taskId")
                     self.get_task_status(task_id=task_id)
                     self.result["changed"] = True
@@ -942,7 +942,7 @@ class Provision(DnacBase):
                             op_modifies=True,
                             params=self.want["prov_params"],
                         )
-                        self.log("Provisioning response collected from 'provision_wired_device' API is: {0}".format(response), "DEBUG")
+                        self.log("Provisioning response collected from 'provision_wired_device' API is: {0}", "DEBUG", response)
                     except Exception as e:
                         self.msg = "Error in provisioning due to {0}".format(str(e))
                         self.log(self.msg, "ERROR")
@@ -969,7 +969,7 @@ class Provision(DnacBase):
                                 "payload": self.want.get("prov_params")
                             },
                         )
-                        self.log("Assignment response collected from 'assign_devices_to_site' API is: {0}".format(response), "DEBUG")
+                        self.log("Assignment response collected from 'assign_devices_to_site' API is: {0}", "DEBUG", response)
                         execution_id = response.get("executionId")
                         assignment_info = self.get_execution_status_site(execution_id=execution_id)
                         self.result["changed"] = True
@@ -992,7 +992,7 @@ class Provision(DnacBase):
                     op_modifies=True,
                     params={"payload": self.want.get("prov_params")}
                 )
-                self.log("Wireless provisioning response collected from 'provision' API is: {0}".format(str(response)), "DEBUG")
+                self.log("Wireless provisioning response collected from 'provision' API is: {0}", "DEBUG", response)
                 execution_id = response.get("executionId")
                 self.get_execution_status_wireless(execution_id=execution_id)
                 self.result["changed"] = True
@@ -1002,7 +1002,7 @@ class Provision(DnacBase):
                 self.log(self.result['msg'], "INFO")
                 return self
             except Exception as e:
-                self.log("Parameters are {0}".format(self.want))
+                self.log("Parameters are {0}", "WARNING", self.want)
                 self.msg = "Error in wireless provisioning of {0} due to {1}".format(self.validated_config[0]["management_ip_address"], e)
                 self.log(self.msg, "ERROR")
                 self.status = "failed"
@@ -1055,9 +1055,9 @@ class Provision(DnacBase):
 
         except Exception:
             status_response = {}
-        self.log("Wired device's status Response collected from 'get_provisioned_wired_device' API is:{0}".format(str(status_response)), "DEBUG")
+        self.log("Wired device's status Response collected from 'get_provisioned_wired_device' API is:{0}", "DEBUG", status_response)
         status = status_response.get("status")
-        self.log("The provisioned status of the wired device is {0}".format(status), "INFO")
+        self.log("The provisioned status of the wired device is {0}", "INFO", status)
 
         if status != "success":
             self.result['msg'] = "Device associated with the passed IP address is not provisioned"
@@ -1073,7 +1073,7 @@ class Provision(DnacBase):
                 "device_management_ip_address": self.validated_config[0]["management_ip_address"]
             },
         )
-        self.log("Response collected from the 'delete_provisioned_wired_device' API is : {0}".format(str(response)), "DEBUG")
+        self.log("Response collected from the 'delete_provisioned_wired_device' API is : {0}", "DEBUG", response)
 
         task_id = response.get("taskId")
         deletion_info = self.get_task_status(task_id=task_id)
@@ -1099,7 +1099,7 @@ class Provision(DnacBase):
             Center configuration's Inventory Database in the provisioned state.
         """
 
-        self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+        self.log("Desired State (want): {0}", "INFO", self.want)
         # Code to validate Cisco Catalyst Center config for merged state
 
         device_type = self.want.get("device_type")
@@ -1108,9 +1108,9 @@ class Provision(DnacBase):
         uuid = self.get_device_id()
         if provisioning is False:
             if self.is_device_assigned_to_site(uuid) is True:
-                self.log("Requested device is already added to the site {0}".format(site_name_hierarchy), "INFO")
+                self.log("Requested device is already added to the site {0}", "INFO", site_name_hierarchy)
             else:
-                self.log("Requested device is not added to the site {0}".format(site_name_hierarchy), "INFO")
+                self.log("Requested device is not added to the site {0}", "INFO", site_name_hierarchy)
             return self
 
         if device_type == "wired":
@@ -1125,9 +1125,9 @@ class Provision(DnacBase):
                 )
             except Exception:
                 status_response = {}
-            self.log("Wired device's status Response collected from 'get_provisioned_wired_device' API is:{0}".format(str(status_response)), "DEBUG")
+            self.log("Wired device's status Response collected from 'get_provisioned_wired_device' API is:{0}", "DEBUG", status_response)
             status = status_response.get("status")
-            self.log("The provisioned status of the wired device is {0}".format(status), "INFO")
+            self.log("The provisioned status of the wired device is {0}", "INFO", status)
 
             if status == "success":
                 self.log("Requested wired device is alread provisioned", "INFO")
@@ -1155,7 +1155,7 @@ class Provision(DnacBase):
             Inventory Database in the provisioned state.
         """
 
-        self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+        self.log("Desired State (want): {0}", "INFO", self.want)
         # Code to validate Cisco Catalyst Center config for merged state
 
         device_type = self.want.get("device_type")
@@ -1171,9 +1171,9 @@ class Provision(DnacBase):
                 )
             except Exception:
                 status_response = {}
-            self.log("Wired device's status Response collected from 'get_provisioned_wired_device' API is:{0}".format(str(status_response)), "DEBUG")
+            self.log("Wired device's status Response collected from 'get_provisioned_wired_device' API is:{0}", "DEBUG", status_response)
             status = status_response.get("status")
-            self.log("The provisioned status of the wired device is {0}".format(status), "INFO")
+            self.log("The provisioned status of the wired device is {0}", "INFO", status)
 
             if status == "success":
                 self.log("Requested wired device is in provisioned state and is not unprovisioned", "INFO")
@@ -1205,9 +1205,24 @@ def main():
                     "dnac_log_level": {"type": 'str', "default": 'WARNING'},
                     "dnac_log_file_path": {"type": 'str', "default": 'dnac.log'},
                     "dnac_log_append": {"type": 'bool', "default": True},
+                    "dnac_log_max_bytes": {"type": 'int', "default": 0},
+                    "dnac_log_backup_count": {"type": 'int', "default": 5},
+                    "dnac_log_compress": {"type": 'bool', "default": False},
+                    "dnac_log_format": {"type": 'str', "default": 'text', "choices": ['text', 'json']},
                     "config_verify": {"type": 'bool', "default": False},
                     'dnac_api_task_timeout': {'type': 'int', "default": 1200},
                     'dnac_task_poll_interval': {'type': 'int', "default": 2},
+                    'dnac_token_cache': {'type': 'bool', 'default': False},
+                    'dnac_rate_limit': {'type': 'float', 'default': 0},
+                    'dnac_rate_limit_per_family': {'type': 'bool', 'default': False},
+                    'dnac_rate_limit_retries': {'type': 'int', 'default': 5},
+                    'dnac_shared_rate_limit': {'type': 'float', 'default': 0},
+                    'dnac_shared_family_concurrency': {'type': 'int', 'default': 0},
+                    'dnac_memoize_reads': {'type': 'bool', 'default': False},
+                    'dnac_metrics': {'type': 'bool', 'default': False},
+                    'dnac_metrics_file': {'type': 'str'},
+                    'dnac_timings': {'type': 'bool', 'default': False},
+                    'dnac_timings_file': {'type': 'str'},
                     'validate_response_schema': {'type': 'bool', 'default': True},
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'merged', 'choices': ['merged', 'deleted']}
@@ -296,6 +296,7 @@ import re
 import json
 from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
+    Deferred,
     validate_list_of_dicts,
     validate_str
 )
@@ -379,7 +380,7 @@ class DeviceReplacement(DnacBase):
                     filtered_config[key] = config[key]
             self.validated_config.append(filtered_config)
 
-        self.log("Validated config: {0}".format(self.pprint(self.validated_config)), "INFO")
+        self.log("Validated config: {0}", "INFO", Deferred(self.pprint, self.validated_config))
         self.msg = "Successfully validated playbook config params:{0}".format(str(self.validated_config[0]))
         self.log(self.msg, "INFO")
         self.status = "success"
@@ -416,7 +417,7 @@ class DeviceReplacement(DnacBase):
             self.log("Validation failed. Returning with status 'failed'.", "ERROR")
             return self
 
-        self.log("Desired State (want): {0}".format(str(self.pprint(self.want))), "INFO")
+        self.log("Desired State (want): {0}", "INFO", Deferred(self.pprint, self.want))
         return self
 
     def get_have(self):
@@ -485,7 +486,7 @@ class DeviceReplacement(DnacBase):
                 have["faulty_device_platform_id"] = faulty_device_params.get("platform_id")
                 have[faulty_key] = faulty_identifier
                 have["faulty_device_exists"] = True
-                self.log("Faulty device '{0}' found in Cisco Catalyst Center".format(faulty_identifier), "INFO")
+                self.log("Faulty device '{0}' found in Cisco Catalyst Center", "INFO", faulty_identifier)
 
                 # Check if replacement device exists
                 replacement_device_params = self.device_exists(replacement_identifier, replacement_key)
@@ -505,7 +506,7 @@ class DeviceReplacement(DnacBase):
                 have["replacement_device_platform_id"] = replacement_device_params.get("platform_id")
                 have[replacement_key] = replacement_identifier
                 have["replacement_device_exists"] = True
-                self.log("Replacement device '{0}' found in Cisco Catalyst Center".format(replacement_identifier), "INFO")
+                self.log("Replacement device '{0}' found in Cisco Catalyst Center", "INFO", replacement_identifier)
                 break
 
         # Check if any valid identifier combination was not found
@@ -528,7 +529,7 @@ class DeviceReplacement(DnacBase):
             self.status = "failed"
         else:
             self.msg = "Successfully retrieved device details: {0}".format(self.pprint(config))
-            self.log("Current State (have): {0}".format(self.pprint(self.have)), "INFO")
+            self.log("Current State (have): {0}", "INFO", Deferred(self.pprint, self.have))
             self.log(self.msg, "INFO")
             self.status = "success"
 
@@ -565,7 +566,7 @@ class DeviceReplacement(DnacBase):
             self.status = "failed"
             return self
 
-        self.log("The replacement device '{0}' is reachable.".format(self.have.get("replacement_device_name")), "DEBUG")
+        self.log("The replacement device '{0}' is reachable.", "DEBUG", self.have.get("replacement_device_name"))
         return self
 
     def device_exists(self, identifier, identifier_type):
@@ -605,7 +606,7 @@ class DeviceReplacement(DnacBase):
                 op_modifies=False,
                 params=params
             )
-            self.log("Received API response from 'get_device_list': {0}".format(self.pprint(response)), "DEBUG")
+            self.log("Received API response from 'get_device_list': {0}", "DEBUG", Deferred(self.pprint, response))
             device_param_list = {}
 
             if response and response.get('response'):
@@ -627,7 +628,7 @@ class DeviceReplacement(DnacBase):
             else:
                 self.log("No valid response received from Cisco Catalyst Center", "ERROR")
         except Exception as e:
-            self.log("Exception occurred while querying device: {0}".format(str(e)), "ERROR")
+            self.log("Exception occurred while querying device: {0}", "ERROR", e)
 
         return {}
 
@@ -704,7 +705,7 @@ class DeviceReplacement(DnacBase):
             function='return_replacement_devices_with_details'
         )
         devices = response.get("response", [])
-        self.log("Received API response from 'return_replacement_devices_with_details': {0}".format(self.pprint(response)), "DEBUG")
+        self.log("Received API response from 'return_replacement_devices_with_details': {0}", "DEBUG", Deferred(self.pprint, response))
 
         for device in devices:
             if device.get("faultyDeviceSerialNumber") == self.have.get("faulty_device_serial_number"):
@@ -746,7 +747,7 @@ class DeviceReplacement(DnacBase):
                     function='mark_device_for_replacement',
                     params=import_params
                 )
-                self.log("Received API response from 'mark_device_for_replacement': {0}".format(str(response)), "DEBUG")
+                self.log("Received API response from 'mark_device_for_replacement': {0}", "DEBUG", response)
                 task_id = response.get("response", {}).get("taskId")
                 task_result = self.check_rma_task_status(
                     task_id,
@@ -765,7 +766,7 @@ class DeviceReplacement(DnacBase):
                 self.msg = "Exception occurred while marking device for replacement: {0}".format(str(e))
                 self.log(self.msg, "ERROR")
 
-        self.log("The device '{0}' is already in the 'READY-FOR-REPLACEMENT' state.".format(self.have.get("faulty_device_name")), "DEBUG")
+        self.log("The device '{0}' is already in the 'READY-FOR-REPLACEMENT' state.", "DEBUG", self.have.get("faulty_device_name"))
         return self
 
     def get_diff_replaced(self, config):
@@ -796,7 +797,7 @@ class DeviceReplacement(DnacBase):
             }
         )
 
-        self.log("Replacing device with parameters: {0}".format(self.pprint(import_params)), "INFO")
+        self.log("Replacing device with parameters: {0}", "INFO", Deferred(self.pprint, import_params))
 
         try:
             response = self.dnac._exec(
@@ -805,7 +806,7 @@ class DeviceReplacement(DnacBase):
                 op_modifies=True,
                 params=import_params
             )
-            self.log("Received API response from 'deploy_device_replacement_workflow': {0}".format(self.pprint(response)), "DEBUG")
+            self.log("Received API response from 'deploy_device_replacement_workflow': {0}", "DEBUG", Deferred(self.pprint, response))
             task_id = response.get("response", {}).get("taskId")
 
             # Monitor the task status using check_rma_task_status
@@ -892,7 +893,7 @@ class DeviceReplacement(DnacBase):
         resync_retry_interval = self.params.get('resync_retry_interval')
         while resync_retry_count:
             task_details = self.get_task_details(self.task_id)
-            self.log("Task Details: {0}".format(self.pprint(task_details)), "DEBUG")
+            self.log("Task Details: {0}", "DEBUG", Deferred(self.pprint, task_details))
 
             if task_details.get("endTime") is not None:
                 if task_details.get("isError") is False:
@@ -915,7 +916,7 @@ class DeviceReplacement(DnacBase):
                 }
                 return {"status": "failed", "msg": self.msg}
 
-            self.log("RMA workflow in progress: {0}".format(task_details.get("progress")), "INFO")
+            self.log("RMA workflow in progress: {0}", "INFO", task_details.get("progress"))
             time.sleep(resync_retry_interval)
             resync_retry_count -= 1
 
@@ -959,7 +960,7 @@ class DeviceReplacement(DnacBase):
                 op_modifies=True,
                 params=import_params
             )
-            self.log("Received API response from 'unmark_device_for_replacement': {0}".format(self.pprint(response)), "DEBUG")
+            self.log("Received API response from 'unmark_device_for_replacement': {0}", "DEBUG", Deferred(self.pprint, response))
             task_id = response.get("response", {}).get("taskId")
             task_result = self.check_rma_task_status(
                 task_id,
@@ -995,7 +996,7 @@ class DeviceReplacement(DnacBase):
         for device in devices:
             if device.get("replacementStatus") == "READY-FOR-REPLACEMENT":
                 device_id = device.get("id")
-                self.log("Found ready-for-replacement device with ID: {0}".format(device_id))
+                self.log("Found ready-for-replacement device with ID: {0}", "WARNING", device_id)
                 return device_id
 
         self.log("No devices found with status 'READY-FOR-REPLACEMENT'.")
@@ -1110,9 +1111,9 @@ class DeviceReplacement(DnacBase):
             for device in devices:
                 if device.get("id") == self.have.get("device_replacement_id"):
                     replacement_status = device
-            self.log("Replacement status: {0}".format(self.pprint(replacement_status)), "INFO")
+            self.log("Replacement status: {0}", "INFO", Deferred(self.pprint, replacement_status))
         except Exception as e:
-            self.log("Error getting replacement status: {0}".format(str(e)), "ERROR")
+            self.log("Error getting replacement status: {0}", "ERROR", e)
 
         return self
 
@@ -1134,8 +1135,23 @@ def main():
         "dnac_log_file_path": {"type": 'str', "default": 'dnac.log'},
         'config_verify': {'type': 'bool', "default": False},
         "dnac_log_append": {"type": 'bool', "default": True},
+        "dnac_log_max_bytes": {"type": 'int', "default": 0},
+        "dnac_log_backup_count": {"type": 'int', "default": 5},
+        "dnac_log_compress": {"type": 'bool', "default": False},
+        "dnac_log_format": {"type": 'str', "default": 'text', "choices": ['text', 'json']},
         'dnac_api_task_timeout': {'type': 'int', "default": 1200},
         'dnac_task_poll_interval': {'type': 'int', "default": 2},
+        'dnac_token_cache': {'type': 'bool', 'default': False},
+        'dnac_rate_limit': {'type': 'float', 'default': 0},
+        'dnac_rate_limit_per_family': {'type': 'bool', 'default': False},
+        'dnac_rate_limit_retries': {'type': 'int', 'default': 5},
+        'dnac_shared_rate_limit': {'type': 'float', 'default': 0},
+        'dnac_shared_family_concurrency': {'type': 'int', 'default': 0},
+        'dnac_memoize_reads': {'type': 'bool', 'default': False},
+        'dnac_metrics': {'type': 'bool', 'default': False},
+        'dnac_metrics_file': {'type': 'str'},
+        'dnac_timings': {'type': 'bool', 'default': False},
+        'dnac_timings_file': {'type': 'str'},
         'resync_retry_count': {'type': 'int', 'default': 1000},
         'resync_retry_interval': {'type': 'int', 'default': 30},
         'ccc_poll_interval': {'type': 'int', 'default': 2},
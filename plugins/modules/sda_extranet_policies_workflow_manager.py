@@ -508,7 +508,7 @@ class SDAExtranetPolicies(DnacBase):
                 op_modifies=True,
                 params={"name": site_name},
             )
-            self.log("Response received post 'get_site' API call: {0}".format(str(response)), "DEBUG")
+            self.log("Response received post 'get_site' API call: {0}", "DEBUG", response)
 
             # Process the response if available
             if response["response"]:
@@ -520,7 +520,7 @@ class SDAExtranetPolicies(DnacBase):
 
         except Exception as e:
             # Log an error message and fail if an exception occurs
-            self.log("An error occurred while retrieving site details for Site '{0}' using 'get_site' API call: {1}".format(site_name, str(e)), "ERROR")
+            self.log("An error occurred while retrieving site details for Site '{0}' using 'get_site' API call: {1}", "ERROR", site_name, e)
 
         if not site_exists:
             self.msg = "An error occurred while retrieving site details for Site '{0}'. Please verify that the site exists.".format(site_name)
@@ -575,7 +575,7 @@ class SDAExtranetPolicies(DnacBase):
                 op_modifies=True,
                 params={"siteId": site_id},
             )
-            self.log("Response received post SDA - 'get_fabric_sites' API call: {0}".format(str(response)), "DEBUG")
+            self.log("Response received post SDA - 'get_fabric_sites' API call: {0}", "DEBUG", response)
 
             # Process the response if available
             if response["response"]:
@@ -611,9 +611,9 @@ class SDAExtranetPolicies(DnacBase):
             site_id = site_info["site_id"]
             # Get the fabric ID using the site name and site ID
             fabric_id = self.get_fabric_sites(site_name, site_id)
-            self.log("Fabric Id: {0} collected for the fabric_site: {1} with siteId: {2}".format(fabric_id, site_name, site_id))
+            self.log("Fabric Id: {0} collected for the fabric_site: {1} with siteId: {2}", "WARNING", fabric_id, site_name, site_id)
             site_info["fabric_id"] = fabric_id
-        self.log("Updated 'site_details' with the fabric_ids of each site.  {0}".format(site_details))
+        self.log("Updated 'site_details' with the fabric_ids of each site.  {0}", "WARNING", site_details)
         return site_details
 
     def get_extranet_policies(self, extranet_policy_name):
@@ -637,7 +637,7 @@ class SDAExtranetPolicies(DnacBase):
                 op_modifies=True,
                 params={"extranetPolicyName": extranet_policy_name},
             )
-            self.log("Response received post SDA - 'get_extranet_policies' API call: {0}".format(str(response)), "DEBUG")
+            self.log("Response received post SDA - 'get_extranet_policies' API call: {0}", "DEBUG", response)
 
             # Process the response if available
             if response.get("response"):
@@ -736,7 +736,7 @@ class SDAExtranetPolicies(DnacBase):
                 op_modifies=True,
             )
             self.log("Response received post 'get_task_by_id' API Call for the Task {0} with Task id {1} "
-                     "is {2}".format(task_name, str(task_id), str(response)), "DEBUG")
+                     "is {2}", "DEBUG", task_name, task_id, response)
 
             if response["response"]:
                 response = response["response"]
@@ -771,12 +771,12 @@ class SDAExtranetPolicies(DnacBase):
                 op_modifies=True,
                 params={"payload": [add_extranet_policy_params]},
             )
-            self.log("Response received post SDA - 'add_extranet_policy' API call: {0}".format(str(response)), "DEBUG")
+            self.log("Response received post SDA - 'add_extranet_policy' API call: {0}", "DEBUG", response)
 
             # Process the response if available
             if response["response"]:
                 self.result.update(dict(response=response["response"]))
-                self.log("Task Id for the 'add_extranet_policy' task  is {0}".format(response["response"].get("taskId")), "INFO")
+                self.log("Task Id for the 'add_extranet_policy' task  is {0}", "INFO", response["response"].get("taskId"))
                 # Return the task ID
                 return response["response"].get("taskId")
             else:
@@ -871,12 +871,12 @@ class SDAExtranetPolicies(DnacBase):
                 op_modifies=True,
                 params={"payload": [update_extranet_policy_params]},
             )
-            self.log("Response received post SDA - 'update_extranet_policy' API call: {0}".format(str(response)), "DEBUG")
+            self.log("Response received post SDA - 'update_extranet_policy' API call: {0}", "DEBUG", response)
 
             # Process the response if available
             if response["response"]:
                 self.result.update(dict(response=response["response"]))
-                self.log("Task Id for the 'update_extranet_policy' task  is {0}".format(response["response"].get("taskId")), "INFO")
+                self.log("Task Id for the 'update_extranet_policy' task  is {0}", "INFO", response["response"].get("taskId"))
                 # Return the task ID
                 return response["response"].get("taskId")
             else:
@@ -973,12 +973,12 @@ class SDAExtranetPolicies(DnacBase):
                 op_modifies=True,
                 params=delete_extranet_policy_params,
             )
-            self.log("Response received post SDA - 'delete_extranet_policy_by_id' API call: {0}".format(str(response)), "DEBUG")
+            self.log("Response received post SDA - 'delete_extranet_policy_by_id' API call: {0}", "DEBUG", response)
 
             # Process the response if available
             if response["response"]:
                 self.result.update(dict(response=response["response"]))
-                self.log("Task Id for the 'delete_extranet_policy_by_id' task  is {0}".format(response["response"].get("taskId")), "INFO")
+                self.log("Task Id for the 'delete_extranet_policy_by_id' task  is {0}", "INFO", response["response"].get("taskId"))
                 # Return the task ID
                 return response["response"].get("taskId")
             else:
@@ -1074,14 +1074,14 @@ class SDAExtranetPolicies(DnacBase):
         # check if given site exits, if exists store current site info
         (extranet_policy_exists, extranet_policy_id, extranet_policy_details) = self.validate_extranet_policy_exists(config)
 
-        self.log("Current Extranet Policy details (have): {0}".format(str(extranet_policy_details)), "DEBUG")
+        self.log("Current Extranet Policy details (have): {0}", "DEBUG", extranet_policy_details)
 
         have["extranet_policy_exists"] = extranet_policy_exists
         have["extranet_policy_id"] = extranet_policy_id
         have["current_extranet_policy"] = extranet_policy_details
 
         self.have = have
-        self.log("Current State (have): {0}".format(str(self.have)), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
 
         return self
 
@@ -1105,7 +1105,7 @@ class SDAExtranetPolicies(DnacBase):
         want = {}
         site_details = {}
 
-        self.log("Creating Parameters for API Calls with state: {0}".format(state))
+        self.log("Creating Parameters for API Calls with state: {0}", "WARNING", state)
 
         # Identify if policy already exists or needs to be created
         extranet_policy_name = config.get("extranet_policy_name")
@@ -1117,16 +1117,15 @@ class SDAExtranetPolicies(DnacBase):
             self.validate_merged_parameters(config)
             fabric_sites = config.get("fabric_sites")
             if fabric_sites:
-                self.log("Attempting to get the 'SiteId' for the provided fabric sites: {0}".format(fabric_sites), "DEBUG")
+                self.log("Attempting to get the 'SiteId' for the provided fabric sites: {0}", "DEBUG", fabric_sites)
                 site_details = self.get_site_details(fabric_sites)
-                self.log("Attempting to get the fabric 'Id' for the provided fabric sites: {0}".format(fabric_sites), "DEBUG")
+                self.log("Attempting to get the fabric 'Id' for the provided fabric sites: {0}", "DEBUG", fabric_sites)
                 site_details = self.get_fabric_sites_ids(site_details)
 
             if extranet_policy_exists:
                 self.log(
                     "Extranet Policy - '{0}' exists in the Cisco Catalyst Center, "
-                    "therefore setting 'update_extranet_policy_params'.".format(extranet_policy_name),
-                    "DEBUG"
+                    "therefore setting 'update_extranet_policy_params'.", "DEBUG", extranet_policy_name
                 )
                 want = dict(update_extranet_policy_params=self.get_update_extranet_policy_params(config, extranet_policy_id, site_details))
                 if self.compare_extranet_policies(extranet_policy_details, want["update_extranet_policy_params"]):
@@ -1140,16 +1139,14 @@ class SDAExtranetPolicies(DnacBase):
             else:
                 self.log(
                     "Extranet Policy - '{0}' does not exist in the Cisco Catalyst Center, "
-                    "therefore setting 'add_extranet_policy_params'.".format(extranet_policy_name),
-                    "DEBUG"
+                    "therefore setting 'add_extranet_policy_params'.", "DEBUG", extranet_policy_name
                 )
                 want = dict(add_extranet_policy_params=self.get_add_extranet_policy_params(config, site_details))
         else:
             if extranet_policy_exists:
                 self.log(
                     "State is delete and Extranet Policy - '{0}' exists in the Cisco Catalyst Center, "
-                    "therefore setting 'delete_extranet_policy_params'.".format(extranet_policy_name),
-                    "DEBUG"
+                    "therefore setting 'delete_extranet_policy_params'.", "DEBUG", extranet_policy_name
                 )
                 want = dict(extranet_policy_name=extranet_policy_name,
                             delete_extranet_policy_params=self.get_delete_extranet_policy_params(extranet_policy_id))
@@ -1163,7 +1160,7 @@ class SDAExtranetPolicies(DnacBase):
                 return self
 
         self.want = want
-        self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+        self.log("Desired State (want): {0}", "INFO", self.want)
         return self
 
     def get_diff_merged(self):
@@ -1238,32 +1235,30 @@ class SDAExtranetPolicies(DnacBase):
         extranet_policy_name = config.get("extranet_policy_name")
 
         if desired_state.get("add_extranet_policy_params"):
-            self.log("State before performing ADD Extranet Policy operation: {0}".format(str(pre_operation_state)), "INFO")
-            self.log("Desired State: {}".format(str(desired_state)), "INFO")
-            self.log("State after performing ADD Extranet Policy operation: {0}".format(str(post_operation_state)), "INFO")
+            self.log("State before performing ADD Extranet Policy operation: {0}", "INFO", pre_operation_state)
+            self.log("Desired State: {}", "INFO", desired_state)
+            self.log("State after performing ADD Extranet Policy operation: {0}", "INFO", post_operation_state)
 
             if post_operation_state["extranet_policy_exists"]:
-                self.log("Verified the success of ADD Extranet Policy - '{0}' operation.".format(extranet_policy_name), "INFO")
+                self.log("Verified the success of ADD Extranet Policy - '{0}' operation.", "INFO", extranet_policy_name)
             else:
                 self.log(
                     "The ADD Extranet Policy - '{0}' operation may not have been successful "
-                    "since the Extranet Policy does not exist in the Cisco Catalyst Center.".format(extranet_policy_name),
-                    "WARNING"
+                    "since the Extranet Policy does not exist in the Cisco Catalyst Center.", "WARNING", extranet_policy_name
                 )
 
         if self.want.get("update_extranet_policy_params"):
-            self.log("State before performing UPDATE Extranet Policy operation: {0}".format(str(pre_operation_state)), "INFO")
-            self.log("Desired State: {}".format(str(desired_state)), "INFO")
-            self.log("State after performing UPDATE Extranet Policy operation - '{0}'".format(str(post_operation_state)), "INFO")
+            self.log("State before performing UPDATE Extranet Policy operation: {0}", "INFO", pre_operation_state)
+            self.log("Desired State: {}", "INFO", desired_state)
+            self.log("State after performing UPDATE Extranet Policy operation - '{0}'", "INFO", post_operation_state)
 
             if not self.compare_extranet_policies(pre_operation_state["current_extranet_policy"], post_operation_state["current_extranet_policy"]):
-                self.log("Verified the success of UPDATE Extranet Policy - '{0}' operation.".format(extranet_policy_name), "INFO")
+                self.log("Verified the success of UPDATE Extranet Policy - '{0}' operation.", "INFO", extranet_policy_name)
             else:
                 self.log(
                     "The UPDATE Extranet Policy - '{0}' operation may not have been performed or "
                     "may not have been successful because no change was detected in the Extranet Policy "
-                    "in the Cisco Catalyst Center".format(extranet_policy_name),
-                    "WARNING"
+                    "in the Cisco Catalyst Center", "WARNING", extranet_policy_name
                 )
         return self
 
@@ -1287,17 +1282,16 @@ class SDAExtranetPolicies(DnacBase):
         post_operation_state = self.have.copy()
         extranet_policy_name = config.get("extranet_policy_name")
 
-        self.log("State before performing DELETE Extranet Policy operation: {0}".format(str(pre_operation_state)), "INFO")
-        self.log("Desired State: {}".format(str(desired_state)), "INFO")
-        self.log("State after performing DELETE Extranet Policy operation: {0}".format(str(post_operation_state)), "INFO")
+        self.log("State before performing DELETE Extranet Policy operation: {0}", "INFO", pre_operation_state)
+        self.log("Desired State: {}", "INFO", desired_state)
+        self.log("State after performing DELETE Extranet Policy operation: {0}", "INFO", post_operation_state)
 
         if not post_operation_state["extranet_policy_exists"]:
-            self.log("Verified the success of DELETE Extranet Policy - '{0}' operation".format(extranet_policy_name), "INFO")
+            self.log("Verified the success of DELETE Extranet Policy - '{0}' operation", "INFO", extranet_policy_name)
         else:
             self.log(
                 "The DELETE Extranet Policy - '{0}' operation may not have been successful since "
-                "the policy still exists in the Cisco Catalyst Center.".format(extranet_policy_name),
-                "WARNING"
+                "the policy still exists in the Cisco Catalyst Center.", "WARNING", extranet_policy_name
             )
         return self
 
@@ -1316,11 +1310,26 @@ def main():
                     "dnac_log_level": {"type": "str", "default": "WARNING"},
                     "dnac_log_file_path": {"type": "str", "default": "dnac.log"},
                     "dnac_log_append": {"type": "bool", "default": True},
+                    "dnac_log_max_bytes": {"type": "int", "default": 0},
+                    "dnac_log_backup_count": {"type": "int", "default": 5},
+                    "dnac_log_compress": {"type": "bool", "default": False},
+                    "dnac_log_format": {"type": "str", "default": "text", "choices": ["text", "json"]},
                     "dnac_log": {"type": "bool", "default": False},
                     "validate_response_schema": {"type": "bool", "default": True},
                     "config_verify": {"type": "bool", "default": False},
                     "dnac_api_task_timeout": {"type": "int", "default": 1200},
                     "dnac_task_poll_interval": {"type": "int", "default": 2},
+                    "dnac_token_cache": {"type": "bool", "default": False},
+                    "dnac_rate_limit": {"type": "float", "default": 0},
+                    "dnac_rate_limit_per_family": {"type": "bool", "default": False},
+                    "dnac_rate_limit_retries": {"type": "int", "default": 5},
+                    "dnac_shared_rate_limit": {"type": "float", "default": 0},
+                    "dnac_shared_family_concurrency": {"type": "int", "default": 0},
+                    "dnac_memoize_reads": {"type": "bool", "default": False},
+                    "dnac_metrics": {"type": "bool", "default": False},
+                    "dnac_metrics_file": {"type": "str"},
+                    "dnac_timings": {"type": "bool", "default": False},
+                    "dnac_timings_file": {"type": "str"},
                     "config": {"required": True, "type": "list", "elements": "dict"},
                     'state': {'default': 'merged', 'choices': ['merged', 'deleted']}
                     }
@@ -461,7 +461,7 @@ class DnacSite(DnacBase):
             siteId=site[0].get("id")
         )
 
-        self.log("Current site details: {0}".format(str(current_site)), "INFO")
+        self.log("Current site details: {0}", "INFO", current_site)
 
         return current_site
 
@@ -496,14 +496,13 @@ class DnacSite(DnacBase):
             )
 
         except Exception as e:
-            self.log("The provided site name '{0}' is either invalid or not present in the Cisco Catalyst Center."
-                     .format(self.want.get("site_name")), "WARNING")
+            self.log("The provided site name '{0}' is either invalid or not present in the Cisco Catalyst Center.", "WARNING", self.want.get("site_name"))
         if response:
             response = response.get("response")
-            self.log("Received API response from 'get_site': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'get_site': {0}", "DEBUG", response)
             current_site = self.get_current_site(response)
             site_exists = True
-            self.log("Site '{0}' exists in Cisco Catalyst Center".format(self.want.get("site_name")), "INFO")
+            self.log("Site '{0}' exists in Cisco Catalyst Center", "INFO", self.want.get("site_name"))
 
         return (site_exists, current_site)
 
@@ -563,13 +562,13 @@ class DnacSite(DnacBase):
             try:
                 site_info["floor"]["rfModel"] = floor_details.get("rf_model")
             except Exception as e:
-                self.log("The attribute 'rf_model' is missing in floor '{0}'.".format(floor_details.get('name')), "WARNING")
+                self.log("The attribute 'rf_model' is missing in floor '{0}'.", "WARNING", floor_details.get('name'))
 
         site_params = dict(
             type=typeinfo,
             site=site_info,
         )
-        self.log("Site parameters: {0}".format(str(site_params)), "DEBUG")
+        self.log("Site parameters: {0}", "DEBUG", site_params)
 
         return site_params
 
@@ -591,7 +590,7 @@ class DnacSite(DnacBase):
         parent_name = site.get("site").get(site_type).get("parent_name")
         name = site.get("site").get(site_type).get("name")
         site_name = '/'.join([parent_name, name])
-        self.log("Site name: {0}".format(site_name), "INFO")
+        self.log("Site name: {0}", "INFO", site_name)
 
         return site_name
 
@@ -700,8 +699,8 @@ class DnacSite(DnacBase):
         type = self.have['current_site']['type']
         updated_site = self.have['current_site']['site'][type]
         requested_site = self.want['site_params']['site'][type]
-        self.log("Current Site type: {0}".format(str(updated_site)), "INFO")
-        self.log("Requested Site type: {0}".format(str(requested_site)), "INFO")
+        self.log("Current Site type: {0}", "INFO", updated_site)
+        self.log("Requested Site type: {0}", "INFO", requested_site)
 
         if type == "building":
             return not self.is_building_updated(updated_site, requested_site)
@@ -733,7 +732,7 @@ class DnacSite(DnacBase):
         # check if given site exits, if exists store current site info
         (site_exists, current_site) = self.site_exists()
 
-        self.log("Current Site details (have): {0}".format(str(current_site)), "DEBUG")
+        self.log("Current Site details (have): {0}", "DEBUG", current_site)
 
         if site_exists:
             have["site_id"] = current_site.get("siteId")
@@ -741,7 +740,7 @@ class DnacSite(DnacBase):
             have["current_site"] = current_site
 
         self.have = have
-        self.log("Current State (have): {0}".format(str(self.have)), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
 
         return self
 
@@ -766,7 +765,7 @@ class DnacSite(DnacBase):
             site_name=self.get_site_name(config),
         )
         self.want = want
-        self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+        self.log("Desired State (want): {0}", "INFO", self.want)
 
         return self
 
@@ -804,13 +803,13 @@ class DnacSite(DnacBase):
                     op_modifies=True,
                     params=site_params,
                 )
-                self.log("Received API response from 'update_site': {0}".format(str(response)), "DEBUG")
+                self.log("Received API response from 'update_site': {0}", "DEBUG", response)
                 site_updated = True
 
             else:
                 # Site does not neet update
                 self.update_not_neeeded_sites.append(site_name)
-                self.log("Site - {0} does not need any update".format(site_name), "INFO")
+                self.log("Site - {0} does not need any update", "INFO", site_name)
                 return self
 
         else:
@@ -827,7 +826,7 @@ class DnacSite(DnacBase):
                 site_type = site_params['type']
                 name = site_params['site'][site_type]['name']
                 self.log("""The site '{0}' is not categorized as a building; hence, there is no need to filter out 'None'
-                            values from the 'site_params' dictionary.""".format(name), "INFO")
+                            values from the 'site_params' dictionary.""", "INFO", name)
 
             response = self.dnac._exec(
                 family="sites",
@@ -835,7 +834,7 @@ class DnacSite(DnacBase):
                 op_modifies=True,
                 params=site_params,
             )
-            self.log("Received API response from 'create_site': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'create_site': {0}", "DEBUG", response)
             site_created = True
 
         if site_created or site_updated:
@@ -854,14 +853,14 @@ class DnacSite(DnacBase):
 
                 if site_updated:
                     self.updated_site_list.append(site_name)
-                    self.log("Site - {0} Updated Successfully".format(site_name), "INFO")
+                    self.log("Site - {0} Updated Successfully", "INFO", site_name)
                 else:
                     # Get the site id of the newly created site.
                     (site_exists, current_site) = self.site_exists()
 
                     if site_exists:
                         self.created_site_list.append(site_name)
-                        self.log("Site '{0}' created successfully".format(site_name), "INFO")
+                        self.log("Site '{0}' created successfully", "INFO", site_name)
 
         return self
 
@@ -890,7 +889,7 @@ class DnacSite(DnacBase):
             )
 
             if response and isinstance(response, dict):
-                self.log("Received API response from 'delete_site': {0}".format(str(response)), "DEBUG")
+                self.log("Received API response from 'delete_site': {0}", "DEBUG", response)
                 executionid = response.get("executionId")
 
                 while True:
@@ -898,10 +897,10 @@ class DnacSite(DnacBase):
                     if execution_details.get("status") == "SUCCESS":
                         self.status = "success"
                         self.deleted_site_list.append(site_name)
-                        self.log("Site '{0}' deleted successfully".format(site_name), "INFO")
+                        self.log("Site '{0}' deleted successfully", "INFO", site_name)
                         break
                     elif execution_details.get("bapiError"):
-                        self.log("Error response for 'delete_site' execution: {0}".format(execution_details.get("bapiError")), "ERROR")
+                        self.log("Error response for 'delete_site' execution: {0}", "ERROR", execution_details.get("bapiError"))
                         self.module.fail_json(msg=execution_details.get("bapiError"), response=execution_details)
                         break
 
@@ -935,7 +934,7 @@ class DnacSite(DnacBase):
         if not site_exists:
             self.status = "success"
             self.site_absent_list.append(site_name)
-            self.log("Unable to delete site '{0}' as it's not found in Cisco Catalyst Center".format(site_name), "INFO")
+            self.log("Unable to delete site '{0}' as it's not found in Cisco Catalyst Center", "INFO", site_name)
             return self
 
         # Check here if the site have the childs then fetch it using get membership API and then sort it
@@ -947,9 +946,9 @@ class DnacSite(DnacBase):
             op_modifies=True,
             params={"site_id": site_id},
         )
-        self.log("Received API response from 'get_membership': {0}".format(str(mem_response)), "DEBUG")
+        self.log("Received API response from 'get_membership': {0}", "DEBUG", mem_response)
         site_response = mem_response.get("site").get("response")
-        self.log("Site {0} response along with it's child sites: {1}".format(site_name, str(site_response)), "DEBUG")
+        self.log("Site {0} response along with it's child sites: {1}", "DEBUG", site_name, site_response)
 
         if len(site_response) == 0:
             self.delete_single_site(site_id, site_name)
@@ -964,7 +963,7 @@ class DnacSite(DnacBase):
 
         # Delete the final parent site
         self.delete_single_site(site_id, site_name)
-        self.log("The site '{0}' and its child sites have been deleted successfully".format(site_name), "INFO")
+        self.log("The site '{0}' and its child sites have been deleted successfully", "INFO", site_name)
 
         return self
 
@@ -983,8 +982,8 @@ class DnacSite(DnacBase):
         """
 
         self.get_have(config)
-        self.log("Current State (have): {0}".format(str(self.have)), "INFO")
-        self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
+        self.log("Desired State (want): {0}", "INFO", self.want)
 
         # Code to validate dnac config for merged state
         site_exist = self.have.get("site_exists")
@@ -998,12 +997,12 @@ class DnacSite(DnacBase):
         require_update = self.site_requires_update()
 
         if not require_update:
-            self.log("The update for site '{0}' has been successfully verified.".format(site_name), "INFO")
+            self.log("The update for site '{0}' has been successfully verified.", "INFO", site_name)
             self. status = "success"
             return self
 
         self.log("""The playbook input for site '{0}' does not align with the Cisco Catalyst Center, indicating that the merge task
-                 may not have executed successfully.""".format(site_name), "INFO")
+                 may not have executed successfully.""", "INFO", site_name)
 
         return self
 
@@ -1021,8 +1020,8 @@ class DnacSite(DnacBase):
         """
 
         self.get_have(config)
-        self.log("Current State (have): {0}".format(str(self.have)), "INFO")
-        self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
+        self.log("Desired State (want): {0}", "INFO", self.want)
 
         # Code to validate dnac config for delete state
         site_exist = self.have.get("site_exists")
@@ -1034,7 +1033,7 @@ class DnacSite(DnacBase):
             self.log(msg, "INFO")
             return self
         self.log("""Mismatch between the playbook input for site '{0}' and the Cisco Catalyst Center indicates that
-                 the deletion was not executed successfully.""".format(self.want.get("site_name")), "INFO")
+                 the deletion was not executed successfully.""", "INFO", self.want.get("site_name"))
 
         return self
 
@@ -1110,11 +1109,26 @@ def main():
                     'dnac_log_level': {'type': 'str', 'default': 'WARNING'},
                     "dnac_log_file_path": {"type": 'str', "default": 'dnac.log'},
                     "dnac_log_append": {"type": 'bool', "default": True},
+                    "dnac_log_max_bytes": {"type": 'int', "default": 0},
+                    "dnac_log_backup_count": {"type": 'int', "default": 5},
+                    "dnac_log_compress": {"type": 'bool', "default": False},
+                    "dnac_log_format": {"type": 'str', "default": 'text', "choices": ['text', 'json']},
                     'dnac_log': {'type': 'bool', 'default': False},
                     'validate_response_schema': {'type': 'bool', 'default': True},
                     'config_verify': {'type': 'bool', "default": False},
                     'dnac_api_task_timeout': {'type': 'int', "default": 1200},
                     'dnac_task_poll_interval': {'type': 'int', "default": 2},
+                    'dnac_token_cache': {'type': 'bool', 'default': False},
+                    'dnac_rate_limit': {'type': 'float', 'default': 0},
+                    'dnac_rate_limit_per_family': {'type': 'bool', 'default': False},
+                    'dnac_rate_limit_retries': {'type': 'int', 'default': 5},
+                    'dnac_shared_rate_limit': {'type': 'float', 'default': 0},
+                    'dnac_shared_family_concurrency': {'type': 'int', 'default': 0},
+                    'dnac_memoize_reads': {'type': 'bool', 'default': False},
+                    'dnac_metrics': {'type': 'bool', 'default': False},
+                    'dnac_metrics_file': {'type': 'str'},
+                    'dnac_timings': {'type': 'bool', 'default': False},
+                    'dnac_timings_file': {'type': 'str'},
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'merged', 'choices': ['merged', 'deleted']}
                     }
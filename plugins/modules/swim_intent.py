@@ -592,7 +592,7 @@ class DnacSwims(DnacBase):
             self.module.fail_json(msg=self.msg)
 
         if response:
-            self.log("Received API response from 'get_site': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'get_site': {0}", "DEBUG", response)
             site = response.get("response")
             site_id = site[0].get("id")
             site_exists = True
@@ -621,12 +621,12 @@ class DnacSwims(DnacBase):
             op_modifies=True,
             params={"image_name": name},
         )
-        self.log("Received API response from 'get_software_image_details': {0}".format(str(image_response)), "DEBUG")
+        self.log("Received API response from 'get_software_image_details': {0}", "DEBUG", image_response)
         image_list = image_response.get("response")
 
         if (len(image_list) == 1):
             image_id = image_list[0].get("imageUuid")
-            self.log("SWIM image '{0}' has the ID: {1}".format(name, image_id), "INFO")
+            self.log("SWIM image '{0}' has the ID: {1}", "INFO", name, image_id)
         else:
             error_message = "SWIM image '{0}' could not be found".format(name)
             self.log(error_message, "ERROR")
@@ -656,12 +656,12 @@ class DnacSwims(DnacBase):
             op_modifies=True,
             params={"image_uuid": image_id},
         )
-        self.log("Received API response from 'get_software_image_details': {0}".format(str(image_response)), "DEBUG")
+        self.log("Received API response from 'get_software_image_details': {0}", "DEBUG", image_response)
         image_list = image_response.get("response")
 
         if (len(image_list) == 1):
             image_name = image_list[0].get("name")
-            self.log("SWIM image '{0}' has been fetched successfully from Cisco Catalyst Center".format(image_name), "INFO")
+            self.log("SWIM image '{0}' has been fetched successfully from Cisco Catalyst Center", "INFO", image_name)
         else:
             error_message = "SWIM image with Id '{0}' could not be found in Cisco Catalyst Center".format(image_id)
             self.log(error_message, "ERROR")
@@ -692,7 +692,7 @@ class DnacSwims(DnacBase):
             op_modifies=True,
             params={"image_name": name},
         )
-        self.log("Received API response from 'get_software_image_details': {0}".format(str(image_response)), "DEBUG")
+        self.log("Received API response from 'get_software_image_details': {0}", "DEBUG", image_response)
         image_list = image_response.get("response")
 
         if (len(image_list) == 1):
@@ -720,12 +720,12 @@ class DnacSwims(DnacBase):
             op_modifies=True,
             params=params,
         )
-        self.log("Received API response from 'get_device_list': {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from 'get_device_list': {0}", "DEBUG", response)
 
         device_list = response.get("response")
         if (len(device_list) == 1):
             device_id = device_list[0].get("id")
-            self.log("Device Id: {0}".format(str(device_id)), "INFO")
+            self.log("Device Id: {0}", "INFO", device_id)
         else:
             self.msg = "Device with params: '{0}' not found in Cisco Catalyst Center so can't fetch the device id".format(str(params))
             self.log(self.msg, "WARNING")
@@ -757,12 +757,12 @@ class DnacSwims(DnacBase):
         (site_exists, site_id) = self.site_exists(site_name)
         if not site_exists:
             self.log("""Site '{0}' is not found in the Cisco Catalyst Center, hence unable to fetch associated
-                        devices.""".format(site_name), "INFO")
+                        devices.""", "INFO", site_name)
             return device_uuid_list
 
         if device_series_name:
             if device_series_name.startswith(".*") and device_series_name.endswith(".*"):
-                self.log("Device series name '{0}' is already in the regex format".format(device_series_name), "INFO")
+                self.log("Device series name '{0}' is already in the regex format", "INFO", device_series_name)
             else:
                 device_series_name = ".*" + device_series_name + ".*"
 
@@ -779,10 +779,10 @@ class DnacSwims(DnacBase):
                 params=site_params,
             )
         except Exception as e:
-            self.log("Unable to fetch the device(s) associated to the site '{0}' due to '{1}'".format(site_name, str(e)), "WARNING")
+            self.log("Unable to fetch the device(s) associated to the site '{0}' due to '{1}'", "WARNING", site_name, e)
             return device_uuid_list
 
-        self.log("Received API response from 'get_membership': {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from 'get_membership': {0}", "DEBUG", response)
         response = response['device']
 
         site_response_list = []
@@ -826,25 +826,25 @@ class DnacSwims(DnacBase):
                 device_response = device_list_response.get('response')
 
                 if not response or not device_response:
-                    self.log("Failed to retrieve devices associated with the site '{0}' due to empty API response.".format(site_name), "INFO")
+                    self.log("Failed to retrieve devices associated with the site '{0}' due to empty API response.", "INFO", site_name)
                     break
 
                 for item in site_response_list:
                     if item["reachabilityStatus"] != "Reachable":
                         self.log("""Device '{0}' is currently '{1}' and cannot be included in the SWIM distribution/activation
-                                    process.""".format(item["managementIpAddress"], item["reachabilityStatus"]), "INFO")
+                                    process.""", "INFO", item["managementIpAddress"], item["reachabilityStatus"])
                         continue
                     self.log("""Device '{0}' from site '{1}' is ready for the SWIM distribution/activation
-                                process.""".format(item["managementIpAddress"], site_name), "INFO")
+                                process.""", "INFO", item["managementIpAddress"], site_name)
                     site_memberships_ids.append(item["instanceUuid"])
 
                 for item in device_response:
                     if item["reachabilityStatus"] != "Reachable":
                         self.log("""Unable to proceed with the device '{0}' for SWIM distribution/activation as its status is
-                                    '{1}'.""".format(item["managementIpAddress"], item["reachabilityStatus"]), "INFO")
+                                    '{1}'.""", "INFO", item["managementIpAddress"], item["reachabilityStatus"])
                         continue
                     self.log("""Device '{0}' matches to the specified filter requirements and is set for SWIM
-                            distribution/activation.""".format(item["managementIpAddress"]), "INFO")
+                            distribution/activation.""", "INFO", item["managementIpAddress"])
                     device_response_ids.append(item["instanceUuid"])
             except Exception as e:
                 self.msg = "An exception occured while fetching the device uuids from Cisco Catalyst Center: {0}".format(str(e))
@@ -852,7 +852,7 @@ class DnacSwims(DnacBase):
                 return device_uuid_list
 
         if not device_response_ids or not site_memberships_ids:
-            self.log("Failed to retrieve devices associated with the site '{0}' due to empty API response.".format(site_name), "INFO")
+            self.log("Failed to retrieve devices associated with the site '{0}' due to empty API response.", "INFO", site_name)
             return device_uuid_list
 
         # Find the intersection of device IDs with the response get from get_membership api and get_device_list api with provided filters
@@ -881,7 +881,7 @@ class DnacSwims(DnacBase):
             family="software_image_management_swim",
             function='get_device_family_identifiers',
         )
-        self.log("Received API response from 'get_device_family_identifiers': {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from 'get_device_family_identifiers': {0}", "DEBUG", response)
         device_family_db = response.get("response")
 
         if device_family_db:
@@ -890,7 +890,7 @@ class DnacSwims(DnacBase):
             if device_family_details:
                 device_family_identifier = device_family_details.get("deviceFamilyIdentifier")
                 have["device_family_identifier"] = device_family_identifier
-                self.log("Family device indentifier: {0}".format(str(device_family_identifier)), "INFO")
+                self.log("Family device indentifier: {0}", "INFO", device_family_identifier)
             else:
                 self.msg = "Device Family: {0} not found".format(str(family_name))
                 self.log(self.msg, "ERROR")
@@ -933,7 +933,7 @@ class DnacSwims(DnacBase):
                 (site_exists, site_id) = self.site_exists(site_name)
                 if site_exists:
                     have["site_id"] = site_id
-                    self.log("Site {0} exists having the site id: {1}".format(site_name, str(site_id)), "DEBUG")
+                    self.log("Site {0} exists having the site id: {1}", "DEBUG", site_name, site_id)
             else:
                 # For global site, use -1 as siteId
                 have["site_id"] = "-1"
@@ -954,7 +954,7 @@ class DnacSwims(DnacBase):
 
                 if site_exists:
                     have["site_id"] = site_id
-                    self.log("Site '{0}' exists and has the site ID: {1}".format(site_name, str(site_id)), "DEBUG")
+                    self.log("Site '{0}' exists and has the site ID: {1}", "DEBUG", site_name, site_id)
 
             # check if image for distributon is available
             if distribution_details.get("image_name"):
@@ -1003,7 +1003,7 @@ class DnacSwims(DnacBase):
                 (site_exists, site_id) = self.site_exists(site_name)
                 if site_exists:
                     have["site_id"] = site_id
-                    self.log("The site '{0}' exists and has the site ID '{1}'".format(site_name, str(site_id)), "INFO")
+                    self.log("The site '{0}' exists and has the site ID '{1}'", "INFO", site_name, site_id)
 
             device_params = dict(
                 hostname=activation_details.get("device_hostname"),
@@ -1016,7 +1016,7 @@ class DnacSwims(DnacBase):
             if device_id is not None:
                 have["activation_device_id"] = device_id
             self.have.update(have)
-            self.log("Current State (have): {0}".format(str(self.have)), "INFO")
+            self.log("Current State (have): {0}", "INFO", self.have)
 
         return self
 
@@ -1045,7 +1045,7 @@ class DnacSwims(DnacBase):
             elif want["import_type"] == "local":
                 want["local_import_details"] = config.get("import_image_details").get("local_image_details")
             else:
-                self.log("The import type '{0}' provided is incorrect. Only 'local' or 'remote' are supported.".format(want["import_type"]), "CRITICAL")
+                self.log("The import type '{0}' provided is incorrect. Only 'local' or 'remote' are supported.", "CRITICAL", want["import_type"])
                 self.module.fail_json(msg="Incorrect import type. Supported Values: local or remote")
 
         want["tagging_details"] = config.get("tagging_details")
@@ -1053,7 +1053,7 @@ class DnacSwims(DnacBase):
         want["activation_details"] = config.get("image_activation_details")
 
         self.want = want
-        self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+        self.log("Desired State (want): {0}", "INFO", self.want)
 
         return self
 
@@ -1145,7 +1145,7 @@ class DnacSwims(DnacBase):
                 op_modifies=True,
                 params=import_params,
             )
-            self.log("Received API response from {0}: {1}".format(import_function, str(response)), "DEBUG")
+            self.log("Received API response from {0}: {1}", "DEBUG", import_function, response)
 
             task_details = {}
             task_id = response.get("response").get("taskId")
@@ -1228,7 +1228,7 @@ class DnacSwims(DnacBase):
             op_modifies=True,
             params=image_params
         )
-        self.log("Received API response from 'get_golden_tag_status_of_an_image': {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from 'get_golden_tag_status_of_an_image': {0}", "DEBUG", response)
 
         response = response.get('response')
         if response:
@@ -1256,7 +1256,7 @@ class DnacSwims(DnacBase):
                 deviceFamilyIdentifier=self.have.get("device_family_identifier"),
                 deviceRole=tagging_details.get("device_role", "ALL").upper()
             )
-            self.log("Parameters for tagging the image as golden: {0}".format(str(image_params)), "INFO")
+            self.log("Parameters for tagging the image as golden: {0}", "INFO", image_params)
 
             response = self.dnac._exec(
                 family="software_image_management_swim",
@@ -1264,10 +1264,10 @@ class DnacSwims(DnacBase):
                 op_modifies=True,
                 params=image_params
             )
-            self.log("Received API response from 'tag_as_golden_image': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'tag_as_golden_image': {0}", "DEBUG", response)
 
         else:
-            self.log("Parameters for un-tagging the image as golden: {0}".format(str(image_params)), "INFO")
+            self.log("Parameters for un-tagging the image as golden: {0}", "INFO", image_params)
 
             response = self.dnac._exec(
                 family="software_image_management_swim",
@@ -1275,7 +1275,7 @@ class DnacSwims(DnacBase):
                 op_modifies=True,
                 params=image_params
             )
-            self.log("Received API response from 'remove_golden_tag_for_image': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'remove_golden_tag_for_image': {0}", "DEBUG", response)
 
         if not response:
             self.status = "failed"
@@ -1343,7 +1343,7 @@ class DnacSwims(DnacBase):
                 op_modifies=True,
                 params={"id": device_id}
             )
-            self.log("Received API response from 'get_device_list': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'get_device_list': {0}", "DEBUG", response)
             response = response.get('response')[0]
             device_ip = response.get("managementIpAddress")
 
@@ -1383,7 +1383,7 @@ class DnacSwims(DnacBase):
                 end_time = time.time()
                 if (end_time - start_time) >= max_timeout:
                     self.log("""Max timeout of {0} sec has reached for the task id '{1}' for the device '{2}' and unexpected
-                                 task status so moving out to next task id""".format(max_timeout, task_id, device_ip), "WARNING")
+                                 task status so moving out to next task id""", "WARNING", max_timeout, task_id, device_ip)
                     device_ips_list.append(device_ip)
                     break
 
@@ -1393,7 +1393,7 @@ class DnacSwims(DnacBase):
                         ("completed successfully" in task_details.get("progress")):
                     self.result['changed'] = True
                     self.status = "success"
-                    self.log("Image {0} successfully for the device '{1}".format(swim_task_name, device_ip), "INFO")
+                    self.log("Image {0} successfully for the device '{1}", "INFO", swim_task_name, device_ip)
                     device_count += 1
                     break
 
@@ -1439,7 +1439,7 @@ class DnacSwims(DnacBase):
                     imageUuid=image_id
                 )]
             )
-            self.log("Distribution Params: {0}".format(str(distribution_params)), "INFO")
+            self.log("Distribution Params: {0}", "INFO", distribution_params)
 
             response = self.dnac._exec(
                 family="software_image_management_swim",
@@ -1447,7 +1447,7 @@ class DnacSwims(DnacBase):
                 op_modifies=True,
                 params=distribution_params,
             )
-            self.log("Received API response from 'trigger_software_image_distribution': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'trigger_software_image_distribution': {0}", "DEBUG", response)
 
             if response:
                 task_details = {}
@@ -1482,7 +1482,7 @@ class DnacSwims(DnacBase):
             self.log(self.msg, "WARNING")
             return self
 
-        self.log("Device UUIDs involved in Image Distribution: {0}".format(str(device_uuid_list)), "INFO")
+        self.log("Device UUIDs involved in Image Distribution: {0}", "INFO", device_uuid_list)
         distribution_task_dict = {}
 
         for device_uuid in device_uuid_list:
@@ -1493,14 +1493,14 @@ class DnacSwims(DnacBase):
                     imageUuid=image_id
                 )]
             )
-            self.log("Distribution Params: {0}".format(str(distribution_params)), "INFO")
+            self.log("Distribution Params: {0}", "INFO", distribution_params)
             response = self.dnac._exec(
                 family="software_image_management_swim",
                 function='trigger_software_image_distribution',
                 op_modifies=True,
                 params=distribution_params,
             )
-            self.log("Received API response from 'trigger_software_image_distribution': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'trigger_software_image_distribution': {0}", "DEBUG", response)
 
             if response:
                 task_details = {}
@@ -1522,7 +1522,7 @@ class DnacSwims(DnacBase):
             self.status = "success"
             self.partial_successful_distribution = False
             self.msg = "Image with Id '{0}' Distributed and partially successfull".format(image_id)
-            self.log("For device(s) {0} image Distribution gets failed".format(str(device_ips_list)), "CRITICAL")
+            self.log("For device(s) {0} image Distribution gets failed", "CRITICAL", device_ips_list)
 
         self.result['msg'] = self.msg
         self.log(self.msg, "INFO")
@@ -1566,7 +1566,7 @@ class DnacSwims(DnacBase):
                 schedule_validate=activation_details.get("scehdule_validate"),
                 payload=payload
             )
-            self.log("Activation Params: {0}".format(str(activation_params)), "INFO")
+            self.log("Activation Params: {0}", "INFO", activation_params)
 
             response = self.dnac._exec(
                 family="software_image_management_swim",
@@ -1574,7 +1574,7 @@ class DnacSwims(DnacBase):
                 op_modifies=True,
                 params=activation_params,
             )
-            self.log("Received API response from 'trigger_software_image_activation': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'trigger_software_image_activation': {0}", "DEBUG", response)
 
             task_details = {}
             task_id = response.get("response").get("taskId")
@@ -1608,7 +1608,7 @@ class DnacSwims(DnacBase):
             self.log(self.msg, "WARNING")
             return self
 
-        self.log("Device UUIDs involved in Image Activation: {0}".format(str(device_uuid_list)), "INFO")
+        self.log("Device UUIDs involved in Image Activation: {0}", "INFO", device_uuid_list)
         activation_task_dict = {}
 
         for device_uuid in device_uuid_list:
@@ -1625,7 +1625,7 @@ class DnacSwims(DnacBase):
                 schedule_validate=activation_details.get("scehdule_validate"),
                 payload=payload
             )
-            self.log("Activation Params: {0}".format(str(activation_params)), "INFO")
+            self.log("Activation Params: {0}", "INFO", activation_params)
 
             response = self.dnac._exec(
                 family="software_image_management_swim",
@@ -1633,7 +1633,7 @@ class DnacSwims(DnacBase):
                 op_modifies=True,
                 params=activation_params,
             )
-            self.log("Received API response from 'trigger_software_image_activation': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'trigger_software_image_activation': {0}", "DEBUG", response)
 
             if response:
                 task_details = {}
@@ -1655,7 +1655,7 @@ class DnacSwims(DnacBase):
             self.status = "success"
             self.partial_successful_activation = True
             self.msg = "Image with Id '{0}' activated and partially successfull".format(image_id)
-            self.log("For Device(s) {0} Image activation gets Failed".format(str(device_ips_list)), "CRITICAL")
+            self.log("For Device(s) {0} Image activation gets Failed", "CRITICAL", device_ips_list)
 
         self.result['msg'] = self.msg
         self.log(self.msg, "INFO")
@@ -1717,7 +1717,7 @@ class DnacSwims(DnacBase):
             self.log(self.msg, "INFO")
         else:
             self.log("""The playbook input for SWIM Image '{0}' does not align with the Cisco Catalyst Center, indicating that image
-                        may not have imported successfully.""".format(name), "INFO")
+                        may not have imported successfully.""", "INFO", name)
 
         return self
 
@@ -1748,7 +1748,7 @@ class DnacSwims(DnacBase):
             device_family_identifier=self.have.get("device_family_identifier"),
             device_role=tagging_details.get("device_role", "ALL").upper()
         )
-        self.log("Parameters for checking the status of image: {0}".format(str(image_params)), "INFO")
+        self.log("Parameters for checking the status of image: {0}", "INFO", image_params)
 
         response = self.dnac._exec(
             family="software_image_management_swim",
@@ -1756,7 +1756,7 @@ class DnacSwims(DnacBase):
             op_modifies=True,
             params=image_params
         )
-        self.log("Received API response from 'get_golden_tag_status_of_an_image': {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from 'get_golden_tag_status_of_an_image': {0}", "DEBUG", response)
 
         response = response.get('response')
         if response:
@@ -1801,7 +1801,7 @@ class DnacSwims(DnacBase):
             else:
                 self.log("""Mismatch between the playbook input for distributing the image to the device with ID '{0}' and the actual state in the
                          Cisco Catalyst Center suggests that the distribution task might not have been executed
-                         successfully.""".format(self.have.get("distribution_device_id")), "INFO")
+                         successfully.""", "INFO", self.have.get("distribution_device_id"))
         elif self.complete_successful_distribution:
             self.msg = """The requested image '{0}', with ID '{1}', has been successfully distributed to all devices within the specified
                      site in the Cisco Catalyst Center.""".format(image_name, image_id)
@@ -1841,7 +1841,7 @@ class DnacSwims(DnacBase):
             else:
                 self.log("""Mismatch between the playbook's input for activating the image '{0}' on the device with ID '{1}' and the actual state in
                          the Cisco Catalyst Center suggests that the activation task might not have been executed
-                         successfully.""".format(image_name, self.have.get("activation_device_id")), "INFO")
+                         successfully.""", "INFO", image_name, self.have.get("activation_device_id"))
         elif self.complete_successful_activation:
             self.msg = """The requested image '{0}', with ID '{1}', has been successfully activated on all devices within the specified site in the
                      Cisco Catalyst Center.""".format(image_name, image_id)
@@ -1872,8 +1872,8 @@ class DnacSwims(DnacBase):
         """
 
         self.get_have()
-        self.log("Current State (have): {0}".format(str(self.have)), "INFO")
-        self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
+        self.log("Desired State (want): {0}", "INFO", self.want)
 
         import_type = self.want.get("import_type")
         if import_type:
@@ -1908,11 +1908,26 @@ def main():
                     'dnac_log_level': {'type': 'str', 'default': 'WARNING'},
                     "dnac_log_file_path": {"type": 'str', "default": 'dnac.log'},
                     "dnac_log_append": {"type": 'bool', "default": True},
+                    "dnac_log_max_bytes": {"type": 'int', "default": 0},
+                    "dnac_log_backup_count": {"type": 'int', "default": 5},
+                    "dnac_log_compress": {"type": 'bool', "default": False},
+                    "dnac_log_format": {"type": 'str', "default": 'text', "choices": ['text', 'json']},
                     'dnac_log': {'type': 'bool', 'default': False},
                     'validate_response_schema': {'type': 'bool', 'default': True},
                     'config_verify': {'type': 'bool', "default": False},
                     'dnac_api_task_timeout': {'type': 'int', "default": 1200},
                     'dnac_task_poll_interval': {'type': 'int', "default": 2},
+                    'dnac_token_cache': {'type': 'bool', 'default': False},
+                    'dnac_rate_limit': {'type': 'float', 'default': 0},
+                    'dnac_rate_limit_per_family': {'type': 'bool', 'default': False},
+                    'dnac_rate_limit_retries': {'type': 'int', 'default': 5},
+                    'dnac_shared_rate_limit': {'type': 'float', 'default': 0},
+                    'dnac_shared_family_concurrency': {'type': 'int', 'default': 0},
+                    'dnac_memoize_reads': {'type': 'bool', 'default': False},
+                    'dnac_metrics': {'type': 'bool', 'default': False},
+                    'dnac_metrics_file': {'type': 'str'},
+                    'dnac_timings': {'type': 'bool', 'default': False},
+                    'dnac_timings_file': {'type': 'str'},
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'merged', 'choices': ['merged']}
                     }
@@ -59,6 +59,8 @@ options:
               file_path:
                 description: Provide the absolute file path needed to import an image from your local system (Eg "/path/to/your/file").
                     Accepted files formats are - .gz,.bin,.img,.tar,.smu,.pie,.aes,.iso,.ova,.tar_gz,.qcow2,.nfvispkg,.zip,.spa,.rpm.
+                    The file is not uploaded when an image with the same MD5 and SHA checksums already exists in Cisco Catalyst Center,
+                    whatever its name. The ID of that image is used instead.
                 type: str
               is_third_party:
                 description: Query parameter to determine if the image is from a third party (optional).
@@ -486,9 +488,11 @@ from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     validate_list_of_dicts,
     get_dict_result,
 )
+from ansible_collections.cisco.dnac.plugins.module_utils.upload import (
+    file_checksums,
+)
 from ansible.module_utils.basic import AnsibleModule
 import os
-import time
 
 
 class Swim(DnacBase):
@@ -578,7 +582,7 @@ class Swim(DnacBase):
             self.module.fail_json(msg=self.msg)
 
         if response:
-            self.log("Received API response from 'get_site': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'get_site': {0}", "DEBUG", response)
             site = response.get("response")
             site_id = site[0].get("id")
             site_exists = True
@@ -607,12 +611,12 @@ class Swim(DnacBase):
             op_modifies=True,
             params={"image_name": name},
         )
-        self.log("Received API response from 'get_software_image_details': {0}".format(str(image_response)), "DEBUG")
+        self.log("Received API response from 'get_software_image_details': {0}", "DEBUG", image_response)
         image_list = image_response.get("response")
 
         if (len(image_list) == 1):
             image_id = image_list[0].get("imageUuid")
-            self.log("SWIM image '{0}' has the ID: {1}".format(name, image_id), "INFO")
+            self.log("SWIM image '{0}' has the ID: {1}", "INFO", name, image_id)
         else:
             error_message = "SWIM image '{0}' could not be found".format(name)
             self.log(error_message, "ERROR")
@@ -642,12 +646,12 @@ class Swim(DnacBase):
             op_modifies=True,
             params={"image_uuid": image_id},
         )
-        self.log("Received API response from 'get_software_image_details': {0}".format(str(image_response)), "DEBUG")
+        self.log("Received API response from 'get_software_image_details': {0}", "DEBUG", image_response)
         image_list = image_response.get("response")
 
         if (len(image_list) == 1):
             image_name = image_list[0].get("name")
-            self.log("SWIM image '{0}' has been fetched successfully from Cisco Catalyst Center".format(image_name), "INFO")
+            self.log("SWIM image '{0}' has been fetched successfully from Cisco Catalyst Center", "INFO", image_name)
         else:
             error_message = "SWIM image with Id '{0}' could not be found in Cisco Catalyst Center".format(image_id)
             self.log(error_message, "ERROR")
@@ -678,7 +682,7 @@ class Swim(DnacBase):
             op_modifies=True,
             params={"image_name": name},
         )
-        self.log("Received API response from 'get_software_image_details': {0}".format(str(image_response)), "DEBUG")
+        self.log("Received API response from 'get_software_image_details': {0}", "DEBUG", image_response)
         image_list = image_response.get("response")
 
         if (len(image_list) == 1):
@@ -686,6 +690,52 @@ class Swim(DnacBase):
 
         return image_exist
 
+    def get_duplicate_image(self, file_path):
+        """
+        Find an image of Cisco Catalyst Center with the same content as a local image file, whatever its name.
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            file_path (str): The path of the local image file.
+        Returns:
+            dict: The details of the matching image, or None when the image is not in Cisco Catalyst Center or
+                  the lookup failed.
+        Description:
+            Only the images of the same size in bytes are requested. The file is read once, in chunks, to compute
+            its MD5 and SHA-512 checksums when there are such images, and an image matches when every checksum
+            reported by Cisco Catalyst Center is equal to the one of the file.
+        """
+
+        try:
+            file_size = os.path.getsize(file_path)
+            image_response = self.dnac._exec(
+                family="software_image_management_swim",
+                function='get_software_image_details',
+                op_modifies=True,
+                params={"image_size_greater_than": file_size - 1, "image_size_lesser_than": file_size + 1},
+            )
+            self.log("Received API response from 'get_software_image_details': {0}", "DEBUG", image_response)
+            image_list = image_response.get("response") or []
+            if not image_list:
+                self.log("No SWIM image of {0} bytes found in the Cisco Catalyst Center", "DEBUG", file_size)
+                return None
+
+            checksums = file_checksums(file_path)
+        except Exception as e:
+            self.log("Unable to look for a duplicate of the image '{0}', it is uploaded: {1}", "WARNING", file_path, e)
+            return None
+
+        self.log("Checksums of the local image '{0}': {1}", "DEBUG", file_path, checksums)
+        for image in image_list:
+            reported = [
+                (image.get("md5Checksum"), checksums["md5"]),
+                (image.get("shaCheckSum"), checksums["sha512"]),
+            ]
+            reported = [(value.lower(), expected) for value, expected in reported if value]
+            if reported and all(value == expected for value, expected in reported):
+                return image
+
+        return None
+
     def get_device_id(self, params):
         """
         Retrieve the unique device ID based on the provided parameters.
@@ -706,12 +756,12 @@ class Swim(DnacBase):
             op_modifies=True,
             params=params,
         )
-        self.log("Received API response from 'get_device_list': {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from 'get_device_list': {0}", "DEBUG", response)
 
         device_list = response.get("response")
         if (len(device_list) == 1):
             device_id = device_list[0].get("id")
-            self.log("Device Id: {0}".format(str(device_id)), "INFO")
+            self.log("Device Id: {0}", "INFO", device_id)
         else:
             self.msg = "Device with params: '{0}' not found in Cisco Catalyst Center so can't fetch the device id".format(str(params))
             self.log(self.msg, "WARNING")
@@ -743,12 +793,12 @@ class Swim(DnacBase):
         (site_exists, site_id) = self.site_exists(site_name)
         if not site_exists:
             self.log("""Site '{0}' is not found in the Cisco Catalyst Center, hence unable to fetch associated
-                        devices.""".format(site_name), "INFO")
+                        devices.""", "INFO", site_name)
             return device_uuid_list
 
         if device_series_name:
             if device_series_name.startswith(".*") and device_series_name.endswith(".*"):
-                self.log("Device series name '{0}' is already in the regex format".format(device_series_name), "INFO")
+                self.log("Device series name '{0}' is already in the regex format", "INFO", device_series_name)
             else:
                 device_series_name = ".*" + device_series_name + ".*"
 
@@ -765,10 +815,10 @@ class Swim(DnacBase):
                 params=site_params,
             )
         except Exception as e:
-            self.log("Unable to fetch the device(s) associated to the site '{0}' due to '{1}'".format(site_name, str(e)), "WARNING")
+            self.log("Unable to fetch the device(s) associated to the site '{0}' due to '{1}'", "WARNING", site_name, e)
             return device_uuid_list
 
-        self.log("Received API response from 'get_membership': {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from 'get_membership': {0}", "DEBUG", response)
         response = response['device']
 
         site_response_list = []
@@ -785,60 +835,36 @@ class Swim(DnacBase):
             'family': device_family,
             'role': device_role
         }
-        offset = 0
-        limit = self.get_device_details_limit()
-        initial_exec = False
         site_memberships_ids, device_response_ids = [], []
 
-        while True:
-            try:
-                if initial_exec:
-                    device_params["limit"] = limit
-                    device_params["offset"] = offset * limit
-                    device_list_response = self.dnac._exec(
-                        family="devices",
-                        function='get_device_list',
-                        params=device_params
-                    )
-                else:
-                    initial_exec = True
-                    device_list_response = self.dnac._exec(
-                        family="devices",
-                        function='get_device_list',
-                        op_modifies=True,
-                        params=device_params,
-                    )
-                offset = offset + 1
-                device_response = device_list_response.get('response')
-
-                if not response or not device_response:
-                    self.log("Failed to retrieve devices associated with the site '{0}' due to empty API response.".format(site_name), "INFO")
-                    break
+        for item in site_response_list:
+            if item["reachabilityStatus"] != "Reachable":
+                self.log("""Device '{0}' is currently '{1}' and cannot be included in the SWIM distribution/activation
+                            process.""", "INFO", item["managementIpAddress"], item["reachabilityStatus"])
+                continue
+            self.log("""Device '{0}' from site '{1}' is ready for the SWIM distribution/activation
+                        process.""", "INFO", item["managementIpAddress"], site_name)
+            site_memberships_ids.append(item["instanceUuid"])
 
-                for item in site_response_list:
-                    if item["reachabilityStatus"] != "Reachable":
-                        self.log("""Device '{0}' is currently '{1}' and cannot be included in the SWIM distribution/activation
-                                    process.""".format(item["managementIpAddress"], item["reachabilityStatus"]), "INFO")
-                        continue
-                    self.log("""Device '{0}' from site '{1}' is ready for the SWIM distribution/activation
-                                process.""".format(item["managementIpAddress"], site_name), "INFO")
-                    site_memberships_ids.append(item["instanceUuid"])
-
-                for item in device_response:
-                    if item["reachabilityStatus"] != "Reachable":
-                        self.log("""Unable to proceed with the device '{0}' for SWIM distribution/activation as its status is
-                                    '{1}'.""".format(item["managementIpAddress"], item["reachabilityStatus"]), "INFO")
-                        continue
-                    self.log("""Device '{0}' matches to the specified filter requirements and is set for SWIM
-                            distribution/activation.""".format(item["managementIpAddress"]), "INFO")
-                    device_response_ids.append(item["instanceUuid"])
-            except Exception as e:
-                self.msg = "An exception occured while fetching the device uuids from Cisco Catalyst Center: {0}".format(str(e))
-                self.log(self.msg, "ERROR")
-                return device_uuid_list
+        try:
+            # The device count ignores the series, family and role, it is only used without them
+            count_function = None if any(device_params.values()) else 'get_device_count'
+            for item in self.paginate(family="devices", function='get_device_list', params=device_params,
+                                      op_modifies=True, count_function=count_function):
+                if item["reachabilityStatus"] != "Reachable":
+                    self.log("""Unable to proceed with the device '{0}' for SWIM distribution/activation as its status is
+                                '{1}'.""", "INFO", item["managementIpAddress"], item["reachabilityStatus"])
+                    continue
+                self.log("""Device '{0}' matches to the specified filter requirements and is set for SWIM
+                        distribution/activation.""", "INFO", item["managementIpAddress"])
+                device_response_ids.append(item["instanceUuid"])
+        except Exception as e:
+            self.msg = "An exception occured while fetching the device uuids from Cisco Catalyst Center: {0}".format(str(e))
+            self.log(self.msg, "ERROR")
+            return device_uuid_list
 
         if not device_response_ids or not site_memberships_ids:
-            self.log("Failed to retrieve devices associated with the site '{0}' due to empty API response.".format(site_name), "INFO")
+            self.log("Failed to retrieve devices associated with the site '{0}' due to empty API response.", "INFO", site_name)
             return device_uuid_list
 
         # Find the intersection of device IDs with the response get from get_membership api and get_device_list api with provided filters
@@ -867,7 +893,7 @@ class Swim(DnacBase):
             family="software_image_management_swim",
             function='get_device_family_identifiers',
         )
-        self.log("Received API response from 'get_device_family_identifiers': {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from 'get_device_family_identifiers': {0}", "DEBUG", response)
         device_family_db = response.get("response")
 
         if device_family_db:
@@ -876,7 +902,7 @@ class Swim(DnacBase):
             if device_family_details:
                 device_family_identifier = device_family_details.get("deviceFamilyIdentifier")
                 have["device_family_identifier"] = device_family_identifier
-                self.log("Family device indentifier: {0}".format(str(device_family_identifier)), "INFO")
+                self.log("Family device indentifier: {0}", "INFO", device_family_identifier)
             else:
                 self.msg = "Device Family: {0} not found".format(str(family_name))
                 self.log(self.msg, "ERROR")
@@ -919,7 +945,7 @@ class Swim(DnacBase):
                 (site_exists, site_id) = self.site_exists(site_name)
                 if site_exists:
                     have["site_id"] = site_id
-                    self.log("Site {0} exists having the site id: {1}".format(site_name, str(site_id)), "DEBUG")
+                    self.log("Site {0} exists having the site id: {1}", "DEBUG", site_name, site_id)
             else:
                 # For global site, use -1 as siteId
                 have["site_id"] = "-1"
@@ -940,7 +966,7 @@ class Swim(DnacBase):
 
                 if site_exists:
                     have["site_id"] = site_id
-                    self.log("Site '{0}' exists and has the site ID: {1}".format(site_name, str(site_id)), "DEBUG")
+                    self.log("Site '{0}' exists and has the site ID: {1}", "DEBUG", site_name, site_id)
 
             # check if image for distributon is available
             if distribution_details.get("image_name"):
@@ -989,7 +1015,7 @@ class Swim(DnacBase):
                 (site_exists, site_id) = self.site_exists(site_name)
                 if site_exists:
                     have["site_id"] = site_id
-                    self.log("The site '{0}' exists and has the site ID '{1}'".format(site_name, str(site_id)), "INFO")
+                    self.log("The site '{0}' exists and has the site ID '{1}'", "INFO", site_name, site_id)
 
             device_params = dict(
                 hostname=activation_details.get("device_hostname"),
@@ -1002,7 +1028,7 @@ class Swim(DnacBase):
             if device_id is not None:
                 have["activation_device_id"] = device_id
             self.have.update(have)
-            self.log("Current State (have): {0}".format(str(self.have)), "INFO")
+            self.log("Current State (have): {0}", "INFO", self.have)
 
         return self
 
@@ -1031,7 +1057,7 @@ class Swim(DnacBase):
             elif want["import_type"] == "local":
                 want["local_import_details"] = config.get("import_image_details").get("local_image_details")
             else:
-                self.log("The import type '{0}' provided is incorrect. Only 'local' or 'remote' are supported.".format(want["import_type"]), "CRITICAL")
+                self.log("The import type '{0}' provided is incorrect. Only 'local' or 'remote' are supported.", "CRITICAL", want["import_type"])
                 self.module.fail_json(msg="Incorrect import type. Supported Values: local or remote")
 
         want["tagging_details"] = config.get("tagging_details")
@@ -1039,7 +1065,7 @@ class Swim(DnacBase):
         want["activation_details"] = config.get("image_activation_details")
 
         self.want = want
-        self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+        self.log("Desired State (want): {0}", "INFO", self.want)
 
         return self
 
@@ -1095,6 +1121,21 @@ class Swim(DnacBase):
                 self.result['changed'] = False
                 return self
 
+            if import_type == "local":
+                # The same binary may already be in the repository under another name, skip its upload
+                duplicate_image = self.get_duplicate_image(image_name)
+                if duplicate_image:
+                    self.have["imported_image_id"] = duplicate_image.get("imageUuid")
+                    self.have["duplicate_image_name"] = duplicate_image.get("name")
+                    self.msg = "Image '{0}' already exists in the Cisco Catalyst Center as '{1}' with the ID: {2}".format(
+                        name, duplicate_image.get("name"), duplicate_image.get("imageUuid"))
+                    self.result['msg'] = self.msg
+                    self.result['response'] = {"imageUuid": duplicate_image.get("imageUuid"), "name": duplicate_image.get("name")}
+                    self.log(self.msg, "INFO")
+                    self.status = "success"
+                    self.result['changed'] = False
+                    return self
+
             if self.want.get("import_type") == "remote":
                 import_payload_dict = {}
                 temp_payload = self.want.get("url_import_details").get("payload")[0]
@@ -1131,7 +1172,7 @@ class Swim(DnacBase):
                 op_modifies=True,
                 params=import_params,
             )
-            self.log("Received API response from {0}: {1}".format(import_function, str(response)), "DEBUG")
+            self.log("Received API response from {0}: {1}", "DEBUG", import_function, response)
 
             task_details = {}
             task_id = response.get("response").get("taskId")
@@ -1214,7 +1255,7 @@ class Swim(DnacBase):
             op_modifies=True,
             params=image_params
         )
-        self.log("Received API response from 'get_golden_tag_status_of_an_image': {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from 'get_golden_tag_status_of_an_image': {0}", "DEBUG", response)
 
         response = response.get('response')
         if response:
@@ -1242,7 +1283,7 @@ class Swim(DnacBase):
                 deviceFamilyIdentifier=self.have.get("device_family_identifier"),
                 deviceRole=tagging_details.get("device_role", "ALL").upper()
             )
-            self.log("Parameters for tagging the image as golden: {0}".format(str(image_params)), "INFO")
+            self.log("Parameters for tagging the image as golden: {0}", "INFO", image_params)
 
             response = self.dnac._exec(
                 family="software_image_management_swim",
@@ -1250,10 +1291,10 @@ class Swim(DnacBase):
                 op_modifies=True,
                 params=image_params
             )
-            self.log("Received API response from 'tag_as_golden_image': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'tag_as_golden_image': {0}", "DEBUG", response)
 
         else:
-            self.log("Parameters for un-tagging the image as golden: {0}".format(str(image_params)), "INFO")
+            self.log("Parameters for un-tagging the image as golden: {0}", "INFO", image_params)
 
             response = self.dnac._exec(
                 family="software_image_management_swim",
@@ -1261,7 +1302,7 @@ class Swim(DnacBase):
                 op_modifies=True,
                 params=image_params
             )
-            self.log("Received API response from 'remove_golden_tag_for_image': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'remove_golden_tag_for_image': {0}", "DEBUG", response)
 
         if not response:
             self.status = "failed"
@@ -1329,7 +1370,7 @@ class Swim(DnacBase):
                 op_modifies=True,
                 params={"id": device_id}
             )
-            self.log("Received API response from 'get_device_list': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'get_device_list': {0}", "DEBUG", response)
             response = response.get('response')[0]
             device_ip = response.get("managementIpAddress")
 
@@ -1360,37 +1401,32 @@ class Swim(DnacBase):
 
         device_ips_list = []
         device_count = 0
+        max_timeout = self.params.get('dnac_api_task_timeout')
+
+        # Track the tasks of all the devices together, each one is reported as soon as it finishes
+        swim_task_results = self.iter_task_results(
+            swim_task_dict,
+            is_success=lambda task_details: "completed successfully" in ((task_details or {}).get("progress") or ""),
+            is_failure=lambda task_details: bool((task_details or {}).get("isError")),
+            timeout=max_timeout,
+        )
 
-        for device_ip, task_id in swim_task_dict.items():
-            start_time = time.time()
-
-            while (True):
-                end_time = time.time()
-                max_timeout = self.params.get('dnac_api_task_timeout')
-
-                if (end_time - start_time) >= max_timeout:
-                    self.log("""Max timeout of {0} has reached for the task id '{1}' for the device '{2}' and unexpected
-                                 task status so moving out to next task id""".format(max_timeout, task_id, device_ip), "WARNING")
-                    device_ips_list.append(device_ip)
-                    break
-
-                task_details = self.get_task_details(task_id)
-
-                if not task_details.get("isError") and \
-                        ("completed successfully" in task_details.get("progress")):
-                    self.result['changed'] = True
-                    self.status = "success"
-                    self.log("Image {0} successfully for the device '{1}".format(swim_task_name, device_ip), "INFO")
-                    device_count += 1
-                    break
-
-                if task_details.get("isError"):
-                    error_msg = "Image {0} gets failed for the device '{1}'".format(swim_task_name, device_ip)
-                    self.log(error_msg, "ERROR")
-                    self.result['response'] = task_details
-                    device_ips_list.append(device_ip)
-                    break
-                time.sleep(self.params.get('dnac_task_poll_interval'))
+        for device_ip, wait_result in swim_task_results:
+            task_id = swim_task_dict[device_ip]
+            if wait_result.succeeded:
+                self.result['changed'] = True
+                self.status = "success"
+                self.log("Image {0} successfully for the device '{1}", "INFO", swim_task_name, device_ip)
+                device_count += 1
+            elif wait_result.failed:
+                error_msg = "Image {0} gets failed for the device '{1}'".format(swim_task_name, device_ip)
+                self.log(error_msg, "ERROR")
+                self.result['response'] = wait_result.value
+                device_ips_list.append(device_ip)
+            else:
+                self.log("""Max timeout of {0} has reached for the task id '{1}' for the device '{2}' and unexpected
+                             task status so moving out to next task id""", "WARNING", max_timeout, task_id, device_ip)
+                device_ips_list.append(device_ip)
 
         return device_ips_list, device_count
 
@@ -1425,7 +1461,7 @@ class Swim(DnacBase):
                     imageUuid=image_id
                 )]
             )
-            self.log("Distribution Params: {0}".format(str(distribution_params)), "INFO")
+            self.log("Distribution Params: {0}", "INFO", distribution_params)
 
             response = self.dnac._exec(
                 family="software_image_management_swim",
@@ -1433,7 +1469,7 @@ class Swim(DnacBase):
                 op_modifies=True,
                 params=distribution_params,
             )
-            self.log("Received API response from 'trigger_software_image_distribution': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'trigger_software_image_distribution': {0}", "DEBUG", response)
 
             if response:
                 task_details = {}
@@ -1468,7 +1504,7 @@ class Swim(DnacBase):
             self.log(self.msg, "WARNING")
             return self
 
-        self.log("Device UUIDs involved in Image Distribution: {0}".format(str(device_uuid_list)), "INFO")
+        self.log("Device UUIDs involved in Image Distribution: {0}", "INFO", device_uuid_list)
         distribution_task_dict = {}
 
         for device_uuid in device_uuid_list:
@@ -1479,14 +1515,14 @@ class Swim(DnacBase):
                     imageUuid=image_id
                 )]
             )
-            self.log("Distribution Params: {0}".format(str(distribution_params)), "INFO")
+            self.log("Distribution Params: {0}", "INFO", distribution_params)
             response = self.dnac._exec(
                 family="software_image_management_swim",
                 function='trigger_software_image_distribution',
                 op_modifies=True,
                 params=distribution_params,
             )
-            self.log("Received API response from 'trigger_software_image_distribution': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'trigger_software_image_distribution': {0}", "DEBUG", response)
 
             if response:
                 task_details = {}
@@ -1508,7 +1544,7 @@ class Swim(DnacBase):
             self.status = "success"
             self.partial_successful_distribution = False
             self.msg = "Image with Id '{0}' Distributed and partially successfull".format(image_id)
-            self.log("For device(s) {0} image Distribution gets failed".format(str(device_ips_list)), "CRITICAL")
+            self.log("For device(s) {0} image Distribution gets failed", "CRITICAL", device_ips_list)
 
         self.result['msg'] = self.msg
         self.log(self.msg, "INFO")
@@ -1552,7 +1588,7 @@ class Swim(DnacBase):
                 schedule_validate=activation_details.get("scehdule_validate"),
                 payload=payload
             )
-            self.log("Activation Params: {0}".format(str(activation_params)), "INFO")
+            self.log("Activation Params: {0}", "INFO", activation_params)
 
             response = self.dnac._exec(
                 family="software_image_management_swim",
@@ -1560,7 +1596,7 @@ class Swim(DnacBase):
                 op_modifies=True,
                 params=activation_params,
             )
-            self.log("Received API response from 'trigger_software_image_activation': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'trigger_software_image_activation': {0}", "DEBUG", response)
 
             task_details = {}
             task_id = response.get("response").get("taskId")
@@ -1594,7 +1630,7 @@ class Swim(DnacBase):
             self.log(self.msg, "WARNING")
             return self
 
-        self.log("Device UUIDs involved in Image Activation: {0}".format(str(device_uuid_list)), "INFO")
+        self.log("Device UUIDs involved in Image Activation: {0}", "INFO", device_uuid_list)
         activation_task_dict = {}
 
         for device_uuid in device_uuid_list:
@@ -1611,7 +1647,7 @@ class Swim(DnacBase):
                 schedule_validate=activation_details.get("scehdule_validate"),
                 payload=payload
             )
-            self.log("Activation Params: {0}".format(str(activation_params)), "INFO")
+            self.log("Activation Params: {0}", "INFO", activation_params)
 
             response = self.dnac._exec(
                 family="software_image_management_swim",
@@ -1619,7 +1655,7 @@ class Swim(DnacBase):
                 op_modifies=True,
                 params=activation_params,
             )
-            self.log("Received API response from 'trigger_software_image_activation': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'trigger_software_image_activation': {0}", "DEBUG", response)
 
             if response:
                 task_details = {}
@@ -1641,7 +1677,7 @@ class Swim(DnacBase):
             self.status = "success"
             self.partial_successful_activation = True
             self.msg = "Image with Id '{0}' activated and partially successful.".format(image_id)
-            self.log("For Device(s) {0} Image activation gets Failed".format(str(device_ips_list)), "CRITICAL")
+            self.log("For Device(s) {0} Image activation gets Failed", "CRITICAL", device_ips_list)
 
         self.result['msg'] = self.msg
         self.log(self.msg, "INFO")
@@ -1694,8 +1730,8 @@ class Swim(DnacBase):
         else:
             image_name = self.want.get("local_import_details").get("file_path")
 
-        # Code to check if the image already exists in Catalyst Center
-        name = image_name.split('/')[-1]
+        # Code to check if the image already exists in Catalyst Center, under another name when its upload was skipped
+        name = self.have.get("duplicate_image_name") or image_name.split('/')[-1]
         image_exist = self.is_image_exist(name)
         if image_exist:
             self.status = "success"
@@ -1703,7 +1739,7 @@ class Swim(DnacBase):
             self.log(self.msg, "INFO")
         else:
             self.log("""The playbook input for SWIM Image '{0}' does not align with the Cisco Catalyst Center, indicating that image
-                        may not have imported successfully.""".format(name), "INFO")
+                        may not have imported successfully.""", "INFO", name)
 
         return self
 
@@ -1734,7 +1770,7 @@ class Swim(DnacBase):
             device_family_identifier=self.have.get("device_family_identifier"),
             device_role=tagging_details.get("device_role", "ALL").upper()
         )
-        self.log("Parameters for checking the status of image: {0}".format(str(image_params)), "INFO")
+        self.log("Parameters for checking the status of image: {0}", "INFO", image_params)
 
         response = self.dnac._exec(
             family="software_image_management_swim",
@@ -1742,7 +1778,7 @@ class Swim(DnacBase):
             op_modifies=True,
             params=image_params
         )
-        self.log("Received API response from 'get_golden_tag_status_of_an_image': {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from 'get_golden_tag_status_of_an_image': {0}", "DEBUG", response)
 
         response = response.get('response')
         if response:
@@ -1786,7 +1822,7 @@ class Swim(DnacBase):
             else:
                 self.log("""Mismatch between the playbook input for distributing the image to the device with ID '{0}' and the actual state in the
                          Cisco Catalyst Center suggests that the distribution task might not have been executed
-                         successfully.""".format(self.have.get("distribution_device_id")), "INFO")
+                         successfully.""", "INFO", self.have.get("distribution_device_id"))
         elif self.complete_successful_distribution:
             self.msg = """The requested image '{0}', with ID '{1}', has been successfully distributed to all devices within the specified
                      site in the Cisco Catalyst Center.""".format(image_name, image_id)
@@ -1826,7 +1862,7 @@ class Swim(DnacBase):
             else:
                 self.log("""Mismatch between the playbook's input for activating the image '{0}' on the device with ID '{1}' and the actual state in
                          the Cisco Catalyst Center suggests that the activation task might not have been executed
-                         successfully.""".format(image_name, self.have.get("activation_device_id")), "INFO")
+                         successfully.""", "INFO", image_name, self.have.get("activation_device_id"))
         elif self.complete_successful_activation:
             self.msg = """The requested image '{0}', with ID '{1}', has been successfully activated on all devices within the specified site in the
                      Cisco Catalyst Center.""".format(image_name, image_id)
@@ -1857,8 +1893,8 @@ class Swim(DnacBase):
         """
 
         self.get_have()
-        self.log("Current State (have): {0}".format(str(self.have)), "INFO")
-        self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
+        self.log("Desired State (want): {0}", "INFO", self.want)
 
         import_type = self.want.get("import_type")
         if import_type:
@@ -1893,11 +1929,26 @@ def main():
                     'dnac_log_level': {'type': 'str', 'default': 'WARNING'},
                     "dnac_log_file_path": {"type": 'str', "default": 'dnac.log'},
                     "dnac_log_append": {"type": 'bool', "default": True},
+                    "dnac_log_max_bytes": {"type": 'int', "default": 0},
+                    "dnac_log_backup_count": {"type": 'int', "default": 5},
+                    "dnac_log_compress": {"type": 'bool', "default": False},
+                    "dnac_log_format": {"type": 'str', "default": 'text', "choices": ['text', 'json']},
                     'dnac_log': {'type': 'bool', 'default': False},
                     'validate_response_schema': {'type': 'bool', 'default': True},
                     'config_verify': {'type': 'bool', "default": False},
                     'dnac_api_task_timeout': {'type': 'int', "default": 1200},
                     'dnac_task_poll_interval': {'type': 'int', "default": 2},
+                    'dnac_token_cache': {'type': 'bool', 'default': False},
+                    'dnac_rate_limit': {'type': 'float', 'default': 0},
+                    'dnac_rate_limit_per_family': {'type': 'bool', 'default': False},
+                    'dnac_rate_limit_retries': {'type': 'int', 'default': 5},
+                    'dnac_shared_rate_limit': {'type': 'float', 'default': 0},
+                    'dnac_shared_family_concurrency': {'type': 'int', 'default': 0},
+                    'dnac_memoize_reads': {'type': 'bool', 'default': False},
+                    'dnac_metrics': {'type': 'bool', 'default': False},
+                    'dnac_metrics_file': {'type': 'str'},
+                    'dnac_timings': {'type': 'bool', 'default': False},
+                    'dnac_timings_file': {'type': 'str'},
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'merged', 'choices': ['merged']}
                     }
@@ -1453,7 +1453,7 @@ class DnacTemplate(DnacBase):
             return self
 
         self.validated_config = valid_temp
-        self.log("Successfully validated playbook config params: {0}".format(valid_temp), "INFO")
+        self.log("Successfully validated playbook config params: {0}", "INFO", valid_temp)
         self.msg = "Successfully validated input"
         self.status = "success"
         return self
@@ -1602,9 +1602,9 @@ class DnacTemplate(DnacBase):
 
         templateParams = []
         i = 0
-        self.log("Template params details: {0}".format(template_params), "DEBUG")
+        self.log("Template params details: {0}", "DEBUG", template_params)
         for item in template_params:
-            self.log("Template params items: {0}".format(item), "DEBUG")
+            self.log("Template params items: {0}", "DEBUG", item)
             templateParams.append({})
             binding = item.get("binding")
             if binding is not None:
@@ -1684,11 +1684,11 @@ class DnacTemplate(DnacBase):
                 templateParams[i].update({"required": required})
 
             range = item.get("range")
-            self.log("Template params range list: {0}".format(range), "DEBUG")
+            self.log("Template params range list: {0}", "DEBUG", range)
             if range is not None:
                 templateParams[i].update({"range": []})
                 _range = templateParams[i].get("range")
-                self.log("Template params range: {0}".format(_range), "DEBUG")
+                self.log("Template params range: {0}", "DEBUG", _range)
                 j = 0
                 for value in range:
                     _range.append({})
@@ -1711,9 +1711,9 @@ class DnacTemplate(DnacBase):
                         return self.check_return_status()
                     j = j + 1
 
-            self.log("Template params details: {0}".format(templateParams), "DEBUG")
+            self.log("Template params details: {0}", "DEBUG", templateParams)
             selection = item.get("selection")
-            self.log("Template params selection: {0}".format(selection), "DEBUG")
+            self.log("Template params selection: {0}", "DEBUG", selection)
             if selection is not None:
                 templateParams[i].update({"selection": {}})
                 _selection = templateParams[i].get("selection")
@@ -1838,7 +1838,7 @@ class DnacTemplate(DnacBase):
             temp_params (dict) - Organized template parameters.
         """
 
-        self.log("Template params playbook details: {0}".format(params), "DEBUG")
+        self.log("Template params playbook details: {0}", "DEBUG", params)
         temp_params = {
             "tags": self.get_tags(params.get("template_tag")),
             "author": params.get("author"),
@@ -1873,12 +1873,12 @@ class DnacTemplate(DnacBase):
             "version": params.get("version"),
             "project_id": params.get("project_id")
         }
-        self.log("Formatted template params details: {0}".format(temp_params), "DEBUG")
+        self.log("Formatted template params details: {0}", "DEBUG", temp_params)
         copy_temp_params = copy.deepcopy(temp_params)
         for item in copy_temp_params:
             if temp_params[item] is None:
                 del temp_params[item]
-        self.log("Formatted template params details: {0}".format(temp_params), "DEBUG")
+        self.log("Formatted template params details: {0}", "DEBUG", temp_params)
         return temp_params
 
     def get_template(self, config):
@@ -1902,7 +1902,7 @@ class DnacTemplate(DnacBase):
         if items:
             result = items
 
-        self.log("Received API response from 'get_template_details': {0}".format(items), "DEBUG")
+        self.log("Received API response from 'get_template_details': {0}", "DEBUG", items)
         self.result['response'] = items
         return result
 
@@ -1926,14 +1926,12 @@ class DnacTemplate(DnacBase):
         # DNAC returns project details even if the substring matches.
         # Hence check the projectName retrieved from DNAC.
         if not (project_details and isinstance(project_details, list)):
-            self.log("Project: {0} not found, need to create new project in DNAC"
-                     .format(given_projectName), "INFO")
+            self.log("Project: {0} not found, need to create new project in DNAC", "INFO", given_projectName)
             return None
 
         fetched_projectName = project_details[0].get('name')
         if fetched_projectName != given_projectName:
-            self.log("Project {0} provided is not exact match in DNAC DB"
-                     .format(given_projectName), "INFO")
+            self.log("Project {0} provided is not exact match in DNAC DB", "INFO", given_projectName)
             return None
 
         template_available = project_details[0].get('templates')
@@ -1969,8 +1967,7 @@ class DnacTemplate(DnacBase):
                                            templateName)
         # Check if specified template in playbook is available
         if not template_details:
-            self.log("Template {0} not found in project {1}"
-                     .format(templateName, projectName), "INFO")
+            self.log("Template {0} not found in project {1}", "INFO", templateName, projectName)
             self.msg = "Template : {0} missing, new template to be created".format(templateName)
             self.status = "success"
             return self
@@ -1997,12 +1994,12 @@ class DnacTemplate(DnacBase):
                 have_template["template_found"] = template is not None \
                     and isinstance(template, dict)
                 self.log("Template {0} is found and template "
-                         "details are :{1}".format(templateName, str(template)), "INFO")
+                         "details are :{1}", "INFO", templateName, template)
 
         # There are committed templates in the project but the
         # one specified in the playbook may not be committed
         self.log("Commit pending for template name {0}"
-                 " is {1}".format(templateName, have_template.get('isCommitPending')), "INFO")
+                 " is {1}", "INFO", templateName, have_template.get('isCommitPending'))
 
         self.have_template = have_template
         self.msg = "Successfully collected all template parameters from dnac for comparison"
@@ -2067,7 +2064,7 @@ class DnacTemplate(DnacBase):
 
         want = {}
         configuration_templates = config.get("configuration_templates")
-        self.log("Playbook details: {0}".format(config), "INFO")
+        self.log("Playbook details: {0}", "INFO", config)
         if configuration_templates:
             template_params = self.get_template_params(configuration_templates)
             project_params = self.get_project_params(configuration_templates)
@@ -2100,7 +2097,7 @@ class DnacTemplate(DnacBase):
 
         creation_id = None
         created = False
-        self.log("Desired State (want): {0}".format(self.want), "INFO")
+        self.log("Desired State (want): {0}", "INFO", self.want)
         template_params = self.want.get("template_params")
         project_params = self.want.get("project_params")
 
@@ -2122,31 +2119,27 @@ class DnacTemplate(DnacBase):
             params=params_key,
         )
         if not isinstance(response, dict):
-            self.log("Response of '{0}' is not in dictionary format."
-                     .format(creation_value), "CRITICAL")
+            self.log("Response of '{0}' is not in dictionary format.", "CRITICAL", creation_value)
             return creation_id, created
 
         task_id = response.get("response").get("taskId")
         if not task_id:
-            self.log("Task id {0} not found for '{1}'.".format(task_id, creation_value), "CRITICAL")
+            self.log("Task id {0} not found for '{1}'.", "CRITICAL", task_id, creation_value)
             return creation_id, created
 
         while not created:
             task_details = self.get_task_details(task_id)
             if not task_details:
-                self.log("Failed to get task details of '{0}' for taskid: {1}"
-                         .format(creation_value, task_id), "CRITICAL")
+                self.log("Failed to get task details of '{0}' for taskid: {1}", "CRITICAL", creation_value, task_id)
                 return creation_id, created
 
-            self.log("Task details for {0}: {1}".format(creation_value, task_details), "DEBUG")
+            self.log("Task details for {0}: {1}", "DEBUG", creation_value, task_details)
             if task_details.get("isError"):
-                self.log("Error occurred for '{0}' with taskid: {1}"
-                         .format(creation_value, task_id), "ERROR")
+                self.log("Error occurred for '{0}' with taskid: {1}", "ERROR", creation_value, task_id)
                 return creation_id, created
 
             if validation_string not in task_details.get("progress"):
-                self.log("'{0}' progress set to {1} for taskid: {2}"
-                         .format(creation_value, task_details.get('progress'), task_id), "DEBUG")
+                self.log("'{0}' progress set to {1} for taskid: {2}", "DEBUG", creation_value, task_details.get('progress'), task_id)
                 continue
 
             task_details_data = task_details.get("data")
@@ -2156,8 +2149,7 @@ class DnacTemplate(DnacBase):
             else:
                 creation_id = value.get("templateId")
             if not creation_id:
-                self.log("Export data is not found for '{0}' with taskid : {1}"
-                         .format(creation_value, task_id), "DEBUG")
+                self.log("Export data is not found for '{0}' with taskid : {1}", "DEBUG", creation_value, task_id)
                 continue
 
             created = True
@@ -2167,7 +2159,7 @@ class DnacTemplate(DnacBase):
                 template_params["projectId"] = creation_id
                 template_params["project_id"] = creation_id
 
-        self.log("New {0} created with id {1}".format(name, creation_id), "DEBUG")
+        self.log("New {0} created with id {1}", "DEBUG", name, creation_id)
         return creation_id, created
 
     def requires_update(self):
@@ -2184,14 +2176,13 @@ class DnacTemplate(DnacBase):
         """
 
         if self.have_template.get("isCommitPending"):
-            self.log("Template '{0}' is in saved state and needs to be updated and committed."
-                     .format(self.have_template.get("template").get("name")), "DEBUG")
+            self.log("Template '{0}' is in saved state and needs to be updated and committed.", "DEBUG", self.have_template.get("template").get("name"))
             return True
 
         current_obj = self.have_template.get("template")
         requested_obj = self.want.get("template_params")
-        self.log("Current State (have): {0}".format(current_obj), "INFO")
-        self.log("Desired State (want): {0}".format(requested_obj), "INFO")
+        self.log("Current State (have): {0}", "INFO", current_obj)
+        self.log("Desired State (want): {0}", "INFO", requested_obj)
         obj_params = [
             ("tags", "tags", ""),
             ("author", "author", ""),
@@ -2306,23 +2297,20 @@ class DnacTemplate(DnacBase):
         )
         for values in export_values:
             project_name = values.get("project_name")
-            self.log("Project name for export template: {0}".format(project_name), "DEBUG")
+            self.log("Project name for export template: {0}", "DEBUG", project_name)
             template_details = template_details.get("response")
-            self.log("Template details: {0}".format(template_details), "DEBUG")
+            self.log("Template details: {0}", "DEBUG", template_details)
             all_template_details = get_dict_result(template_details,
                                                    "name",
                                                    project_name)
-            self.log("Template details under the project name {0}: {1}"
-                     .format(project_name, all_template_details), "DEBUG")
+            self.log("Template details under the project name {0}: {1}", "DEBUG", project_name, all_template_details)
             all_template_details = all_template_details.get("templates")
-            self.log("Template details under the project name {0}: {1}"
-                     .format(project_name, all_template_details), "DEBUG")
+            self.log("Template details under the project name {0}: {1}", "DEBUG", project_name, all_template_details)
             template_name = values.get("template_name")
             template_detail = get_dict_result(all_template_details,
                                               "name",
                                               template_name)
-            self.log("Template details with template name {0}: {1}"
-                     .format(template_name, template_detail), "DEBUG")
+            self.log("Template details with template name {0}: {1}", "DEBUG", template_name, template_detail)
             if template_detail is None:
                 self.msg = "Invalid project_name and template_name in export"
                 self.status = "failed"
@@ -2351,7 +2339,7 @@ class DnacTemplate(DnacBase):
                 project_id, project_created = \
                     self.create_project_or_template(is_create_project=True)
                 if project_created:
-                    self.log("project created with projectId: {0}".format(project_id), "DEBUG")
+                    self.log("project created with projectId: {0}", "DEBUG", project_id)
                 else:
                     self.status = "failed"
                     self.msg = "Project creation failed"
@@ -2359,8 +2347,8 @@ class DnacTemplate(DnacBase):
 
             is_template_found = self.have_template.get("template_found")
             template_params = self.want.get("template_params")
-            self.log("Desired template details: {0}".format(template_params), "DEBUG")
-            self.log("Current template details: {0}".format(self.have_template), "DEBUG")
+            self.log("Desired template details: {0}", "DEBUG", template_params)
+            self.log("Current template details: {0}", "DEBUG", self.have_template)
             template_id = None
             template_updated = False
             self.validate_input_merge(is_template_found).check_return_status()
@@ -2368,8 +2356,8 @@ class DnacTemplate(DnacBase):
                 if self.requires_update():
                     template_id = self.have_template.get("id")
                     template_params.update({"id": template_id})
-                    self.log("Current State (have): {0}".format(self.have_template), "INFO")
-                    self.log("Desired State (want): {0}".format(self.want), "INFO")
+                    self.log("Current State (have): {0}", "INFO", self.have_template)
+                    self.log("Desired State (want): {0}", "INFO", self.want)
                     response = self.dnac_apply['exec'](
                         family="configuration_templates",
                         function="update_template",
@@ -2377,8 +2365,7 @@ class DnacTemplate(DnacBase):
                         params=template_params,
                     )
                     template_updated = True
-                    self.log("Updating existing template '{0}'."
-                             .format(self.have_template.get("template").get("name")), "INFO")
+                    self.log("Updating existing template '{0}'.", "INFO", self.have_template.get("template").get("name"))
                 else:
                     # Template does not need update
                     self.result.update({
@@ -2416,7 +2403,7 @@ class DnacTemplate(DnacBase):
                 self.result['changed'] = True
                 self.result['msg'] = task_details.get('progress')
                 self.result['diff'] = config.get("configuration_templates")
-                self.log("Task details for 'version_template': {0}".format(task_details), "DEBUG")
+                self.log("Task details for 'version_template': {0}", "DEBUG", task_details)
                 self.result['response'] = task_details if task_details else response
 
                 if not self.result.get('msg'):
@@ -2438,8 +2425,7 @@ class DnacTemplate(DnacBase):
         export = config.get("export")
         if export:
             export_project = export.get("project")
-            self.log("Export project playbook details: {0}"
-                     .format(export_project), "DEBUG")
+            self.log("Export project playbook details: {0}", "DEBUG", export_project)
             if export_project:
                 response = self.dnac._exec(
                     family="configuration_templates",
@@ -2456,8 +2442,7 @@ class DnacTemplate(DnacBase):
             export_values = export.get("template")
             if export_values:
                 self.get_export_template_values(export_values).check_return_status()
-                self.log("Exporting template playbook details: {0}"
-                         .format(self.export_template), "DEBUG")
+                self.log("Exporting template playbook details: {0}", "DEBUG", self.export_template)
                 response = self.dnac._exec(
                     family="configuration_templates",
                     function='export_templates',
@@ -2499,8 +2484,7 @@ class DnacTemplate(DnacBase):
                 # "payload": "{0}".format(payload)
                 "payload": payload
             }
-            self.log("Importing project details from the playbook: {0}"
-                     .format(_import_project), "DEBUG")
+            self.log("Importing project details from the playbook: {0}", "DEBUG", _import_project)
             if _import_project:
                 response = self.dnac._exec(
                     family="configuration_templates",
@@ -2528,8 +2512,7 @@ class DnacTemplate(DnacBase):
                 "projectName": _import_template.get("project_name"),
                 "payload": self.get_template_params(payload)
             }
-            self.log("Import template details from the playbook: {0}"
-                     .format(_import_template), "DEBUG")
+            self.log("Import template details from the playbook: {0}", "DEBUG", _import_template)
             if _import_template:
                 response = self.dnac._exec(
                     family="configuration_templates",
@@ -2608,7 +2591,7 @@ class DnacTemplate(DnacBase):
             self.result['msg'] = task_details.get('progress')
             self.result['diff'] = config.get("configuration_templates")
 
-            self.log("Task details for '{0}': {1}".format(deletion_value, task_details), "DEBUG")
+            self.log("Task details for '{0}': {1}", "DEBUG", deletion_value, task_details)
             self.result['response'] = task_details if task_details else response
             if not self.result['msg']:
                 self.result['msg'] = "Error while deleting {name} : "
@@ -2652,8 +2635,7 @@ class DnacTemplate(DnacBase):
                     return self
             else:
                 self.log("Template name is empty, deleting the project '{0}' and "
-                         "associated templates"
-                         .format(config.get("configuration_templates").get("project_name")), "INFO")
+                         "associated templates", "INFO", config.get("configuration_templates").get("project_name"))
                 is_project_deletable = self.have_project.get("isDeletable")
                 if is_project_deletable:
                     self.delete_project_or_template(config, is_delete_project=True)
@@ -2681,15 +2663,15 @@ class DnacTemplate(DnacBase):
 
         if config.get("configuration_templates") is not None:
             is_template_available = self.get_have_project(config)
-            self.log("Template availability: {0}".format(is_template_available), "INFO")
+            self.log("Template availability: {0}", "INFO", is_template_available)
             if not is_template_available:
                 self.msg = "Configuration Template config is not applied to the DNAC."
                 self.status = "failed"
                 return self
 
             self.get_have_template(config, is_template_available)
-            self.log("Current State (have): {0}".format(self.want.get("template_params")), "INFO")
-            self.log("Desired State (want): {0}".format(self.have_template.get("template")), "INFO")
+            self.log("Current State (have): {0}", "INFO", self.want.get("template_params"))
+            self.log("Desired State (want): {0}", "INFO", self.have_template.get("template"))
             template_params = ["language", "name", "projectName", "softwareType",
                                "softwareVariant", "templateContent"]
             for item in template_params:
@@ -2718,8 +2700,8 @@ class DnacTemplate(DnacBase):
         """
 
         if config.get("configuration_templates") is not None:
-            self.log("Current State (have): {0}".format(self.have), "INFO")
-            self.log("Desired State (want): {0}".format(self.want), "INFO")
+            self.log("Current State (have): {0}", "INFO", self.have)
+            self.log("Desired State (want): {0}", "INFO", self.want)
             template_list = self.dnac_apply['exec'](
                 family="configuration_templates",
                 function="gets_the_templates_available",
@@ -2773,10 +2755,25 @@ def main():
                     "dnac_log_level": {"type": 'str', "default": 'WARNING'},
                     "dnac_log_file_path": {"type": 'str', "default": 'dnac.log'},
                     "dnac_log_append": {"type": 'bool', "default": True},
+                    "dnac_log_max_bytes": {"type": 'int', "default": 0},
+                    "dnac_log_backup_count": {"type": 'int', "default": 5},
+                    "dnac_log_compress": {"type": 'bool', "default": False},
+                    "dnac_log_format": {"type": 'str', "default": 'text', "choices": ['text', 'json']},
                     'validate_response_schema': {'type': 'bool', 'default': True},
                     "config_verify": {"type": 'bool', "default": False},
                     'dnac_api_task_timeout': {'type': 'int', "default": 1200},
                     'dnac_task_poll_interval': {'type': 'int', "default": 2},
+                    'dnac_token_cache': {'type': 'bool', 'default': False},
+                    'dnac_rate_limit': {'type': 'float', 'default': 0},
+                    'dnac_rate_limit_per_family': {'type': 'bool', 'default': False},
+                    'dnac_rate_limit_retries': {'type': 'int', 'default': 5},
+                    'dnac_shared_rate_limit': {'type': 'float', 'default': 0},
+                    'dnac_shared_family_concurrency': {'type': 'int', 'default': 0},
+                    'dnac_memoize_reads': {'type': 'bool', 'default': False},
+                    'dnac_metrics': {'type': 'bool', 'default': False},
+                    'dnac_metrics_file': {'type': 'str'},
+                    'dnac_timings': {'type': 'bool', 'default': False},
+                    'dnac_timings_file': {'type': 'str'},
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'merged', 'choices': ['merged', 'deleted']}
                     }
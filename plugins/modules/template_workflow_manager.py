@@ -34,6 +34,14 @@ options:
     description: Set to True to verify the Cisco Catalyst Center after applying the playbook config.
     type: bool
     default: False
+  dnac_fingerprint_store:
+    description:
+    - Path of a SQLite file recording the config items applied by the module, created when missing.
+    - A config item of the C(merged) state is skipped, without reading its current state, when it is the same as the
+      last time it was applied and the objects it manages did not change in Cisco Catalyst Center since then.
+    - The objects are checked with a single bulk query per kind of objects, e.g. all the templates.
+    - The config items with C(export) or C(import) are never skipped.
+    type: str
   state:
     description: The state of Cisco Catalyst Center after module completion.
     type: str
@@ -1169,7 +1177,7 @@ class Template(DnacBase):
             return self
 
         self.validated_config = valid_temp
-        self.log("Successfully validated playbook config params: {0}".format(valid_temp), "INFO")
+        self.log("Successfully validated playbook config params: {0}", "INFO", valid_temp)
         self.msg = "Successfully validated input"
         self.status = "success"
         return self
@@ -1288,9 +1296,9 @@ class Template(DnacBase):
 
         templateParams = []
         i = 0
-        self.log("Template params details: {0}".format(template_params), "DEBUG")
+        self.log("Template params details: {0}", "DEBUG", template_params)
         for item in template_params:
-            self.log("Template params items: {0}".format(item), "DEBUG")
+            self.log("Template params items: {0}", "DEBUG", item)
             templateParams.append({})
             binding = item.get("binding")
             if binding is not None:
@@ -1370,11 +1378,11 @@ class Template(DnacBase):
                 templateParams[i].update({"required": required})
 
             range = item.get("range")
-            self.log("Template params range list: {0}".format(range), "DEBUG")
+            self.log("Template params range list: {0}", "DEBUG", range)
             if range is not None:
                 templateParams[i].update({"range": []})
                 _range = templateParams[i].get("range")
-                self.log("Template params range: {0}".format(_range), "DEBUG")
+                self.log("Template params range: {0}", "DEBUG", _range)
                 j = 0
                 for value in range:
                     _range.append({})
@@ -1397,9 +1405,9 @@ class Template(DnacBase):
                         return self.check_return_status()
                     j = j + 1
 
-            self.log("Template params details: {0}".format(templateParams), "DEBUG")
+            self.log("Template params details: {0}", "DEBUG", templateParams)
             selection = item.get("selection")
-            self.log("Template params selection: {0}".format(selection), "DEBUG")
+            self.log("Template params selection: {0}", "DEBUG", selection)
             if selection is not None:
                 templateParams[i].update({"selection": {}})
                 _selection = templateParams[i].get("selection")
@@ -1440,7 +1448,7 @@ class Template(DnacBase):
         if items:
             result = items
 
-        self.log("Received API response from 'get_templates_details': {0}".format(items), "DEBUG")
+        self.log("Received API response from 'get_templates_details': {0}", "DEBUG", items)
         return result
 
     def get_containing_templates(self, containing_templates):
@@ -1549,7 +1557,7 @@ class Template(DnacBase):
             temp_params (dict) - Organized template parameters.
         """
 
-        self.log("Template params playbook details: {0}".format(params), "DEBUG")
+        self.log("Template params playbook details: {0}", "DEBUG", params)
         temp_params = {
             "tags": self.get_tags(params.get("template_tag")),
             "author": params.get("author"),
@@ -1624,7 +1632,7 @@ class Template(DnacBase):
 
             temp_params.update({"failurePolicy": failure_policy})
 
-        self.log("Formatted template params details: {0}".format(temp_params), "DEBUG")
+        self.log("Formatted template params details: {0}", "DEBUG", temp_params)
         copy_temp_params = copy.deepcopy(temp_params)
         for item in copy_temp_params:
             if temp_params[item] is None:
@@ -1652,7 +1660,7 @@ class Template(DnacBase):
         if items:
             result = items
 
-        self.log("Received API response from 'get_template_details': {0}".format(items), "DEBUG")
+        self.log("Received API response from 'get_template_details': {0}", "DEBUG", items)
         self.result['response'][0].get("configurationTemplate").update({"items": items})
         return result
 
@@ -1676,14 +1684,12 @@ class Template(DnacBase):
         # Cisco Catalyst Center returns project details even if the substring matches.
         # Hence check the projectName retrieved from Cisco Catalyst Center.
         if not (project_details and isinstance(project_details, list)):
-            self.log("Project: {0} not found, need to create new project in Cisco Catalyst Center"
-                     .format(given_projectName), "INFO")
+            self.log("Project: {0} not found, need to create new project in Cisco Catalyst Center", "INFO", given_projectName)
             return None
 
         fetched_projectName = project_details[0].get('name')
         if fetched_projectName != given_projectName:
-            self.log("Project {0} provided is not exact match in Cisco Catalyst Center DB"
-                     .format(given_projectName), "INFO")
+            self.log("Project {0} provided is not exact match in Cisco Catalyst Center DB", "INFO", given_projectName)
             return None
 
         template_available = project_details[0].get('templates')
@@ -1719,8 +1725,7 @@ class Template(DnacBase):
                                            templateName)
         # Check if specified template in playbook is available
         if not template_details:
-            self.log("Template {0} not found in project {1}"
-                     .format(templateName, projectName), "INFO")
+            self.log("Template {0} not found in project {1}", "INFO", templateName, projectName)
             self.msg = "Template : {0} missing, new template to be created".format(templateName)
             self.status = "success"
             return self
@@ -1747,12 +1752,12 @@ class Template(DnacBase):
                 have_template["template_found"] = template is not None \
                     and isinstance(template, dict)
                 self.log("Template {0} is found and template "
-                         "details are :{1}".format(templateName, str(template)), "INFO")
+                         "details are :{1}", "INFO", templateName, template)
 
         # There are committed templates in the project but the
         # one specified in the playbook may not be committed
         self.log("Commit pending for template name {0}"
-                 " is {1}".format(templateName, have_template.get('isCommitPending')), "INFO")
+                 " is {1}", "INFO", templateName, have_template.get('isCommitPending'))
 
         self.have_template = have_template
         self.msg = "Successfully collected all template parameters from Cisco Catalyst Center for comparison"
@@ -1817,7 +1822,7 @@ class Template(DnacBase):
 
         want = {}
         configuration_templates = config.get("configuration_templates")
-        self.log("Playbook details: {0}".format(config), "INFO")
+        self.log("Playbook details: {0}", "INFO", config)
         if configuration_templates:
             template_params = self.get_template_params(configuration_templates)
             project_params = self.get_project_params(configuration_templates)
@@ -1850,7 +1855,7 @@ class Template(DnacBase):
 
         creation_id = None
         created = False
-        self.log("Desired State (want): {0}".format(self.want), "INFO")
+        self.log("Desired State (want): {0}", "INFO", self.want)
         template_params = self.want.get("template_params")
         project_params = self.want.get("project_params")
 
@@ -1872,31 +1877,27 @@ class Template(DnacBase):
             params=params_key,
         )
         if not isinstance(response, dict):
-            self.log("Response of '{0}' is not in dictionary format."
-                     .format(creation_value), "CRITICAL")
+            self.log("Response of '{0}' is not in dictionary format.", "CRITICAL", creation_value)
             return creation_id, created
 
         task_id = response.get("response").get("taskId")
         if not task_id:
-            self.log("Task id {0} not found for '{1}'.".format(task_id, creation_value), "CRITICAL")
+            self.log("Task id {0} not found for '{1}'.", "CRITICAL", task_id, creation_value)
             return creation_id, created
 
         while not created:
             task_details = self.get_task_details(task_id)
             if not task_details:
-                self.log("Failed to get task details of '{0}' for taskid: {1}"
-                         .format(creation_value, task_id), "CRITICAL")
+                self.log("Failed to get task details of '{0}' for taskid: {1}", "CRITICAL", creation_value, task_id)
                 return creation_id, created
 
-            self.log("Task details for {0}: {1}".format(creation_value, task_details), "DEBUG")
+            self.log("Task details for {0}: {1}", "DEBUG", creation_value, task_details)
             if task_details.get("isError"):
-                self.log("Error occurred for '{0}' with taskid: {1}"
-                         .format(creation_value, task_id), "ERROR")
+                self.log("Error occurred for '{0}' with taskid: {1}", "ERROR", creation_value, task_id)
                 return task_id, created
 
             if validation_string not in task_details.get("progress"):
-                self.log("'{0}' progress set to {1} for taskid: {2}"
-                         .format(creation_value, task_details.get('progress'), task_id), "DEBUG")
+                self.log("'{0}' progress set to {1} for taskid: {2}", "DEBUG", creation_value, task_details.get('progress'), task_id)
                 continue
 
             task_details_data = task_details.get("data")
@@ -1906,8 +1907,7 @@ class Template(DnacBase):
             else:
                 creation_id = value.get("templateId")
             if not creation_id:
-                self.log("Export data is not found for '{0}' with taskid : {1}"
-                         .format(creation_value, task_id), "DEBUG")
+                self.log("Export data is not found for '{0}' with taskid : {1}", "DEBUG", creation_value, task_id)
                 continue
 
             created = True
@@ -1917,7 +1917,7 @@ class Template(DnacBase):
                 template_params["projectId"] = creation_id
                 template_params["project_id"] = creation_id
 
-        self.log("New {0} created with id {1}".format(name, creation_id), "DEBUG")
+        self.log("New {0} created with id {1}", "DEBUG", name, creation_id)
         return creation_id, created
 
     def requires_update(self):
@@ -1934,14 +1934,13 @@ class Template(DnacBase):
         """
 
         if self.have_template.get("isCommitPending"):
-            self.log("Template '{0}' is in saved state and needs to be updated and committed."
-                     .format(self.have_template.get("template").get("name")), "DEBUG")
+            self.log("Template '{0}' is in saved state and needs to be updated and committed.", "DEBUG", self.have_template.get("template").get("name"))
             return True
 
         current_obj = self.have_template.get("template")
         requested_obj = self.want.get("template_params")
-        self.log("Current State (have): {0}".format(current_obj), "INFO")
-        self.log("Desired State (want): {0}".format(requested_obj), "INFO")
+        self.log("Current State (have): {0}", "INFO", current_obj)
+        self.log("Desired State (want): {0}", "INFO", requested_obj)
         obj_params = [
             ("tags", "tags", ""),
             ("author", "author", ""),
@@ -2048,8 +2047,8 @@ class Template(DnacBase):
         all_project_details = all_project_details.get("response")
         for values in export_values:
             project_name = values.get("project_name")
-            self.log("Project name for export template: {0}".format(project_name), "DEBUG")
-            self.log("Template details: {0}".format(all_project_details), "DEBUG")
+            self.log("Project name for export template: {0}", "DEBUG", project_name)
+            self.log("Template details: {0}", "DEBUG", all_project_details)
             project_details = get_dict_result(all_project_details,
                                               "name",
                                               project_name)
@@ -2070,14 +2069,12 @@ class Template(DnacBase):
                 self.status = "failed"
                 return self
 
-            self.log("Template details under the project name {0}: {1}"
-                     .format(project_name, all_template_details), "DEBUG")
+            self.log("Template details under the project name {0}: {1}", "DEBUG", project_name, all_template_details)
             template_name = values.get("template_name")
             template_details = get_dict_result(all_template_details,
                                                "name",
                                                template_name)
-            self.log("Template details with template name {0}: {1}"
-                     .format(template_name, template_details), "DEBUG")
+            self.log("Template details with template name {0}: {1}", "DEBUG", template_name, template_details)
             if template_details is None:
                 self.msg = "Invalid 'project_name' and 'template_name' in export templates."
                 self.status = "failed"
@@ -2108,12 +2105,12 @@ class Template(DnacBase):
                 self.msg = "Project creation failed"
                 return self
 
-            self.log("project created with projectId: {0}".format(project_id), "DEBUG")
+            self.log("project created with projectId: {0}", "DEBUG", project_id)
 
         is_template_found = self.have_template.get("template_found")
         template_params = self.want.get("template_params")
-        self.log("Desired template details: {0}".format(template_params), "DEBUG")
-        self.log("Current template details: {0}".format(self.have_template), "DEBUG")
+        self.log("Desired template details: {0}", "DEBUG", template_params)
+        self.log("Current template details: {0}", "DEBUG", self.have_template)
         template_id = None
         template_updated = False
         self.validate_input_merge(is_template_found).check_return_status()
@@ -2124,13 +2121,16 @@ class Template(DnacBase):
                     'response': self.have_template.get("template"),
                     'msg': "Template does not need update"
                 })
+                # The module exits here, the templates already applied are recorded first
+                self.keep_fingerprint()
+                self.save_fingerprints()
                 self.status = "exited"
                 return self
 
             template_id = self.have_template.get("id")
             template_params.update({"id": template_id})
-            self.log("Current State (have): {0}".format(self.have_template), "INFO")
-            self.log("Desired State (want): {0}".format(self.want), "INFO")
+            self.log("Current State (have): {0}", "INFO", self.have_template)
+            self.log("Desired State (want): {0}", "INFO", self.want)
             response = self.dnac_apply['exec'](
                 family="configuration_templates",
                 function="update_template",
@@ -2138,8 +2138,7 @@ class Template(DnacBase):
                 params=template_params,
             )
             template_updated = True
-            self.log("Updating existing template '{0}'."
-                     .format(self.have_template.get("template").get("name")), "INFO")
+            self.log("Updating existing template '{0}'.", "INFO", self.have_template.get("template").get("name"))
 
         else:
             if not template_params.get("name"):
@@ -2169,7 +2168,7 @@ class Template(DnacBase):
             self.result['changed'] = True
             self.result['response'][0].get("configurationTemplate")['msg'] = task_details.get('progress')
             self.result['response'][0].get("configurationTemplate")['diff'] = configuration_templates
-            self.log("Task details for 'version_template': {0}".format(task_details), "DEBUG")
+            self.log("Task details for 'version_template': {0}", "DEBUG", task_details)
             self.result['response'][0].get("configurationTemplate")['response'] = task_details if task_details else response
 
             if not self.result['response'][0].get("configurationTemplate").get('msg'):
@@ -2178,7 +2177,7 @@ class Template(DnacBase):
                 return self
         else:
             task_details = self.get_task_details(template_id)
-            self.log('Getting task details from task ID {0}: {1}'.format(template_id, task_details), "DEBUG")
+            self.log('Getting task details from task ID {0}: {1}', "DEBUG", template_id, task_details)
             if task_details.get("failureReason"):
                 self.msg = str(task_details.get("failureReason"))
             else:
@@ -2198,8 +2197,7 @@ class Template(DnacBase):
         """
 
         export_project = export.get("project")
-        self.log("Export project playbook details: {0}"
-                 .format(export_project), "DEBUG")
+        self.log("Export project playbook details: {0}", "DEBUG", export_project)
         if export_project:
             response = self.dnac._exec(
                 family="configuration_templates",
@@ -2219,8 +2217,7 @@ class Template(DnacBase):
         export_values = export.get("template")
         if export_values:
             self.get_export_template_values(export_values).check_return_status()
-            self.log("Exporting template playbook details: {0}"
-                     .format(self.export_template), "DEBUG")
+            self.log("Exporting template playbook details: {0}", "DEBUG", self.export_template)
             response = self.dnac._exec(
                 family="configuration_templates",
                 function='export_templates',
@@ -2295,8 +2292,7 @@ class Template(DnacBase):
                     "do_version": do_version,
                     "payload": final_payload,
                 }
-                self.log("Importing project details from the playbook: {0}"
-                         .format(_import_project), "DEBUG")
+                self.log("Importing project details from the playbook: {0}", "DEBUG", _import_project)
                 if _import_project:
                     response = self.dnac._exec(
                         family="configuration_templates",
@@ -2370,8 +2366,7 @@ class Template(DnacBase):
                 "project_name": project_name,
                 "payload": final_payload,
             }
-            self.log("Import template details from the playbook: {0}"
-                     .format(import_template), "DEBUG")
+            self.log("Import template details from the playbook: {0}", "DEBUG", import_template)
             global_project_name = import_template.get("project_name")
             for item in import_template.get("payload"):
                 template_project_name = item.get("projectName")
@@ -2468,7 +2463,7 @@ class Template(DnacBase):
             self.result['response'][0].get("configurationTemplate")['msg'] = task_details.get('progress')
             self.result['response'][0].get("configurationTemplate")['diff'] = config.get("configuration_templates")
 
-            self.log("Task details for '{0}': {1}".format(deletion_value, task_details), "DEBUG")
+            self.log("Task details for '{0}': {1}", "DEBUG", deletion_value, task_details)
             self.result['response'][0].get("configurationTemplate")['response'] = task_details if task_details else response
             if not self.result['response'][0].get("configurationTemplate")['msg']:
                 self.result['response'][0].get("configurationTemplate")['msg'] = "Error while deleting {name} : "
@@ -2515,8 +2510,7 @@ class Template(DnacBase):
                     return self
             else:
                 self.log("Template name is empty, deleting the project '{0}' and "
-                         "associated templates"
-                         .format(config.get("configuration_templates").get("project_name")), "INFO")
+                         "associated templates", "INFO", config.get("configuration_templates").get("project_name"))
                 is_project_deletable = self.have_project.get("isDeletable")
                 if is_project_deletable:
                     self.delete_project_or_template(config, is_delete_project=True)
@@ -2544,15 +2538,15 @@ class Template(DnacBase):
 
         if config.get("configuration_templates") is not None:
             is_template_available = self.get_have_project(config)
-            self.log("Template availability: {0}".format(is_template_available), "INFO")
+            self.log("Template availability: {0}", "INFO", is_template_available)
             if not is_template_available:
                 self.msg = "Configuration Template config is not applied to the Cisco Catalyst Center."
                 self.status = "failed"
                 return self
 
             self.get_have_template(config, is_template_available)
-            self.log("Desired State (have): {0}".format(self.want.get("template_params")), "INFO")
-            self.log("Current State (want): {0}".format(self.have_template.get("template")), "INFO")
+            self.log("Desired State (have): {0}", "INFO", self.want.get("template_params"))
+            self.log("Current State (want): {0}", "INFO", self.have_template.get("template"))
             if not self.have_template.get("template"):
                 self.msg = "No template created with the name '{0}'".format(self.want.get("template_params").get("name"))
                 self.status = "failed"
@@ -2607,8 +2601,8 @@ class Template(DnacBase):
         """
 
         if config.get("configuration_templates") is not None:
-            self.log("Current State (have): {0}".format(self.have), "INFO")
-            self.log("Desired State (want): {0}".format(self.want), "INFO")
+            self.log("Current State (have): {0}", "INFO", self.have)
+            self.log("Desired State (want): {0}", "INFO", self.want)
             template_list = self.dnac_apply['exec'](
                 family="configuration_templates",
                 function="gets_the_templates_available",
@@ -2632,6 +2626,66 @@ class Template(DnacBase):
         self.status = "success"
         return self
 
+    def get_fingerprint_objects(self, config):
+        """
+        Get the template managed by a config item, for 'dnac_fingerprint_store'.
+
+        Parameters:
+            config (dict) - Playbook details containing template information.
+
+        Returns:
+            list - The ('template', 'project_name/template_name') pair of the template,
+                   None for the items exporting or importing, they are never skipped.
+        """
+
+        if config.get("export") or config.get("import"):
+            return None
+
+        configuration_templates = config.get("configuration_templates") or {}
+        project_name = configuration_templates.get("project_name")
+        template_name = configuration_templates.get("template_name")
+        if not (project_name and template_name):
+            return None
+
+        return [("template", "{0}/{1}".format(project_name, template_name))]
+
+    def list_fingerprint_markers(self, kind):
+        """
+        Get the last update time of all the templates, with the 'get_templates_details' API.
+
+        Parameters:
+            kind (str) - The kind of objects, 'template'.
+
+        Returns:
+            dict - The last update time of every template by 'project_name/template_name'.
+        """
+
+        markers = {}
+        for template in self.paginate("configuration_templates", "get_templates_details"):
+            name = "{0}/{1}".format(template.get("projectName"), template.get("name"))
+            markers[name] = template.get("lastUpdateTime") or template
+
+        return markers
+
+    def skip_unchanged(self, config):
+        """
+        Skip a template unchanged since the last run, reported as not needing an update.
+
+        Parameters:
+            config (dict) - Playbook details containing template information.
+
+        Returns:
+            bool - True when the template is skipped.
+        """
+
+        if not super().skip_unchanged(config):
+            return False
+
+        self.result['response'][0].get("configurationTemplate").update({
+            'msg': "Template does not need update"
+        })
+        return True
+
     def reset_values(self):
         """
         Reset all neccessary attributes to default values.
@@ -2663,10 +2717,26 @@ def main():
         "dnac_log_level": {"type": 'str', "default": 'WARNING'},
         "dnac_log_file_path": {"type": 'str', "default": 'dnac.log'},
         "dnac_log_append": {"type": 'bool', "default": True},
+        "dnac_log_max_bytes": {"type": 'int', "default": 0},
+        "dnac_log_backup_count": {"type": 'int', "default": 5},
+        "dnac_log_compress": {"type": 'bool', "default": False},
+        "dnac_log_format": {"type": 'str', "default": 'text', "choices": ['text', 'json']},
         'validate_response_schema': {'type': 'bool', 'default': True},
         "config_verify": {"type": 'bool', "default": False},
         'dnac_api_task_timeout': {'type': 'int', "default": 1200},
         'dnac_task_poll_interval': {'type': 'int', "default": 2},
+        'dnac_token_cache': {'type': 'bool', 'default': False},
+        'dnac_rate_limit': {'type': 'float', 'default': 0},
+        'dnac_rate_limit_per_family': {'type': 'bool', 'default': False},
+        'dnac_rate_limit_retries': {'type': 'int', 'default': 5},
+        'dnac_shared_rate_limit': {'type': 'float', 'default': 0},
+        'dnac_shared_family_concurrency': {'type': 'int', 'default': 0},
+        'dnac_memoize_reads': {'type': 'bool', 'default': False},
+        'dnac_metrics': {'type': 'bool', 'default': False},
+        'dnac_metrics_file': {'type': 'str'},
+        'dnac_timings': {'type': 'bool', 'default': False},
+        'dnac_timings_file': {'type': 'str'},
+        'dnac_fingerprint_store': {'type': 'str'},
         'config': {'required': True, 'type': 'list', 'elements': 'dict'},
         'state': {'default': 'merged', 'choices': ['merged', 'deleted']}
     }
@@ -2683,12 +2753,16 @@ def main():
 
     for config in ccc_template.validated_config:
         ccc_template.reset_values()
+        if ccc_template.skip_unchanged(config):
+            continue
         ccc_template.get_have(config).check_return_status()
         ccc_template.get_want(config).check_return_status()
         ccc_template.get_diff_state_apply[state](config).check_return_status()
         if config_verify:
             ccc_template.verify_diff_state_apply[state](config).check_return_status()
+        ccc_template.keep_fingerprint()
 
+    ccc_template.save_fingerprints()
     module.exit_json(**ccc_template.result)
 
 
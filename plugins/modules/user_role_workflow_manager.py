@@ -1026,7 +1026,7 @@ class UserandRole(DnacBase):
                 break
 
         if not is_valid_password:
-            self.log("Password validation failed: {0}".format(password_criteria_message), "DEBUG")
+            self.log("Password validation failed: {0}", "DEBUG", password_criteria_message)
             error_messages.append(password_criteria_message)
 
     def validate_role_parameters(self, role_key, params_list, role_config, role_param_map, error_messages):
@@ -1036,21 +1036,20 @@ class UserandRole(DnacBase):
         role_list = role_config.get(role_key, [])
         if role_list is not None:
             for role in role_list:
-                self.log("Validating role: {0}".format(role), "DEBUG")
+                self.log("Validating role: {0}", "DEBUG", role)
                 for param in params_list:
                     if role.get(param):
-                        self.log("Validating parameter '{0}' with value '{1}'".format(param, role[param]), "DEBUG")
+                        self.log("Validating parameter '{0}' with value '{1}'", "DEBUG", param, role[param])
                         self.validate_string_parameter(param, role[param], error_messages)
 
                 if role == "network_provision":
                     inventory_management_list = role.get("inventory_management", [])
                     if inventory_management_list is not None:
                         for inventory_management in inventory_management_list:
-                            self.log("Validating inventory management: {0}".format(inventory_management), "DEBUG")
+                            self.log("Validating inventory management: {0}", "DEBUG", inventory_management)
                             for param in role_param_map["inventory_management"]:
                                 if inventory_management.get(param):
-                                    self.log("Validating inventory management parameter '{0}' with value '{1}'".format(param, inventory_management[param]),
-                                             "DEBUG")
+                                    self.log("Validating inventory management parameter '{0}' with value '{1}'", "DEBUG", param, inventory_management[param])
                                     self.validate_string_parameter(param, inventory_management[param], error_messages)
 
     def identify_invalid_params(self, params, mismatches):
@@ -1081,7 +1080,7 @@ class UserandRole(DnacBase):
         if isinstance(params, dict):
             for key, value in params.items():
                 if key not in allowed_params:
-                    self.log("Invalid parameter detected: {0}".format(key), "ERROR")
+                    self.log("Invalid parameter detected: {0}", "ERROR", key)
                     mismatches.append(key)
 
                 if isinstance(value, dict) or isinstance(value, list):
@@ -1260,7 +1259,7 @@ class UserandRole(DnacBase):
             want[key] = value
 
         self.want = want
-        self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+        self.log("Desired State (want): {0}", "INFO", self.want)
         return self
 
     def update_have_with_role(self, have, role_exists, current_role_config):
@@ -1301,16 +1300,16 @@ class UserandRole(DnacBase):
 
         if "role_name" in input_config and input_config["role_name"] is not None:
             role_exists, current_role_config = self.get_current_config(input_config)
-            self.log("Current role config details (have): {0}".format(str(current_role_config)), "DEBUG")
+            self.log("Current role config details (have): {0}", "DEBUG", current_role_config)
             self.update_have_with_role(have, role_exists, current_role_config)
 
         if "username" in input_config or "email" in input_config:
             user_exists, current_user_config, current_role_id_config = self.get_current_config(input_config)
-            self.log("Current user config details (have): {0}".format(str(current_user_config)), "DEBUG")
+            self.log("Current user config details (have): {0}", "DEBUG", current_user_config)
             self.update_have_with_user(have, user_exists, current_user_config, current_role_id_config)
 
         self.have = have
-        self.log("Current State (have): {0}".format(str(self.have)), "INFO")
+        self.log("Current State (have): {0}", "INFO", self.have)
         return self
 
     def get_diff_merged(self, config):
@@ -1338,7 +1337,7 @@ class UserandRole(DnacBase):
             if self.have.get("role_exists"):
                 self.valid_role_config_parameters(config).check_return_status()
                 desired_role = self.generate_role_payload(self.want, "update")
-                self.log("desired role with config {0}".format(str(desired_role)), "DEBUG")
+                self.log("desired role with config {0}", "DEBUG", desired_role)
 
                 if "error_message" not in desired_role:
                     consolidated_data, update_required_param = self.role_requires_update(self.have["current_role_config"], desired_role)
@@ -1358,7 +1357,7 @@ class UserandRole(DnacBase):
             else:
                 # Create the role
                 self.valid_role_config_parameters(config).check_return_status()
-                self.log("Creating role with config {0}".format(str(config)), "DEBUG")
+                self.log("Creating role with config {0}", "DEBUG", config)
                 role_info_params = self.generate_role_payload(self.want, "create")
 
                 if "error_message" not in role_info_params:
@@ -1403,7 +1402,7 @@ class UserandRole(DnacBase):
             else:
                 # Create the user
                 self.valid_user_config_parameters(config).check_return_status()
-                self.log("Creating user with config {0}".format(str(config)), "DEBUG")
+                self.log("Creating user with config {0}", "DEBUG", config)
                 user_params = self.want
 
                 user_details = {}
@@ -1419,7 +1418,7 @@ class UserandRole(DnacBase):
                                 if role_id:
                                     user_details[key].append(role_id)
                                 else:
-                                    self.log("Role ID for {0} not found in current_role_id_config".format(str(role_name)), "DEBUG")
+                                    self.log("Role ID for {0} not found in current_role_id_config", "DEBUG", role_name)
 
                 if "role_list" not in user_details:
                     default_role = self.have.get("current_role_id_config")
@@ -1434,7 +1433,7 @@ class UserandRole(DnacBase):
                                      " Please provide a valid role name"}
 
         if task_response and "error_message" not in task_response:
-            self.log("Task respoonse {0}".format(str(task_response)), "INFO")
+            self.log("Task respoonse {0}", "INFO", task_response)
             responses["operation"] = {"response": task_response}
             self.msg = responses
             self.result["response"] = self.msg
@@ -1479,7 +1478,7 @@ class UserandRole(DnacBase):
         current_role_id = {}
 
         if "role_name" in input_config and input_config["role_name"] is not None:
-            self.log("Retrieving role details for role_name: {0}".format(str(input_config["role_name"])), "DEBUG")
+            self.log("Retrieving role details for role_name: {0}", "DEBUG", input_config["role_name"])
 
             response_role = self.get_role()
             response_role = self.camel_to_snake_case(response_role)
@@ -1490,13 +1489,11 @@ class UserandRole(DnacBase):
                     current_role_configuration = role
                     role_exists = True
 
-            self.log("Role retrieval result - role_exists: {0}, current_role_configuration: {1}".format(
-                str(role_exists), str(current_role_configuration)), "DEBUG")
+            self.log("Role retrieval result - role_exists: {0}, current_role_configuration: {1}", "DEBUG", role_exists, current_role_configuration)
             return role_exists, current_role_configuration
 
         if "username" in input_config or "email" in input_config:
-            self.log("Retrieving user details for username: {0}, email: {1}".format(
-                str(input_config.get("username")), str(input_config.get("email"))), "DEBUG")
+            self.log("Retrieving user details for username: {0}, email: {1}", "DEBUG", input_config.get("username"), input_config.get("email"))
             response_user = self.get_user()
             response_role = self.get_role()
             response_user = self.camel_to_snake_case(response_user)
@@ -1513,8 +1510,7 @@ class UserandRole(DnacBase):
                         current_user_configuration = user
                         user_exists = True
 
-            self.log("User retrieval result - user_exists: {0}, current_user_configuration: {1}".format(
-                str(user_exists), str(current_user_configuration)), "DEBUG")
+            self.log("User retrieval result - user_exists: {0}, current_user_configuration: {1}", "DEBUG", user_exists, current_user_configuration)
 
             if input_config.get("role_list"):
                 for role_name in input_config["role_list"]:
@@ -1526,7 +1522,7 @@ class UserandRole(DnacBase):
                     if role.get("name").lower() == "observer-role":
                         current_role_id[role.get("name").lower()] = role.get("role_id")
 
-            self.log("Role ID retrieval result - current_role_id: {0}".format(str(current_role_id)), "DEBUG")
+            self.log("Role ID retrieval result - current_role_id: {0}", "DEBUG", current_role_id)
             return user_exists, current_user_configuration, current_role_id
 
     def create_user(self, user_params):
@@ -1572,12 +1568,12 @@ class UserandRole(DnacBase):
                 op_modifies=True,
                 params=user_params,
             )
-            self.log("Received API response from create_user: {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from create_user: {0}", "DEBUG", response)
             self.created_user.append(user_params.get("username"))
             return response
 
         except Exception as e:
-            self.log("Unexpected error occurred: {0}".format(str(e)), "ERROR")
+            self.log("Unexpected error occurred: {0}", "ERROR", e)
             if "[403]" in str(e):
                 error_message = (
                     "The Catalyst Center user '{0}' does not have the necessary permissions to 'create or update' a user through the API.".format(
@@ -1603,19 +1599,19 @@ class UserandRole(DnacBase):
             - Returns the API response from the "create_role" function.
         """
         try:
-            self.log("Create role with role_info_params: {0}".format(str(role_params)), "DEBUG")
+            self.log("Create role with role_info_params: {0}", "DEBUG", role_params)
             response = self.dnac._exec(
                 family="user_and_roles",
                 function="add_role_api",
                 op_modifies=True,
                 params=role_params,
             )
-            self.log("Received API response from create_role: {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from create_role: {0}", "DEBUG", response)
             self.created_role.append(role_params.get("role"))
             return response
 
         except Exception as e:
-            self.log("Unexpected error occurred: {0}".format(str(e)), "ERROR")
+            self.log("Unexpected error occurred: {0}", "ERROR", e)
             error_message = "The Catalyst Center user '{0}' does not have the necessary permissions to 'create a role' through the API.".format(
                 self.payload.get("dnac_username"))
             return {"error_message": error_message}
@@ -1638,7 +1634,7 @@ class UserandRole(DnacBase):
             op_modifies=True,
             params={"invoke_source": "external"},
         )
-        self.log("Received API response from get_users_api: {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from get_users_api: {0}", "DEBUG", response)
         return response
 
     def get_role(self):
@@ -1658,7 +1654,7 @@ class UserandRole(DnacBase):
             function="get_roles_api",
             op_modifies=True,
         )
-        self.log("Received API response from get_roles_api: {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from get_roles_api: {0}", "DEBUG", response)
         return response
 
     def add_entries(self, entry_types, operations, unique_types):
@@ -1669,7 +1665,7 @@ class UserandRole(DnacBase):
                 "operations": operations
             }
             unique_types[new_entry["type"]] = new_entry
-            self.log("Added entry: {0}".format(new_entry), "DEBUG")
+            self.log("Added entry: {0}", "DEBUG", new_entry)
 
     def process_assurance_rules(self, role_config, role_operation, unique_types):
         """
@@ -1701,7 +1697,7 @@ class UserandRole(DnacBase):
         for assurance_rule in role_config["assurance"]:
             for resource_name, permission in assurance_rule.items():
                 if permission is None:
-                    self.log("Skipping resource {0} because permission is None".format(resource_name), "DEBUG")
+                    self.log("Skipping resource {0} because permission is None", "DEBUG", resource_name)
                     continue
 
                 permission = permission.lower()
@@ -1713,11 +1709,11 @@ class UserandRole(DnacBase):
                     return {"error_message": error_message}
 
                 if permission == "deny":
-                    self.log("Skipping resource {0} because permission is 'deny'".format(resource_name), "DEBUG")
+                    self.log("Skipping resource {0} because permission is 'deny'", "DEBUG", resource_name)
                     continue
 
                 operations = self.convert_permission_to_operations(permission)
-                self.log("Converted permission {0} to operations {1}".format(permission, operations), "DEBUG")
+                self.log("Converted permission {0} to operations {1}", "DEBUG", permission, operations)
 
                 if resource_name == "overall":
                     self.add_entries(entry_types, operations, unique_types)
@@ -1727,14 +1723,14 @@ class UserandRole(DnacBase):
                         "operations": operations
                     }
                     unique_types[new_entry["type"]] = new_entry
-                    self.log("Added entry for 'monitoring_and_troubleshooting': {0}".format(new_entry), "DEBUG")
+                    self.log("Added entry for 'monitoring_and_troubleshooting': {0}", "DEBUG", new_entry)
                 else:
                     new_entry = {
                         "type": "Assurance.{0}".format(resource_name.replace("_", " ").title()),
                         "operations": operations
                     }
                     unique_types[new_entry["type"]] = new_entry
-                    self.log("Added entry for resource {0}: {1}".format(resource_name, new_entry), "DEBUG")
+                    self.log("Added entry for resource {0}: {1}", "DEBUG", resource_name, new_entry)
         return {}
 
     def process_network_analytics_rules(self, role_config, role_operation, unique_types):
@@ -1766,7 +1762,7 @@ class UserandRole(DnacBase):
         for network_analytics_rule in role_config["network_analytics"]:
             for resource_name, permission in network_analytics_rule.items():
                 if permission is None:
-                    self.log("Skipping resource {0} because permission is None".format(resource_name), "DEBUG")
+                    self.log("Skipping resource {0} because permission is None", "DEBUG", resource_name)
                     continue
 
                 permission = permission.lower()
@@ -1778,11 +1774,11 @@ class UserandRole(DnacBase):
                     return {"error_message": error_message}
 
                 if permission == "deny":
-                    self.log("Skipping resource {0} because permission is 'deny'".format(resource_name), "DEBUG")
+                    self.log("Skipping resource {0} because permission is 'deny'", "DEBUG", resource_name)
                     continue
 
                 operations = self.convert_permission_to_operations(permission)
-                self.log("Converted permission {0} to operations {1}".format(permission, operations), "DEBUG")
+                self.log("Converted permission {0} to operations {1}", "DEBUG", permission, operations)
 
                 if resource_name == "overall":
                     unique_types[entry_types["type"]] = entry_types
@@ -1792,7 +1788,7 @@ class UserandRole(DnacBase):
                         "operations": operations
                     }
                     unique_types[new_entry["type"]] = new_entry
-                    self.log("Added entry for resource {0}: {1}".format(resource_name, new_entry), "DEBUG")
+                    self.log("Added entry for resource {0}: {1}", "DEBUG", resource_name, new_entry)
         return {}
 
     def process_network_design_rules(self, role_config, role_operation, unique_types):
@@ -1828,7 +1824,7 @@ class UserandRole(DnacBase):
         for network_design_rule in role_config["network_design"]:
             for resource_name, permission in network_design_rule.items():
                 if permission is None:
-                    self.log("Skipping resource {0} because permission is None".format(resource_name), "DEBUG")
+                    self.log("Skipping resource {0} because permission is None", "DEBUG", resource_name)
                     continue
 
                 permission = permission.lower()
@@ -1840,11 +1836,11 @@ class UserandRole(DnacBase):
                     return {"error_message": error_message}
 
                 if permission == "deny":
-                    self.log("Skipping resource {0} because permission is 'deny'".format(resource_name), "DEBUG")
+                    self.log("Skipping resource {0} because permission is 'deny'", "DEBUG", resource_name)
                     continue
 
                 operations = self.convert_permission_to_operations(permission)
-                self.log("Converted permission {0} to operations {1}".format(permission, operations), "DEBUG")
+                self.log("Converted permission {0} to operations {1}", "DEBUG", permission, operations)
 
                 if resource_name == "overall":
                     self.add_entries(entry_types, operations, unique_types)
@@ -1854,7 +1850,7 @@ class UserandRole(DnacBase):
                         "operations": operations
                     }
                     unique_types[new_entry["type"]] = new_entry
-                    self.log("Added entry for resource {0}: {1}".format(resource_name, new_entry), "DEBUG")
+                    self.log("Added entry for resource {0}: {1}", "DEBUG", resource_name, new_entry)
         return {}
 
     def process_network_provision_rules(self, role_config, role_operation, unique_types):
@@ -1904,7 +1900,7 @@ class UserandRole(DnacBase):
                     # Handle nested inventory_management
                     for sub_resource_name, sub_permission in permission[0].items():
                         if sub_permission is None:
-                            self.log("Skipping sub-resource {0} because permission is None".format(sub_resource_name), "DEBUG")
+                            self.log("Skipping sub-resource {0} because permission is None", "DEBUG", sub_resource_name)
                             continue
 
                         sub_permission = sub_permission.lower()
@@ -1916,11 +1912,11 @@ class UserandRole(DnacBase):
                             return {"error_message": error_message}
 
                         if sub_permission == "deny":
-                            self.log("Skipping sub-resource {0} because permission is 'deny'".format(sub_resource_name), "DEBUG")
+                            self.log("Skipping sub-resource {0} because permission is 'deny'", "DEBUG", sub_resource_name)
                             continue
 
                         operations = self.convert_permission_to_operations(sub_permission)
-                        self.log("Converted sub-permission {0} to operations {1}".format(sub_permission, operations), "DEBUG")
+                        self.log("Converted sub-permission {0} to operations {1}", "DEBUG", sub_permission, operations)
 
                         if sub_resource_name == "overall":
                             overall_entry_types = [
@@ -1938,10 +1934,10 @@ class UserandRole(DnacBase):
                                 "operations": operations
                             }
                             unique_types[new_entry["type"]] = new_entry
-                            self.log("Added entry for resource {0}: {1}".format(sub_resource_name, new_entry), "DEBUG")
+                            self.log("Added entry for resource {0}: {1}", "DEBUG", sub_resource_name, new_entry)
                 else:
                     if permission is None:
-                        self.log("Skipping resource {0} because permission is None".format(resource_name), "DEBUG")
+                        self.log("Skipping resource {0} because permission is None", "DEBUG", resource_name)
                         continue
 
                     permission = permission.lower()
@@ -1953,11 +1949,11 @@ class UserandRole(DnacBase):
                         return {"error_message": error_message}
 
                     if permission == "deny":
-                        self.log("Skipping resource {0} because permission is 'deny'".format(resource_name), "DEBUG")
+                        self.log("Skipping resource {0} because permission is 'deny'", "DEBUG", resource_name)
                         continue
 
                     operations = self.convert_permission_to_operations(permission)
-                    self.log("Converted permission {0} to operations {1}".format(permission, operations), "DEBUG")
+                    self.log("Converted permission {0} to operations {1}", "DEBUG", permission, operations)
 
                     if resource_name == "overall":
                         self.add_entries(entry_types, operations, unique_types)
@@ -1967,21 +1963,21 @@ class UserandRole(DnacBase):
                             "operations": operations
                         }
                         unique_types[new_entry["type"]] = new_entry
-                        self.log("Added entry for 'eox': {0}".format(new_entry), "DEBUG")
+                        self.log("Added entry for 'eox': {0}", "DEBUG", new_entry)
                     elif resource_name == "pnp":
                         new_entry = {
                             "type": "Network Provision.PnP",
                             "operations": operations
                         }
                         unique_types[new_entry["type"]] = new_entry
-                        self.log("Added entry for 'pnp': {0}".format(new_entry), "DEBUG")
+                        self.log("Added entry for 'pnp': {0}", "DEBUG", new_entry)
                     else:
                         new_entry = {
                             "type": "Network Provision.{0}".format(resource_name.replace("_", " ").title()),
                             "operations": operations
                         }
                         unique_types[new_entry["type"]] = new_entry
-                        self.log("Added entry for resource {0}: {1}".format(resource_name, new_entry), "DEBUG")
+                        self.log("Added entry for resource {0}: {1}", "DEBUG", resource_name, new_entry)
         return {}
 
     def process_network_services_rules(self, role_config, role_operation, unique_types):
@@ -2015,7 +2011,7 @@ class UserandRole(DnacBase):
         for services_rule in role_config["network_services"]:
             for resource_name, permission in services_rule.items():
                 if permission is None:
-                    self.log("Skipping resource {0} because permission is None".format(resource_name), "DEBUG")
+                    self.log("Skipping resource {0} because permission is None", "DEBUG", resource_name)
                     continue
 
                 permission = permission.lower()
@@ -2027,11 +2023,11 @@ class UserandRole(DnacBase):
                     return {"error_message": error_message}
 
                 if permission == "deny":
-                    self.log("Skipping resource {0} because permission is 'deny'".format(resource_name), "DEBUG")
+                    self.log("Skipping resource {0} because permission is 'deny'", "DEBUG", resource_name)
                     continue
 
                 operations = self.convert_permission_to_operations(permission)
-                self.log("Converted permission {0} to operations {1}".format(permission, operations), "DEBUG")
+                self.log("Converted permission {0} to operations {1}", "DEBUG", permission, operations)
 
                 if resource_name == "overall":
                     self.add_entries(entry_types, operations, unique_types)
@@ -2041,7 +2037,7 @@ class UserandRole(DnacBase):
                         "operations": operations
                     }
                     unique_types[new_entry["type"]] = new_entry
-                    self.log("Added entry for resource {0}: {1}".format(resource_name, new_entry), "DEBUG")
+                    self.log("Added entry for resource {0}: {1}", "DEBUG", resource_name, new_entry)
         return {}
 
     def process_platform_rules(self, role_config, unique_types):
@@ -2061,7 +2057,7 @@ class UserandRole(DnacBase):
         for platform_rule in role_config["platform"]:
             for resource_name, permission in platform_rule.items():
                 if permission is None:
-                    self.log("Skipping resource {0} because permission is None".format(resource_name), "DEBUG")
+                    self.log("Skipping resource {0} because permission is None", "DEBUG", resource_name)
                     continue
 
                 permission = permission.lower()
@@ -2073,11 +2069,11 @@ class UserandRole(DnacBase):
                     return {"error_message": error_message}
 
                 if permission == "deny":
-                    self.log("Skipping resource {0} because permission is 'deny'".format(resource_name), "DEBUG")
+                    self.log("Skipping resource {0} because permission is 'deny'", "DEBUG", resource_name)
                     continue
 
                 operations = self.convert_permission_to_operations(permission)
-                self.log("Converted permission {0} to operations {1}".format(permission, operations), "DEBUG")
+                self.log("Converted permission {0} to operations {1}", "DEBUG", permission, operations)
 
                 if resource_name == "overall":
                     overall_entry_types = [
@@ -2093,14 +2089,14 @@ class UserandRole(DnacBase):
                         "operations": operations
                     }
                     unique_types[new_entry["type"]] = new_entry
-                    self.log("Added entry for 'apis': {0}".format(new_entry), "DEBUG")
+                    self.log("Added entry for 'apis': {0}", "DEBUG", new_entry)
                 else:
                     new_entry = {
                         "type": "Platform.{0}".format(resource_name.replace("_", " ").title()),
                         "operations": operations
                     }
                     unique_types[new_entry["type"]] = new_entry
-                    self.log("Added entry for resource {0}: {1}".format(resource_name, new_entry), "DEBUG")
+                    self.log("Added entry for resource {0}: {1}", "DEBUG", resource_name, new_entry)
         return {}
 
     def process_security_rules(self, role_config, role_operation, unique_types):
@@ -2133,7 +2129,7 @@ class UserandRole(DnacBase):
         for security_rule in role_config["security"]:
             for resource_name, permission in security_rule.items():
                 if permission is None:
-                    self.log("Skipping resource {0} because permission is None".format(resource_name), "DEBUG")
+                    self.log("Skipping resource {0} because permission is None", "DEBUG", resource_name)
                     continue
 
                 permission = permission.lower()
@@ -2145,11 +2141,11 @@ class UserandRole(DnacBase):
                     return {"error_message": error_message}
 
                 if permission == "deny":
-                    self.log("Skipping resource {0} because permission is 'deny'".format(resource_name), "DEBUG")
+                    self.log("Skipping resource {0} because permission is 'deny'", "DEBUG", resource_name)
                     continue
 
                 operations = self.convert_permission_to_operations(permission)
-                self.log("Converted permission {0} to operations {1}".format(permission, operations), "DEBUG")
+                self.log("Converted permission {0} to operations {1}", "DEBUG", permission, operations)
 
                 if resource_name == "overall":
                     self.add_entries(entry_types, operations, unique_types)
@@ -2159,21 +2155,21 @@ class UserandRole(DnacBase):
                         "operations": operations
                     }
                     unique_types[new_entry["type"]] = new_entry
-                    self.log("Added entry for 'ip_based_access_control': {0}".format(new_entry), "DEBUG")
+                    self.log("Added entry for 'ip_based_access_control': {0}", "DEBUG", new_entry)
                 elif resource_name == "group_based_policy":
                     new_entry = {
                         "type": "Security.Group-Based Policy",
                         "operations": operations
                     }
                     unique_types[new_entry["type"]] = new_entry
-                    self.log("Added entry for 'group_based_policy': {0}".format(new_entry), "DEBUG")
+                    self.log("Added entry for 'group_based_policy': {0}", "DEBUG", new_entry)
                 else:
                     new_entry = {
                         "type": "Security.{0}".format(resource_name.replace("_", " ").title()),
                         "operations": operations
                     }
                     unique_types[new_entry["type"]] = new_entry
-                    self.log("Added entry for resource {0}: {1}".format(resource_name, new_entry), "DEBUG")
+                    self.log("Added entry for resource {0}: {1}", "DEBUG", resource_name, new_entry)
         return {}
 
     def process_system_rules(self, role_config, role_operation, unique_types):
@@ -2205,7 +2201,7 @@ class UserandRole(DnacBase):
         for system_rule in role_config["system"]:
             for resource_name, permission in system_rule.items():
                 if permission is None:
-                    self.log("Skipping resource {0} because permission is None".format(resource_name), "DEBUG")
+                    self.log("Skipping resource {0} because permission is None", "DEBUG", resource_name)
                     continue
 
                 permission = permission.lower()
@@ -2217,11 +2213,11 @@ class UserandRole(DnacBase):
                     return {"error_message": error_message}
 
                 if permission == "deny":
-                    self.log("Skipping resource {0} because permission is 'deny'".format(resource_name), "DEBUG")
+                    self.log("Skipping resource {0} because permission is 'deny'", "DEBUG", resource_name)
                     continue
 
                 operations = self.convert_permission_to_operations(permission)
-                self.log("Converted permission {0} to operations {1}".format(permission, operations), "DEBUG")
+                self.log("Converted permission {0} to operations {1}", "DEBUG", permission, operations)
 
                 if resource_name == "overall":
                     self.add_entries(entry_types, operations, unique_types)
@@ -2231,7 +2227,7 @@ class UserandRole(DnacBase):
                         "operations": operations
                     }
                     unique_types[new_entry["type"]] = new_entry
-                    self.log("Added entry for resource {0}: {1}".format(resource_name, new_entry), "DEBUG")
+                    self.log("Added entry for resource {0}: {1}", "DEBUG", resource_name, new_entry)
         return {}
 
     def process_utilities_rules(self, role_config, role_operation, unique_types):
@@ -2269,7 +2265,7 @@ class UserandRole(DnacBase):
         for utilities_rule in role_config["utilities"]:
             for resource_name, permission in utilities_rule.items():
                 if permission is None:
-                    self.log("Skipping resource {0} because permission is None".format(resource_name), "DEBUG")
+                    self.log("Skipping resource {0} because permission is None", "DEBUG", resource_name)
                     continue
 
                 permission = permission.lower()
@@ -2281,11 +2277,11 @@ class UserandRole(DnacBase):
                     return {"error_message": error_message}
 
                 if permission == "deny":
-                    self.log("Skipping resource {0} because permission is 'deny'".format(resource_name), "DEBUG")
+                    self.log("Skipping resource {0} because permission is 'deny'", "DEBUG", resource_name)
                     continue
 
                 operations = self.convert_permission_to_operations(permission)
-                self.log("Converted permission {0} to operations {1}".format(permission, operations), "DEBUG")
+                self.log("Converted permission {0} to operations {1}", "DEBUG", permission, operations)
 
                 if resource_name == "overall":
                     overall_entry_types = [
@@ -2303,7 +2299,7 @@ class UserandRole(DnacBase):
                         "operations": operations
                     }
                     unique_types[new_entry["type"]] = new_entry
-                    self.log("Added entry for resource {0}: {1}".format(resource_name, new_entry), "DEBUG")
+                    self.log("Added entry for resource {0}: {1}", "DEBUG", resource_name, new_entry)
         return {}
 
     def generate_role_payload(self, role_config, role_operation):
@@ -2348,24 +2344,24 @@ class UserandRole(DnacBase):
         # Process each section and check for errors
         for process_func in processing_functions:
             func_name = process_func.__name__
-            self.log("Processing with {0}...".format(func_name), "DEBUG")
+            self.log("Processing with {0}...", "DEBUG", func_name)
             if func_name in "process_platform_rules":
                 function_response = process_func(role_config, unique_types)
             else:
                 function_response = process_func(role_config, role_operation, unique_types)
             if function_response:
-                self.log("Error occurred in {0}: {1}".format(func_name, function_response), "DEBUG")
+                self.log("Error occurred in {0}: {1}", "DEBUG", func_name, function_response)
                 return function_response
 
         # Construct the final payload
         resource_types_list = list(unique_types.values())
-        self.log("Generated resource types: {0}".format(resource_types_list), "DEBUG")
+        self.log("Generated resource types: {0}", "DEBUG", resource_types_list)
         payload = {
             "role": role_name,
             "description": description,
             "resourceTypes": resource_types_list
         }
-        self.log("Generated payload: {0}".format(payload), "DEBUG")
+        self.log("Generated payload: {0}", "DEBUG", payload)
 
         return payload
 
@@ -2416,12 +2412,12 @@ class UserandRole(DnacBase):
                 if have_resource["type"] == want_resource["type"]:
                     resource_found = True
                     if have_resource["operations"] != want_resource["operations"]:
-                        self.log("Updating operations for resource type {0}.".format(want_resource["type"]), "DEBUG")
+                        self.log("Updating operations for resource type {0}.", "DEBUG", want_resource["type"])
                         have_resource["operations"] = want_resource["operations"]
                         update_required = True
                     break
             if not resource_found:
-                self.log("Adding new resource type {0} to current role.".format(want_resource["type"]), "DEBUG")
+                self.log("Adding new resource type {0} to current role.", "DEBUG", want_resource["type"])
                 current_role["resource_types"].append(want_resource)
                 update_required = True
 
@@ -2430,7 +2426,7 @@ class UserandRole(DnacBase):
         current_description = current_role.get("description")
         if desired_description is not None:
             if current_description != desired_description:
-                self.log("Updating description from {0} to {1}.".format(current_description, desired_description), "DEBUG")
+                self.log("Updating description from {0} to {1}.", "DEBUG", current_description, desired_description)
                 update_role_params["description"] = desired_description
                 update_required = True
             elif "description" not in update_role_params:
@@ -2483,7 +2479,7 @@ class UserandRole(DnacBase):
         current_first_name = current_user.get("first_name")
         if desired_first_name is not None:
             if current_first_name != desired_first_name:
-                self.log("Updating first name from {0} to {1}.".format(current_first_name, desired_first_name), "DEBUG")
+                self.log("Updating first name from {0} to {1}.", "DEBUG", current_first_name, desired_first_name)
                 update_user_params["first_name"] = desired_first_name
                 update_needed = True
             elif "first_name" not in update_user_params:
@@ -2496,7 +2492,7 @@ class UserandRole(DnacBase):
         current_last_name = current_user.get("last_name")
         if desired_last_name is not None:
             if current_last_name != desired_last_name:
-                self.log("Updating last name from {0} to {1}.".format(current_last_name, desired_last_name), "DEBUG")
+                self.log("Updating last name from {0} to {1}.", "DEBUG", current_last_name, desired_last_name)
                 update_user_params["last_name"] = desired_last_name
                 update_needed = True
             elif "last_name" not in update_user_params:
@@ -2509,7 +2505,7 @@ class UserandRole(DnacBase):
         current_username = current_user.get("username")
         if desired_username is not None:
             if current_username != desired_username:
-                self.log("Username for an existing User cannot be updated from {0} to {1}.".format(current_username, desired_username), "DEBUG")
+                self.log("Username for an existing User cannot be updated from {0} to {1}.", "DEBUG", current_username, desired_username)
                 update_user_params["username"] = desired_username
                 update_needed = True
             elif "username" not in update_user_params:
@@ -2522,7 +2518,7 @@ class UserandRole(DnacBase):
         current_email = current_user.get("email")
         if desired_email is not None:
             if current_email != desired_email:
-                self.log("Updating email from {0} to {1}.".format(current_email, desired_email), "DEBUG")
+                self.log("Updating email from {0} to {1}.", "DEBUG", current_email, desired_email)
                 update_user_params["email"] = desired_email
                 update_needed = True
             elif "email" not in update_user_params:
@@ -2538,19 +2534,19 @@ class UserandRole(DnacBase):
             if desired_role_name in current_role:
                 role_id = current_role[desired_role_name]
                 if current_role_list[0] != role_id:
-                    self.log("Updating role list with new role ID {0}.".format(role_id), "DEBUG")
+                    self.log("Updating role list with new role ID {0}.", "DEBUG", role_id)
                     update_user_params["role_list"] = [role_id]
                     update_needed = True
                 else:
                     update_user_params["role_list"] = current_role_list
             else:
-                self.log("Role {0} not found in current_role. Setting role list to empty.".format(desired_role_name), "DEBUG")
+                self.log("Role {0} not found in current_role. Setting role list to empty.", "DEBUG", desired_role_name)
                 update_user_params["role_list"] = []
                 update_needed = True
         else:
             update_user_params["role_list"] = current_role_list
 
-        self.log("User update parameters: {0}".format(update_user_params), "DEBUG")
+        self.log("User update parameters: {0}", "DEBUG", update_user_params)
 
         return update_needed, update_user_params
 
@@ -2567,19 +2563,19 @@ class UserandRole(DnacBase):
             - user parameters. It logs the response and returns it.
         """
         try:
-            self.log("Updating user with parameters: {0}".format(user_params), "DEBUG")
+            self.log("Updating user with parameters: {0}", "DEBUG", user_params)
             response = self.dnac._exec(
                 family="user_and_roles",
                 function="update_user_api",
                 op_modifies=True,
                 params=user_params,
             )
-            self.log("Received API response from update_user: {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from update_user: {0}", "DEBUG", response)
             self.updated_user.append(user_params.get("username"))
             return response
 
         except Exception as e:
-            self.log("Unexpected error occurred: {0}".format(str(e)), "ERROR")
+            self.log("Unexpected error occurred: {0}", "ERROR", e)
             error_message = "Invalid email format for email '{0}' under username '{1}'".format(user_params.get("email"), user_params.get("username"))
             return {"error_message": error_message}
 
@@ -2599,19 +2595,19 @@ class UserandRole(DnacBase):
               finally returns the response.
         """
         try:
-            self.log("Updating role with role_info_params: {0}".format(str(role_params)), "DEBUG")
+            self.log("Updating role with role_info_params: {0}", "DEBUG", role_params)
             response = self.dnac._exec(
                 family="user_and_roles",
                 function="update_role_api",
                 op_modifies=True,
                 params=role_params,
             )
-            self.log("Received API response from update_role: {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from update_role: {0}", "DEBUG", response)
             self.updated_role.append(self.have.get("role_name"))
             return response
 
         except Exception as e:
-            self.log("Unexpected error occurred: {0}".format(str(e)), "ERROR")
+            self.log("Unexpected error occurred: {0}", "ERROR", e)
             error_message = "The catalyst center user '{0}' does not have the necessary permissions to update role through the API.".format(
                 self.payload.get("dnac_username"))
             return {"error_message": error_message}
@@ -2633,31 +2629,31 @@ class UserandRole(DnacBase):
         denied_permissions = []
 
         if isinstance(config, dict):
-            self.log("Processing dictionary with parent_key: {0}".format(parent_key), "DEBUG")
+            self.log("Processing dictionary with parent_key: {0}", "DEBUG", parent_key)
 
             for key, value in config.items():
                 if parent_key:
                     full_key = "{0}.{1}".format(parent_key, key)
                 else:
                     full_key = key
-                self.log("Checking key: {0}".format(full_key), "DEBUG")
+                self.log("Checking key: {0}", "DEBUG", full_key)
 
                 if isinstance(value, dict) or isinstance(value, list):
                     denied_permissions.extend(self.find_denied_permissions(value, full_key))
                 elif isinstance(value, str) and value.lower() == "deny":
                     denied_permissions.append(full_key)
-                self.log("Found 'deny' at key: {0}".format(full_key), "DEBUG")
+                self.log("Found 'deny' at key: {0}", "DEBUG", full_key)
 
         elif isinstance(config, list):
             for index, item in enumerate(config):
                 full_key = "{0}[{1}]".format(parent_key, index)
-                self.log("Processing list with parent_key: {0}".format(parent_key), "DEBUG")
+                self.log("Processing list with parent_key: {0}", "DEBUG", parent_key)
 
                 if isinstance(item, dict):
                     denied_permissions.extend(self.find_denied_permissions(item, full_key))
-                self.log("Found 'deny' at index: {0}".format(full_key), "DEBUG")
+                self.log("Found 'deny' at index: {0}", "DEBUG", full_key)
 
-        self.log("Denied permissions are {0}".format(str(denied_permissions)), "DEBUG")
+        self.log("Denied permissions are {0}", "DEBUG", denied_permissions)
         return denied_permissions
 
     def remove_denied_operations(self, input_data, denied_permissions):
@@ -2691,7 +2687,7 @@ class UserandRole(DnacBase):
                     denied_type_lower = "network design.network settings"
                     if denied_type_lower in resource_type_lower:
                         keep_resource = False
-                        self.log("Removing resource due to denied type: {0}".format(denied_type_lower), "DEBUG")
+                        self.log("Removing resource due to denied type: {0}", "DEBUG", denied_type_lower)
                         update_required = True
                         break
 
@@ -2699,7 +2695,7 @@ class UserandRole(DnacBase):
                     denied_type_lower = "network provision.provision"
                     if denied_type_lower in resource_type_lower:
                         keep_resource = False
-                        self.log("Removing resource due to denied type: {0}".format(denied_type_lower), "DEBUG")
+                        self.log("Removing resource due to denied type: {0}", "DEBUG", denied_type_lower)
                         update_required = True
                         break
 
@@ -2707,14 +2703,14 @@ class UserandRole(DnacBase):
                     denied_type_lower = "security.group-based policy"
                     if denied_type_lower in resource_type_lower:
                         keep_resource = False
-                        self.log("Removing resource due to denied type: {0}".format(denied_type_lower), "DEBUG")
+                        self.log("Removing resource due to denied type: {0}", "DEBUG", denied_type_lower)
                         update_required = True
                         break
 
                 else:
                     if denied_type_lower in resource_type_lower:
                         keep_resource = False
-                        self.log("Removing resource due to denied type: {0}".format(denied_type_lower), "DEBUG")
+                        self.log("Removing resource due to denied type: {0}", "DEBUG", denied_type_lower)
                         update_required = True
                         break
 
@@ -2722,7 +2718,7 @@ class UserandRole(DnacBase):
                 remaining_resource_types.append(resource)
 
         input_data["resourceTypes"] = remaining_resource_types
-        self.log("Removal complete. Update required: {0}".format(update_required), "DEBUG")
+        self.log("Removal complete. Update required: {0}", "DEBUG", update_required)
 
         return update_required, input_data
 
@@ -2773,16 +2769,16 @@ class UserandRole(DnacBase):
         for key in keys:
             if key in current_level:
                 current_level = current_level[key]
-                self.log("Navigated to level: {0}".format(key), "DEBUG")
+                self.log("Navigated to level: {0}", "DEBUG", key)
             elif "overall" in current_level and current_level["overall"].lower() == "deny":
-                self.log("Permission denied at level: {0}".format(key), "DEBUG")
+                self.log("Permission denied at level: {0}", "DEBUG", key)
                 return True, False
             else:
-                self.log("Permission allowed at level: {0}".format(key), "DEBUG")
+                self.log("Permission allowed at level: {0}", "DEBUG", key)
                 return False, True
 
         overall_permission = "overall" in current_level and current_level["overall"].lower() == "deny"
-        self.log("Final permission check: Denied: {0}, Allowed: {1}".format(overall_permission, not overall_permission), "DEBUG")
+        self.log("Final permission check: Denied: {0}, Allowed: {1}", "DEBUG", overall_permission, not overall_permission)
         return False, not overall_permission
 
     def get_operations(self, permissions, resource_type):
@@ -2800,18 +2796,18 @@ class UserandRole(DnacBase):
             - If an "overall" permission of "deny" is found, it collects and returns specific permissions that are not denied.
             - If no specific operations are found or if the "overall" permission is not "deny", it returns an empty list.
         """
-        self.log("Retrieving operations for resource type: {0}".format(resource_type), "INFO")
+        self.log("Retrieving operations for resource type: {0}", "INFO", resource_type)
         keys = resource_type.lower().replace(" ", "_").split(".")
         current_level = permissions
 
         for key in keys:
             if key in current_level:
                 current_level = current_level[key]
-                self.log("Navigated to level: {0}".format(key), "DEBUG")
+                self.log("Navigated to level: {0}", "DEBUG", key)
 
         if "overall" in current_level and current_level["overall"].lower() == "deny":
             specific_permissions = {}
-            self.log("Overall permission denied for resource type: {0}".format(resource_type), "DEBUG")
+            self.log("Overall permission denied for resource type: {0}", "DEBUG", resource_type)
 
             for k, v in current_level.items():
                 if k != "overall" and v.lower() != "deny":
@@ -2840,7 +2836,7 @@ class UserandRole(DnacBase):
             - It logs the final permissions configuration and returns the result along with a boolean indicating if any operations
             are denied.
         """
-        self.log("Starting permission retrieval for role operation: {0}".format(role_operation), "INFO")
+        self.log("Starting permission retrieval for role operation: {0}", "INFO", role_operation)
         permissions = self.parse_config(config)
         allowed_operations = []
         check_deny = []
@@ -2871,7 +2867,7 @@ class UserandRole(DnacBase):
                 "resourceTypes": allowed_operations
             }
 
-        self.log("Final permissions configuration: {0}".format(result), "DEBUG")
+        self.log("Final permissions configuration: {0}", "DEBUG", result)
 
         if "True" in check_deny:
             self.log("Permission check complete. Any denied operations: True", "DEBUG")
@@ -2899,13 +2895,13 @@ class UserandRole(DnacBase):
         if "role_name" in config:
             if self.have.get("role_exists"):
                 self.valid_role_config_parameters(config).check_return_status()
-                self.log("Deleting role with config {0}".format(str(config)), "DEBUG")
+                self.log("Deleting role with config {0}", "DEBUG", config)
 
                 current_role = self.have.get("current_role_config")
                 role_id_to_delete = {}
                 role_id_to_delete["role_id"] = current_role.get("role_id")
                 task_response = self.delete_role(role_id_to_delete)
-                self.log("Task response {0}".format(str(task_response)), "INFO")
+                self.log("Task response {0}", "INFO", task_response)
 
                 if task_response and "error_message" not in task_response:
                     responses = {"role_operation": {"response": task_response}}
@@ -2929,13 +2925,13 @@ class UserandRole(DnacBase):
         if "username" in config or "email" in config:
             if self.have.get("user_exists"):
                 self.valid_user_config_parameters(config).check_return_status()
-                self.log("Deleting user with config {0}".format(str(config)), "DEBUG")
+                self.log("Deleting user with config {0}", "DEBUG", config)
 
                 current_user = self.have.get("current_user_config")
                 user_id_to_delete = {}
                 user_id_to_delete["user_id"] = current_user.get("user_id")
                 task_response = self.delete_user(user_id_to_delete)
-                self.log("Task response {0}".format(str(task_response)), "INFO")
+                self.log("Task response {0}", "INFO", task_response)
 
                 responses = {"users_operation": {"response": task_response}}
                 self.msg = responses
@@ -2967,14 +2963,14 @@ class UserandRole(DnacBase):
             - It logs the response and returns it.
             - The function uses the "user_and_roles" family and the "delete_user_api" function from the Cisco Catalyst Center API.
         """
-        self.log("delete user with user_params: {0}".format(str(user_params)), "DEBUG")
+        self.log("delete user with user_params: {0}", "DEBUG", user_params)
         response = self.dnac._exec(
             family="user_and_roles",
             function="delete_user_api",
             op_modifies=True,
             params=user_params,
         )
-        self.log("Received API response from delete_user: {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from delete_user: {0}", "DEBUG", response)
         self.deleted_user.append(self.have.get("username"))
         return response
 
@@ -2992,19 +2988,19 @@ class UserandRole(DnacBase):
             - The function uses the "user_and_roles" family and the "delete_role_api" function from the Cisco Catalyst Center API.
         """
         try:
-            self.log("delete role with role_params: {0}".format(str(role_params)), "DEBUG")
+            self.log("delete role with role_params: {0}", "DEBUG", role_params)
             response = self.dnac._exec(
                 family="user_and_roles",
                 function="delete_role_api",
                 op_modifies=True,
                 params=role_params,
             )
-            self.log("Received API response from delete_role: {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from delete_role: {0}", "DEBUG", response)
             self.deleted_role.append(self.have.get("role_name"))
             return response
 
         except Exception as e:
-            self.log("Unexpected error occurred: {0}".format(str(e)), "ERROR")
+            self.log("Unexpected error occurred: {0}", "ERROR", e)
             if "[403]" in str(e):
                 error_message = (
                     "The Catalyst Center user '{0}' does not have the necessary permissions to delete the role through the API.".format(
@@ -3038,8 +3034,8 @@ class UserandRole(DnacBase):
 
         if "role_name" in config:
             self.get_have(config)
-            self.log("Current State (have): {0}".format(str(self.have)), "INFO")
-            self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+            self.log("Current State (have): {0}", "INFO", self.have)
+            self.log("Desired State (want): {0}", "INFO", self.want)
 
             # Code to validate ccc config for merged state
             role_exist = self.have.get("role_exists")
@@ -3051,18 +3047,18 @@ class UserandRole(DnacBase):
                 self.log(self.msg, "INFO")
             else:
                 self.log("The playbook input for role {0} does not align with the Cisco Catalyst Center, indicating that the \
-                         merge task may not have executed successfully.".format(role_name), "INFO")
+                         merge task may not have executed successfully.", "INFO", role_name)
 
             desired_role = self.generate_role_payload(self.want, "update")
             (require_update, updated_role_info) = self.role_requires_update(self.have["current_role_config"], desired_role)
             if not require_update:
-                self.log("The update for role {0} has been successfully verified. The updated info - {1}".format(role_name, updated_role_info), "INFO")
+                self.log("The update for role {0} has been successfully verified. The updated info - {1}", "INFO", role_name, updated_role_info)
                 self. status = "success"
 
         if "username" in config or "email" in config:
             self.get_have(config)
-            self.log("Current State (have): {0}".format(str(self.have)), "INFO")
-            self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+            self.log("Current State (have): {0}", "INFO", self.have)
+            self.log("Desired State (want): {0}", "INFO", self.want)
 
             # Code to validate ccc config for merged state
             user_exist = self.have.get("user_exists")
@@ -3074,11 +3070,11 @@ class UserandRole(DnacBase):
                 self.log(self.msg, "INFO")
             else:
                 self.log("The playbook input for user {0} does not align with the Cisco Catalyst Center, indicating that \
-                         the merge task may not have executed successfully.".format(user_name), "INFO")
+                         the merge task may not have executed successfully.", "INFO", user_name)
 
             (require_update, updated_user_info) = self.user_requires_update(self.have["current_user_config"], self.have["current_role_id_config"])
             if not require_update:
-                self.log("The update for user {0} has been successfully verified. The updated info - {1}".format(user_name, updated_user_info), "INFO")
+                self.log("The update for user {0} has been successfully verified. The updated info - {1}", "INFO", user_name, updated_user_info)
                 self. status = "success"
 
         return self
@@ -3101,8 +3097,8 @@ class UserandRole(DnacBase):
 
         if "role_name" in config:
             self.get_have(config)
-            self.log("Current State (have): {0}".format(str(self.have)), "INFO")
-            self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+            self.log("Current State (have): {0}", "INFO", self.have)
+            self.log("Desired State (want): {0}", "INFO", self.want)
 
             role_exist = self.have.get("role_exists")
 
@@ -3114,12 +3110,12 @@ class UserandRole(DnacBase):
                 return self
 
             self.log("Mismatch between the playbook input for role {0} and the Cisco Catalyst Center indicates that the deletion was \
-                     not executed successfully.".format(str(self.want.get("role_name"))), "INFO")
+                     not executed successfully.", "INFO", self.want.get("role_name"))
 
         if "username" in config or "email" in config:
             self.get_have(config)
-            self.log("Current State (have): {0}".format(str(self.have)), "INFO")
-            self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+            self.log("Current State (have): {0}", "INFO", self.have)
+            self.log("Desired State (want): {0}", "INFO", self.want)
 
             user_exist = self.have.get("user_exists")
 
@@ -3131,7 +3127,7 @@ class UserandRole(DnacBase):
                 return self
 
             self.log("Mismatch between the playbook input for user {0} and the Cisco Catalyst Center indicates that the deletion \
-                     was not executed successfully.".format(str(self.want.get("username"))), "INFO")
+                     was not executed successfully.", "INFO", self.want.get("username"))
 
         return self
 
@@ -3250,8 +3246,23 @@ def main():
                          "dnac_log_file_path": {"type": "str", "default": "dnac.log"},
                          "config_verify": {"type": "bool", "default": False},
                          "dnac_log_append": {"type": "bool", "default": True},
+                         "dnac_log_max_bytes": {"type": "int", "default": 0},
+                         "dnac_log_backup_count": {"type": "int", "default": 5},
+                         "dnac_log_compress": {"type": "bool", "default": False},
+                         "dnac_log_format": {"type": "str", "default": "text", "choices": ["text", "json"]},
                          "dnac_api_task_timeout": {"type": "int", "default": 1200},
                          "dnac_task_poll_interval": {"type": "int", "default": 2},
+                         "dnac_token_cache": {"type": "bool", "default": False},
+                         "dnac_rate_limit": {"type": "float", "default": 0},
+                         "dnac_rate_limit_per_family": {"type": "bool", "default": False},
+                         "dnac_rate_limit_retries": {"type": "int", "default": 5},
+                         "dnac_shared_rate_limit": {"type": "float", "default": 0},
+                         "dnac_shared_family_concurrency": {"type": "int", "default": 0},
+                         "dnac_memoize_reads": {"type": "bool", "default": False},
+                         "dnac_metrics": {"type": "bool", "default": False},
+                         "dnac_metrics_file": {"type": "str"},
+                         "dnac_timings": {"type": "bool", "default": False},
+                         "dnac_timings_file": {"type": "str"},
                          "config": {"required": True, "type": "dict"},
                          "validate_response_schema": {"type": "bool", "default": True},
                          "state": {"default": "merged", "choices": ["merged", "deleted"]},
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2024, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+from collections import OrderedDict
+import copy
+import hashlib
+import json
+
+from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
+from ansible.module_utils.errors import UnsupportedError
+
+# Normalized arguments remembered per plugin, e.g. the items of a loop
+MAX_NORMALIZED_ARGS = 256
+
+# Validators built in this process, by plugin name and argument spec fingerprint
+_VALIDATORS = {}
+# Fingerprints of the argument specs seen, by identity, the specs are only hashed once
+_SPEC_KEYS = {}
+
+
+def fingerprint(value):
+    """
+    Hash a JSON-like value, dict keys in any order give the same hash.
+
+    Returns:
+        str - SHA-1 of the canonical JSON of the value, None when it cannot be serialized.
+    """
+
+    try:
+        data = json.dumps(value, sort_keys=True, separators=(",", ":"), default=repr)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+class CachedArgSpecValidator(object):
+    """
+    Argument spec validator of an action plugin, built once per process.
+
+    It validates like the AnsibleArgSpecValidator of ansible.utils, which merges the spec,
+    and builds an AnsibleModule and a validator from it on every run. The arguments it
+    normalized are remembered, the same arguments, or the normalized ones passed again, are
+    not validated another time.
+    """
+
+    def __init__(self, name, argument_spec, mutually_exclusive=None, required_together=None,
+                 required_one_of=None, required_if=None, max_normalized=MAX_NORMALIZED_ARGS):
+        """
+        Parameters:
+            name (str) - Name of the plugin, used in the error messages.
+            argument_spec (dict) - Argument spec of the plugin.
+            mutually_exclusive, required_together, required_one_of, required_if (list) - The conditionals of the spec.
+            max_normalized (int) - Number of normalized arguments remembered.
+        """
+
+        self.name = name
+        self.validator = ArgumentSpecValidator(
+            argument_spec,
+            mutually_exclusive=mutually_exclusive,
+            required_together=required_together,
+            required_one_of=required_one_of,
+            required_if=required_if,
+        )
+        self.max_normalized = max_normalized
+        self.normalized = OrderedDict()
+        self.stats = {"validations": 0, "hits": 0}
+
+    def remember(self, key, params):
+        if key is None:
+            return
+        self.normalized[key] = params
+        self.normalized.move_to_end(key)
+        while len(self.normalized) > self.max_normalized:
+            self.normalized.popitem(last=False)
+
+    def validate(self, args):
+        """
+        Validate and normalize the arguments of a task.
+
+        Returns:
+            tuple - (valid, errors, normalized arguments) like AnsibleArgSpecValidator.validate().
+        """
+
+        key = fingerprint(args)
+        if key in self.normalized:
+            self.normalized.move_to_end(key)
+            self.stats["hits"] += 1
+            return True, None, copy.deepcopy(self.normalized[key])
+
+        self.stats["validations"] += 1
+        result = self.validator.validate(args)
+        if result.error_messages:
+            msg = result.errors.msg
+            if isinstance(result.errors[0], UnsupportedError):
+                msg = "Unsupported parameters for ({0}) module: {1}".format(self.name, msg)
+            return False, msg, {}
+
+        params = result.validated_parameters
+        self.remember(key, params)
+        # Normalized arguments validate to themselves, e.g. when a task passes them on
+        self.remember(fingerprint(params), params)
+        return True, None, copy.deepcopy(params)
+
+
+def get_validator(name, argument_spec, mutually_exclusive=None, required_together=None,
+                  required_one_of=None, required_if=None):
+    """Return the CachedArgSpecValidator of a plugin, built by the first call in this process."""
+
+    spec = [argument_spec, mutually_exclusive, required_together, required_one_of, required_if]
+    identity = tuple(id(item) for item in spec)
+    if identity not in _SPEC_KEYS:
+        # The spec is kept, so its objects and their ids stay in use
+        _SPEC_KEYS[identity] = (spec, fingerprint(spec))
+    spec_key = _SPEC_KEYS[identity][1]
+    key = (name, spec_key)
+    validator = _VALIDATORS.get(key)
+    if validator is None:
+        validator = CachedArgSpecValidator(name, argument_spec, mutually_exclusive, required_together,
+                                           required_one_of, required_if)
+        if spec_key is not None:
+            _VALIDATORS[key] = validator
+    return validator
+
+
+def validate_argspec(name, args, argument_spec, mutually_exclusive=None, required_together=None,
+                     required_one_of=None, required_if=None):
+    """
+    Check the arguments of a task against the argument spec of its action plugin.
+
+    Parameters:
+        name (str) - Name of the plugin, e.g. the 'action' of the task.
+        args (dict) - Arguments of the task.
+        argument_spec (dict) - Argument spec of the plugin.
+        mutually_exclusive, required_together, required_one_of, required_if (list) - The conditionals of the spec.
+
+    Returns:
+        tuple - (valid, errors, normalized arguments).
+    """
+
+    validator = get_validator(name, argument_spec, mutually_exclusive, required_together,
+                              required_one_of, required_if)
+    return validator.validate(args)
@@ -7,14 +7,51 @@
 from __future__ import (absolute_import, division, print_function)
 
 __metaclass__ = type
-try:
-    from dnacentersdk import api, exceptions
-except ImportError:
-    DNAC_SDK_IS_INSTALLED = False
-else:
-    DNAC_SDK_IS_INSTALLED = True
 from ansible.module_utils.basic import env_fallback
 from ansible.module_utils._text import to_native
+from ansible_collections.cisco.dnac.plugins.module_utils.canonical import (
+    multiset_equal,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.download import (
+    DownloadError,
+    download_to_file,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.lazy_import import (
+    LazyModule,
+    is_importable,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_PAGE_WORKERS,
+    paginate,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.rate_limiter import (
+    DEFAULT_MAX_RETRIES,
+    get_rate_limiter,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.request_memo import (
+    RequestMemo,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.session_registry import (
+    DEFAULT_POOL_MAXSIZE,
+    get_shared_session,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.token_cache import (
+    attach_token_cache,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.upload import (
+    HAS_REQUESTS_TOOLBELT,
+    close_multipart_fields,
+    get_multipart_data,
+)
+from ansible_collections.cisco.dnac.plugins.plugin_utils.response_cache import (
+    CACHE_BYPASS,
+    CACHE_MODES,
+    CACHE_REFRESH,
+    CACHE_USE,
+    DEFAULT_TTL,
+    ResponseCache,
+)
 try:
     from ansible.errors import AnsibleActionFail
 except ImportError:
@@ -28,14 +65,12 @@ except ImportError:
 else:
     LOGGING_IN_STANDARD = True
 import os.path
+import re
 
-
-def is_list_complex(x):
-    return isinstance(x[0], dict) or isinstance(x[0], list)
-
-
-def has_diff_elem(ls1, ls2):
-    return any((elem not in ls1 for elem in ls2))
+# Imported on first use, see LazyModule
+DNAC_SDK_IS_INSTALLED = is_importable("dnacentersdk")
+api = LazyModule("dnacentersdk.api")
+exceptions = LazyModule("dnacentersdk.exceptions")
 
 
 def compare_list(list1, list2):
@@ -51,19 +86,9 @@ def compare_list(list1, list2):
     if attempt_std_cmp:
         return True
 
-    if not is_list_complex(list1) and not is_list_complex(list2):
-        return set(list1) == set(list2)
-
-    # Compare normally if it exceeds expected size * 2 (len_list1==len_list2)
-    MAX_SIZE_CMP = 100
-    # Fail fast if elem not in list, thanks to any and generators
-    if len_list1 > MAX_SIZE_CMP:
-        return attempt_std_cmp
-    else:
-        # not changes 'has diff elem' to list1 != list2 ':lists are not equal'
-        has_diff_1 = has_diff_elem(list1, list2)
-        has_diff_2 = has_diff_elem(list2, list1)
-        return not has_diff_1 or not has_diff_2
+    # The order of the elements does not matter, their number does, the lists are
+    # compared as multisets of the canonical forms of their elements in O(n)
+    return multiset_equal(list1, list2)
 
 
 def fn_comp_key(k, dict1, dict2):
@@ -77,8 +102,11 @@ def dnac_compare_equality(current_value, requested_value):
     if current_value is None:
         return True
     if isinstance(current_value, dict) and isinstance(requested_value, dict):
-        all_dict_params = list(current_value.keys()) + list(requested_value.keys())
-        return not any((not fn_comp_key(param, current_value, requested_value) for param in all_dict_params))
+        # A key missing on either side compares as None, hence equal, only the shared keys matter
+        for param, value in requested_value.items():
+            if param in current_value and not dnac_compare_equality(current_value[param], value):
+                return False
+        return True
     elif isinstance(current_value, list) and isinstance(requested_value, list):
         return compare_list(current_value, requested_value)
     else:
@@ -99,14 +127,121 @@ def dnac_compare_equality2(current_value, requested_value, is_query_param=False)
     if current_value is None:
         return False
     if isinstance(current_value, dict) and isinstance(requested_value, dict):
-        all_dict_params = list(current_value.keys()) + list(requested_value.keys())
-        return not any((not fn_comp_key2(param, current_value, requested_value) for param in all_dict_params))
+        # A key missing on one side compares as None, equal only to a None value
+        for param, value in current_value.items():
+            if not dnac_compare_equality2(value, requested_value.get(param)):
+                return False
+        for param, value in requested_value.items():
+            if value is not None and param not in current_value:
+                return False
+        return True
     elif isinstance(current_value, list) and isinstance(requested_value, list):
         return compare_list(current_value, requested_value)
     else:
         return current_value == requested_value
 
 
+# Shown in place of a no_log value, as Ansible does
+NO_LOG_VALUE = "VALUE_SPECIFIED_IN_NO_LOG_PARAMETER"
+# Names of the fields holding credentials, whether or not they are declared no_log
+SECRET_NAME = re.compile(r"password|passphrase|secret|community|key|token", re.IGNORECASE)
+
+
+def no_log_params(argument_spec):
+    """Names of the no_log params of an argument spec, at any depth of its suboptions."""
+
+    names = set()
+    for param, spec in (argument_spec or {}).items():
+        if spec.get("no_log"):
+            names.add(param)
+        names.update(no_log_params(spec.get("options")))
+    return names
+
+
+def mask_secrets(value, name=None, no_log=frozenset()):
+    """
+    Copy of a value of a diff where the credentials are replaced with NO_LOG_VALUE.
+
+    A value is a credential when its name, or the key holding it in a nested dict, is a no_log
+    param or looks like a password, passphrase, secret, community, key or token.
+    """
+
+    if name is not None and value is not None and (name in no_log or SECRET_NAME.search(name)):
+        return NO_LOG_VALUE
+    if isinstance(value, dict):
+        return dict((key, mask_secrets(item, key, no_log)) for key, item in value.items())
+    if isinstance(value, list):
+        return [mask_secrets(item, None, no_log) for item in value]
+    return value
+
+
+class FieldComparator(object):
+    """
+    Compare the current object of DNAC with the requested one, field by field.
+
+    Built once per plugin class by compile_comparator(), the (dnac_param, ansible_param)
+    pairs are not rebuilt on every call. The comparison stops at the first differing
+    field, unless the full diff is asked for, e.g. to show it with '--diff'. The credentials
+    are masked in the diff, see mask_secrets().
+    """
+
+    def __init__(self, fields, compare=dnac_compare_equality, argument_spec=None):
+        """
+        Parameters:
+            fields (list) - (dnac_param, ansible_param) pairs, duplicates are compared once.
+            compare (callable) - Tells whether a current value equals the requested one.
+            argument_spec (dict) - Argument spec of the plugin, for its no_log params and suboptions.
+        """
+
+        seen = set()
+        self.fields = tuple(field for field in fields if not (field in seen or seen.add(field)))
+        self.compare = compare
+        # dnac_compare_equality considers a value not requested as equal to anything
+        self.skip_unset = compare is dnac_compare_equality
+        self.no_log = frozenset(no_log_params(argument_spec))
+
+    def __call__(self, current_obj, requested_obj, full=False):
+        """
+        Returns:
+            tuple - (changed, diff), 'diff' holds the differing fields keyed by ansible_param,
+                    under 'before' and 'after' like the diff of an Ansible result, empty when
+                    nothing changed. Without 'full' it only holds the first differing field.
+        """
+
+        before = {}
+        after = {}
+        current_get = current_obj.get
+        requested_get = requested_obj.get
+        compare = self.compare
+        skip_unset = self.skip_unset
+        for dnac_param, ansible_param in self.fields:
+            requested = requested_get(ansible_param)
+            if requested is None and skip_unset:
+                continue
+            current = current_get(dnac_param)
+            if current == requested or compare(current, requested):
+                continue
+            before[ansible_param] = mask_secrets(current, ansible_param, self.no_log)
+            after[ansible_param] = mask_secrets(requested, ansible_param, self.no_log)
+            if not full:
+                break
+        if not after:
+            return False, {}
+        return True, dict(before=before, after=after)
+
+    def requires_update(self, current_obj, requested_obj):
+        return self(current_obj, requested_obj)[0]
+
+    def diff(self, current_obj, requested_obj):
+        return self(current_obj, requested_obj, full=True)[1]
+
+
+def compile_comparator(fields, compare=dnac_compare_equality, argument_spec=None):
+    """Build the FieldComparator of a plugin, once, as a class attribute."""
+
+    return FieldComparator(fields, compare, argument_spec)
+
+
 def simple_cmp(obj1, obj2):
     return obj1 == obj2
 
@@ -142,31 +277,99 @@ def dnac_argument_spec():
         dnac_verify=dict(type="bool", fallback=(env_fallback, ['DNAC_VERIFY']), default=True),
         dnac_version=dict(type="str", fallback=(env_fallback, ['DNAC_VERSION']), default="2.3.7.6"),
         dnac_debug=dict(type="bool", fallback=(env_fallback, ['DNAC_DEBUG']), default=False),
+        dnac_token_cache=dict(type="bool", fallback=(env_fallback, ['DNAC_TOKEN_CACHE']), default=False),
+        dnac_connection_pool_size=dict(type="int", fallback=(env_fallback, ['DNAC_CONNECTION_POOL_SIZE']),
+                                       default=DEFAULT_POOL_MAXSIZE),
+        dnac_rate_limit=dict(type="float", fallback=(env_fallback, ['DNAC_RATE_LIMIT']), default=0),
+        dnac_rate_limit_per_family=dict(type="bool", fallback=(env_fallback, ['DNAC_RATE_LIMIT_PER_FAMILY']), default=False),
+        dnac_rate_limit_retries=dict(type="int", fallback=(env_fallback, ['DNAC_RATE_LIMIT_RETRIES']),
+                                     default=DEFAULT_MAX_RETRIES),
+        dnac_shared_rate_limit=dict(type="float", fallback=(env_fallback, ['DNAC_SHARED_RATE_LIMIT']), default=0),
+        dnac_shared_family_concurrency=dict(type="int", fallback=(env_fallback, ['DNAC_SHARED_FAMILY_CONCURRENCY']),
+                                            default=0),
+        dnac_memoize_reads=dict(type="bool", fallback=(env_fallback, ['DNAC_MEMOIZE_READS']), default=False),
         validate_response_schema=dict(type="bool", fallback=(env_fallback, ['VALIDATE_RESPONSE_SCHEMA']), default=True),
     )
     return argument_spec
 
 
+def response_cache_argument_spec(ttl=DEFAULT_TTL):
+    """Arguments of the read-only plugins backed by the response cache, 'ttl' is the plugin default."""
+
+    return dict(
+        cache=dict(type="str", choices=CACHE_MODES, default=CACHE_BYPASS),
+        cache_ttl=dict(type="int", default=ttl),
+    )
+
+
 class DNACSDK(object):
     def __init__(self, params):
         self.result = dict(changed=False, result="")
         self.validate_response_schema = params.get("validate_response_schema")
         if DNAC_SDK_IS_INSTALLED:
-            self.api = api.DNACenterAPI(
-                username=params.get("dnac_username"),
-                password=params.get("dnac_password"),
-                base_url="https://{dnac_host}:{dnac_port}".format(
-                    dnac_host=params.get("dnac_host"), dnac_port=params.get("dnac_port")
-                ),
-                version=params.get("dnac_version"),
-                verify=params.get("dnac_verify"),
-                debug=params.get("dnac_debug"),
+            base_url = "https://{dnac_host}:{dnac_port}".format(
+                dnac_host=params.get("dnac_host"), dnac_port=params.get("dnac_port")
             )
+            self.base_url = base_url
+            self.username = params.get("dnac_username")
+            self.version = params.get("dnac_version")
+            self.params = params
+            self._api = None
+            self.rate_limiter = get_rate_limiter(
+                base_url,
+                rate=params.get("dnac_rate_limit"),
+                per_family=params.get("dnac_rate_limit_per_family"),
+                max_retries=params.get("dnac_rate_limit_retries"),
+                shared_rate=params.get("dnac_shared_rate_limit"),
+                family_concurrency=params.get("dnac_shared_family_concurrency"),
+            )
+            if params.get("dnac_rate_limit") or self.rate_limiter.budget is not None:
+                self.result["rate_limit"] = self.rate_limiter.state
+            self.memo = None
+            if params.get("dnac_memoize_reads"):
+                self.memo = RequestMemo()
+                self.result["read_cache"] = self.memo.stats
             if params.get("dnac_debug") and LOGGING_IN_STANDARD:
                 logging.getLogger('dnacentersdk').addHandler(logging.StreamHandler())
         else:
             self.fail_json(msg="DNA Center Python SDK is not installed. Execute 'pip install dnacentersdk'")
 
+    @property
+    def api(self):
+        """The DNACenterAPI client, built by the first API call, see the module_utils DNACSDK."""
+
+        if self._api is None:
+            self._api = self.create_api()
+        return self._api
+
+    def create_api(self):
+        params = self.params
+        # Reuse the keep-alive session of this worker process for the same controller
+        session = get_shared_session(
+            self.base_url,
+            username=params.get("dnac_username"),
+            version=params.get("dnac_version"),
+            pool_maxsize=params.get("dnac_connection_pool_size") or DEFAULT_POOL_MAXSIZE,
+        )
+        # Rejected requests are retried by the rate limiter instead of the SDK
+        dnac_api = api.DNACenterAPI(
+            username=params.get("dnac_username"),
+            password=params.get("dnac_password"),
+            base_url=self.base_url,
+            version=params.get("dnac_version"),
+            verify=params.get("dnac_verify"),
+            debug=params.get("dnac_debug"),
+            session=session,
+            wait_on_rate_limit=False,
+        )
+        if params.get("dnac_token_cache"):
+            attach_token_cache(dnac_api, params)
+        if HAS_REQUESTS_TOOLBELT:
+            # Uploads are streamed in large chunks and their throughput is reported
+            dnac_api._session.multipart_data = get_multipart_data(
+                log=logging.getLogger('dnacentersdk').info, on_complete=self.record_upload)
+        return dnac_api
+
     def changed(self):
         self.result["changed"] = True
 
@@ -203,7 +406,45 @@ class DNACSDK(object):
     def extract_file_name(self, file_path):
         return os.path.basename(file_path)
 
-    def exec(self, family, function, params=None, op_modifies=False, **kwargs):
+    def download(self, path, dest, params=None, headers=None, checksum=None, family=None):
+        """
+        Stream the body of an API path to a file instead of keeping it in memory.
+
+        Parameters:
+            path (str) - API path, e.g. '/dna/intent/api/v1/file/<id>'.
+            dest (str) - Path of the file, or directory where the file named by the server is written.
+            checksum (str) - Expected checksum formatted as '<algorithm>:<checksum>'.
+            family (str) - API family of the request for the rate limiter.
+
+        Returns:
+            dict - 'path', 'filename', 'dirpath', 'size', 'checksum', 'content_type' and 'changed' of the file,
+                   'changed' is False when 'dest' already had this content.
+        """
+
+        try:
+            return self.rate_limiter.call(
+                lambda: download_to_file(self.api._session, path, dest, params, headers, checksum),
+                family, log=logging.getLogger('dnacentersdk').warning,
+            )
+        except (exceptions.dnacentersdkException, DownloadError, EnvironmentError) as e:
+            self.fail_json(
+                msg=(
+                    "An error occured when downloading '{path}'."
+                    " The error was: {error}"
+                ).format(path=path, error=to_native(e))
+            )
+
+    def record_upload(self, stats):
+        self.result.setdefault("uploads", []).append(stats)
+
+    def rewind_multipart_fields(self, params):
+        # A retried upload has to send the files from the start again
+        for field in (params.get("multipart_fields") or {}).values():
+            if isinstance(field, tuple) and len(field) > 1 and hasattr(field[1], "seek"):
+                field[1].seek(0)
+
+    def exec(self, family, function, params=None, op_modifies=False, memoize=True, **kwargs):
+        family_name = family
         try:
             family = getattr(self.api, family)
             func = getattr(family, function)
@@ -228,9 +469,19 @@ class DNACSDK(object):
                 if not self.validate_response_schema and op_modifies:
                     params["active_validation"] = False
 
-                response = func(**params)
+                def send():
+                    self.rewind_multipart_fields(params)
+                    return func(**params)
             else:
-                response = func()
+                send = func
+
+            def limited_send():
+                return self.rate_limiter.call(send, family_name, log=logging.getLogger('dnacentersdk').warning)
+
+            if self.memo is not None and memoize:
+                response = self.memo.call(family_name, function, params, limited_send, op_modifies)
+            else:
+                response = limited_send()
         except exceptions.dnacentersdkException as e:
             self.fail_json(
                 msg=(
@@ -238,8 +489,80 @@ class DNACSDK(object):
                     " The error was: {error}"
                 ).format(error=to_native(e))
             )
+        finally:
+            # The files of an upload are closed once the call is done, retries included
+            close_multipart_fields(params)
+        return response
+
+    def cached_exec(self, family, function, params=None, cache=CACHE_BYPASS, ttl=DEFAULT_TTL):
+        """
+        Run a read-only call through the on-disk response cache.
+
+        Parameters:
+            cache (str) - 'use' returns a cached response younger than 'ttl' seconds and stores
+                          the fresh ones, 'refresh' always calls the API and stores the response,
+                          'bypass' calls the API without touching the cache.
+            ttl (int) - Maximum age in seconds of a cached response.
+
+        Returns:
+            The response. The cache status and the age of the response are added to the
+            result as 'response_cache', the status is 'error' when the cache could not be used.
+        """
+
+        if cache not in (CACHE_USE, CACHE_REFRESH):
+            return self.exec(family=family, function=function, params=params)
+
+        response_cache = ResponseCache()
+        key = response_cache.make_key(self.base_url, self.username, self.version, family, function, params)
+        if cache == CACHE_USE:
+            response, age = response_cache.get(key, ttl if ttl is not None else DEFAULT_TTL)
+            if response is not None:
+                self.result["response_cache"] = dict(status="hit", age=round(age, 1))
+                return response
+
+        response = self.exec(family=family, function=function, params=params)
+        response_cache.put(key, response)
+        if not response_cache.available:
+            self.result["response_cache"] = dict(status="error", msg=response_cache.error)
+            return response
+        self.result["response_cache"] = dict(status="miss" if cache == CACHE_USE else "refresh", age=0)
         return response
 
+    def paginate(self, family, function, params=None, page_size=DEFAULT_PAGE_SIZE, offset_param="offset",
+                 limit_param="limit", start=1, count_function=None, count_params=None, max_workers=None):
+        """
+        Return every item of an offset/limit API.
+
+        Parameters:
+            params (dict) - Parameters of the API, the same for every page.
+            count_function (str) - SDK function returning the number of items, e.g. 'get_device_count'.
+                                   Its 'count_params' must filter the items like 'params'.
+            max_workers (int) - Pages requested at the same time once the count is known.
+
+        Returns:
+            list - The items of the 'response' list of every page, in order.
+        """
+
+        total = None
+        if count_function:
+            count = self.exec(family=family, function=count_function, params=count_params or {})
+            count = count.get("response") if isinstance(count, dict) else None
+            if isinstance(count, int) and not isinstance(count, bool):
+                total = count
+        if max_workers is None:
+            max_workers = DEFAULT_PAGE_WORKERS if total is not None else 1
+
+        def fetch_page(offset, limit):
+            page_params = dict(params or {})
+            page_params[offset_param] = offset
+            page_params[limit_param] = limit
+            response = self.exec(family=family, function=function, params=page_params)
+            if not isinstance(response, dict):
+                return []
+            return response.get("response") or []
+
+        return list(paginate(fetch_page, page_size, start, total=total, max_workers=max_workers))
+
     def fail_json(self, msg, **kwargs):
         self.result.update(**kwargs)
         raise AnsibleActionFail(msg, kwargs)
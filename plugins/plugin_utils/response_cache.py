@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2024, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import json
+import os
+import time
+
+from ansible_collections.cisco.dnac.plugins.module_utils.local_state import (
+    FileLock,
+    get_state_dir,
+    hash_key,
+    read_json,
+    write_json_atomic,
+)
+
+CACHE_USE = "use"
+CACHE_REFRESH = "refresh"
+CACHE_BYPASS = "bypass"
+CACHE_MODES = [CACHE_USE, CACHE_REFRESH, CACHE_BYPASS]
+
+DEFAULT_TTL = 300
+DEFAULT_MAX_SIZE = 50 * 1024 * 1024
+CACHE_DIR_ENV = "DNAC_RESPONSE_CACHE_DIR"
+CACHE_MAX_SIZE_ENV = "DNAC_RESPONSE_CACHE_MAX_SIZE"
+
+
+def normalize_params(params):
+    """Drop the unset parameters so that omitted and null options share a cache entry."""
+
+    if isinstance(params, dict):
+        return dict((key, normalize_params(value)) for key, value in params.items() if value is not None)
+    if isinstance(params, (list, tuple)):
+        return [normalize_params(value) for value in params]
+    return params
+
+
+class ResponseCache(object):
+    """
+    On-disk cache of read-only API responses shared by the plays of the control node.
+
+    Every response is kept in its own JSON file, readable by the owner only, together
+    with the time it was stored. The file modification time records the last use, so
+    when the cache grows over 'max_size' bytes the least recently used entries are
+    removed first.
+
+    A cache that cannot be written is unavailable rather than an error of the task,
+    'error' then tells why and the responses are neither read nor stored.
+    """
+
+    def __init__(self, cache_dir=None, max_size=None, clock=time.time):
+        """
+        Parameters:
+            cache_dir (str) - Directory of the entries, defaults to '~/.ansible/cisco_dnac/responses'.
+                              It can be changed with the DNAC_RESPONSE_CACHE_DIR environment variable.
+            max_size (int) - Size cap of the cache in bytes, defaults to 50 MiB or to the
+                             DNAC_RESPONSE_CACHE_MAX_SIZE environment variable.
+        """
+
+        self.max_size = int(max_size or os.environ.get(CACHE_MAX_SIZE_ENV) or DEFAULT_MAX_SIZE)
+        self.clock = clock
+        self.error = None
+        try:
+            self.cache_dir = cache_dir or os.environ.get(CACHE_DIR_ENV) or get_state_dir("responses")
+            if not os.path.isdir(self.cache_dir):
+                os.makedirs(self.cache_dir, 0o700)
+        except (IOError, OSError) as e:
+            self.cache_dir = cache_dir
+            self.error = "Unable to create the response cache directory: {0}".format(e)
+        self.lock_path = os.path.join(self.cache_dir or "", ".lock")
+
+    @property
+    def available(self):
+        return self.error is None
+
+    def make_key(self, base_url, username, version, family, function, params):
+        return hash_key(base_url, username, version, family, function,
+                        json.dumps(normalize_params(params) or {}, sort_keys=True, default=str))
+
+    def entry_path(self, key):
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def get(self, key, ttl):
+        """
+        Return the cached response of 'key' when it is younger than 'ttl' seconds.
+
+        Returns:
+            tuple - (response, age in seconds), or (None, None) on a miss.
+        """
+
+        if not self.available:
+            return None, None
+
+        path = self.entry_path(key)
+        entry = read_json(path)
+        if not isinstance(entry, dict) or "response" not in entry:
+            return None, None
+
+        age = self.clock() - entry.get("stored", 0)
+        if age < 0 or age >= ttl:
+            return None, None
+
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return entry["response"], age
+
+    def put(self, key, response):
+        """Store 'response', then evict the least recently used entries over the size cap."""
+
+        if not self.available:
+            return
+        try:
+            with FileLock(self.lock_path):
+                write_json_atomic(self.entry_path(key), {"stored": self.clock(), "response": response})
+                self.evict()
+        except (TypeError, ValueError):
+            # Responses that are not JSON documents are not cached
+            pass
+        except (IOError, OSError) as e:
+            self.error = "Unable to write the response cache: {0}".format(e)
+
+    def evict(self):
+        entries = []
+        total_size = 0
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_size += stat.st_size
+
+        entries.sort()
+        while entries and total_size > self.max_size:
+            dummy, size, path = entries.pop(0)
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_size -= size
@@ -0,0 +1,104 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""compare_list() on lists of device-like dicts, in the same and in shuffled order.
+
+'before' is compare_list() as it was, it compared the lists of more than 100 elements
+in order, so shuffled lists were reported as different, and the shorter lists with
+'elem not in list' in O(n^2). 'quadratic' is that O(n^2) comparison at every size, it is
+skipped above --max-quadratic elements. 'canonical' is compare_list() now.
+
+Usage: python tests/benchmarks/bench_compare_list.py [--sizes 100,1000,10000] [--max-quadratic N]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import random
+import time
+
+from stand_in_server import add_collection_to_path
+
+add_collection_to_path()
+
+from ansible_collections.cisco.dnac.plugins.plugin_utils.dnac import compare_list  # noqa: E402
+
+MAX_SIZE_CMP = 100
+
+
+def has_diff_elem(ls1, ls2):
+    return any((elem not in ls1 for elem in ls2))
+
+
+def quadratic_compare_list(list1, list2):
+    if len(list1) != len(list2):
+        return False
+    if list1 == list2:
+        return True
+    return not has_diff_elem(list1, list2) or not has_diff_elem(list2, list1)
+
+
+def previous_compare_list(list1, list2):
+    if len(list1) > MAX_SIZE_CMP:
+        return list1 == list2
+    return quadratic_compare_list(list1, list2)
+
+
+def devices(count):
+    return [
+        {
+            "id": "device-{0}".format(index),
+            "hostname": "switch-{0}".format(index),
+            "managementIpAddress": "10.{0}.{1}.{2}".format(index // 65536, index // 256 % 256, index % 256),
+            "role": "ACCESS",
+            "tags": ["floor-{0}".format(index % 8), "building-1"],
+            "site": {"name": "Global/USA/San Jose", "id": index % 16},
+        }
+        for index in range(count)
+    ]
+
+
+def measure(compare, list1, list2):
+    start = time.perf_counter()
+    result = compare(list1, list2)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="100,1000,10000")
+    parser.add_argument("--max-quadratic", type=int, default=2000)
+    args = parser.parse_args()
+
+    print("{0:>8} {1:<10} {2:>18} {3:>18} {4:>18}".format("size", "order", "before", "quadratic", "canonical"))
+    for size in [int(size) for size in args.sizes.split(",")]:
+        current = devices(size)
+        shuffled = devices(size)
+        random.Random(size).shuffle(shuffled)
+        for order, requested in (("same", devices(size)), ("shuffled", shuffled)):
+            columns = []
+            for name, compare in (("before", previous_compare_list), ("quadratic", quadratic_compare_list),
+                                  ("canonical", compare_list)):
+                if name == "quadratic" and size > args.max_quadratic:
+                    columns.append("-")
+                    continue
+                elapsed, result = measure(compare, current, requested)
+                columns.append("{0:8.2f} ms {1:<6}".format(1000 * elapsed, "equal" if result else "DIFF"))
+            print("{0:>8} {1:<10} {2:>18} {3:>18} {4:>18}".format(size, order, *columns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Import time of a representative set of action plugins and modules, in fresh interpreters.
+
+The 'eager' column imports the libraries the collection now loads on first use (the SDK,
+cryptography, pyzipper, asyncio, requests_toolbelt) before the plugin, as every task did
+before. The last column lists the ones the plugin still loads when it is imported.
+
+Usage: python tests/benchmarks/bench_import_time.py [--runs N]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import os
+import subprocess
+import sys
+
+from stand_in_server import add_collection_to_path
+
+add_collection_to_path()
+
+PLUGINS = (
+    "plugins.action.network_device_info",
+    "plugins.action.site_create",
+    "plugins.action.swim_import_local",
+    "plugins.action.pnp_device",
+    "plugins.modules.swim_workflow_manager",
+    "plugins.modules.inventory_workflow_manager",
+    "plugins.modules.device_configs_backup_workflow_manager",
+    "plugins.modules.site_workflow_manager",
+    "plugins.modules.template_workflow_manager",
+)
+LAZY_LIBRARIES = ("dnacentersdk.api", "cryptography.fernet", "pyzipper", "asyncio",
+                  "requests_toolbelt.multipart.encoder")
+
+PROBE = """
+import importlib, sys, time
+eager = {eager}
+start = time.perf_counter()
+for name in eager:
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        pass
+importlib.import_module("ansible_collections.cisco.dnac.{plugin}")
+elapsed = time.perf_counter() - start
+loaded = [name for name in {libraries} if name in sys.modules]
+print(elapsed, ",".join(loaded) or "-")
+"""
+
+
+def measure(plugin, runs, eager):
+    # The interpreters find the collection where add_collection_to_path() did
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(path for path in sys.path if path))
+    timings = []
+    loaded = "-"
+    for dummy in range(runs):
+        code = PROBE.format(eager=LAZY_LIBRARIES if eager else (), plugin=plugin, libraries=LAZY_LIBRARIES)
+        output = subprocess.check_output([sys.executable, "-c", code], env=env, universal_newlines=True)
+        elapsed, loaded = output.split()
+        timings.append(float(elapsed))
+    timings.sort()
+    return timings[len(timings) // 2], loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print("{0:<56} {1:>10} {2:>10}  {3}".format("plugin", "eager", "lazy", "loaded at import"))
+    for plugin in PLUGINS:
+        eager, dummy = measure(plugin, args.runs, True)
+        lazy, loaded = measure(plugin, args.runs, False)
+        print("{0:<56} {1:7.1f} ms {2:7.1f} ms  {3}".format(plugin, 1000 * eager, 1000 * lazy, loaded))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cost of the DnacBase.log() calls of a module, with logging disabled and enabled.
+
+A step logs a small message, the 'get_device_list' response of a large inventory and the
+pretty-printed want, like the inventory and access point modules do. The 'eager' column
+formats the messages in the caller and finds the caller with inspect.stack(), as log()
+did before, the 'lazy' column passes the arguments to log(), formatted only when the
+level is logged.
+
+Usage: python tests/benchmarks/bench_logging.py [--devices N] [--steps N]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import inspect
+import json
+import logging
+import os
+import time
+
+from stand_in_server import add_collection_to_path
+
+add_collection_to_path()
+
+from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (  # noqa: E402
+    Deferred,
+    DnacBase,
+    dnac_argument_spec,
+)
+
+
+class FakeModule(object):
+    def __init__(self):
+        self.params = dict((key, spec.get("default")) for key, spec in dnac_argument_spec().items())
+        self.params.update(dnac_host="127.0.0.1", dnac_username="admin", dnac_password="secret", config=[])
+
+
+class Workflow(DnacBase):
+    def validate_input(self):
+        return self
+
+    def pprint(self, jsondata):
+        return json.dumps(jsondata, indent=4, separators=(',', ': '))
+
+    def eager_log(self, message, level="WARNING", frameIncrement=0):
+        # DnacBase.log() before the arguments were deferred
+        if self.dnac_log:
+            class_name = self.__class__.__name__
+            callerframerecord = inspect.stack()[1 + frameIncrement]
+            frame = callerframerecord[0]
+            info = inspect.getframeinfo(frame)
+            log_message = " %s: %s: %s: %s \n" % (class_name, info.function, info.lineno, message)
+            log_method = getattr(self.logger, level.lower())
+            log_method(log_message)
+
+    def eager_step(self, response):
+        self.eager_log("Getting the devices of site '{0}'".format("Global/USA/San Jose"), "INFO")
+        self.eager_log("Received API response from 'get_device_list': {0}".format(str(response)), "DEBUG")
+        self.eager_log("Desired State (want): {0}".format(self.pprint(self.want)), "INFO")
+
+    def lazy_step(self, response):
+        self.log("Getting the devices of site '{0}'", "INFO", "Global/USA/San Jose")
+        self.log("Received API response from 'get_device_list': {0}", "DEBUG", response)
+        self.log("Desired State (want): {0}", "INFO", Deferred(self.pprint, self.want))
+
+
+def device_list(count):
+    return {"response": [
+        {"id": "device-{0}".format(index), "hostname": "switch-{0}".format(index),
+         "managementIpAddress": "10.{0}.{1}.{2}".format(index // 65536, index // 256 % 256, index % 256),
+         "platformId": "C9300-48U", "softwareVersion": "17.9.4a", "reachabilityStatus": "Reachable"}
+        for index in range(count)
+    ], "version": "1.0"}
+
+
+def measure(step, response, steps):
+    start = time.perf_counter()
+    for dummy in range(steps):
+        step(response)
+    return (time.perf_counter() - start) / steps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--devices", type=int, default=10000)
+    parser.add_argument("--steps", type=int, default=20)
+    args = parser.parse_args()
+
+    workflow = Workflow(FakeModule())
+    workflow.want = {"config": [{"hostname": "switch-{0}".format(index)} for index in range(200)]}
+    response = device_list(args.devices)
+
+    logger = logging.getLogger("bench_logging")
+    logger.propagate = False
+    handler = logging.FileHandler(os.devnull)
+    logger.addHandler(handler)
+    workflow.logger = logger
+
+    print("{0:<32} {1:>12} {2:>12}".format("dnac_log / level", "eager", "lazy"))
+    for dnac_log, level in ((False, "WARNING"), (True, "WARNING"), (True, "INFO"), (True, "DEBUG")):
+        workflow.dnac_log = dnac_log
+        logger.setLevel(level)
+        eager = measure(workflow.eager_step, response, args.steps)
+        lazy = measure(workflow.lazy_step, response, args.steps)
+        print("{0:<32} {1:9.3f} ms {2:9.3f} ms".format(
+            "{0} / {1}".format(str(dnac_log).lower(), level if dnac_log else "-"), 1000 * eager, 1000 * lazy))
+    handler.close()
+
+
+if __name__ == "__main__":
+    main()
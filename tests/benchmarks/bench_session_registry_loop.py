@@ -0,0 +1,99 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Latency per loop item of *_info calls with and without the shared session registry.
+
+Every task runs in its own Ansible worker process, so the registry only serves the calls made
+within one worker: the items of a loop, or several SDK objects of one task. The items are run
+back to back in this process, as a worker runs them. Tasks, which start with an empty registry,
+are not measured.
+
+Only the API call is timed, building the SDK object costs the same in both runs. Both runs use
+the token cache so the numbers are not skewed by logins.
+
+Usage: python tests/benchmarks/bench_session_registry_loop.py [--items N]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import os
+import tempfile
+import time
+import warnings
+
+from stand_in_server import StandInServer, add_collection_to_path
+
+add_collection_to_path()
+
+from ansible_collections.cisco.dnac.plugins.module_utils import session_registry  # noqa: E402
+from ansible_collections.cisco.dnac.plugins.plugin_utils.dnac import DNACSDK  # noqa: E402
+
+
+def run_loop_items(port, items, shared):
+    params = dict(
+        dnac_host="127.0.0.1",
+        dnac_port=port,
+        dnac_username="admin",
+        dnac_password="secret",
+        dnac_version="2.3.7.6",
+        dnac_verify=False,
+        dnac_debug=False,
+        dnac_connection_pool_size=10,
+        dnac_token_cache=True,
+        validate_response_schema=True,
+    )
+    latencies = []
+    for dummy in range(items):
+        if not shared:
+            # What every loop item paid before: a brand new session and TLS handshake
+            session_registry.close_shared_sessions()
+        dnac = DNACSDK(params=params)
+        # The SDK client is built by the first call, keep it out of the timing
+        dnac.api
+        start = time.perf_counter()
+        dnac.exec(family="devices", function="get_device_list", params={"hostname": ["sw1"]})
+        latencies.append(time.perf_counter() - start)
+    session_registry.close_shared_sessions()
+    return latencies
+
+
+def report(label, latencies, stats):
+    latencies = sorted(latencies)
+    print("{0:<22} mean {1:7.2f} ms  p50 {2:7.2f} ms  p95 {3:7.2f} ms  connections {4}".format(
+        label,
+        1000 * sum(latencies) / len(latencies),
+        1000 * latencies[len(latencies) // 2],
+        1000 * latencies[int(len(latencies) * 0.95) - 1],
+        stats["connections"],
+    ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=50)
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+    os.environ["DNAC_TOKEN_CACHE_DIR"] = tempfile.mkdtemp(prefix="dnac-bench-tokens-")
+
+    for label, shared in (("fresh session per item", False), ("shared session", True)):
+        with StandInServer() as server:
+            latencies = run_loop_items(server.port, args.items, shared)
+            report(label, latencies, server.stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Upload of a large sparse image with the multipart body of the SDK and with the streaming one.
+
+Every run happens in its own process so its peak RSS is measured alone. The stand-in server
+reads and drops the body, the numbers are the cost of the client side.
+
+Usage: python tests/benchmarks/bench_upload.py [--size-mib N]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+
+from stand_in_server import StandInServer, add_collection_to_path
+
+add_collection_to_path()
+
+from ansible_collections.cisco.dnac.plugins.plugin_utils.dnac import DNACSDK  # noqa: E402
+
+MODES = (("SDK multipart body", "sdk"), ("streaming upload", "streaming"))
+
+
+def run_upload(port, path, mode):
+    dnac = DNACSDK(params=dict(
+        dnac_host="127.0.0.1",
+        dnac_port=port,
+        dnac_username="admin",
+        dnac_password="secret",
+        dnac_version="2.3.7.6",
+        dnac_verify=False,
+        dnac_debug=False,
+        validate_response_schema=False,
+    ))
+    # The SDK client is built by the first call, keep it out of the timing
+    rest_session = dnac.api._session
+    if mode == "sdk":
+        # Back to the multipart_data method of the SDK session
+        del rest_session.multipart_data
+
+    start = time.perf_counter()
+    dnac.exec(
+        family="software_image_management_swim",
+        function="import_local_software_image",
+        op_modifies=True,
+        params={"file_path": path, "third_party_vendor": "stand-in"},
+        file_paths=[("file_path", "file")],
+    )
+    elapsed = time.perf_counter() - start
+    upload = (dnac.result.get("uploads") or [{}])[0]
+    print("{0:.6f} {1} {2}".format(elapsed, upload.get("reads", "-"),
+                                   resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mib", type=int, default=1024)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    parser.add_argument("--mode", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    if args.mode:
+        run_upload(args.port, args.path, args.mode)
+        return
+
+    fd, path = tempfile.mkstemp(prefix="dnac-bench-image-", suffix=".bin")
+    try:
+        # Sparse, so the benchmark does not depend on the disk
+        os.ftruncate(fd, args.size_mib * 1024 * 1024)
+        os.close(fd)
+        with StandInServer() as server:
+            for label, mode in MODES:
+                output = subprocess.check_output([
+                    sys.executable, os.path.abspath(__file__),
+                    "--port", str(server.port), "--path", path, "--mode", mode,
+                ], universal_newlines=True)
+                elapsed, reads, max_rss = output.split()[-3:]
+                print("{0:<20} {1:8.2f} s  {2:8.1f} MiB/s  reads {3:>8}  peak RSS {4:7.1f} MiB".format(
+                    label, float(elapsed), args.size_mib / float(elapsed), reads, int(max_rss) / 1024.0))
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
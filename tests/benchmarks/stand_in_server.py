@@ -0,0 +1,161 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Local HTTPS stand-in for Cisco Catalyst Center used by the benchmarks."""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import datetime
+import json
+import os
+import ssl
+import sys
+import tempfile
+import threading
+
+try:
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+except ImportError:
+    sys.exit("The benchmarks require Python 3.7 or later")
+
+
+def add_collection_to_path():
+    """Make 'ansible_collections.cisco.dnac' importable when run from a checkout."""
+
+    collection_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+    collections_path = os.path.abspath(os.path.join(collection_root, "..", "..", ".."))
+    if os.path.basename(os.path.dirname(os.path.dirname(collection_root))) == "ansible_collections":
+        if collections_path not in sys.path:
+            sys.path.insert(0, collections_path)
+    try:
+        import ansible_collections.cisco.dnac  # noqa: F401
+    except ImportError:
+        sys.exit("Run the benchmarks from a checkout located at ansible_collections/cisco/dnac "
+                 "or add the collections path to PYTHONPATH")
+
+
+def _self_signed_certificate(directory):
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from cryptography.x509.oid import NameOID
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, u"localhost")])
+    now = datetime.datetime.utcnow()
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    with open(cert_path, "wb") as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as f:
+        f.write(key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.TraditionalOpenSSL,
+            serialization.NoEncryption(),
+        ))
+    return cert_path, key_path
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, payload, status=200):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _drain(self):
+        remaining = int(self.headers.get("Content-Length") or 0)
+        received = 0
+        while remaining > 0:
+            chunk = self.rfile.read(min(remaining, 1024 * 1024))
+            if not chunk:
+                break
+            received += len(chunk)
+            remaining -= len(chunk)
+        return received
+
+    def do_POST(self):
+        received = self._drain()
+        self.server.stats["posts"] += 1
+        if self.path.startswith("/dna/system/api/v1/auth/token"):
+            self.server.stats["logins"] += 1
+            self._reply({"Token": "stand-in-token"})
+        else:
+            self._reply({"response": {"taskId": "stand-in-task", "url": self.path}, "received": received})
+
+    def do_GET(self):
+        self.server.stats["gets"] += 1
+        self._reply({"response": [{"id": "device-{0}".format(i), "hostname": "sw{0}".format(i)} for i in range(5)],
+                     "version": "1.0"})
+
+
+class StandInServer(object):
+    """Threaded HTTPS server answering the few endpoints the benchmarks call."""
+
+    def __init__(self, tls=True):
+        self.tls = tls
+        self._tmpdir = tempfile.mkdtemp(prefix="dnac-bench-")
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.stats = {"gets": 0, "posts": 0, "logins": 0, "connections": 0}
+        if tls:
+            cert_path, key_path = _self_signed_certificate(self._tmpdir)
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(cert_path, key_path)
+            self.httpd.socket = context.wrap_socket(self.httpd.socket, server_side=True)
+        original_get_request = self.httpd.get_request
+
+        def counting_get_request():
+            connection = original_get_request()
+            self.httpd.stats["connections"] += 1
+            return connection
+
+        self.httpd.get_request = counting_get_request
+        self._thread = threading.Thread(target=self.httpd.serve_forever)
+        self._thread.daemon = True
+
+    @property
+    def port(self):
+        return self.httpd.server_address[1]
+
+    @property
+    def stats(self):
+        return self.httpd.stats
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.httpd.shutdown()
+        self.httpd.server_close()
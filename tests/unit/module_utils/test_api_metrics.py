@@ -0,0 +1,128 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from ansible_collections.cisco.dnac.plugins.module_utils.api_metrics import ApiMetrics, percentile
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeResponse(object):
+    def __init__(self, content=b"", headers=None):
+        self.content = content
+        self.headers = headers or {}
+
+
+class TestApiMetrics(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.metrics = ApiMetrics(clock=self.clock)
+
+    def call(self, function, elapsed, responses=(), retries=0, polls=0):
+        with self.metrics.call("devices", function):
+            for response in responses:
+                self.metrics.response_hook(response, stream=False)
+            for dummy in range(retries):
+                self.metrics.count_retry()
+            self.metrics.count_polls(polls)
+            self.clock.now += elapsed
+
+    def test_latencies_and_counts(self):
+        for elapsed in range(1, 21):
+            self.call("get_device_list", elapsed / 10.0, responses=[FakeResponse(b"x" * 10)])
+        self.call("add_device", 2.0, responses=[FakeResponse(b"{}"), FakeResponse(b"{}")], retries=1, polls=3)
+
+        stats = self.metrics.summarize()["calls"]["devices.get_device_list"]
+        self.assertEqual(stats["count"], 20)
+        self.assertEqual(stats["p50"], 1.0)
+        self.assertEqual(stats["p95"], 1.9)
+        self.assertEqual(stats["max"], 2.0)
+        self.assertEqual(stats["bytes"], 200)
+        self.assertEqual(self.metrics.summary["calls"]["devices.add_device"]["retries"], 1)
+        self.assertEqual(self.metrics.summary["totals"],
+                         {"calls": 21, "errors": 0, "requests": 22, "bytes": 204, "retries": 1, "polls": 3,
+                          "elapsed": 23.0})
+
+    def test_latencies_are_summarized_on_exit(self):
+        exited = []
+        exit_json = self.metrics.summarized(lambda **result: exited.append(result["api_metrics"]))
+        self.call("get_device_list", 0.1234)
+        self.call("get_device_list", 0.1)
+        self.assertNotIn("p50", self.metrics.summary["calls"]["devices.get_device_list"])
+        self.assertEqual(self.metrics.summary["totals"]["elapsed"], 0.0)
+
+        exit_json(api_metrics=self.metrics.summary)
+        self.assertEqual(exited[0]["calls"]["devices.get_device_list"]["p50"], 0.1)
+        self.assertEqual(exited[0]["calls"]["devices.get_device_list"]["total"], 0.223)
+        self.assertEqual(exited[0]["totals"]["elapsed"], 0.223)
+
+    def test_errors_are_counted_and_raised(self):
+        with self.assertRaises(ValueError):
+            with self.metrics.call("devices", "get_device_list"):
+                raise ValueError("failed")
+        self.assertEqual(self.metrics.summary["calls"]["devices.get_device_list"]["errors"], 1)
+
+    def test_streamed_responses_are_not_read(self):
+        class StreamedResponse(object):
+            headers = {"Content-Length": "1024"}
+
+            @property
+            def content(self):
+                raise AssertionError("The body was read")
+
+        response = StreamedResponse()
+        with self.metrics.call("file", "download_a_file_by_fileid"):
+            self.metrics.response_hook(response, stream=True)
+        self.assertEqual(self.metrics.summary["totals"]["bytes"], 1024)
+
+    def test_outside_of_a_call(self):
+        self.metrics.response_hook(FakeResponse(b"{}"))
+        self.metrics.count_retry()
+        self.assertEqual(self.metrics.summary["totals"]["requests"], 0)
+
+    def test_json_lines(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "metrics.jsonl")
+        self.metrics = ApiMetrics(path, clock=self.clock)
+        self.call("get_device_list", 0.5, responses=[FakeResponse(b"{}")])
+        self.call("get_device_by_id", 0.25, polls=2)
+
+        with open(path) as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual([line["function"] for line in lines], ["get_device_list", "get_device_by_id"])
+        self.assertEqual(lines[0]["bytes"], 2)
+        self.assertEqual(lines[1]["polls"], 2)
+        self.assertIsNone(lines[1]["error"])
+
+    def test_percentile(self):
+        self.assertIsNone(percentile([], 0.5))
+        self.assertEqual(percentile([3.0], 0.95), 3.0)
+        self.assertEqual(percentile([1, 2, 3, 4], 0.5), 2)
@@ -0,0 +1,129 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import asyncio
+import logging
+import threading
+import unittest
+
+from ansible_collections.cisco.dnac.plugins.module_utils.async_client import AsyncDnacClient
+from ansible_collections.cisco.dnac.plugins.module_utils.rate_limiter import RateLimiter
+from ansible_collections.cisco.dnac.plugins.module_utils.task_waiter import TaskWaiter
+
+
+class FakeRestSession(object):
+    access_token = "token"
+
+    def __init__(self, polls_until_done=3):
+        self.polls_until_done = polls_until_done
+        self.polls = {}
+        self.lock = threading.Lock()
+
+    def get(self, url, params=None):
+        task_id = url.rsplit("/", 1)[-1]
+        with self.lock:
+            self.polls[task_id] = self.polls.get(task_id, 0) + 1
+            done = self.polls[task_id] >= self.polls_until_done
+        details = {"id": task_id, "isError": task_id.startswith("bad")}
+        if done:
+            details["endTime"] = 1
+        return {"response": details}
+
+
+class FakeApi(object):
+    def __init__(self, rest_session):
+        self._session = rest_session
+
+
+class FakeDnac(object):
+    def __init__(self, rest_session):
+        self.api = FakeApi(rest_session)
+        self.rate_limiter = RateLimiter()
+        self.task_waiter = TaskWaiter(initial_delay=0.001, max_delay=0.005, timeout=5)
+        self.logger = logging.getLogger("test_async_client")
+        self.exec_calls = []
+
+    def _exec(self, family, function, params=None, op_modifies=False):
+        self.exec_calls.append((family, function))
+        if function == "fail":
+            raise Exception("{0} failed".format(function))
+        return {"function": function, "params": params}
+
+
+def is_success(task_details):
+    return bool(task_details.get("endTime"))
+
+
+def is_failure(task_details):
+    return task_details.get("isError") is True
+
+
+class TestAsyncClient(unittest.TestCase):
+    def test_wait_tasks_polls_every_task_concurrently(self):
+        dnac = FakeDnac(FakeRestSession(polls_until_done=3))
+        client = AsyncDnacClient(dnac, use_aiohttp=False)
+        task_ids = dict(("device-{0}".format(index), "task-{0}".format(index)) for index in range(200))
+        task_ids["broken"] = "bad-task"
+
+        results = client.run(client.wait_tasks(task_ids, is_success, is_failure))
+
+        self.assertEqual(set(results), set(task_ids))
+        self.assertTrue(results["device-0"].succeeded)
+        self.assertEqual(results["device-0"].polls, 3)
+        self.assertTrue(results["broken"].failed)
+        self.assertEqual(results["broken"].polls, 1)
+        self.assertEqual(dnac.task_waiter.total_polls, 200 * 3 + 1)
+        self.assertGreater(client.stats["peak_in_flight"], 1)
+
+    def test_native_polls_can_be_replaced(self):
+        dnac = FakeDnac(FakeRestSession())
+        client = AsyncDnacClient(dnac, use_aiohttp=False)
+        polled = []
+
+        async def poll_task(task_id):
+            polled.append(task_id)
+            await asyncio.sleep(0)
+            return {"endTime": 1}
+
+        results = client.run(client.wait_tasks({"a": "t1", "b": "t2"}, is_success, timeout=1, poll_task=poll_task))
+
+        self.assertEqual(sorted(polled), ["t1", "t2"])
+        self.assertTrue(all(result.succeeded for result in results.values()))
+
+    def test_wait_task_timeout(self):
+        dnac = FakeDnac(FakeRestSession(polls_until_done=10 ** 6))
+        client = AsyncDnacClient(dnac, use_aiohttp=False)
+
+        result = client.run(client.wait_task("slow", is_success, is_failure, timeout=0.02))
+
+        self.assertTrue(result.timed_out)
+        self.assertGreater(result.polls, 1)
+
+    def test_amap_exec_keeps_order_and_collects_errors(self):
+        dnac = FakeDnac(FakeRestSession())
+        client = AsyncDnacClient(dnac, use_aiohttp=False)
+        calls = [("devices", "get_device_list", {"hostname": "a"}), ("devices", "fail", None), ("sites", "get_site")]
+
+        results = client.run(client.amap_exec(calls))
+
+        self.assertEqual(results[0].response["params"], {"hostname": "a"})
+        self.assertTrue(results[1].failed)
+        self.assertEqual(str(results[1].error), "fail failed")
+        self.assertEqual(results[2].response["function"], "get_site")
+        self.assertEqual(sorted(dnac.exec_calls), sorted((call[0], call[1]) for call in calls))
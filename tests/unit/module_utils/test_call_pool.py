@@ -0,0 +1,62 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import threading
+import unittest
+
+from ansible_collections.cisco.dnac.plugins.module_utils.call_pool import map_calls
+
+
+class TestCallPool(unittest.TestCase):
+    def test_results_keep_the_order_of_the_calls(self):
+        results = map_calls(lambda name, value: "{0}={1}".format(name, value), [("a", 1), ("b", 2), ("c", 3)])
+
+        self.assertEqual([result.response for result in results], ["a=1", "b=2", "c=3"])
+        self.assertFalse(any(result.failed for result in results))
+
+    def test_calls_run_concurrently(self):
+        all_started = threading.Barrier(4, timeout=5)
+
+        def send(index):
+            # Only returns once the four calls run at the same time
+            all_started.wait()
+            return index
+
+        results = map_calls(send, [(index,) for index in range(4)], max_workers=4)
+
+        self.assertEqual([result.response for result in results], [0, 1, 2, 3])
+
+    def test_errors_are_collected_per_call(self):
+        def send(index):
+            if index == 1:
+                raise ValueError("call {0} failed".format(index))
+            return index
+
+        results = map_calls(send, [(0,), (1,), (2,)], max_workers=2)
+
+        self.assertEqual([result.failed for result in results], [False, True, False])
+        self.assertEqual(str(results[1].error), "call 1 failed")
+        self.assertEqual(results[2].response, 2)
+
+    def test_single_worker_runs_in_the_calling_thread(self):
+        threads = []
+        map_calls(lambda: threads.append(threading.current_thread()), [(), ()], max_workers=1)
+
+        self.assertEqual(threads, [threading.current_thread()] * 2)
+        self.assertEqual(map_calls(lambda: None, []), [])
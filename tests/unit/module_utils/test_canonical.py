@@ -0,0 +1,92 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import random
+import unittest
+
+from ansible_collections.cisco.dnac.plugins.module_utils import dnac as module_utils_dnac
+from ansible_collections.cisco.dnac.plugins.module_utils.canonical import canonical_hash, multiset_equal
+from ansible_collections.cisco.dnac.plugins.plugin_utils import dnac as plugin_utils_dnac
+
+
+def devices(count):
+    return [{"id": index, "hostname": "switch-{0}".format(index), "tags": ["a", "b"], "site": {"name": "Global"}}
+            for index in range(count)]
+
+
+class TestCanonicalHash(unittest.TestCase):
+    def test_equal_values_have_equal_hashes(self):
+        self.assertEqual(canonical_hash({"a": 1, "b": [1, {"c": None}]}), canonical_hash({"b": [1, {"c": None}], "a": 1}))
+        self.assertEqual(canonical_hash({1, 2}), canonical_hash({2, 1}))
+        self.assertEqual(canonical_hash([1, True]), canonical_hash([1.0, 1]))
+
+    def test_order_of_lists(self):
+        self.assertNotEqual(canonical_hash([1, 2]), canonical_hash([2, 1]))
+        self.assertNotEqual(canonical_hash([1]), canonical_hash(1))
+
+    def test_collisions_are_compared(self):
+        # A list and a tuple hash the same but are not equal
+        self.assertEqual(canonical_hash([1]), canonical_hash((1,)))
+        self.assertFalse(multiset_equal([[1], (1,)], [[1], [1]]))
+
+    def test_unhashable(self):
+        with self.assertRaises(TypeError):
+            canonical_hash(bytearray(b"x"))
+        self.assertTrue(multiset_equal([bytearray(b"x"), 1], [1, bytearray(b"x")]))
+        self.assertFalse(multiset_equal([bytearray(b"x"), 1], [1, bytearray(b"y")]))
+
+
+class TestCompareList(unittest.TestCase):
+    compare_functions = (module_utils_dnac.compare_list, plugin_utils_dnac.compare_list)
+
+    def assertCompare(self, list1, list2, expected):
+        for compare_list in self.compare_functions:
+            self.assertEqual(compare_list(list1, list2), expected, compare_list.__module__)
+
+    def test_order_does_not_matter(self):
+        shuffled = devices(1000)
+        random.Random(0).shuffle(shuffled)
+        # Longer lists were compared in order before
+        self.assertCompare(devices(1000), shuffled, True)
+        self.assertCompare([{"a": 1}, {"b": 2}], [{"b": 2}, {"a": 1}], True)
+        self.assertCompare(["a", "b"], ["b", "a"], True)
+
+    def test_duplicates_are_counted(self):
+        self.assertCompare([{"a": 1}, {"a": 1}, {"b": 2}], [{"a": 1}, {"b": 2}, {"b": 2}], False)
+        self.assertCompare(["a", "a", "b"], ["a", "b", "b"], False)
+        self.assertCompare(["a", "a", "b"], ["a", "b", "a"], True)
+
+    def test_differences(self):
+        changed = devices(500)
+        changed[250]["tags"] = ["b", "a"]
+        self.assertCompare(devices(500), changed, False)
+        self.assertCompare([{"a": 1}], [{"a": 1}, {"a": 1}], False)
+        self.assertCompare([[1, 2]], [[2, 1]], False)
+        self.assertCompare([], [], True)
+
+    def test_mixed_elements(self):
+        self.assertCompare(["a", {"b": 1}, [2]], [[2], "a", {"b": 1}], True)
+
+    def test_dnac_compare_equality(self):
+        current = {"name": "site", "devices": devices(200)}
+        requested = {"name": "site", "devices": list(reversed(devices(200)))}
+        self.assertTrue(module_utils_dnac.dnac_compare_equality(current, requested))
+        self.assertTrue(plugin_utils_dnac.dnac_compare_equality2(current, requested))
+        requested["devices"][0]["hostname"] = "renamed"
+        self.assertFalse(plugin_utils_dnac.dnac_compare_equality(current, requested))
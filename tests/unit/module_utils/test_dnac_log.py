@@ -0,0 +1,96 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import logging
+import unittest
+
+from ansible_collections.cisco.dnac.plugins.module_utils.dnac import Deferred, DnacBase, dnac_argument_spec
+
+
+class FakeModule(object):
+    def __init__(self, **params):
+        self.params = dict((key, spec.get("default")) for key, spec in dnac_argument_spec().items())
+        self.params.update(dnac_host="127.0.0.1", dnac_username="admin", dnac_password="secret", config=[], **params)
+
+
+class Workflow(DnacBase):
+    def validate_input(self):
+        self.log("Validating {0} item(s)", "DEBUG", len(self.config))
+        return self
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestDnacBaseLog(unittest.TestCase):
+    def setUp(self):
+        self.workflow = Workflow(FakeModule())
+        self.handler = ListHandler()
+        self.workflow.logger = logging.getLogger("test_dnac_log")
+        self.workflow.logger.propagate = False
+        self.workflow.logger.addHandler(self.handler)
+        self.addCleanup(self.workflow.logger.removeHandler, self.handler)
+        self.workflow.logger.setLevel(logging.INFO)
+        self.workflow.dnac_log = True
+        self.formatted = []
+
+    def pprint(self, value):
+        self.formatted.append(value)
+        return repr(value)
+
+    def test_arguments_are_formatted_when_logged(self):
+        self.workflow.log("Current State (have): {0}", "INFO", Deferred(self.pprint, {"site": "a"}))
+        self.workflow.log("Desired State (want): {0}", "DEBUG", Deferred(self.pprint, {"site": "b"}))
+
+        self.assertEqual(self.formatted, [{"site": "a"}])
+        self.assertEqual(len(self.handler.messages), 1)
+        self.assertTrue(self.handler.messages[0].endswith("Current State (have): {'site': 'a'} \n"))
+
+    def test_caller_and_braces(self):
+        self.workflow.logger.setLevel(logging.DEBUG)
+        self.workflow.validate_input()
+        self.workflow.log("No arguments, {braces} are kept", "warning")
+
+        self.assertTrue(self.handler.messages[0].startswith(" Workflow: validate_input: "))
+        self.assertTrue(self.handler.messages[0].endswith(": Validating 0 item(s) \n"))
+        self.assertIn("{braces}", self.handler.messages[1])
+
+    def test_disabled(self):
+        self.workflow.dnac_log = False
+        self.workflow.log("Current State (have): {0}", "CRITICAL", Deferred(self.pprint, {}))
+        self.assertEqual(self.formatted, [])
+        self.assertEqual(self.handler.messages, [])
+
+    def test_json_fields(self):
+        records = []
+        self.handler.emit = records.append
+        self.workflow.logger.setLevel(logging.DEBUG)
+        self.workflow.phase = "diff"
+        self.workflow.log_api_call("sites", "get_site", 0.2504)
+
+        record = records[0]
+        self.assertEqual((record.dnac_phase, record.dnac_caller), ("diff", "log_api_call"))
+        self.assertEqual((record.dnac_family, record.dnac_function, record.dnac_latency), ("sites", "get_site", 0.25))
+        self.assertEqual(record.dnac_message, "API call 'sites.get_site' returned in 0.250s")
@@ -0,0 +1,161 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+
+from ansible_collections.cisco.dnac.plugins.module_utils.download import (
+    DownloadError,
+    existing_download,
+    get_filename,
+    parse_checksum,
+    planned_download,
+    save_response,
+    write_chunks,
+)
+
+
+class FakeResponse(object):
+    def __init__(self, body, headers=None, chunk_limit=None):
+        self.body = body
+        self.headers = headers or {}
+        self.chunk_limit = chunk_limit
+        self.closed = False
+        self.chunk_sizes = []
+
+    def iter_content(self, chunk_size):
+        sent = 0
+        for start in range(0, len(self.body), chunk_size):
+            if self.chunk_limit is not None and sent >= self.chunk_limit:
+                return
+            chunk = self.body[start:start + chunk_size]
+            self.chunk_sizes.append(len(chunk))
+            sent += 1
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+class TestDownload(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.body = os.urandom(10000)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_streams_to_the_file_named_by_the_server(self):
+        response = FakeResponse(self.body, {
+            "Content-Disposition": 'attachment; filename="../report.csv"',
+            "Content-Length": str(len(self.body)),
+            "Content-Type": "text/csv",
+        })
+
+        metadata = save_response(response, self.directory + os.sep, chunk_size=1024)
+
+        path = os.path.join(self.directory, "report.csv")
+        self.assertEqual(metadata["path"], path)
+        self.assertEqual(metadata["filename"], "report.csv")
+        self.assertEqual(metadata["size"], len(self.body))
+        self.assertEqual(metadata["checksum"], "sha256:" + hashlib.sha256(self.body).hexdigest())
+        self.assertEqual(metadata["content_type"], "text/csv")
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), self.body)
+        self.assertEqual(max(response.chunk_sizes), 1024)
+        self.assertTrue(response.closed)
+        # No temporary file is left behind
+        self.assertEqual(os.listdir(self.directory), ["report.csv"])
+
+    def test_checksum_is_verified(self):
+        dest = os.path.join(self.directory, "archive.zip")
+        checksum = "md5:" + hashlib.md5(self.body).hexdigest().upper()
+
+        self.assertEqual(write_chunks([self.body], dest, checksum=checksum)["size"], len(self.body))
+
+        with open(dest, "wb") as f:
+            f.write(b"previous")
+        with self.assertRaises(DownloadError):
+            write_chunks([self.body[:-1]], dest, checksum=checksum)
+        # The file is only replaced by a verified download
+        with open(dest, "rb") as f:
+            self.assertEqual(f.read(), b"previous")
+        self.assertEqual(os.listdir(self.directory), ["archive.zip"])
+
+    def test_same_content_does_not_replace_dest(self):
+        dest = os.path.join(self.directory, "report.csv")
+
+        self.assertTrue(write_chunks([self.body], dest)["changed"])
+        os.utime(dest, (0, 0))
+        metadata = write_chunks([self.body[:5000], self.body[5000:]], dest)
+
+        self.assertFalse(metadata["changed"])
+        self.assertEqual(metadata["checksum"], "sha256:" + hashlib.sha256(self.body).hexdigest())
+        self.assertEqual(os.path.getmtime(dest), 0)
+        self.assertEqual(os.listdir(self.directory), ["report.csv"])
+        self.assertTrue(write_chunks([self.body[::-1]], dest)["changed"])
+
+    def test_existing_download_matching_the_checksum(self):
+        dest = os.path.join(self.directory, "archive.zip")
+        checksum = "md5:" + hashlib.md5(self.body).hexdigest()
+
+        self.assertIsNone(existing_download(dest, checksum))
+        with open(dest, "wb") as f:
+            f.write(self.body)
+        metadata = existing_download(dest, checksum)
+
+        self.assertEqual(metadata["path"], dest)
+        self.assertEqual(metadata["size"], len(self.body))
+        self.assertEqual(metadata["checksum"], "sha256:" + hashlib.sha256(self.body).hexdigest())
+        self.assertFalse(metadata["changed"])
+        self.assertIsNone(existing_download(dest, None))
+        self.assertIsNone(existing_download(dest, "md5:0"))
+        self.assertIsNone(existing_download(dest, "not a checksum"))
+        self.assertIsNone(existing_download(self.directory, checksum))
+
+    def test_truncated_download_is_rejected(self):
+        response = FakeResponse(self.body, {"Content-Length": str(len(self.body))}, chunk_limit=3)
+
+        with self.assertRaises(DownloadError):
+            save_response(response, os.path.join(self.directory, "file"), chunk_size=1000)
+        self.assertEqual(os.listdir(self.directory), [])
+        self.assertTrue(response.closed)
+
+    def test_compressed_body_size_is_not_checked(self):
+        response = FakeResponse(self.body, {"Content-Length": "10", "Content-Encoding": "gzip"})
+
+        self.assertEqual(save_response(response, os.path.join(self.directory, "file"))["size"], len(self.body))
+
+    def test_helpers(self):
+        self.assertEqual(parse_checksum("SHA1: ABC"), ("sha1", "abc"))
+        self.assertEqual(parse_checksum(None), (None, None))
+        self.assertRaises(DownloadError, parse_checksum, "abc")
+        self.assertRaises(DownloadError, parse_checksum, "nohash:abc")
+        self.assertEqual(get_filename({"Content-Disposition": "attachment; filename=config.zip"}), "config.zip")
+        self.assertEqual(get_filename({}), "download")
+
+    def test_planned_download_writes_nothing(self):
+        path = os.path.join(self.directory, "report.csv")
+
+        self.assertEqual(planned_download(path), dict(path=path, filename="report.csv", dirpath=self.directory))
+        self.assertEqual(planned_download(self.directory), dict(path=None, filename=None, dirpath=self.directory))
+        self.assertEqual(os.listdir(self.directory), [])
@@ -0,0 +1,146 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from ansible_collections.cisco.dnac.plugins.module_utils.canonical import canonical_digest
+from ansible_collections.cisco.dnac.plugins.module_utils.dnac import DnacBase, dnac_argument_spec
+from ansible_collections.cisco.dnac.plugins.module_utils.fingerprint_store import FingerprintStore
+
+
+class FakeModule(object):
+    _name = "site_workflow_manager"
+
+    def __init__(self, **params):
+        self.params = dict((key, spec.get("default")) for key, spec in dnac_argument_spec().items())
+        self.params.update(dnac_host="127.0.0.1", dnac_username="admin", dnac_password="secret", config=[], **params)
+
+
+class Workflow(DnacBase):
+    """Manages sites, their markers are set by the tests."""
+
+    def __init__(self, module, sites):
+        DnacBase.__init__(self, module)
+        self.sites = sites
+        self.listings = 0
+
+    def validate_input(self):
+        return self
+
+    def get_fingerprint_objects(self, config):
+        if config.get("export"):
+            return None
+        return [("site", config["name"])]
+
+    def list_fingerprint_markers(self, kind):
+        self.listings += 1
+        return dict(self.sites)
+
+    def run(self, config):
+        """Apply the items like the main() of the modules, return the items not skipped."""
+
+        applied = []
+        for item in config:
+            self.reset_values()
+            if self.skip_unchanged(item):
+                continue
+            applied.append(item["name"])
+            self.sites[item["name"]] = item.get("update", self.sites.get(item["name"]))
+            self.keep_fingerprint()
+        self.save_fingerprints()
+        return applied
+
+
+class TestCanonicalDigest(unittest.TestCase):
+    def test_stable(self):
+        self.assertEqual(canonical_digest({"a": 1, "b": [1, {"c": None}]}), canonical_digest({"b": [1, {"c": None}], "a": 1}))
+        self.assertEqual(canonical_digest("x"), "ba2df4903a2c14e86dc3bcca58911b44ac1d2514b7227bf6eb08cfb978f55a1b")
+        self.assertNotEqual(canonical_digest([1, 2]), canonical_digest([2, 1]))
+
+
+class TestFingerprintStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "fingerprints.db")
+
+    def test_save_and_load(self):
+        store = FingerprintStore(self.path, "site_workflow_manager@a")
+        self.assertIsNone(store.get("item1"))
+        store.save([("item1", "d1", "m1"), ("item2", "d2", "m2")])
+        self.assertEqual(store.get("item1"), ("d1", "m1"))
+
+        other = FingerprintStore(self.path, "site_workflow_manager@b")
+        self.assertEqual(other.load(), {})
+        reloaded = FingerprintStore(self.path, "site_workflow_manager@a")
+        self.assertEqual(reloaded.load(), {"item1": ("d1", "m1"), "item2": ("d2", "m2")})
+
+        reloaded.save([("item1", "d1", None), ("item2", "d3", "m3")])
+        self.assertEqual(FingerprintStore(self.path, "site_workflow_manager@a").load(), {"item2": ("d3", "m3")})
+
+    def test_unusable_file(self):
+        store = FingerprintStore(os.path.join(self.directory, "missing", "fingerprints.db"), "scope")
+        self.assertEqual(store.load(), {})
+        self.assertIsNotNone(store.error)
+        store.save([("item1", "d1", "m1")])
+
+
+class TestSkipUnchanged(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, "fingerprints.db")
+        self.sites = {"Global/a": {"id": 1}, "Global/b": {"id": 2}}
+        self.config = [{"name": "Global/a", "update": {"id": 1, "v": 1}}, {"name": "Global/b"}]
+
+    def workflow(self, **params):
+        params.setdefault("dnac_fingerprint_store", self.path)
+        params.setdefault("state", "merged")
+        return Workflow(FakeModule(**params), self.sites)
+
+    def test_second_run_skips(self):
+        first = self.workflow()
+        self.assertEqual(first.run(self.config), ["Global/a", "Global/b"])
+        # Nothing stored yet, the markers are only listed to be recorded after the changes
+        self.assertEqual(first.listings, 1)
+
+        second = self.workflow()
+        self.assertEqual(second.run(self.config), [])
+        self.assertEqual(second.listings, 1)
+
+    def test_changed_item_or_object(self):
+        self.workflow().run(self.config)
+        self.config[1]["description"] = "new"
+        self.sites["Global/a"] = {"id": 1, "v": 2}
+        self.assertEqual(self.workflow().run(self.config), ["Global/a", "Global/b"])
+        self.assertEqual(self.workflow().run(self.config), [])
+
+    def test_missing_object(self):
+        self.workflow().run(self.config)
+        del self.sites["Global/b"]
+        self.assertEqual(self.workflow().run(self.config), ["Global/b"])
+
+    def test_not_skipped(self):
+        self.workflow().run(self.config)
+        self.assertEqual(self.workflow(state="deleted").run(self.config), ["Global/a", "Global/b"])
+        self.assertEqual(self.workflow(dnac_fingerprint_store=None).run(self.config), ["Global/a", "Global/b"])
+        self.assertEqual(self.workflow().run([{"name": "Global/a", "export": True}]), ["Global/a"])
@@ -0,0 +1,57 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import sys
+import unittest
+
+from ansible_collections.cisco.dnac.plugins.module_utils.lazy_import import (
+    LazyModule,
+    is_importable,
+)
+
+
+class TestLazyImport(unittest.TestCase):
+    def setUp(self):
+        self.saved = sys.modules.pop("colorsys", None)
+
+    def tearDown(self):
+        sys.modules.pop("colorsys", None)
+        if self.saved is not None:
+            sys.modules["colorsys"] = self.saved
+
+    def test_imports_on_first_attribute_access(self):
+        colorsys = LazyModule("colorsys")
+        self.assertNotIn("colorsys", sys.modules)
+
+        self.assertEqual(colorsys.rgb_to_hsv(1.0, 0.0, 0.0), (0.0, 1.0, 1.0))
+        self.assertIn("colorsys", sys.modules)
+        self.assertIs(colorsys._lazy_module, sys.modules["colorsys"])
+
+    def test_missing_module_fails_on_use(self):
+        missing = LazyModule("dnac_missing_module")
+
+        with self.assertRaises(ImportError):
+            missing.anything
+
+    def test_tells_whether_a_module_is_importable(self):
+        self.assertTrue(is_importable("colorsys"))
+        self.assertNotIn("colorsys", sys.modules)
+        self.assertTrue(is_importable("json.decoder"))
+        self.assertFalse(is_importable("dnac_missing_module"))
+        self.assertFalse(is_importable("dnac_missing_module.child"))
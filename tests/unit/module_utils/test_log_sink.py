@@ -0,0 +1,90 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import gzip
+import json
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+from ansible_collections.cisco.dnac.plugins.module_utils.log_sink import (
+    JsonFormatter,
+    attach_log_sink,
+    create_file_handler,
+    stop_log_sink,
+)
+
+
+class TestLogSink(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "dnac.log")
+        self.logger = logging.getLogger("test_log_sink_{0}".format(self.id()))
+        self.logger.propagate = False
+        self.logger.setLevel(logging.DEBUG)
+
+    def tearDown(self):
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+
+    def test_json_lines(self):
+        listener = attach_log_sink(self.logger, create_file_handler(self.path), JsonFormatter("site_workflow_manager"))
+        self.logger.debug(" Site: get_have: 12: Current State (have) \n", extra={
+            "dnac_class": "Site", "dnac_caller": "get_have", "dnac_line": 12,
+            "dnac_message": "Current State (have)", "dnac_phase": "have"})
+        self.logger.debug("API call", extra={"dnac_family": "sites", "dnac_function": "get_site", "dnac_latency": 0.25})
+        stop_log_sink(listener)
+        stop_log_sink(listener)
+
+        with open(self.path) as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(lines[0]["message"], "Current State (have)")
+        self.assertEqual((lines[0]["module"], lines[0]["phase"], lines[0]["caller"]), ("site_workflow_manager", "have", "get_have"))
+        self.assertEqual((lines[1]["family"], lines[1]["function"], lines[1]["latency"]), ("sites", "get_site", 0.25))
+        self.assertNotIn("phase", lines[1])
+
+    def test_rotation_with_gzip(self):
+        handler = create_file_handler(self.path, max_bytes=1000, backup_count=2, compress=True)
+        listener = attach_log_sink(self.logger, handler, logging.Formatter("%(message)s"))
+        for index in range(100):
+            self.logger.info("record {0:04d} {1}".format(index, "x" * 40))
+        stop_log_sink(listener)
+
+        self.assertEqual(sorted(os.listdir(self.directory)), ["dnac.log", "dnac.log.1.gz", "dnac.log.2.gz"])
+        with gzip.open(self.path + ".1.gz", "rt") as f:
+            rotated = f.read().splitlines()
+        with open(self.path) as f:
+            current = f.read().splitlines()
+        self.assertEqual(current[-1][:11], "record 0099")
+        self.assertLess(rotated[-1], current[0])
+        self.assertLessEqual(os.path.getsize(self.path), 1000)
+
+    def test_write_mode_truncates(self):
+        with open(self.path, "w") as f:
+            f.write("previous run\n")
+        handler = create_file_handler(self.path, mode="w", max_bytes=1000)
+        listener = attach_log_sink(self.logger, handler, logging.Formatter("%(message)s"))
+        self.logger.info("this run")
+        stop_log_sink(listener)
+
+        with open(self.path) as f:
+            self.assertEqual(f.read(), "this run\n")
@@ -0,0 +1,132 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import threading
+import unittest
+
+from ansible_collections.cisco.dnac.plugins.module_utils.pagination import iter_pages, paginate
+
+
+class FakeApi(object):
+    def __init__(self, total, start=1):
+        self.items = list(range(start, start + total))
+        self.start = start
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def fetch_page(self, offset, limit):
+        with self.lock:
+            self.calls.append((offset, limit))
+        index = offset - self.start
+        return self.items[index:index + limit]
+
+
+class TestPagination(unittest.TestCase):
+    def test_all_items_in_order(self):
+        for prefetch in (False, True):
+            api = FakeApi(23)
+            self.assertEqual(list(paginate(api.fetch_page, page_size=5, prefetch=prefetch)), api.items)
+            # The short last page ends the iteration without an extra request
+            self.assertEqual(api.calls, [(1, 5), (6, 5), (11, 5), (16, 5), (21, 5)])
+
+    def test_exact_multiple_needs_an_empty_page(self):
+        api = FakeApi(10)
+        self.assertEqual(len(list(paginate(api.fetch_page, page_size=5, prefetch=False))), 10)
+        self.assertEqual(api.calls, [(1, 5), (6, 5), (11, 5)])
+
+    def test_max_items_and_start(self):
+        api = FakeApi(100, start=0)
+        pages = list(iter_pages(api.fetch_page, page_size=40, start=10, max_items=50, prefetch=False))
+
+        self.assertEqual([len(page) for page in pages], [40, 10])
+        self.assertEqual(api.calls, [(10, 40), (50, 10)])
+
+    def test_early_stop(self):
+        api = FakeApi(1000)
+        found = next(item for item in paginate(api.fetch_page, page_size=10, prefetch=False) if item == 15)
+
+        self.assertEqual(found, 15)
+        self.assertEqual(api.calls, [(1, 10), (11, 10)])
+
+    def test_prefetch_requests_the_next_page_in_the_background(self):
+        api = FakeApi(30)
+        fetched_by = []
+        next_page_requested = threading.Event()
+
+        def fetch_page(offset, limit):
+            fetched_by.append(threading.current_thread())
+            if offset > 1:
+                next_page_requested.set()
+            return api.fetch_page(offset, limit)
+
+        pages = iter_pages(fetch_page, page_size=10)
+        next(pages)
+        # The second page is requested while the caller still holds the first one
+        self.assertTrue(next_page_requested.wait(5))
+        self.assertEqual(len(list(pages)), 2)
+        self.assertEqual(fetched_by[0], threading.current_thread())
+        self.assertNotEqual(fetched_by[1], threading.current_thread())
+
+    def test_known_total_fetches_pages_concurrently(self):
+        api = FakeApi(95)
+        in_flight = [0]
+        peak = [0]
+        all_started = threading.Barrier(4, timeout=5)
+
+        def fetch_page(offset, limit):
+            with api.lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            if offset <= 31:
+                # The first four pages only return once they all were requested
+                all_started.wait()
+            try:
+                return api.fetch_page(offset, limit)
+            finally:
+                with api.lock:
+                    in_flight[0] -= 1
+
+        items = list(paginate(fetch_page, page_size=10, total=95, max_workers=4))
+
+        self.assertEqual(items, api.items)
+        self.assertEqual(peak[0], 4)
+        # No request past the count when the last page is short
+        self.assertEqual(sorted(api.calls), [(offset, 10) for offset in range(1, 92, 10)])
+
+    def test_outdated_total_continues_past_the_count(self):
+        api = FakeApi(37)
+        pages = list(iter_pages(api.fetch_page, page_size=10, total=20, max_workers=4))
+
+        self.assertEqual([len(page) for page in pages], [10, 10, 10, 7])
+        self.assertEqual(sorted(api.calls), [(1, 10), (11, 10), (21, 10), (31, 10)])
+
+    def test_known_total_with_max_items(self):
+        api = FakeApi(100, start=0)
+        pages = list(iter_pages(api.fetch_page, page_size=40, start=10, max_items=50, total=90, max_workers=3))
+
+        self.assertEqual([len(page) for page in pages], [40, 10])
+        self.assertEqual(sorted(api.calls), [(10, 40), (50, 10)])
+
+    def test_known_total_early_stop_cancels_pending_pages(self):
+        api = FakeApi(1000)
+        found = next(item for item in paginate(api.fetch_page, page_size=10, total=1000, max_workers=2) if item == 5)
+
+        self.assertEqual(found, 5)
+        # At most the pages already handed to the workers were requested
+        self.assertLessEqual(len(api.calls), 4)
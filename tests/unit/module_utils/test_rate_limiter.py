@@ -0,0 +1,125 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+
+from ansible_collections.cisco.dnac.plugins.module_utils.rate_limiter import (
+    RateLimiter,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class FakeResponse(object):
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class FakeApiError(Exception):
+    def __init__(self, status_code, headers=None):
+        super(FakeApiError, self).__init__("HTTP {0}".format(status_code))
+        self.response = FakeResponse(status_code, headers)
+        self.status_code = status_code
+
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_bucket_paces_requests(self):
+        bucket = TokenBucket(rate=2, clock=self.clock.time, sleep=self.clock.sleep)
+        start = self.clock.now
+        for dummy in range(6):
+            bucket.acquire()
+
+        # Two requests of burst, then one every half second
+        self.assertAlmostEqual(self.clock.now - start, 2.0)
+
+    def test_throttle_halves_the_rate_and_recovers(self):
+        bucket = TokenBucket(rate=4, clock=self.clock.time, sleep=self.clock.sleep)
+        self.assertEqual(bucket.throttle(3), 3)
+        self.assertEqual(bucket.rate, 2)
+        self.assertEqual(bucket.acquire(), 3)
+        for dummy in range(20):
+            bucket.success()
+        self.assertEqual(bucket.rate, 4)
+
+    def test_retries_honour_retry_after(self):
+        limiter = RateLimiter(max_retries=3, clock=self.clock.time, sleep=self.clock.sleep)
+        errors = [FakeApiError(429, {"Retry-After": "7"}), FakeApiError(503)]
+
+        def send():
+            if errors:
+                raise errors.pop(0)
+            return "ok"
+
+        start = self.clock.now
+        self.assertEqual(limiter.call(send, "devices"), "ok")
+        # 7 seconds from the header, then the default backoff of the second rejection
+        self.assertEqual(self.clock.now - start, 7 + 4)
+        self.assertEqual(limiter.state["retries"], 2)
+        self.assertEqual(limiter.state["controller"]["throttled"], 2)
+
+    def test_retries_are_capped(self):
+        limiter = RateLimiter(max_retries=2, clock=self.clock.time, sleep=self.clock.sleep)
+        calls = []
+
+        def send():
+            calls.append(1)
+            raise FakeApiError(429, {"Retry-After": "1"})
+
+        self.assertRaises(FakeApiError, limiter.call, send)
+        self.assertEqual(len(calls), 3)
+
+    def test_other_errors_are_not_retried(self):
+        limiter = RateLimiter(clock=self.clock.time, sleep=self.clock.sleep)
+        calls = []
+
+        def send():
+            calls.append(1)
+            raise FakeApiError(404)
+
+        self.assertRaises(FakeApiError, limiter.call, send)
+        self.assertEqual(len(calls), 1)
+
+    def test_per_family_buckets(self):
+        limiter = RateLimiter(rate=1, per_family=True, clock=self.clock.time, sleep=self.clock.sleep)
+        limiter.acquire("devices")
+        limiter.throttle("devices", 5)
+
+        self.assertEqual(sorted(limiter.state["families"]), ["devices"])
+        self.assertEqual(limiter.state["families"]["devices"]["throttled"], 1)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("12"), 12)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertEqual(parse_retry_after("Thu, 01 Jan 1970 00:16:50 GMT", clock=self.clock.time), 10)
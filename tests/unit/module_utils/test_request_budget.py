@@ -0,0 +1,84 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import shutil
+import tempfile
+import unittest
+
+from ansible_collections.cisco.dnac.plugins.module_utils.request_budget import SharedRequestBudget
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestSharedRequestBudget(unittest.TestCase):
+    def setUp(self):
+        self.state_dir = tempfile.mkdtemp()
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        shutil.rmtree(self.state_dir)
+
+    def make_budget(self, **kwargs):
+        return SharedRequestBudget("https://10.0.0.1:443", state_dir=self.state_dir,
+                                   clock=self.clock.time, sleep=self.clock.sleep, **kwargs)
+
+    def test_forks_draw_from_the_same_bucket(self):
+        # Two instances stand for two forks, they only share the state directory
+        first = self.make_budget(rate=2)
+        second = self.make_budget(rate=2)
+        waits = [first.reserve(), second.reserve(), first.reserve(), second.reserve()]
+
+        self.assertEqual(waits, [0, 0, 0.5, 1.0])
+
+    def test_throttle_pauses_every_fork(self):
+        first = self.make_budget()
+        second = self.make_budget()
+        first.throttle(10)
+
+        self.assertEqual(second.reserve(), 10)
+
+    def test_family_concurrency(self):
+        first = self.make_budget(family_concurrency=1)
+        second = self.make_budget(family_concurrency=1)
+
+        def busy(seconds):
+            raise RuntimeError("slot busy")
+
+        second.sleep = busy
+        with first.slot("devices"):
+            # Other families have their own slots
+            with second.slot("sites"):
+                pass
+            with self.assertRaises(RuntimeError):
+                with second.slot("devices"):
+                    pass
+
+        with second.slot("devices"):
+            pass
@@ -0,0 +1,147 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import threading
+import unittest
+
+from ansible_collections.cisco.dnac.plugins.module_utils.dnac import DnacBase, dnac_argument_spec
+from ansible_collections.cisco.dnac.plugins.module_utils.request_memo import RequestMemo, is_read
+from ansible_collections.cisco.dnac.plugins.module_utils.task_waiter import TaskWaiter
+
+
+class FakeModule(object):
+    def __init__(self, **params):
+        self.params = dict((key, spec.get("default")) for key, spec in dnac_argument_spec().items())
+        self.params.update(dnac_host="127.0.0.1", dnac_username="admin", dnac_password="secret", config=[],
+                           dnac_api_task_timeout=60, dnac_task_poll_interval=1, **params)
+
+
+class Workflow(DnacBase):
+    def validate_input(self):
+        return self
+
+
+class FakeEventManagement(object):
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.polls = 0
+
+    def get_status_api_for_events(self, execution_id, **kwargs):
+        self.polls += 1
+        return {"apiStatus": self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]}
+
+
+class FakeApi(object):
+    def __init__(self, statuses):
+        self.event_management = FakeEventManagement(statuses)
+
+
+class TestRequestMemo(unittest.TestCase):
+    def setUp(self):
+        self.memo = RequestMemo()
+        self.sent = []
+
+    def send(self, value):
+        def send():
+            self.sent.append(value)
+            return {"response": [value]}
+        return send
+
+    def test_identical_reads_are_sent_once(self):
+        first = self.memo.call("devices", "get_device_list", {"hostname": ["sw1"]}, self.send("sw1"))
+        first["response"].append("modified by the caller")
+        second = self.memo.call("devices", "get_device_list", {"hostname": ["sw1"]}, self.send("sw1"))
+        self.memo.call("devices", "get_device_list", {"hostname": ["sw2"]}, self.send("sw2"))
+
+        self.assertEqual(self.sent, ["sw1", "sw2"])
+        self.assertEqual(second, {"response": ["sw1"]})
+        self.assertEqual(self.memo.stats["hits"], 1)
+
+    def test_writes_and_task_polls_invalidate(self):
+        for family, function in (("devices", "add_device"), ("task", "get_task_by_id")):
+            self.memo.call("devices", "get_device_list", None, self.send("read"))
+            self.memo.call(family, function, {"id": 1}, self.send(function))
+            self.memo.call("devices", "get_device_list", None, self.send("read"))
+
+        # The second loop starts with a hit, the read memoized after the write
+        self.assertEqual(self.sent, ["read", "add_device", "read", "get_task_by_id", "read"])
+        self.assertEqual(self.memo.stats["invalidations"], 2)
+
+    def test_calls_with_op_modifies_are_not_memoized(self):
+        self.memo.call("devices", "get_device_list", None, self.send("read"))
+        for status in ("IN_PROGRESS", "SUCCESS"):
+            self.memo.call("event_management", "get_status_api_for_events", {"execution_id": 1},
+                           self.send(status), op_modifies=True)
+        self.memo.call("devices", "get_device_list", None, self.send("read"))
+
+        self.assertEqual(self.sent, ["read", "IN_PROGRESS", "SUCCESS", "read"])
+        self.assertEqual(self.memo.stats["hits"], 0)
+
+    def test_is_read(self):
+        self.assertTrue(is_read("sites", "get_site"))
+        self.assertTrue(is_read("devices", "retrieves_all_network_devices"))
+        self.assertFalse(is_read("sites", "create_site"))
+        self.assertFalse(is_read("task", "get_task_by_id"))
+
+    def test_concurrent_reads_are_coalesced(self):
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow_send():
+            started.set()
+            release.wait(5)
+            self.sent.append("slow")
+            return {"response": "slow"}
+
+        results = []
+        owner = threading.Thread(target=lambda: results.append(self.memo.call("sites", "get_site", None, slow_send)))
+        owner.start()
+        started.wait(5)
+        waiter = threading.Thread(target=lambda: results.append(self.memo.call("sites", "get_site", None, slow_send)))
+        waiter.start()
+        while self.memo.stats["coalesced"] == 0:
+            threading.Event().wait(0.01)
+        release.set()
+        owner.join(5)
+        waiter.join(5)
+
+        self.assertEqual(self.sent, ["slow"])
+        self.assertEqual(results, [{"response": "slow"}] * 2)
+
+    def test_errors_are_not_memoized(self):
+        def failing():
+            self.sent.append("failed")
+            raise ValueError("boom")
+
+        self.assertRaises(ValueError, self.memo.call, "sites", "get_site", None, failing)
+        self.assertRaises(ValueError, self.memo.call, "sites", "get_site", None, failing)
+        self.assertEqual(self.sent, ["failed", "failed"])
+
+
+class TestPollingWithMemo(unittest.TestCase):
+    def test_status_poll_sees_the_status_change(self):
+        workflow = Workflow(FakeModule(dnac_memoize_reads=True))
+        workflow.dnac._api = FakeApi(["IN_PROGRESS", "IN_PROGRESS", "SUCCESS"])
+        workflow.task_waiter = TaskWaiter(sleep=lambda seconds: None, timeout=60, jitter=0)
+
+        response = workflow.check_status_api_events("exec-1")
+
+        self.assertEqual(response, {"apiStatus": "SUCCESS"})
+        self.assertEqual(workflow.dnac._api.event_management.polls, 3)
+        self.assertEqual(workflow.dnac.memo.stats["hits"], 0)
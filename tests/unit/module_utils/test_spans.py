@@ -0,0 +1,137 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from ansible_collections.cisco.dnac.plugins.module_utils.dnac import DnacBase, dnac_argument_spec
+from ansible_collections.cisco.dnac.plugins.module_utils.spans import SPAN_KIND_CLIENT, Tracer
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeModule(object):
+    def __init__(self, **params):
+        self.params = dict((key, spec.get("default")) for key, spec in dnac_argument_spec().items())
+        self.params.update(dnac_host="127.0.0.1", dnac_username="admin", dnac_password="secret", config=[], **params)
+
+
+class Workflow(DnacBase):
+    def __init__(self, module, clock):
+        DnacBase.__init__(self, module)
+        self.clock = clock
+
+    def validate_input(self):
+        return self
+
+    def get_want(self, config):
+        self.clock.now += 1
+        return self
+
+    def get_have(self, config):
+        self.clock.now += 2
+        return self
+
+    def get_diff_merged(self, config):
+        with self.span("get_sites"):
+            self.clock.now += 0.5
+        self.get_have(config)
+        self.clock.now += 3
+        return self
+
+    def verify_diff_merged(self, config):
+        self.status = "failed"
+        self.msg = "Site not found"
+        return self
+
+
+class TestTracer(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "spans.jsonl")
+
+    def test_timings_and_export(self):
+        tracer = Tracer(self.path, {"ansible.module": "site_workflow_manager"}, clock=self.clock)
+        timings = {}
+        tracer.start_trace("config", timings, index=0)
+        with tracer.span("diff"):
+            self.clock.now += 1
+            with tracer.span("sites.get_site", kind=SPAN_KIND_CLIENT):
+                self.clock.now += 0.25
+        with self.assertRaises(ValueError):
+            with tracer.span("verify"):
+                raise ValueError("mismatch")
+        tracer.end_trace()
+        tracer.end_trace()
+
+        self.assertEqual(timings, {"diff": 1.25, "verify": 0.0, "api": 0.25, "api_calls": 1})
+        with open(self.path) as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(len(lines), 1)
+        spans = lines[0]["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        # The spans are listed as they end
+        self.assertEqual([span["name"] for span in spans], ["config", "sites.get_site", "diff", "verify"])
+        root, call, diff, verify = spans
+        self.assertEqual(call["parentSpanId"], diff["spanId"])
+        self.assertEqual(diff["parentSpanId"], root["spanId"])
+        self.assertEqual(len(set(span["traceId"] for span in spans)), 1)
+        self.assertEqual(root["endTimeUnixNano"], str(int(101.25 * 1e9)))
+        self.assertEqual(verify["status"]["message"], "ValueError: mismatch")
+
+    def test_spans_outside_of_an_item_are_dropped(self):
+        tracer = Tracer(clock=self.clock)
+        with tracer.span("validate"):
+            self.clock.now += 1
+        self.assertEqual(tracer.spans, [])
+
+
+class TestDnacBaseTimings(unittest.TestCase):
+    def test_phases_of_every_config_item(self):
+        clock = FakeClock()
+        workflow = Workflow(FakeModule(dnac_timings=True), clock)
+        workflow.tracer.clock = clock
+        for config in [{"site": "a"}, {"site": "b"}]:
+            workflow.get_want(config)
+            workflow.get_have(config)
+            workflow.get_diff_state_apply["merged"](config)
+            workflow.verify_diff_state_apply["merged"](config)
+
+        self.assertEqual(workflow.result["timings"], [
+            {"want": 1.0, "have": 2.0, "diff": 5.5, "verify": 0.0},
+            {"want": 1.0, "have": 2.0, "diff": 5.5, "verify": 0.0},
+        ])
+        verify = workflow.tracer.spans[-1]
+        self.assertEqual((verify.name, verify.error), ("verify", "Site not found"))
+
+    def test_disabled(self):
+        workflow = Workflow(FakeModule(), FakeClock())
+        self.assertNotIn("timings", workflow.result)
+        with workflow.span("get_sites") as span:
+            self.assertIsNone(span)
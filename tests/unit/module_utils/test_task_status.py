@@ -0,0 +1,79 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+
+from ansible_collections.cisco.dnac.plugins.module_utils.task_status import BatchedTaskStatus
+
+
+class FakeTasks(object):
+    def __init__(self, tasks):
+        self.tasks = tasks
+        self.pages = []
+        self.singles = []
+
+    def list_tasks(self, offset, limit, start_time):
+        self.pages.append(offset)
+        return self.tasks[offset - 1:offset - 1 + limit]
+
+    def get_task(self, task_id):
+        self.singles.append(task_id)
+        return {"id": task_id, "isError": False, "progress": "details of " + task_id}
+
+
+class TestBatchedTaskStatus(unittest.TestCase):
+    def test_detailed_records_need_a_single_list_call(self):
+        fake = FakeTasks([{"id": "t{0}".format(i), "isError": False, "progress": "running"} for i in range(50)])
+        provider = BatchedTaskStatus(fake.list_tasks, fake.get_task)
+        result = provider(["t3", "t7", "t42"])
+
+        self.assertEqual(fake.pages, [1])
+        self.assertEqual(fake.singles, [])
+        self.assertEqual(result["t42"]["progress"], "running")
+
+    def test_summaries_fetch_details_only_when_needed(self):
+        fake = FakeTasks([{"id": "pending", "status": "PENDING"},
+                          {"id": "done", "status": "SUCCESS"}])
+        provider = BatchedTaskStatus(fake.list_tasks, fake.get_task)
+        result = provider(["pending", "done", "missing"])
+
+        self.assertEqual(sorted(fake.singles), ["done", "missing"])
+        self.assertEqual(result["pending"], {"id": "pending", "status": "PENDING"})
+        self.assertEqual(result["done"]["progress"], "details of done")
+
+    def test_pages_overlap_and_stop_when_all_found(self):
+        fake = FakeTasks([{"id": "t{0}".format(i), "isError": False} for i in range(10)])
+        provider = BatchedTaskStatus(fake.list_tasks, fake.get_task, page_size=4)
+        provider(["t0", "t5"])
+
+        self.assertEqual(fake.pages, [1, 4])
+        self.assertEqual(fake.singles, [])
+
+    def test_listing_error_falls_back_to_single_calls(self):
+        fake = FakeTasks([])
+
+        def broken(offset, limit, start_time):
+            raise ValueError("not supported")
+
+        provider = BatchedTaskStatus(broken, fake.get_task)
+        provider(["a", "b"])
+        provider(["a", "b"])
+
+        self.assertFalse(provider.enabled)
+        self.assertEqual(fake.singles, ["a", "b", "a", "b"])
@@ -0,0 +1,102 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+
+from ansible_collections.cisco.dnac.plugins.module_utils.task_waiter import TaskWaiter
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTaskWaiter(unittest.TestCase):
+    def make_waiter(self, **kwargs):
+        self.clock = FakeClock()
+        kwargs.setdefault("jitter", 0)
+        return TaskWaiter(sleep=self.clock.sleep, clock=self.clock.time, **kwargs)
+
+    def test_backoff_is_capped(self):
+        waiter = self.make_waiter(initial_delay=0.5, max_delay=2, multiplier=2)
+        states = iter([None, None, None, None, "done"])
+        result = waiter.wait(lambda: next(states), lambda value: value == "done", name="task")
+
+        self.assertTrue(result.succeeded)
+        self.assertEqual(result.polls, 5)
+        self.assertEqual(self.clock.sleeps, [0.5, 1.0, 2.0, 2.0])
+        self.assertEqual(waiter.poll_counts, {"task": 5})
+
+    def test_failure_predicate_stops_the_wait(self):
+        waiter = self.make_waiter()
+        result = waiter.wait(lambda: {"isError": True}, lambda value: False,
+                             lambda value: value.get("isError"))
+
+        self.assertTrue(result.failed)
+        self.assertEqual(result.polls, 1)
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_deadline(self):
+        waiter = self.make_waiter(initial_delay=1, max_delay=4, timeout=10)
+        result = waiter.wait(lambda: None, lambda value: False)
+
+        self.assertTrue(result.timed_out)
+        self.assertEqual(sum(self.clock.sleeps), 10)
+
+    def test_jitter_stays_in_bounds(self):
+        waiter = self.make_waiter(initial_delay=2, max_delay=2, jitter=0.25)
+        for attempt in range(50):
+            self.assertTrue(1.5 <= waiter.next_delay(attempt) <= 2.5)
+
+    def test_wait_many_yields_in_completion_order(self):
+        waiter = self.make_waiter(initial_delay=1, max_delay=1, timeout=10)
+        finish_at = {"slow": 3, "fast": 1, "never": None}
+        batches = []
+
+        def poll_many(names):
+            batches.append(sorted(names))
+            return dict((name, finish_at[name] is not None and self.clock.now >= finish_at[name]) for name in names)
+
+        results = list(waiter.wait_many(["slow", "fast", "never"], poll_many, lambda value: value))
+
+        self.assertEqual([result.name for result in results], ["fast", "slow", "never"])
+        self.assertEqual([result.status for result in results], ["success", "success", "timeout"])
+        self.assertEqual(batches[0], ["fast", "never", "slow"])
+        # The whole wait lasts as long as the slowest task, not the sum of all of them
+        self.assertEqual(self.clock.now, 10)
+
+    def test_wait_many_coalesces_polls(self):
+        waiter = self.make_waiter(initial_delay=1, max_delay=1, jitter=0.5, timeout=5)
+        batches = []
+
+        def poll_many(names):
+            batches.append(len(names))
+            return {}
+
+        list(waiter.wait_many(["a", "b", "c"], poll_many, lambda value: False, coalesce=1.5))
+
+        self.assertTrue(all(size == 3 for size in batches))
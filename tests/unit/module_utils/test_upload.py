@@ -0,0 +1,134 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from ansible_collections.cisco.dnac.plugins.module_utils.upload import (
+    MultipartUpload,
+    close_multipart_fields,
+    file_checksums,
+    get_multipart_data,
+)
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestUpload(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "image.bin")
+        self.content = os.urandom(50000)
+        with open(self.path, "wb") as f:
+            f.write(self.content)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def read_all(self, upload, size=8192):
+        body = b""
+        while True:
+            data = upload.read(size)
+            if not data:
+                return body
+            body += data
+
+    def test_reads_fixed_size_chunks(self):
+        with open(self.path, "rb") as f:
+            upload = MultipartUpload({"file": ("image.bin", f, "application/octet-stream")}, chunk_size=16384)
+            body = self.read_all(upload)
+
+        self.assertEqual(len(body), upload.len)
+        self.assertIn(self.content, body)
+        self.assertTrue(upload.content_type.startswith("multipart/form-data; boundary="))
+        # 8 KiB reads of the HTTP stack are served 16 KiB at a time, plus the final empty read
+        self.assertEqual(upload.reads, (upload.len + 16383) // 16384 + 1)
+
+    def test_calls_the_monitor_callback(self):
+        seen = []
+        with open(self.path, "rb") as f:
+            upload = MultipartUpload({"file": ("image.bin", f)}, chunk_size=16384,
+                                     create_callback=lambda monitor: lambda m: seen.append(m.bytes_read))
+            self.read_all(upload)
+
+        self.assertEqual(seen[-1], upload.len)
+        self.assertEqual(seen, sorted(seen))
+
+    def test_reports_throughput_once_complete(self):
+        clock = FakeClock()
+        messages = []
+        completed = []
+        with open(self.path, "rb") as f:
+            upload = MultipartUpload({"file": ("image.bin", f)}, chunk_size=16384, log=messages.append,
+                                     progress_interval=1, on_complete=completed.append, clock=clock)
+            upload.read(8192)
+            clock.now += 2
+            upload.read(8192)
+            clock.now += 2
+            self.read_all(upload)
+
+        self.assertEqual(len(completed), 1)
+        self.assertEqual(completed[0]["size"], upload.len)
+        self.assertEqual(completed[0]["bytes_sent"], upload.len)
+        self.assertEqual(completed[0]["elapsed"], 4.0)
+        self.assertEqual(completed[0]["throughput"], round(upload.len / 1024.0 / 1024.0 / 4, 2))
+        # Progress after 2s and 4s, then the completion
+        self.assertEqual(len(messages), 3)
+        self.assertTrue(messages[0].startswith("Uploaded 0.0 of"))
+        self.assertTrue(messages[2].startswith("Uploaded 0.0 MiB in 4.0s"))
+
+    def test_replaces_the_multipart_data_of_the_session(self):
+        multipart_data = get_multipart_data(chunk_size=4096)
+
+        self.assertIsNone(multipart_data(None, None))
+        upload = multipart_data({"name": "value"}, None)
+        self.assertIsInstance(upload, MultipartUpload)
+        self.assertEqual(upload.chunk_size, 4096)
+        self.assertIn(b"value", self.read_all(upload))
+
+    def test_closes_the_files_of_the_fields(self):
+        first = open(self.path, "rb")
+        second = open(self.path, "rb")
+        close_multipart_fields({"multipart_fields": {"file": ("image.bin", first, "application/octet-stream")}})
+        close_multipart_fields({"multipart_fields": [("file", ("image.bin", second))]})
+
+        self.assertTrue(first.closed)
+        self.assertTrue(second.closed)
+        # Plain values and calls without files are left alone
+        close_multipart_fields({"multipart_fields": {"name": "value", "data": ("data", io.BytesIO(b"x"))}})
+        close_multipart_fields({})
+        close_multipart_fields(None)
+
+    def test_computes_the_checksums_in_one_pass(self):
+        checksums = file_checksums(self.path, chunk_size=4096)
+
+        self.assertEqual(checksums, {
+            "md5": hashlib.md5(self.content).hexdigest(),
+            "sha512": hashlib.sha512(self.content).hexdigest(),
+        })
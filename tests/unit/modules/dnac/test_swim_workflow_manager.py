@@ -0,0 +1,65 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+import os
+import shutil
+import tempfile
+import unittest
+
+from ansible_collections.cisco.dnac.plugins.module_utils.dnac import dnac_argument_spec
+from ansible_collections.cisco.dnac.plugins.modules.swim_workflow_manager import Swim
+
+
+class FakeModule(object):
+    def __init__(self, **params):
+        self.params = dict((key, spec.get("default")) for key, spec in dnac_argument_spec().items())
+        self.params.update(dnac_host="127.0.0.1", dnac_username="admin", dnac_password="secret", config=[], **params)
+
+
+class TestGetDuplicateImage(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.file_path = os.path.join(self.directory, "cat9k.bin")
+        with open(self.file_path, "wb") as image:
+            image.write(b"image")
+        self.swim = Swim(FakeModule())
+        self.logged = []
+        self.swim.log = lambda message, level="WARNING", *args, **kwargs: self.logged.append(level)
+
+    def test_failed_lookup_lets_the_upload_run(self):
+        def _exec(**kwargs):
+            raise Exception("Unable to reach the Cisco Catalyst Center")
+
+        self.swim.dnac._exec = _exec
+        self.assertIsNone(self.swim.get_duplicate_image(self.file_path))
+        self.assertIn("WARNING", self.logged)
+
+    def test_missing_file_lets_the_upload_run(self):
+        self.swim.dnac._exec = lambda **kwargs: self.fail("no lookup without the size of the file")
+        self.assertIsNone(self.swim.get_duplicate_image(os.path.join(self.directory, "missing.bin")))
+        self.assertIn("WARNING", self.logged)
+
+    def test_image_with_the_same_checksum_is_found(self):
+        image = {"name": "cat9k_old.bin", "imageUuid": "1", "md5Checksum": "78805A221A988E79EF3F42D7C5BFD418"}
+        self.swim.dnac._exec = lambda **kwargs: {"response": [image]}
+        self.assertEqual(self.swim.get_duplicate_image(self.file_path), image)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+
+from ansible_collections.cisco.dnac.plugins.plugin_utils import argspec
+from ansible_collections.cisco.dnac.plugins.plugin_utils.argspec import (
+    CachedArgSpecValidator,
+    get_validator,
+    validate_argspec,
+)
+
+ARGUMENT_SPEC = dict(
+    name=dict(type="str", required=True),
+    count=dict(type="int", default=10),
+    state=dict(type="str", choices=["present", "absent"], default="present"),
+    tags=dict(type="list"),
+)
+REQUIRED_IF = [("state", "absent", ["tags"])]
+
+
+class TestArgSpec(unittest.TestCase):
+    def tearDown(self):
+        argspec._VALIDATORS.clear()
+        argspec._SPEC_KEYS.clear()
+
+    def test_normalizes_the_arguments(self):
+        valid, errors, args = validate_argspec("cisco.dnac.sample", {"name": "sw1", "count": "5"},
+                                               ARGUMENT_SPEC, required_if=REQUIRED_IF)
+
+        self.assertTrue(valid)
+        self.assertIsNone(errors)
+        self.assertEqual(args, {"name": "sw1", "count": 5, "state": "present", "tags": None})
+
+    def test_reports_errors(self):
+        valid, errors, args = validate_argspec("cisco.dnac.sample", {"name": "sw1", "state": "absent"},
+                                               ARGUMENT_SPEC, required_if=REQUIRED_IF)
+        self.assertFalse(valid)
+        self.assertIn("tags", errors)
+        self.assertEqual(args, {})
+
+        valid, errors, args = validate_argspec("cisco.dnac.sample", {"name": "sw1", "color": "red"}, ARGUMENT_SPEC)
+        self.assertFalse(valid)
+        self.assertTrue(errors.startswith("Unsupported parameters for (cisco.dnac.sample) module: color."))
+
+    def test_builds_one_validator_per_plugin_and_spec(self):
+        validator = get_validator("cisco.dnac.sample", ARGUMENT_SPEC, required_if=REQUIRED_IF)
+
+        self.assertIs(get_validator("cisco.dnac.sample", ARGUMENT_SPEC, required_if=REQUIRED_IF), validator)
+        # Same content, e.g. a reloaded plugin
+        self.assertIs(get_validator("cisco.dnac.sample", dict(ARGUMENT_SPEC), required_if=list(REQUIRED_IF)), validator)
+        self.assertIsNot(get_validator("cisco.dnac.other", ARGUMENT_SPEC, required_if=REQUIRED_IF), validator)
+        self.assertIsNot(get_validator("cisco.dnac.sample", ARGUMENT_SPEC), validator)
+
+    def test_skips_arguments_already_normalized(self):
+        validator = CachedArgSpecValidator("cisco.dnac.sample", ARGUMENT_SPEC)
+
+        dummy, dummy, args = validator.validate({"name": "sw1"})
+        # The same arguments, in another order, and the normalized ones
+        validator.validate({"name": "sw1"})
+        self.assertEqual(validator.validate(dict(reversed(list(args.items()))))[2], args)
+        self.assertEqual(validator.stats, {"validations": 1, "hits": 2})
+
+        # The callers get their own copy
+        args["tags"] = ["changed"]
+        self.assertIsNone(validator.validate({"name": "sw1"})[2]["tags"])
+
+    def test_forgets_the_oldest_arguments(self):
+        validator = CachedArgSpecValidator("cisco.dnac.sample", ARGUMENT_SPEC, max_normalized=4)
+
+        for index in range(4):
+            validator.validate({"name": "sw{0}".format(index)})
+        validator.validate({"name": "sw0"})
+
+        self.assertEqual(len(validator.normalized), 4)
+        self.assertEqual(validator.stats, {"validations": 5, "hits": 0})
@@ -0,0 +1,129 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+
+from ansible_collections.cisco.dnac.plugins.plugin_utils.dnac import (
+    NO_LOG_VALUE,
+    compile_comparator,
+    dnac_compare_equality,
+    dnac_compare_equality2,
+)
+
+FIELDS = [
+    ("name", "name"),
+    ("description", "description"),
+    ("templateParams", "templateParams"),
+    ("templateId", "template_id"),
+    ("name", "name"),
+]
+CURRENT = dict(
+    name="t1",
+    description="first",
+    templateParams=[dict(parameterName="vlan", order=1), dict(parameterName="hostname", order=2)],
+    templateId="123",
+)
+
+
+class TestFieldComparator(unittest.TestCase):
+    def setUp(self):
+        self.comparator = compile_comparator(FIELDS)
+
+    def test_duplicate_fields_compared_once(self):
+        self.assertEqual(len(self.comparator.fields), 4)
+
+    def test_unchanged(self):
+        requested = dict(
+            name="t1",
+            templateParams=[dict(parameterName="hostname", order=2), dict(parameterName="vlan", order=1)],
+            template_id="123",
+        )
+        self.assertEqual(self.comparator(CURRENT, requested), (False, {}))
+        self.assertEqual(self.comparator.diff(CURRENT, requested), {})
+
+    def test_stops_at_first_difference(self):
+        requested = dict(name="t2", description="second", template_id="123")
+        changed, diff = self.comparator(CURRENT, requested)
+        self.assertTrue(changed)
+        self.assertEqual(diff, dict(before=dict(name="t1"), after=dict(name="t2")))
+
+    def test_full_diff(self):
+        requested = dict(name="t2", description="second", template_id="123")
+        self.assertEqual(
+            self.comparator.diff(CURRENT, requested),
+            dict(before=dict(name="t1", description="first"), after=dict(name="t2", description="second")),
+        )
+
+    def test_same_result_as_field_by_field_comparison(self):
+        for compare in (dnac_compare_equality, dnac_compare_equality2):
+            comparator = compile_comparator(FIELDS, compare=compare)
+            for requested in (dict(name="t1"), dict(description=None), dict(template_id="124"), {}):
+                expected = any(not compare(CURRENT.get(dnac_param), requested.get(ansible_param))
+                               for (dnac_param, ansible_param) in FIELDS)
+                self.assertEqual(comparator.requires_update(CURRENT, requested), expected)
+
+    def test_no_log_masked(self):
+        argument_spec = dict(name=dict(type="str"), description=dict(type="str", no_log=True))
+        comparator = compile_comparator(FIELDS, argument_spec=argument_spec)
+        diff = comparator.diff(CURRENT, dict(name="t2", description="secret"))
+        self.assertEqual(diff["before"], dict(name="t1", description=NO_LOG_VALUE))
+        self.assertEqual(diff["after"], dict(name="t2", description=NO_LOG_VALUE))
+
+    def test_credentials_masked_at_any_depth(self):
+        fields = [("httpReadCredential", "httpReadCredential"), ("snmpROCommunity", "snmpROCommunity"),
+                  ("radiusSettings", "radiusSettings")]
+        current = dict(
+            httpReadCredential=dict(username="admin", password="old", port=443),
+            snmpROCommunity="public",
+            radiusSettings=[dict(address="10.0.0.1", sharedSecret="old")],
+        )
+        requested = dict(
+            httpReadCredential=dict(username="admin", password="new", port=443),
+            snmpROCommunity="private",
+            radiusSettings=[dict(address="10.0.0.2", sharedSecret="new")],
+        )
+        diff = compile_comparator(fields).diff(current, requested)
+        self.assertEqual(diff["after"], dict(
+            httpReadCredential=dict(username="admin", password=NO_LOG_VALUE, port=443),
+            snmpROCommunity=NO_LOG_VALUE,
+            radiusSettings=[dict(address="10.0.0.2", sharedSecret=NO_LOG_VALUE)],
+        ))
+        self.assertEqual(diff["before"]["httpReadCredential"]["password"], NO_LOG_VALUE)
+        self.assertNotIn("old", repr(diff))
+        self.assertNotIn("new", repr(diff))
+
+    def test_no_log_suboptions_masked(self):
+        argument_spec = dict(templateParams=dict(type="list", elements="dict", options=dict(
+            parameterName=dict(type="str", no_log=True))))
+        comparator = compile_comparator(FIELDS, argument_spec=argument_spec)
+        diff = comparator.diff(CURRENT, dict(templateParams=[dict(parameterName="vlan", order=3)]))
+        self.assertEqual(diff["after"], dict(templateParams=[dict(parameterName=NO_LOG_VALUE, order=3)]))
+
+
+class TestCompareEquality(unittest.TestCase):
+    def test_nested_dicts(self):
+        current = dict(a=1, b=dict(c=[1, 2], d="x"), e=None)
+        self.assertTrue(dnac_compare_equality(current, dict(b=dict(c=[2, 1]), f=3)))
+        self.assertFalse(dnac_compare_equality(current, dict(b=dict(d="y"))))
+
+    def test_nested_dicts_strict(self):
+        current = dict(a=1, b=dict(c=[1, 2]), e=None)
+        self.assertTrue(dnac_compare_equality2(current, dict(a=1, b=dict(c=[2, 1]))))
+        self.assertFalse(dnac_compare_equality2(current, dict(b=dict(c=[2, 1]))))
+        self.assertFalse(dnac_compare_equality2(current, dict(a=1, b=dict(c=[1, 2]), f=3)))
@@ -0,0 +1,89 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from ansible_collections.cisco.dnac.plugins.plugin_utils.response_cache import ResponseCache
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.clock = FakeClock()
+        self.cache = ResponseCache(self.cache_dir, clock=self.clock.time)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def key(self, **params):
+        return self.cache.make_key("https://10.0.0.1:443", "admin", "2.3.7.6", "sites", "get_site", params)
+
+    def test_entries_expire(self):
+        self.cache.put(self.key(name="Global"), {"response": ["site"]})
+        self.clock.now += 30
+        self.assertEqual(self.cache.get(self.key(name="Global"), ttl=60), ({"response": ["site"]}, 30))
+        self.clock.now += 30
+        self.assertEqual(self.cache.get(self.key(name="Global"), ttl=60), (None, None))
+
+    def test_keys_ignore_unset_params(self):
+        self.assertEqual(self.key(name="Global", offset=None), self.key(name="Global"))
+        self.assertNotEqual(self.key(name="Global"), self.key(name="Global/USA"))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        payload = {"response": "x" * 60}
+        for index, name in enumerate(["a", "b", "c"]):
+            self.cache.put(self.key(name=name), payload)
+            os.utime(self.cache.entry_path(self.key(name=name)), (index, index))
+        # Room for three entries
+        self.cache.max_size = 3 * os.path.getsize(self.cache.entry_path(self.key(name="a")))
+
+        # Reading 'a' makes 'b' the least recently used entry
+        self.cache.get(self.key(name="a"), ttl=60)
+        self.cache.put(self.key(name="d"), payload)
+
+        cached = [name for name in "abcd" if self.cache.get(self.key(name=name), ttl=60)[0] is not None]
+        self.assertEqual(cached, ["a", "c", "d"])
+
+    def test_cache_directory_that_cannot_be_created_is_unavailable(self):
+        with open(os.path.join(self.cache_dir, "file"), "w") as f:
+            f.write("not a directory")
+        cache = ResponseCache(os.path.join(self.cache_dir, "file", "responses"), clock=self.clock.time)
+
+        self.assertFalse(cache.available)
+        cache.put(self.key(name="Global"), {"response": ["site"]})
+        self.assertEqual(cache.get(self.key(name="Global"), ttl=60), (None, None))
+
+    def test_failed_write_makes_the_cache_unavailable(self):
+        shutil.rmtree(self.cache_dir)
+        self.cache.put(self.key(name="Global"), {"response": ["site"]})
+        os.makedirs(self.cache_dir)
+
+        self.assertFalse(self.cache.available)
+        self.assertIn("Unable to write the response cache", self.cache.error)